@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Adımsız Mod Karşılaştırması - Matematik Kütüphanesi
+===================================================
+
+Her çözücü için adimli=True ve adimli=False modlarında çağrı başına
+süreyi ölçer ve adım metni üretiminden kazanılan süreyi raporlar.
+
+Kullanım:
+    python benchmarks/adimsiz_mod.py [tekrar_sayisi]
+
+Yazar: Matematik Kütüphanesi
+"""
+
+import os
+import sys
+import timeit
+
+# Modül yollarını ekle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.cebir import CebirCozucu
+from modules.analiz import AnalizCozucu
+from modules.trigonometri import TrigonometriCozucu
+from modules.olasilik import OlasililkCozucu
+from modules.geometri import GeometriCozucu
+
+
+# (başlık, çözücü sınıfı, çözücü üzerinde çağrılacak fonksiyon)
+SENARYOLAR = [
+    ("Cebir: ikinci_dereceden_coz", CebirCozucu,
+     lambda c: c.ikinci_dereceden_coz("2x^2 + 3x - 2 = 0")),
+    ("Cebir: polinom_coz", CebirCozucu,
+     lambda c: c.polinom_coz("x^3 - 6x^2 + 11x - 6 = 0")),
+    ("Analiz: turev_hesapla", AnalizCozucu,
+     lambda c: c.turev_hesapla("x**3 * sin(x)")),
+    ("Analiz: integral_hesapla", AnalizCozucu,
+     lambda c: c.integral_hesapla("x**2 + 3*x")),
+    ("Trigonometri: fonksiyon_hesapla", TrigonometriCozucu,
+     lambda c: c.fonksiyon_hesapla("sin", 30)),
+    ("Trigonometri: karma_denklem_coz", TrigonometriCozucu,
+     lambda c: c.karma_trigonometrik_denklem_coz("sin(x) + cos(45) = 1.20")),
+    ("Olasılık: kombinasyon_hesapla(1000, 400)", OlasililkCozucu,
+     lambda c: c.kombinasyon_hesapla(1000, 400)),
+    ("Olasılık: binom_dagılimi", OlasililkCozucu,
+     lambda c: c.binom_dagılimi(20, 7, 0.3)),
+    ("Geometri: ucgen_hesaplama (Heron)", GeometriCozucu,
+     lambda c: c.ucgen_hesaplama("alan", a=3, b=4, c=5)),
+]
+
+
+def cagri_suresi(cozucu, cagri, tekrar: int) -> float:
+    """Bir çağrının en iyi ortalama süresini mikrosaniye cinsinden döndürür"""
+    cagri(cozucu)  # Önbellekleri ısıt
+    sureler = timeit.repeat(lambda: cagri(cozucu), number=tekrar, repeat=3)
+    return min(sureler) / tekrar * 1e6
+
+
+def karsilastir(tekrar: int = 200):
+    """Tüm senaryoları iki modda çalıştırıp tablo halinde yazdırır"""
+    print(f"{'Senaryo':<42}{'adımlı (µs)':>14}{'adımsız (µs)':>15}{'kazanç':>10}")
+    print("-" * 81)
+    for baslik, sinif, cagri in SENARYOLAR:
+        adimli = cagri_suresi(sinif(adimli=True), cagri, tekrar)
+        adimsiz = cagri_suresi(sinif(adimli=False), cagri, tekrar)
+        kazanc = (adimli - adimsiz) / adimli * 100 if adimli else 0.0
+        print(f"{baslik:<42}{adimli:>14.1f}{adimsiz:>15.1f}{kazanc:>9.1f}%")
+
+
+if __name__ == "__main__":
+    karsilastir(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Belirli İntegral Karşılaştırması - Matematik Kütüphanesi
+========================================================
+
+integral_hesapla'nın belirli integral yolunu önceki haliyle
+karşılaştırır. Önceki hal sembolik integrali iki kez alıyordu
+(sp.integrate(f, (x, a, b)) ve adımlar için sp.integrate(f, x));
+yeni hal belirsiz integrali bir kez alıp sınırlarda değerlendirir.
+Her iki yolun sonucu da karşılaştırılır. SymPy'nin kendi iç
+önbelleği her ölçümden önce temizlenir.
+
+Kullanım:
+    python benchmarks/belirli_integral.py [tekrar_sayisi]
+
+Yazar: Matematik Kütüphanesi
+"""
+
+import os
+import sys
+import time
+
+import sympy as sp
+from sympy.core.cache import clear_cache
+
+# Modül yollarını ekle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.analiz import AnalizCozucu
+
+
+def eski_belirli_integral(fonksiyon, var, alt_sinir, ust_sinir):
+    """integral_hesapla'nın belirli integral yolunun önceki hali"""
+    integral = sp.integrate(fonksiyon, (var, alt_sinir, ust_sinir))
+    belirsiz_integral = sp.integrate(fonksiyon, var)
+    return integral, belirsiz_integral
+
+
+# (fonksiyon, alt sınır, üst sınır)
+SENARYOLAR = [
+    ("x**3 - 2*x", -2, 5),
+    ("x*exp(x)", 0, 1),
+    ("sin(x)**2", 0, 2 * sp.pi),
+    ("cos(x)*exp(x)", 0, 1.5),
+    ("1/(x**2 - 1)", 2, 3),
+    ("log(x)", 0, 1),
+    ("exp(-x**2)", -sp.oo, sp.oo),
+    ("1/x**2", 1, sp.oo),
+]
+
+
+def sure_olc(hesapla, fonksiyon, var, alt, ust, tekrar: int):
+    """En iyi çağrı süresini milisaniye cinsinden ve son sonucu döndürür"""
+    en_iyi, sonuc = float("inf"), None
+    for _ in range(tekrar):
+        clear_cache()
+        baslangic = time.perf_counter()
+        sonuc = hesapla(fonksiyon, var, alt, ust)
+        en_iyi = min(en_iyi, time.perf_counter() - baslangic)
+    return en_iyi * 1e3, sonuc
+
+
+def karsilastir(tekrar: int = 3):
+    """Tüm senaryoları iki yolla çalıştırıp tablo halinde yazdırır"""
+    cozucu = AnalizCozucu(adimli=False)
+    x = sp.Symbol('x')
+    print(f"{'Senaryo':<34}{'eski (ms)':>11}{'yeni (ms)':>11}{'oran':>8}  sonuç")
+    print("-" * 72)
+    for fonksiyon_str, alt, ust in SENARYOLAR:
+        fonksiyon = sp.sympify(fonksiyon_str)
+        eski_sure, eski = sure_olc(eski_belirli_integral, fonksiyon, x, alt, ust, tekrar)
+        yeni_sure, yeni = sure_olc(cozucu._belirli_integral_hesapla, fonksiyon, x, alt, ust, tekrar)
+        ayni = eski[0] == yeni[0] or sp.simplify(eski[0] - yeni[0]) == 0
+        baslik = f"∫[{alt}, {ust}] {fonksiyon_str}"
+        print(f"{baslik:<34}{eski_sure:>11.1f}{yeni_sure:>11.1f}{eski_sure / yeni_sure:>7.1f}x  "
+              f"{'aynı' if ayni else 'FARKLI'}")
+
+
+if __name__ == "__main__":
+    karsilastir(int(sys.argv[1]) if len(sys.argv) > 1 else 3)
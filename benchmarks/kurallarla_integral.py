@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Kurallı İntegral Karşılaştırması - Matematik Kütüphanesi
+========================================================
+
+Basit integrandlarda kurallı hızlı yolu (utils.integral_kurallari)
+sp.integrate ile karşılaştırır. Her iki sonucun türevi integranda
+eşit mi diye denetlenir; sonda kural isabet oranı yazdırılır. SymPy'nin
+kendi iç önbelleği her ölçümden önce temizlenir.
+
+Kullanım:
+    python benchmarks/kurallarla_integral.py [tekrar_sayisi]
+
+Yazar: Matematik Kütüphanesi
+"""
+
+import os
+import sys
+import time
+
+import sympy as sp
+from sympy.core.cache import clear_cache
+
+# Modül yollarını ekle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.integral_kurallari import kurallarla_integral, kural_istatistikleri, kural_sayaclarini_sifirla
+
+
+SENARYOLAR = [
+    "3*x**4 - 2*x + 7",
+    "5*sin(2*x + 1)",
+    "a*sin(b*x + c)",
+    "exp(3*x)",
+    "exp(k*x)",
+    "1/(2*x + 3)",
+    "(x**2 + 1)/(x - 1)",
+    "(2*x + 3)/(x**2 + 2*x + 5)",
+    "1/(x**2 - 1)",
+    "sqrt(x) + 2**x",
+    "sec(2*x) + tan(x)",
+    "x*sin(x)",
+]
+
+
+def sure_olc(hesapla, fonksiyon, x, tekrar: int):
+    """En iyi çağrı süresini milisaniye cinsinden ve son sonucu döndürür"""
+    en_iyi, sonuc = float("inf"), None
+    for _ in range(tekrar):
+        clear_cache()
+        baslangic = time.perf_counter()
+        sonuc = hesapla(fonksiyon, x)
+        en_iyi = min(en_iyi, time.perf_counter() - baslangic)
+    return en_iyi * 1e3, sonuc
+
+
+def karsilastir(tekrar: int = 3):
+    """Tüm senaryoları iki yolla çalıştırıp tablo halinde yazdırır"""
+    x = sp.Symbol('x')
+    kural_sayaclarini_sifirla()
+    print(f"{'Integrand':<30}{'sympy (ms)':>12}{'kural (ms)':>12}{'oran':>8}  sonuç")
+    print("-" * 72)
+    for fonksiyon_str in SENARYOLAR:
+        fonksiyon = sp.sympify(fonksiyon_str)
+        sympy_sure, _ = sure_olc(sp.integrate, fonksiyon, x, tekrar)
+        kural_sure, sonuc = sure_olc(kurallarla_integral, fonksiyon, x, tekrar)
+        if sonuc is None:
+            durum = "ıskalama (sp.integrate)"
+        else:
+            # Parçalı sonuçlarda genel (katsayı ≠ 0) dal denetlenir
+            genel = sonuc.replace(lambda ifade: ifade.is_Piecewise, lambda ifade: ifade.args[0].expr)
+            durum = "doğru" if sp.simplify(sp.diff(genel, x) - fonksiyon) == 0 else "YANLIŞ"
+        print(f"{fonksiyon_str:<30}{sympy_sure:>12.2f}{kural_sure:>12.3f}{sympy_sure / kural_sure:>7.0f}x  {durum}")
+    istatistik = kural_istatistikleri()
+    print(f"\nİsabet oranı: {istatistik['isabet_orani']:.0%} "
+          f"({istatistik['isabet']} isabet, {istatistik['iskalama']} ıskalama)")
+
+
+if __name__ == "__main__":
+    karsilastir(int(sys.argv[1]) if len(sys.argv) > 1 else 3)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Okunabilir Yazıcı Karşılaştırması - Matematik Kütüphanesi
+=========================================================
+
+Büyük türev çıktılarında okunabilir metin üretimini iki yolla ölçer:
+eski yol str() çıktısı üzerinde ~25 düzenli ifade değiştirmesi yapar,
+yeni yol (utils.yazici) sembolleri yazdırma sırasında tek ağaç
+dolaşımında üretir. İki çıktının farklı olduğu senaryolar işaretlenir
+(örn. eski yol gamma fonksiyonunu γ, yeni yol Γ olarak yazar).
+
+Kullanım:
+    python benchmarks/okunabilir_yazici.py [tekrar_sayisi]
+
+Yazar: Matematik Kütüphanesi
+"""
+
+import os
+import re
+import sys
+import time
+
+import sympy as sp
+
+# Modül yollarını ekle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.yazici import YUNAN_HARFLERI, okunabilir
+
+
+x = sp.Symbol('x')
+SENARYOLAR = {
+    "d³/dx³ sqrt(sin(x)² + x)": sp.diff(sp.sqrt(sp.sin(x)**2 + x), x, 3),
+    "d⁴/dx⁴ exp(x)·sqrt(x + 1)/(x² + 1)": sp.diff(sp.exp(x) * sp.sqrt(x + 1) / (x**2 + 1), x, 4),
+    "d⁵/dx⁵ atan(sqrt(x))·pi": sp.diff(sp.atan(sp.sqrt(x)) * sp.pi, x, 5),
+    "d²/dx² fresnels(sqrt(x))·gamma(x)": sp.diff(sp.fresnels(sp.sqrt(x)) * sp.gamma(x), x, 2),
+}
+
+
+def eski_donusum(metin: str) -> str:
+    """Yazıcıdan önceki str() + düzenli ifade yolu (karşılaştırma için)"""
+    metin = re.sub(r'sqrt\(([^)]+)\)', r'√(\1)', metin)
+    metin = re.sub(r'fresnels\(([^)]+)\)', r'S(\1)', metin)
+    metin = re.sub(r'fresnelc\(([^)]+)\)', r'C(\1)', metin)
+    metin = re.sub(r'erf\(([^)]+)\)', r'erf(\1)', metin)
+    metin = re.sub(r'erfc\(([^)]+)\)', r'erfc(\1)', metin)
+    metin = re.sub(r'elliptic_f\(([^,]+),([^)]+)\)', r'F(\1|\2)', metin)
+    metin = re.sub(r'elliptic_e\(([^,]+),([^)]+)\)', r'E(\1|\2)', metin)
+    donusumler = dict(YUNAN_HARFLERI, pi="π", Pi="π", infinity="∞")
+    for eski, yeni in donusumler.items():
+        metin = re.sub(r'\b' + re.escape(eski) + r'\b', yeni, metin)
+    return metin
+
+
+def sure_olc(hesapla, ifade, tekrar: int):
+    """En iyi çağrı süresini milisaniye cinsinden ve son sonucu döndürür"""
+    en_iyi, sonuc = float("inf"), None
+    for _ in range(tekrar):
+        baslangic = time.perf_counter()
+        sonuc = hesapla(ifade)
+        en_iyi = min(en_iyi, time.perf_counter() - baslangic)
+    return en_iyi * 1e3, sonuc
+
+
+def karsilastir(tekrar: int = 20):
+    """Tüm senaryoları iki yolla çalıştırıp tablo halinde yazdırır"""
+    print(f"{'İfade':<40}{'uzunluk':>9}{'regex (ms)':>12}{'yazıcı (ms)':>13}{'oran':>7}  çıktı")
+    print("-" * 96)
+    for ad, ifade in SENARYOLAR.items():
+        eski_sure, eski = sure_olc(lambda i: eski_donusum(str(i)), ifade, tekrar)
+        yeni_sure, yeni = sure_olc(okunabilir, ifade, tekrar)
+        durum = "aynı" if eski == yeni else "farklı"
+        print(f"{ad:<40}{len(yeni):>9}{eski_sure:>12.3f}{yeni_sure:>13.3f}{eski_sure / yeni_sure:>6.1f}x  {durum}")
+
+
+if __name__ == "__main__":
+    karsilastir(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Sadeleştirme Düzeyi Karşılaştırması - Matematik Kütüphanesi
+===========================================================
+
+turev_hesapla ve integral_hesapla çağrı başına süresini sadeleştirme
+düzeylerine göre ölçer: tam + süre sınırı (varsayılan, her sadeleştirme
+ayrı bir süreçte), tam (sadelestirme_suresi=None, aynı süreçte), ucuz ve
+kapalı. İlk iki satır arasındaki fark süre sınırının fork maliyetidir.
+
+Her turda fonksiyonlara farklı bir terim eklenir; böylece şablon ve
+kalıcı depo önbellekleri ölçümü etkilemez.
+
+Kullanım:
+    python benchmarks/sadelestirme.py [tur_sayisi]
+
+Yazar: Matematik Kütüphanesi
+"""
+
+import os
+import sys
+import time
+
+# Modül yollarını ekle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sympy.core.cache import clear_cache
+
+from modules.analiz import AnalizCozucu
+
+
+FONKSIYONLAR = ["x**3*sin(x) + x", "(x^2-1)/(x-1)*exp(x)", "sin(x)^2*cos(x)",
+                "log(x)*x^4", "x*exp(2x)", "sqrt(x+1)/x"]
+
+# (başlık, AnalizCozucu ayarları)
+DUZEYLER = [
+    ("tam + 5 s süre sınırı (fork)", {}),
+    ("tam (aynı süreçte)", {"sadelestirme_suresi": None}),
+    ("ucuz", {"sadelestirme": "ucuz"}),
+    ("kapalı", {"sadelestirme": "kapali"}),
+]
+
+
+def karsilastir(tur: int = 3):
+    """Her düzey için türev + integral çifti başına ortalama süreyi yazdırır"""
+    print(f"{'Düzey':<32}{'ms / (türev + integral)':>26}")
+    print("-" * 58)
+    for baslik, ayarlar in DUZEYLER:
+        cozucu = AnalizCozucu(adimli=False, **ayarlar)
+        # İlk çağrının tembel içe aktarma yükü ölçüme girmesin
+        cozucu.turev_hesapla("x*exp(x)*sin(x)")
+        cozucu.integral_hesapla("x*exp(x)*sin(x)")
+        # Önceki düzeyin SymPy önbelleği sonraki düzeyi hızlandırmasın
+        clear_cache()
+        baslangic = time.perf_counter()
+        for i in range(tur):
+            for fonksiyon in FONKSIYONLAR:
+                cozucu.turev_hesapla(f"{fonksiyon} + {i + 2}*x**7")
+                cozucu.integral_hesapla(f"{fonksiyon} + {i + 2}*x**7")
+        sure = (time.perf_counter() - baslangic) / (tur * len(FONKSIYONLAR))
+        print(f"{baslik:<32}{sure * 1e3:>26.1f}")
+
+
+if __name__ == "__main__":
+    karsilastir(int(sys.argv[1]) if len(sys.argv) > 1 else 3)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Sözcükleyici Hız Karşılaştırması - Matematik Kütüphanesi
+========================================================
+
+Sözcükleyicinin (utils.sozcukleyici) girdi temizleme maliyetini,
+modüllerde daha önce kullanılan str.replace / re.sub zincirleriyle
+karşılaştırır. Eski temizleyiciler karşılaştırma için aşağıda aynen
+korunmuştur. Önbellek devre dışıdır; yalnızca temizleme ölçülür.
+
+Sözcükleyici hız için değil, tutarlı ayrıştırma için yazılmıştır
+(boşluk kuralları, tanınmayan isimlerin reddi). Cebir denklemlerinde
+eski zincirden hızlıdır; isim dönüşümü ve kelime atma gerektiren kısa
+analiz ve trigonometri girdilerinde ise birkaç str.replace çağrısı
+hâlâ daha ucuzdur. Oran sütunu bu farkı, son sütun aynı girdinin
+sp.sympify süresini gösterir. Temizleme, ayrıştırmanın küçük bir
+kısmıdır ve paylaşılan ayrıştırma önbelleğinin arkasında benzersiz
+girdi başına bir kez çalışır.
+
+Kullanım:
+    python benchmarks/sozcukleyici.py [tekrar_sayisi]
+
+Yazar: Matematik Kütüphanesi
+"""
+
+import os
+import re
+import sys
+import timeit
+
+import sympy as sp
+
+# Modül yollarını ekle
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.cebir import CebirCozucu
+from modules.analiz import AnalizCozucu
+from modules.trigonometri import TrigonometriCozucu
+
+
+def eski_denklem_temizle(denklem_str: str) -> str:
+    """cebir._denklem_temizle'nin önceki hali"""
+    denklem = denklem_str.lower()
+    if "=" in denklem:
+        sol, sag = denklem.split("=", 1)
+        denklem = f"({sol}) - ({sag})"
+    denklem = denklem.replace("²", "**2")
+    denklem = denklem.replace("^", "**")
+    denklem = denklem.replace("ü", "u").replace("ğ", "g").replace("ı", "i")
+    denklem = denklem.replace("ş", "s").replace("ç", "c").replace("ö", "o")
+    denklem = re.sub(r'\s+', '', denklem)
+    denklem = re.sub(r'(\d)([a-z])', r'\1*\2', denklem)
+    return denklem
+
+
+def eski_fonksiyon_temizle(fonksiyon_str: str) -> str:
+    """analiz._fonksiyon_temizle'nin önceki hali"""
+    fonksiyon_temiz = fonksiyon_str.lower().strip()
+    donusumler = {
+        "sinüs": "sin", "kosinüs": "cos", "tanjant": "tan", "kotanjant": "cot",
+        "sekant": "sec", "kosekant": "csc", "ln": "log", "üs": "**", "^": "**"
+    }
+    for tr_kelime, en_kelime in donusumler.items():
+        fonksiyon_temiz = fonksiyon_temiz.replace(tr_kelime, en_kelime)
+    fonksiyon_temiz = re.sub(r'(\d)([a-z])', r'\1*\2', fonksiyon_temiz)
+    fonksiyon_temiz = fonksiyon_temiz.replace("²", "**2")
+    fonksiyon_temiz = fonksiyon_temiz.replace("³", "**3")
+    return fonksiyon_temiz
+
+
+def eski_ifade_temizle(ifade_str: str):
+    """trigonometri._ifade_ayristir'in önceki hali (önbelleksiz)"""
+    ifade_temiz = ifade_str.lower()
+    for kelime in ["hesapla", "bul", "çöz", "değer", "sonuç"]:
+        ifade_temiz = ifade_temiz.replace(kelime, "")
+    ifade_temiz = ifade_temiz.replace(" ", "")
+    if "=" in ifade_temiz:
+        ifade_temiz = ifade_temiz.split("=")[0]
+    trig_eslesmeler = re.findall(r'(sin|cos|tan|sinüs|kosinüs|tanjant)\s*\(?(\d+(?:\.\d+)?)\)?', ifade_temiz)
+    return ifade_temiz, tuple(trig_eslesmeler)
+
+
+def eski_karma_denklem_temizle(denklem_str: str) -> str:
+    """trigonometri._karma_denklem_temizle'nin önceki hali"""
+    denklem_temiz = denklem_str.lower()
+    denklem_temiz = denklem_temiz.replace("x hesapla", "")
+    denklem_temiz = denklem_temiz.replace("ise x", "")
+    for kelime in ["ise", "hesapla", "bul", "çöz", "değer", "sonuç"]:
+        denklem_temiz = denklem_temiz.replace(kelime, "")
+    return denklem_temiz.replace(" ", "")
+
+
+_trig = TrigonometriCozucu()
+
+# (başlık, eski temizleyici, yeni temizleyici, girdiler)
+SENARYOLAR = [
+    ("Cebir: denklem", eski_denklem_temizle, CebirCozucu()._denklem_temizle,
+     ["2x² + 3x - 2 = 0", "x^3 - 6x^2 + 11x - 6 = 0", "4x^4 - 17x^2 + 4 = 0"]),
+    ("Analiz: fonksiyon", eski_fonksiyon_temizle, AnalizCozucu()._fonksiyon_temizle,
+     ["x^2 + 3x", "sinüs(x) * 2x", "kosinüs(x) + ln(x) + x³"]),
+    ("Trigonometri: ifade", eski_ifade_temizle, _trig._ifade_temizle,
+     ["sin(30) + cos(60) hesapla", "sinüs 45 * 2 + tan(60)"]),
+    ("Trigonometri: karma denklem", eski_karma_denklem_temizle, _trig._karma_denklem_temizle,
+     ["sin(x) + cos(45) = 1.20 ise x hesapla", "cos(x) - sin(30) = 0"]),
+]
+
+
+def girdi_basina_sure(temizle, girdiler, tekrar: int) -> float:
+    """Girdi başına en iyi ortalama süreyi mikrosaniye cinsinden döndürür"""
+    def calistir():
+        for girdi in girdiler:
+            temizle(girdi)
+    sureler = timeit.repeat(calistir, number=tekrar, repeat=3)
+    return min(sureler) / (tekrar * len(girdiler)) * 1e6
+
+
+def karsilastir(tekrar: int = 5000):
+    """Tüm senaryoları eski ve yeni temizleyiciyle çalıştırıp tablo halinde yazdırır"""
+    print(f"{'Senaryo':<32}{'eski (µs)':>12}{'yeni (µs)':>12}{'oran':>10}{'sympify (µs)':>15}")
+    print("-" * 81)
+    for baslik, eski, yeni, girdiler in SENARYOLAR:
+        eski_sure = girdi_basina_sure(eski, girdiler, tekrar)
+        yeni_sure = girdi_basina_sure(yeni, girdiler, tekrar)
+        # Karşılaştırma için temizlenmiş metnin (eşittirin sol tarafı) ayrıştırılma süresi
+        temizler = []
+        for girdi in girdiler:
+            temiz = yeni(girdi)
+            if isinstance(temiz, tuple):
+                temiz = temiz[0]
+            temizler.append(temiz.split("=")[0])
+        ayristirma_sure = girdi_basina_sure(sp.sympify, temizler, max(1, tekrar // 50))
+        print(f"{baslik:<32}{eski_sure:>12.2f}{yeni_sure:>12.2f}{eski_sure / yeni_sure:>9.2f}x"
+              f"{ayristirma_sure:>15.2f}")
+
+
+if __name__ == "__main__":
+    karsilastir(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -23,11 +23,13 @@ from typing import Dict, Any
 # Modül yollarını ekle
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from modules.cebir import ikinci_dereceden_coz, carpanlara_ayir
+from modules.cebir import ikinci_dereceden_coz, carpanlara_ayir, denklem_sistemi_coz
 from modules.trigonometri import (trigonometrik_hesapla, ters_trigonometrik_hesapla, aci_donustur, 
                                  trigonometrik_denklem_coz, trigonometrik_ifade_hesapla, 
                                  karma_trigonometrik_denklem_coz, trigonometrik_turev_integral)
-from modules.analiz import turev_hesapla, integral_hesapla, trigonometrik_analiz
+from modules.analiz import (turev_hesapla, integral_hesapla, limit_hesapla, fonksiyon_tablola,
+                            trigonometrik_analiz)
+from modules.diferansiyel import baslangic_deger_problemi_coz
 from modules.olasilik import faktoriyel, permutasyon, kombinasyon, olasilik_hesapla, binom_dagilimi
 from modules.geometri import ucgen_hesapla, dortgen_hesapla
 from utils.parser import sorgu_analiz_et, DoğalDilParser
@@ -180,6 +182,9 @@ class MatematikKutuphanesi:
                 )
             
             sonuc = ikinci_dereceden_coz(denklem)
+            if sonuc.get("derece", 0) > 2:
+                # Yüksek dereceli denklemler genel polinom kök bulucuyla çözülmüştür
+                return cozum_formatla(sonuc, "Polinom Denklem Çözümü")
             return cozum_formatla(sonuc, "İkinci Dereceden Denklem Çözümü")
         
         elif fonksiyon == "carpanlara_ayir":
@@ -194,6 +199,18 @@ class MatematikKutuphanesi:
             sonuc = carpanlara_ayir(ifade)
             return cozum_formatla(sonuc, "Çarpanlara Ayırma İşlemi")
         
+        elif fonksiyon == "denklem_sistemi_coz":
+            denklemler = parametreler.get("denklemler")
+            if not denklemler:
+                return hata_mesaji_formatla(
+                    "Denklem sistemi tespit edilemedi.",
+                    ["Denklemleri virgül veya noktalı virgülle ayırın",
+                     "Örnek: 2x + y = 5, x - y = 1"]
+                )
+            
+            sonuc = denklem_sistemi_coz(denklemler)
+            return cozum_formatla(sonuc, "Doğrusal Denklem Sistemi Çözümü")
+        
         else:
             return hata_mesaji_formatla(
                 f"'{fonksiyon}' fonksiyonu henüz desteklenmiyor."
@@ -348,6 +365,58 @@ class MatematikKutuphanesi:
                         ["Örnek: x², sin(x), 2x+3"]
                     )
             
+            elif fonksiyon == "limit_hesapla":
+                # Limit hesapla
+                fonksiyon_str = parametreler.get("fonksiyon")
+                nokta = parametreler.get("nokta")
+                
+                if fonksiyon_str and nokta is not None:
+                    sonuc = limit_hesapla(fonksiyon_str, nokta,
+                                          parametreler.get("degisken", "x"),
+                                          parametreler.get("yon", "+-"))
+                    return cozum_formatla(sonuc, "Limit Hesaplama")
+                else:
+                    return hata_mesaji_formatla(
+                        "Limit alınacak fonksiyon veya yaklaşılan nokta tespit edilemedi.",
+                        ["Örnek: lim x->0 sin(x)/x",
+                         "Örnek: x sonsuza giderken (2x+1)/(x-3) limiti",
+                         "Örnek: x sağdan 0'a yaklaşırken 1/x limiti"]
+                    )
+            
+            elif fonksiyon == "fonksiyon_tablola":
+                # Grafik verisi: ekranda gösterilecek kadar noktalık tablo
+                sonuc = fonksiyon_tablola(parametreler.get("fonksiyon", "x"),
+                                          parametreler.get("alt_sinir", "-10"),
+                                          parametreler.get("ust_sinir", "10"),
+                                          nokta_sayisi=11)
+                if sonuc["basarili"]:
+                    sonuc["tablo"] = [satir for parca in sonuc.pop("parcalar") for satir in parca]
+                return cozum_formatla(sonuc, "Fonksiyon Tablosu")
+            
+            elif fonksiyon == "baslangic_deger_problemi_coz":
+                # Diferansiyel denklem: çözüm ekranda 11 zaman noktasında tablolanır
+                if not parametreler.get("denklemler"):
+                    return hata_mesaji_formatla(
+                        "Diferansiyel denklem tespit edilemedi.",
+                        ["Örnek: y' = -2y + sin(t), y(0) = 1, [0, 5] aralığında çöz",
+                         "Örnek: x' = v; v' = -x; x(0) = 1; v(0) = 0, 0'dan 10'a kadar"]
+                    )
+                if parametreler.get("hata"):
+                    return hata_mesaji_formatla(
+                        parametreler["hata"],
+                        ["Her bilinmeyen için başlangıç koşulu verin: y(0) = 1",
+                         "Çözüm aralığını belirtin: [0, 5] aralığında veya t 0 dan 5 e"]
+                    )
+                sonuc = baslangic_deger_problemi_coz(parametreler["denklemler"],
+                                                     parametreler["baslangic_degerleri"],
+                                                     parametreler["t_araligi"],
+                                                     parametreler.get("degiskenler"),
+                                                     nokta_sayisi=11)
+                if sonuc["basarili"]:
+                    sonuc["sutunlar"] = [sonuc["zaman"]] + sonuc["degiskenler"]
+                    sonuc["tablo"] = [[t, *y] for t, y in zip(sonuc["t"], sonuc["y"])]
+                return cozum_formatla(sonuc, "Diferansiyel Denklem Çözümü")
+            
             else:
                 return hata_mesaji_formatla(
                     f"'{fonksiyon}' analiz fonksiyonu henüz desteklenmiyor."
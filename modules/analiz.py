@@ -7,78 +7,259 @@ Bu modül matematik analizini içerir:
 - İntegral hesaplamaları
 - Trigonometrik fonksiyonların türev ve integralleri
 - Limit hesaplamaları
+- Türev ve integrallerin NumPy dizileri üzerinde sayısal değerlendirilmesi
+- İleri mod otomatik türev ile noktasal türev değerleri
+- f(x) = 0 denklemlerinin aralıktaki tüm köklerinin sayısal bulunması
+- Parçalı akışla fonksiyon tablosu (grafik verisi) üretimi ve CSV/NPY'ye yazımı
+- Uyarlamalı Gauss-Kronrod ile sayısal belirli integral
+- Çok değişkenli fonksiyonlar için kısmi türev, gradyan, Jacobian ve Hessian
+- Taylor/Maclaurin serileri
 - Temel analiz kuralları
 """
 
 import math
+import threading
+import numpy as np
 import sympy as sp
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 import re
 
+from utils.onbellek import AyristirmaOnbellegi, ayristirma_onbellegi, girdi_normalize_et
+from utils.sozcukleyici import Sozcukleyici
+from utils.sablon import sablonla_hesapla
+from utils.kalici_depo import kalici_hesapla
+from utils.integral_kurallari import kurallarla_integral
+from utils.yazici import okunabilir
+from utils.derleyici import derle, derleme_onbellegi, toplu_derle
+from utils.zaman_siniri import SureAsimi, sure_sinirli_calistir
+
+
+# Sembolik belirli integral ve limit için varsayılan süre sınırı (saniye);
+# aşılırsa sayısal yönteme geçilir. Süre sınırı işlemi ayrı bir süreçte
+# çalıştırır ve çağrı başına birkaç milisaniyelik fork maliyeti ekler; bu,
+# sp.integrate'in bazı girdilerde dakikalarca takılmasına karşı ödenir.
+# None verilirse sınır kalkar ve işlem aynı süreçte çalışır.
+SEMBOLIK_SURE_SINIRI = 5.0
+
+# Sayısal limitte noktaya yaklaşan dizinin terim sayısı (adımlar 2^-k) ve
+# Richardson tablosunun en fazla derinliği
+LIMIT_DIZI_UZUNLUGU = 30
+LIMIT_RICHARDSON_DERINLIGI = 6
+
+# Yerine koyma kuralının güvenli olmadığı (süreksiz) fonksiyonlar
+_SUREKSIZ_FONKSIYONLAR = (sp.floor, sp.ceiling, sp.sign, sp.Heaviside, sp.Piecewise, sp.frac)
+
+# Sonlu gerçek değer alsa da argümanın bu değerinde sıçrama yapan fonksiyonlar
+# (SymPy'de acot(0) = π/2 ama soldan limit -π/2'dir)
+_SICRAMA_NOKTALARI = {sp.acot: sp.S.Zero}
+
+# Sadeleştirme düzeyleri: kapalı, ucuz (cancel/trigsimp) veya tam (sp.simplify).
+# Tam sadeleştirme varsayılan olarak süre sınırıyla ayrı bir süreçte çalışır;
+# süre dolarsa sadeleştirilmemiş sonuç döner. None ile sınır kalkar ve
+# sp.simplify aynı süreçte çalışır (çağrı başına fork maliyeti olmadan).
+SADELESTIRME_KAPALI = "kapali"
+SADELESTIRME_UCUZ = "ucuz"
+SADELESTIRME_TAM = "tam"
+SADELESTIRME_SURE_ASIMI = "sure_asimi"
+VARSAYILAN_SADELESTIRME = SADELESTIRME_TAM
+SADELESTIRME_SURE_SINIRI = 5.0
+
+# Sayısal integralin varsayılan toleransları ve en fazla alt aralık sayısı
+SAYISAL_MUTLAK_TOLERANS = 1e-10
+SAYISAL_GORELI_TOLERANS = 1e-10
+SAYISAL_AZAMI_ARALIK = 5000
+
+# Taylor serisinde kalan tahmini için mertebenin ötesinde hesaplanan terim
+# sayısı; kalan, bunlardan sıfır olmayan ilkiyle tahmin edilir
+TAYLOR_KALAN_TERIMLERI = 3
+
+# Sayısal kök bulma: işaret değişimi aranan ızgaranın nokta sayısı, göreli
+# tolerans ve alt aralık başına en fazla Newton/ikiye bölme iterasyonu
+KOK_IZGARA_SAYISI = 1000
+KOK_TOLERANSI = 1e-12
+KOK_AZAMI_ITERASYON = 100
+
+# Fonksiyon tablosu (grafik verisi): sütunlar, varsayılan nokta sayısı, parça
+# boyutu, uyarlamalı inceltmenin göreli toleransı ve en fazla bölme sayısı
+TABLO_SUTUNLARI = ("x", "f", "turev", "integral")
+TABLO_NOKTA_SAYISI = 1001
+TABLO_PARCA_BOYUTU = 65536
+TABLO_TOLERANSI = 1e-3
+TABLO_AZAMI_BOLME = 64
+
+# Tablo integrali için alt aralık başına 5 noktalı Gauss-Legendre
+_GL_DUGUMLER, _GL_AGIRLIKLAR = np.polynomial.legendre.leggauss(5)
+
+# NPY dosya başlığının sabit boyutu (satır sayısı yazma bitince doldurulur)
+_NPY_BASLIK_BOYU = 128
+
+# Gauss-Kronrod (G7-K15) düğümleri ve ağırlıkları [-1, 1] üzerinde
+_KRONROD_DUGUMLERI = np.array([
+    0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+    0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+    0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+    0.207784955007898467600689403773245, 0.0
+])
+_KRONROD_AGIRLIKLARI = np.array([
+    0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+    0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+    0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+    0.204432940075298892414161999234649, 0.209482141084727828012999174891714
+])
+# Gauss düğümleri Kronrod düğümlerinin tek sıradakileridir (1, 3, 5, 7)
+_GAUSS_AGIRLIKLARI = np.array([
+    0.0, 0.129484966168869693270611432679082, 0.0, 0.279705391489276667901467771423780,
+    0.0, 0.381830050505118944950369775488975, 0.0, 0.417959183673469387755102040816327
+])
+_GK_DUGUMLER = np.concatenate([-_KRONROD_DUGUMLERI[:-1], _KRONROD_DUGUMLERI[::-1]])
+_GK_KRONROD = np.concatenate([_KRONROD_AGIRLIKLARI[:-1], _KRONROD_AGIRLIKLARI[::-1]])
+_GK_GAUSS = np.concatenate([_GAUSS_AGIRLIKLARI[:-1], _GAUSS_AGIRLIKLARI[::-1]])
+
+
+# Türkçe fonksiyon isimlerini SymPy karşılıklarına çeviren sözcükleyici
+_sozcukleyici = Sozcukleyici(isim_donusumleri={
+    "sinüs": "sin",
+    "kosinüs": "cos",
+    "tanjant": "tan",
+    "kotanjant": "cot",
+    "sekant": "sec",
+    "kosekant": "csc",
+    "ln": "log",
+    "üs": "**",
+    "arcsin": "asin",
+    "arccos": "acos",
+    "arctan": "atan",
+    # Girdi küçük harfe çevrildiğinden büyük harfli SymPy adları geri kazanılır
+    "si": "Si",
+    "ci": "Ci",
+    "ei": "Ei"
+})
+
+
+class _TaylorKatsayilari:
+    """
+    Bir (fonksiyon, nokta) çifti için artımlı hesaplanan Taylor katsayıları.
+    
+    Son alınan türev saklanır; mertebe n'den n+k'ye çıkarılırken yalnızca
+    k yeni türev alınır, ilk n katsayı yeniden hesaplanmaz.
+    """
+    
+    def __init__(self, fonksiyon: sp.Expr, var: sp.Symbol, nokta: sp.Expr):
+        self.var = var
+        self.nokta = nokta
+        self.katsayilar: List[sp.Expr] = []
+        self.sayisal = np.zeros(0)
+        self._son_turev = fonksiyon
+        self._faktoriyel = sp.S.One
+        self._kilit = threading.Lock()
+    
+    def al(self, adet: int) -> Tuple[List[sp.Expr], Optional[np.ndarray]]:
+        """İlk 'adet' katsayıyı (sembolik ve sayısal) döndürür; eksikse hesaplar"""
+        with self._kilit:
+            if len(self.katsayilar) < adet:
+                for k in range(len(self.katsayilar), adet):
+                    if k > 0:
+                        self._son_turev = sp.diff(self._son_turev, self.var)
+                        self._faktoriyel *= k
+                    deger = self._son_turev.subs(self.var, self.nokta)
+                    if deger.has(sp.nan, sp.zoo, sp.oo, -sp.oo):
+                        # Kaldırılabilir tekillik (sin(x)/x gibi): değer limitle bulunur
+                        deger = sp.limit(self._son_turev, self.var, self.nokta)
+                        if deger.has(sp.nan, sp.zoo, sp.oo, -sp.oo) or isinstance(deger, sp.Limit):
+                            raise ValueError(f"Fonksiyon {self.var} = {self.nokta} noktasında Taylor serisine açılamaz")
+                    self.katsayilar.append(deger / self._faktoriyel)
+                try:
+                    sayisal = np.array([complex(katsayi.evalf()) for katsayi in self.katsayilar])
+                    self.sayisal = sayisal if np.any(sayisal.imag) else sayisal.real
+                except TypeError:
+                    # Katsayılarda başka semboller var; yalnızca sembolik seri verilebilir
+                    self.sayisal = None
+            sayisal = self.sayisal[:adet] if self.sayisal is not None else None
+            return self.katsayilar[:adet], sayisal
+
+
+# (fonksiyon, değişken, nokta) -> _TaylorKatsayilari
+taylor_onbellegi = AyristirmaOnbellegi(azami_boyut=256)
+
 
 class AnalizCozucu:
     """Ana analiz çözücü sınıfı"""
     
-    def __init__(self):
+    def __init__(self, adimli: bool = True, sure_siniri: Optional[float] = SEMBOLIK_SURE_SINIRI,
+                 sadelestirme: str = VARSAYILAN_SADELESTIRME,
+                 sadelestirme_suresi: Optional[float] = SADELESTIRME_SURE_SINIRI):
+        if sadelestirme not in (SADELESTIRME_KAPALI, SADELESTIRME_UCUZ, SADELESTIRME_TAM):
+            raise ValueError(f"Bilinmeyen sadeleştirme düzeyi: {sadelestirme}")
         self.x = sp.Symbol('x')
         self.t = sp.Symbol('t')
+        # adimli=False ise çözüm adımı metinleri üretilmez (hızlı mod)
+        self.adimli = adimli
+        # Sembolik belirli integral veya limit bu süreyi aşarsa sayısal yönteme geçilir
+        self.sure_siniri = sure_siniri
+        # Türev ve integral sonuçlarına uygulanacak sadeleştirme ve süre sınırı
+        self.sadelestirme = sadelestirme
+        self.sadelestirme_suresi = sadelestirme_suresi
         
-    def turev_hesapla(self, fonksiyon_str: str, degisken: str = 'x') -> Dict[str, Any]:
+    def turev_hesapla(self, fonksiyon_str: str, degisken: str = 'x', derlenmis: bool = False) -> Dict[str, Any]:
         """
         Fonksiyonun türevini hesaplar.
         
         Args:
             fonksiyon_str (str): Türevi alınacak fonksiyon
             degisken (str): Türev değişkeni (varsayılan: x)
+            derlenmis (bool): True ise sonuca türevin NumPy dizileri üzerinde
+                çalışan derlenmiş fonksiyonu ("turev_fonksiyonu") eklenir
         
         Returns:
             Dict: Türev hesaplama sonuçları
         """
         try:
             adimlar = []
-            adimlar.append(f"Verilen fonksiyon: f({degisken}) = {fonksiyon_str}")
-            
-            # Fonksiyonu temizle ve sympy formatına çevir
-            fonksiyon_temiz = self._fonksiyon_temizle(fonksiyon_str)
-            adimlar.append(f"Temizlenmiş fonksiyon: {fonksiyon_temiz}")
-            
-            # Sympy ifadesi oluştur
-            if degisken == 'x':
-                var = self.x
-            elif degisken == 't':
-                var = self.t
-            else:
-                var = sp.Symbol(degisken)
+            if self.adimli:
+                adimlar.append(f"Verilen fonksiyon: f({degisken}) = {fonksiyon_str}")
             
+            # Fonksiyonu temizle ve sympy formatına çevir (önbellekli)
             try:
-                fonksiyon = sp.sympify(fonksiyon_temiz)
-                adimlar.append(f"SymPy ifadesi: {fonksiyon}")
+                fonksiyon_temiz, fonksiyon = self._fonksiyon_ayristir(fonksiyon_str)
             except Exception as e:
+                if self.adimli:
+                    adimlar.append(f"Temizlenmiş fonksiyon: {self._fonksiyon_temizle(fonksiyon_str)}")
                 return {
                     "basarili": False,
                     "hata": f"Fonksiyon ayrıştırılamadı: {str(e)}",
                     "adimlar": adimlar
                 }
+            if self.adimli:
+                adimlar.append(f"Temizlenmiş fonksiyon: {fonksiyon_temiz}")
+                adimlar.append(f"SymPy ifadesi: {fonksiyon}")
             
-            # Türev hesapla
-            turev = sp.diff(fonksiyon, var)
-            adimlar.append(f"Türev kuralları uygulanıyor...")
-            
-            # Türev kurallarını açıkla
-            self._turev_kurallari_acikla(fonksiyon, var, adimlar)
+            # Sympy ifadesi oluştur
+            if degisken == 'x':
+                var = self.x
+            elif degisken == 't':
+                var = self.t
+            else:
+                var = sp.Symbol(degisken)
             
-            adimlar.append(f"f'({degisken}) = {turev}")
+            # Türev hesapla ve basitleştir (aynı yapıdaki fonksiyonlar için önbellekli,
+            # kalıcı depo açıksa süreçler arasında da saklanır)
+            turev, turev_basit, sadelestirme = self._turev_ve_basit_hali(fonksiyon, var)
             
-            # Basitleştir
-            turev_basit = sp.simplify(turev)
-            if turev != turev_basit:
-                adimlar.append(f"Basitleştirilmiş: f'({degisken}) = {turev_basit}")
+            if self.adimli:
+                adimlar.append(f"Türev kuralları uygulanıyor...")
+                
+                # Türev kurallarını açıkla
+                self._turev_kurallari_acikla(fonksiyon, var, adimlar)
+                
+                adimlar.append(f"f'({degisken}) = {turev}")
+                if turev != turev_basit:
+                    adimlar.append(f"Basitleştirilmiş: f'({degisken}) = {turev_basit}")
             
             # Sonuçları daha okunabilir hale getir
-            turev_okunabilir = self._matematik_sembolleri_donustur(str(turev))
-            turev_basit_okunabilir = self._matematik_sembolleri_donustur(str(turev_basit))
+            turev_okunabilir = okunabilir(turev)
+            turev_basit_okunabilir = okunabilir(turev_basit)
             
-            return {
+            sonuc = {
                 "basarili": True,
                 "adimlar": adimlar,
                 "orijinal_fonksiyon": fonksiyon_str,
@@ -86,8 +267,12 @@ class AnalizCozucu:
                 "sympy_fonksiyon": str(fonksiyon),
                 "turev": turev_okunabilir,
                 "turev_basit": turev_basit_okunabilir,
+                "sadelestirme": sadelestirme,
                 "degisken": degisken
             }
+            if derlenmis:
+                sonuc["turev_fonksiyonu"] = derle(turev_basit, var)
+            return sonuc
             
         except Exception as e:
             return {
@@ -97,7 +282,8 @@ class AnalizCozucu:
             }
     
     def integral_hesapla(self, fonksiyon_str: str, degisken: str = 'x', belirli: bool = False, 
-                        alt_sinir: Optional[float] = None, ust_sinir: Optional[float] = None) -> Dict[str, Any]:
+                        alt_sinir: Optional[float] = None, ust_sinir: Optional[float] = None,
+                        derlenmis: bool = False) -> Dict[str, Any]:
         """
         Fonksiyonun integralini hesaplar.
         
@@ -107,6 +293,8 @@ class AnalizCozucu:
             belirli (bool): Belirli integral mi?
             alt_sinir (float): Alt sınır (belirli integral için)
             ust_sinir (float): Üst sınır (belirli integral için)
+            derlenmis (bool): True ise sonuca ilkel fonksiyonun NumPy dizileri
+                üzerinde çalışan derlenmiş hali ("integral_fonksiyonu") eklenir
         
         Returns:
             Dict: İntegral hesaplama sonuçları
@@ -121,14 +309,26 @@ class AnalizCozucu:
                     "adimlar": []
                 }
             
-            if belirli:
-                adimlar.append(f"Belirli integral: ∫[{alt_sinir}→{ust_sinir}] {fonksiyon_str} d{degisken}")
-            else:
-                adimlar.append(f"Belirsiz integral: ∫ {fonksiyon_str} d{degisken}")
+            if self.adimli:
+                if belirli:
+                    adimlar.append(f"Belirli integral: ∫[{alt_sinir}→{ust_sinir}] {fonksiyon_str} d{degisken}")
+                else:
+                    adimlar.append(f"Belirsiz integral: ∫ {fonksiyon_str} d{degisken}")
             
-            # Fonksiyonu temizle ve sympy formatına çevir
-            fonksiyon_temiz = self._fonksiyon_temizle(fonksiyon_str)
-            adimlar.append(f"Temizlenmiş fonksiyon: {fonksiyon_temiz}")
+            # Fonksiyonu temizle ve sympy formatına çevir (önbellekli)
+            try:
+                fonksiyon_temiz, fonksiyon = self._fonksiyon_ayristir(fonksiyon_str)
+            except Exception as e:
+                if self.adimli:
+                    adimlar.append(f"Temizlenmiş fonksiyon: {self._fonksiyon_temizle(fonksiyon_str)}")
+                return {
+                    "basarili": False,
+                    "hata": f"Fonksiyon ayrıştırılamadı: {str(e)}",
+                    "adimlar": adimlar
+                }
+            if self.adimli:
+                adimlar.append(f"Temizlenmiş fonksiyon: {fonksiyon_temiz}")
+                adimlar.append(f"SymPy ifadesi: {fonksiyon}")
             
             # Sympy ifadesi oluştur
             if degisken == 'x':
@@ -138,38 +338,75 @@ class AnalizCozucu:
             else:
                 var = sp.Symbol(degisken)
             
-            try:
-                fonksiyon = sp.sympify(fonksiyon_temiz)
-                adimlar.append(f"SymPy ifadesi: {fonksiyon}")
-            except Exception as e:
-                return {
-                    "basarili": False,
-                    "hata": f"Fonksiyon ayrıştırılamadı: {str(e)}",
-                    "adimlar": adimlar
-                }
-            
             # İntegral hesapla
             if belirli:
-                integral = sp.integrate(fonksiyon, (var, alt_sinir, ust_sinir))
-                adimlar.append(f"Belirli integral hesaplanıyor: ∫[{alt_sinir}→{ust_sinir}] {fonksiyon} d{degisken}")
-                
-                # Önce belirsiz integrali bul
-                belirsiz_integral = sp.integrate(fonksiyon, var)
-                adimlar.append(f"Önce belirsiz integral: ∫ {fonksiyon} d{degisken} = {belirsiz_integral}")
+                # Belirsiz integral bir kez alınır (kurallarla bulunabiliyorsa burada),
+                # sınırlarda değerlendirilir (süre sınırlı; kalıcı depo açıksa saklanır)
+                kural_integrali = kurallarla_integral(fonksiyon, var)
+                try:
+                    integral, belirsiz_integral = kalici_hesapla(
+                        "belirli_integral", sp.Tuple(fonksiyon, var, alt_sinir, ust_sinir),
+                        lambda: sure_sinirli_calistir(self._belirli_integral_hesapla, fonksiyon, var,
+                                                      alt_sinir, ust_sinir, kural_integrali,
+                                                      sure=self.sure_siniri))
+                except SureAsimi:
+                    integral = belirsiz_integral = None
                 
-                # Sınırları uygula
-                adimlar.append(f"Sınırlar uygulanıyor: [{belirsiz_integral}]_{alt_sinir}^{ust_sinir}")
-                adimlar.append(f"= ({belirsiz_integral})|_{degisken}={ust_sinir} - ({belirsiz_integral})|_{degisken}={alt_sinir}")
+                # Kapalı biçim bulunamadıysa veya süre dolduysa sayısal integrale geç
+                if integral is None or integral.has(sp.Integral):
+                    sayisal = self._sayisal_integral(fonksiyon, var, alt_sinir, ust_sinir)
+                    if self.adimli:
+                        if integral is None:
+                            adimlar.append(f"Sembolik integral {self.sure_siniri:g} saniyede bulunamadı, sayısal integrale geçildi")
+                        else:
+                            adimlar.append("Kapalı biçimde integral bulunamadı, sayısal integrale geçildi")
+                        adimlar.extend(sayisal["adimlar"])
+                    if belirsiz_integral is None:
+                        belirsiz_integral = sp.Integral(fonksiyon, var)
+                    
+                    if not sayisal["basarili"]:
+                        return {
+                            "basarili": False,
+                            "hata": sayisal["hata"],
+                            "adimlar": adimlar
+                        }
+                    
+                    return {
+                        "basarili": True,
+                        "adimlar": adimlar,
+                        "orijinal_fonksiyon": fonksiyon_str,
+                        "temizlenmis_fonksiyon": fonksiyon_temiz,
+                        "sympy_fonksiyon": str(fonksiyon),
+                        "integral_turu": "belirli",
+                        "belirsiz_integral": str(belirsiz_integral),
+                        "integral": str(sayisal["sayisal_deger"]),
+                        "sayisal_deger": sayisal["sayisal_deger"],
+                        "yontem": sayisal["yontem"],
+                        "hata_siniri": sayisal["hata_siniri"],
+                        "alt_sinir": alt_sinir,
+                        "ust_sinir": ust_sinir,
+                        "degisken": degisken
+                    }
                 
                 # Sayısal değeri hesapla
                 try:
                     sayisal_deger = float(integral.evalf())
-                    adimlar.append(f"= {integral} = {sayisal_deger:.6f}")
                 except:
                     sayisal_deger = None
-                    adimlar.append(f"= {integral}")
                 
-                return {
+                if self.adimli:
+                    adimlar.append(f"Belirli integral hesaplanıyor: ∫[{alt_sinir}→{ust_sinir}] {fonksiyon} d{degisken}")
+                    adimlar.append(f"Önce belirsiz integral: ∫ {fonksiyon} d{degisken} = {belirsiz_integral}")
+                    
+                    # Sınırları uygula
+                    adimlar.append(f"Sınırlar uygulanıyor: [{belirsiz_integral}]_{alt_sinir}^{ust_sinir}")
+                    adimlar.append(f"= ({belirsiz_integral})|_{degisken}={ust_sinir} - ({belirsiz_integral})|_{degisken}={alt_sinir}")
+                    if sayisal_deger is not None:
+                        adimlar.append(f"= {integral} = {sayisal_deger:.6f}")
+                    else:
+                        adimlar.append(f"= {integral}")
+                
+                sonuc = {
                     "basarili": True,
                     "adimlar": adimlar,
                     "orijinal_fonksiyon": fonksiyon_str,
@@ -179,55 +416,61 @@ class AnalizCozucu:
                     "belirsiz_integral": str(belirsiz_integral),
                     "integral": str(integral),
                     "sayisal_deger": sayisal_deger,
+                    "yontem": "sembolik",
+                    "hata_siniri": 0.0 if sayisal_deger is not None else None,
                     "alt_sinir": alt_sinir,
                     "ust_sinir": ust_sinir,
                     "degisken": degisken
                 }
+                if derlenmis:
+                    sonuc["integral_fonksiyonu"] = derle(belirsiz_integral, var)
+                return sonuc
             
             else:
-                integral = sp.integrate(fonksiyon, var)
-                adimlar.append(f"İntegral kuralları uygulanıyor...")
-                
-                # İntegral kurallarını açıkla
-                self._integral_kurallari_acikla(fonksiyon, var, adimlar)
+                # İntegral al ve basitleştir (kalıcı depo açıksa saklanır)
+                integral, integral_basit, sadelestirme = self._integral_ve_basit_hali(fonksiyon, var)
                 
-                # Karmaşık integraller için açıklama ekle
-                integral_str = str(integral)
-                if any(term in integral_str.lower() for term in ['fresnels', 'fresnelc', 'gamma', 'erf', 'ei', 'li']):
-                    adimlar.append("Bu integral karmaşık özel fonksiyonlar içerir:")
+                if self.adimli:
+                    adimlar.append(f"İntegral kuralları uygulanıyor...")
                     
-                    if 'fresnels' in integral_str.lower():
-                        adimlar.append("• Fresnel S(x) fonksiyonu: ∫₀ˣ sin(πt²/2) dt integrali")
-                        adimlar.append("• Bu fonksiyon optik ve difraksiyon problemlerinde kullanılır")
-                        adimlar.append("• Notasyon: S(x) = Fresnel sinüs integrali")
+                    # İntegral kurallarını açıkla
+                    self._integral_kurallari_acikla(fonksiyon, var, adimlar)
                     
-                    if 'fresnelc' in integral_str.lower():
-                        adimlar.append("• Fresnel C(x) fonksiyonu: ∫₀ˣ cos(πt²/2) dt integrali")
-                        adimlar.append("• Notasyon: C(x) = Fresnel kosinüs integrali")
+                    # Karmaşık integraller için açıklama ekle
+                    integral_str = str(integral)
+                    if any(term in integral_str.lower() for term in ['fresnels', 'fresnelc', 'gamma', 'erf', 'ei', 'li']):
+                        adimlar.append("Bu integral karmaşık özel fonksiyonlar içerir:")
+                        
+                        if 'fresnels' in integral_str.lower():
+                            adimlar.append("• Fresnel S(x) fonksiyonu: ∫₀ˣ sin(πt²/2) dt integrali")
+                            adimlar.append("• Bu fonksiyon optik ve difraksiyon problemlerinde kullanılır")
+                            adimlar.append("• Notasyon: S(x) = Fresnel sinüs integrali")
+                        
+                        if 'fresnelc' in integral_str.lower():
+                            adimlar.append("• Fresnel C(x) fonksiyonu: ∫₀ˣ cos(πt²/2) dt integrali")
+                            adimlar.append("• Notasyon: C(x) = Fresnel kosinüs integrali")
+                        
+                        if 'gamma' in integral_str.lower():
+                            adimlar.append("• Gamma fonksiyonu: faktöriyelin genelleştirilmiş hali")
+                            adimlar.append("• Γ(n) = (n-1)! (pozitif tam sayılar için)")
+                        
+                        if 'erf' in integral_str.lower():
+                            adimlar.append("• Hata fonksiyonu: ∫e^(-t²)dt integrali")
+                            adimlar.append("• İstatistik ve olasılık hesaplamalarında kullanılır")
+                        
+                        adimlar.append("Bu integral basit cebirsel fonksiyonlarla ifade edilemez.")
+                        adimlar.append("Sayısal hesaplama veya özel fonksiyon tabloları gerekir.")
                     
-                    if 'gamma' in integral_str.lower():
-                        adimlar.append("• Gamma fonksiyonu: faktöriyelin genelleştirilmiş hali")
-                        adimlar.append("• Γ(n) = (n-1)! (pozitif tam sayılar için)")
+                    adimlar.append(f"∫ {fonksiyon} d{degisken} = {integral} + C")
                     
-                    if 'erf' in integral_str.lower():
-                        adimlar.append("• Hata fonksiyonu: ∫e^(-t²)dt integrali")
-                        adimlar.append("• İstatistik ve olasılık hesaplamalarında kullanılır")
-                    
-                    adimlar.append("Bu integral basit cebirsel fonksiyonlarla ifade edilemez.")
-                    adimlar.append("Sayısal hesaplama veya özel fonksiyon tabloları gerekir.")
-                
-                adimlar.append(f"∫ {fonksiyon} d{degisken} = {integral} + C")
-                
-                # Basitleştir
-                integral_basit = sp.simplify(integral)
-                if integral != integral_basit:
-                    adimlar.append(f"Basitleştirilmiş: ∫ {fonksiyon} d{degisken} = {integral_basit} + C")
+                    if integral != integral_basit:
+                        adimlar.append(f"Basitleştirilmiş: ∫ {fonksiyon} d{degisken} = {integral_basit} + C")
                 
                 # Sonuçları daha okunabilir hale getir
-                integral_okunabilir = self._matematik_sembolleri_donustur(str(integral))
-                integral_basit_okunabilir = self._matematik_sembolleri_donustur(str(integral_basit))
+                integral_okunabilir = okunabilir(integral)
+                integral_basit_okunabilir = okunabilir(integral_basit)
                 
-                return {
+                sonuc = {
                     "basarili": True,
                     "adimlar": adimlar,
                     "orijinal_fonksiyon": fonksiyon_str,
@@ -236,9 +479,13 @@ class AnalizCozucu:
                     "integral_turu": "belirsiz",
                     "integral": integral_okunabilir,
                     "integral_basit": integral_basit_okunabilir,
+                    "sadelestirme": sadelestirme,
                     "degisken": degisken,
                     "karmasik_integral": any(term in str(integral).lower() for term in ['fresnels', 'fresnelc', 'gamma', 'erf', 'ei', 'li'])
                 }
+                if derlenmis:
+                    sonuc["integral_fonksiyonu"] = derle(integral_basit, var)
+                return sonuc
             
         except Exception as e:
             return {
@@ -283,16 +530,17 @@ class AnalizCozucu:
             if islem == "turev":
                 if fonksiyon in trig_turevler:
                     sonuc = trig_turevler[fonksiyon]
-                    adimlar.append(f"Trigonometrik türev kuralı:")
-                    adimlar.append(f"d/dx[{fonksiyon}] = {sonuc}")
-                    
-                    # Açıklama ekle
-                    if fonksiyon == "sin(x)":
-                        adimlar.append("Sinüs fonksiyonunun türevi kosinüstür")
-                    elif fonksiyon == "cos(x)":
-                        adimlar.append("Kosinüs fonksiyonunun türevi negatif sinüstür")
-                    elif fonksiyon == "tan(x)":
-                        adimlar.append("Tanjant fonksiyonunun türevi sekant karesine eşittir")
+                    if self.adimli:
+                        adimlar.append(f"Trigonometrik türev kuralı:")
+                        adimlar.append(f"d/dx[{fonksiyon}] = {sonuc}")
+                        
+                        # Açıklama ekle
+                        if fonksiyon == "sin(x)":
+                            adimlar.append("Sinüs fonksiyonunun türevi kosinüstür")
+                        elif fonksiyon == "cos(x)":
+                            adimlar.append("Kosinüs fonksiyonunun türevi negatif sinüstür")
+                        elif fonksiyon == "tan(x)":
+                            adimlar.append("Tanjant fonksiyonunun türevi sekant karesine eşittir")
                     
                     return {
                         "basarili": True,
@@ -308,16 +556,17 @@ class AnalizCozucu:
             elif islem == "integral":
                 if fonksiyon in trig_integraller:
                     sonuc = trig_integraller[fonksiyon]
-                    adimlar.append(f"Trigonometrik integral kuralı:")
-                    adimlar.append(f"∫ {fonksiyon} dx = {sonuc} + C")
-                    
-                    # Açıklama ekle
-                    if fonksiyon == "sin(x)":
-                        adimlar.append("Sinüs fonksiyonunun integrali negatif kosinüstür")
-                    elif fonksiyon == "cos(x)":
-                        adimlar.append("Kosinüs fonksiyonunun integrali sinüstür")
-                    elif fonksiyon == "tan(x)":
-                        adimlar.append("Tanjant fonksiyonunun integrali -ln|cos(x)|'tır")
+                    if self.adimli:
+                        adimlar.append(f"Trigonometrik integral kuralı:")
+                        adimlar.append(f"∫ {fonksiyon} dx = {sonuc} + C")
+                        
+                        # Açıklama ekle
+                        if fonksiyon == "sin(x)":
+                            adimlar.append("Sinüs fonksiyonunun integrali negatif kosinüstür")
+                        elif fonksiyon == "cos(x)":
+                            adimlar.append("Kosinüs fonksiyonunun integrali sinüstür")
+                        elif fonksiyon == "tan(x)":
+                            adimlar.append("Tanjant fonksiyonunun integrali -ln|cos(x)|'tır")
                     
                     return {
                         "basarili": True,
@@ -344,120 +593,1854 @@ class AnalizCozucu:
                 "adimlar": []
             }
     
-    def _fonksiyon_temizle(self, fonksiyon_str: str) -> str:
-        """Fonksiyon string'ini SymPy için temizler"""
-        fonksiyon_temiz = fonksiyon_str.lower().strip()
-        
-        # Türkçe fonksiyon isimlerini çevir
-        donusumler = {
-            "sinüs": "sin",
-            "kosinüs": "cos", 
-            "tanjant": "tan",
-            "kotanjant": "cot",
-            "sekant": "sec",
-            "kosekant": "csc",
-            "ln": "log",
-            "üs": "**",
-            "^": "**"
-        }
+    def limit_hesapla(self, fonksiyon_str: str, nokta, degisken: str = 'x', yon: str = "+-") -> Dict[str, Any]:
+        """
+        Fonksiyonun verilen noktadaki limitini hesaplar.
+        
+        Önce ucuz kurallar denenir (doğrudan yerine koyma, rasyonel
+        fonksiyonlarda sadeleştirme ve derece karşılaştırması), sonra süre
+        sınırıyla sp.limit. İkisi de sonuç vermezse noktaya yaklaşan bir
+        dizi üzerinde Richardson ekstrapolasyonu ile sayısal tahmin yapılır.
+        
+        Args:
+            fonksiyon_str (str): Limiti alınacak fonksiyon
+            nokta: Yaklaşılan nokta (sayı, "pi", "oo", "∞", "-sonsuz" gibi)
+            degisken (str): Değişken (varsayılan: x)
+            yon (str): "+" sağdan, "-" soldan, "+-" iki yönlü
+        
+        Returns:
+            Dict: Limit hesaplama sonuçları
+        """
+        try:
+            if yon not in ("+", "-", "+-"):
+                return {
+                    "basarili": False,
+                    "hata": f"Geçersiz yön: {yon} ('+', '-' veya '+-' olmalı)",
+                    "adimlar": []
+                }
+            
+            adimlar = []
+            try:
+                fonksiyon_temiz, fonksiyon = self._fonksiyon_ayristir(fonksiyon_str)
+                nokta_ifade = self._limit_noktasi_ayristir(nokta)
+            except Exception as e:
+                return {
+                    "basarili": False,
+                    "hata": f"Fonksiyon veya nokta ayrıştırılamadı: {str(e)}",
+                    "adimlar": []
+                }
+            
+            if degisken == 'x':
+                var = self.x
+            elif degisken == 't':
+                var = self.t
+            else:
+                var = sp.Symbol(degisken)
+            
+            # Sonsuzda yön anlamsızdır; sonsuza hep içeriden yaklaşılır
+            if nokta_ifade.is_infinite:
+                yon = "-" if nokta_ifade is sp.oo else "+"
+            yon_metni = "" if nokta_ifade.is_infinite else {"+": "⁺", "-": "⁻", "+-": ""}[yon]
+            
+            if self.adimli:
+                adimlar.append(f"lim({degisken}→{nokta_ifade}{yon_metni}) {fonksiyon}")
+            
+            sonuc = self._limit_kurallari(fonksiyon, var, nokta_ifade, yon, adimlar)
+            if sonuc is None:
+                sonuc = self._limit_sembolik(fonksiyon, var, nokta_ifade, yon, adimlar)
+            if sonuc is None:
+                sonuc = self._limit_sayisal(fonksiyon, var, nokta_ifade, yon, adimlar)
+            
+            sonuc.update({
+                "basarili": True,
+                "adimlar": adimlar,
+                "orijinal_fonksiyon": fonksiyon_str,
+                "temizlenmis_fonksiyon": fonksiyon_temiz,
+                "sympy_fonksiyon": str(fonksiyon),
+                "nokta": str(nokta_ifade),
+                "yon": yon,
+                "degisken": degisken
+            })
+            return sonuc
+            
+        except Exception as e:
+            return {
+                "basarili": False,
+                "hata": f"Limit hesaplaması sırasında hata: {str(e)}",
+                "adimlar": []
+            }
+    
+    def sayisal_integral_hesapla(self, fonksiyon_str: str, alt_sinir: float, ust_sinir: float,
+                                 degisken: str = 'x') -> Dict[str, Any]:
+        """
+        Belirli integrali sembolik integral almadan sayısal olarak hesaplar.
+        
+        Args:
+            fonksiyon_str (str): İntegrali alınacak fonksiyon
+            alt_sinir (float): Alt sınır (-oo olabilir)
+            ust_sinir (float): Üst sınır (oo olabilir)
+            degisken (str): İntegral değişkeni (varsayılan: x)
         
-        for tr_kelime, en_kelime in donusumler.items():
-            fonksiyon_temiz = fonksiyon_temiz.replace(tr_kelime, en_kelime)
+        Returns:
+            Dict: Sayısal değer, hata sınırı ve kullanılan yöntem
+        """
+        try:
+            _, fonksiyon = self._fonksiyon_ayristir(fonksiyon_str)
+            
+            if degisken == 'x':
+                var = self.x
+            elif degisken == 't':
+                var = self.t
+            else:
+                var = sp.Symbol(degisken)
+            
+            sonuc = self._sayisal_integral(fonksiyon, var, alt_sinir, ust_sinir)
+            if sonuc["basarili"]:
+                sonuc.update({
+                    "orijinal_fonksiyon": fonksiyon_str,
+                    "sympy_fonksiyon": str(fonksiyon),
+                    "integral_turu": "belirli",
+                    "alt_sinir": alt_sinir,
+                    "ust_sinir": ust_sinir,
+                    "degisken": degisken
+                })
+            return sonuc
+            
+        except Exception as e:
+            return {
+                "basarili": False,
+                "hata": f"Sayısal integral hesaplaması sırasında hata: {str(e)}",
+                "adimlar": []
+            }
+    
+    def kismi_turev_hesapla(self, fonksiyon_str: str, turev_degiskenleri,
+                            derlenmis: bool = False) -> Dict[str, Any]:
+        """
+        Kısmi (ve yüksek mertebeden) türev hesaplar.
         
-        # Matematiksel ifadeleri düzelt
-        fonksiyon_temiz = re.sub(r'(\d)([a-z])', r'\1*\2', fonksiyon_temiz)  # 2x -> 2*x
-        fonksiyon_temiz = fonksiyon_temiz.replace("²", "**2")
-        fonksiyon_temiz = fonksiyon_temiz.replace("³", "**3")
+        Args:
+            fonksiyon_str (str): Türevi alınacak fonksiyon (örn: "x**2*y + sin(x*y)")
+            turev_degiskenleri (str veya List[str]): Sırasıyla türev alınacak
+                değişkenler; "x,y" ∂²f/∂x∂y, "x,x,x" ∂³f/∂x³ anlamına gelir
+            derlenmis (bool): True ise sonuca NumPy üzerinde çalışan
+                derlenmiş fonksiyon ("degerlendirici") eklenir
         
-        return fonksiyon_temiz
+        Returns:
+            Dict: Kısmi türev sonuçları
+        """
+        try:
+            _, fonksiyon = self._fonksiyon_ayristir(fonksiyon_str)
+            if isinstance(turev_degiskenleri, str):
+                turev_degiskenleri = turev_degiskenleri.split(",")
+            turev_degiskenleri = [sp.Symbol(d.strip()) for d in turev_degiskenleri]
+            if not turev_degiskenleri:
+                return {
+                    "basarili": False,
+                    "hata": "En az bir türev değişkeni gerekli",
+                    "adimlar": []
+                }
+            
+            turev = sp.diff(fonksiyon, *turev_degiskenleri)
+            mertebe = len(turev_degiskenleri)
+            payda = "".join(f"∂{d}" for d in turev_degiskenleri)
+            pay = "∂" if mertebe == 1 else f"∂{self._ust_simge(mertebe)}"
+            
+            adimlar = []
+            if self.adimli:
+                adimlar.append(f"Verilen fonksiyon: f = {fonksiyon}")
+                ara = fonksiyon
+                for d in turev_degiskenleri:
+                    ara = sp.diff(ara, d)
+                    adimlar.append(f"∂/∂{d} uygulanıyor: {ara}")
+            
+            degiskenler = self._serbest_degiskenler([fonksiyon])
+            sonuc = {
+                "basarili": True,
+                "adimlar": adimlar,
+                "orijinal_fonksiyon": fonksiyon_str,
+                "sympy_fonksiyon": str(fonksiyon),
+                "gosterim": f"{pay}f/{payda}",
+                "mertebe": mertebe,
+                "kismi_turev": okunabilir(turev),
+                "degiskenler": [str(d) for d in degiskenler]
+            }
+            if derlenmis:
+                sonuc["degerlendirici"] = toplu_derle([turev], degiskenler, ())
+            return sonuc
+            
+        except Exception as e:
+            return {
+                "basarili": False,
+                "hata": f"Kısmi türev hesaplaması sırasında hata: {str(e)}",
+                "adimlar": []
+            }
     
-    def _turev_kurallari_acikla(self, fonksiyon, var, adimlar):
-        """Türev kurallarını açıklar"""
-        if isinstance(fonksiyon, sp.Add):
-            adimlar.append("Toplam kuralı: (f + g)' = f' + g'")
-        elif isinstance(fonksiyon, sp.Mul):
-            adimlar.append("Çarpım kuralı: (fg)' = f'g + fg'")
-        elif isinstance(fonksiyon, sp.Pow):
-            adimlar.append("Kuvvet kuralı: (x^n)' = n*x^(n-1)")
-        elif isinstance(fonksiyon, (sp.sin, sp.cos, sp.tan)):
-            adimlar.append("Trigonometrik türev kuralları uygulanıyor")
+    def gradyan_hesapla(self, fonksiyon_str: str, degiskenler=None, derlenmis: bool = False) -> Dict[str, Any]:
+        """
+        Skaler fonksiyonun gradyanını (∇f) hesaplar.
+        
+        Args:
+            fonksiyon_str (str): Fonksiyon
+            degiskenler (str veya List[str]): Değişken sırası ("x,y,z");
+                verilmezse fonksiyondaki değişkenler alfabetik sırayla alınır
+            derlenmis (bool): True ise tüm bileşenleri tek seferde hesaplayan
+                derlenmiş fonksiyon ("degerlendirici") eklenir
+        
+        Returns:
+            Dict: Gradyan sonuçları
+        """
+        return self._turev_matrisi_hesapla("gradyan", [fonksiyon_str], degiskenler, derlenmis)
     
-    def _integral_kurallari_acikla(self, fonksiyon, var, adimlar):
-        """İntegral kurallarını açıklar"""
-        if isinstance(fonksiyon, sp.Add):
-            adimlar.append("Toplam kuralı: ∫(f + g)dx = ∫f dx + ∫g dx")
-        elif isinstance(fonksiyon, sp.Mul):
-            adimlar.append("Sabit çarpan kuralı: ∫c·f dx = c·∫f dx")
-        elif isinstance(fonksiyon, sp.Pow):
-            adimlar.append("Kuvvet kuralı: ∫x^n dx = x^(n+1)/(n+1) + C")
-        elif isinstance(fonksiyon, (sp.sin, sp.cos, sp.tan)):
-            adimlar.append("Trigonometrik integral kuralları uygulanıyor")
+    def jakobiyen_hesapla(self, fonksiyonlar, degiskenler=None, derlenmis: bool = False) -> Dict[str, Any]:
+        """
+        Vektör değerli fonksiyonun Jacobian matrisini hesaplar.
+        
+        Args:
+            fonksiyonlar (str veya List[str]): Bileşenler; metin olarak
+                verilirse ";" veya satır sonuyla ayrılır
+            degiskenler (str veya List[str]): Değişken sırası
+            derlenmis (bool): True ise matrisin tamamını tek seferde hesaplayan
+                derlenmiş fonksiyon ("degerlendirici") eklenir
+        
+        Returns:
+            Dict: Jacobian sonuçları
+        """
+        if isinstance(fonksiyonlar, str):
+            fonksiyonlar = [f for f in re.split(r"[;\n]", fonksiyonlar) if f.strip()]
+        return self._turev_matrisi_hesapla("jakobiyen", list(fonksiyonlar), degiskenler, derlenmis)
     
-    def _matematik_sembolleri_donustur(self, metin: str) -> str:
-        """Matematik ifadelerini daha okunabilir sembollerle değiştirir"""
-        # sqrt yerine karekök sembolü
-        import re
-        
-        # sqrt(x) -> √x formatına çevir
-        metin = re.sub(r'sqrt\(([^)]+)\)', r'√(\1)', metin)
-        
-        # Fresnel fonksiyonları için özel gösterim
-        metin = re.sub(r'fresnels\(([^)]+)\)', r'S(\1)', metin)  # Fresnel S
-        metin = re.sub(r'fresnelc\(([^)]+)\)', r'C(\1)', metin)  # Fresnel C
-        
-        # Diğer özel fonksiyonlar
-        metin = re.sub(r'erf\(([^)]+)\)', r'erf(\1)', metin)      # Hata fonksiyonu (zaten kısa)
-        metin = re.sub(r'erfc\(([^)]+)\)', r'erfc(\1)', metin)    # Tamamlayıcı hata fonksiyonu
-        metin = re.sub(r'elliptic_f\(([^,]+),([^)]+)\)', r'F(\1|\2)', metin)  # Eliptik integral
-        metin = re.sub(r'elliptic_e\(([^,]+),([^)]+)\)', r'E(\1|\2)', metin)  # Eliptik integral
-        
-        # Diğer matematik sembolleri
-        donusumler = {
-            'pi': 'π',
-            'Pi': 'π', 
-            'infinity': '∞',
-            'alpha': 'α',
-            'beta': 'β',
-            'gamma': 'γ',
-            'Gamma': 'Γ',
-            'delta': 'δ',
-            'Delta': 'Δ',
-            'theta': 'θ',
-            'Theta': 'Θ',
-            'lambda': 'λ',
-            'mu': 'μ',
-            'sigma': 'σ',
-            'Sigma': 'Σ',
-            'phi': 'φ',
-            'Phi': 'Φ',
-            'omega': 'ω',
-            'Omega': 'Ω'
-        }
+    def hessian_hesapla(self, fonksiyon_str: str, degiskenler=None, derlenmis: bool = False) -> Dict[str, Any]:
+        """
+        Skaler fonksiyonun Hessian (ikinci kısmi türevler) matrisini hesaplar.
         
-        # Kelime sınırlarında değiştir (başka kelimelerin içindeki harfleri etkilemesin)
-        for eski, yeni in donusumler.items():
-            metin = re.sub(r'\b' + re.escape(eski) + r'\b', yeni, metin)
+        Args:
+            fonksiyon_str (str): Fonksiyon
+            degiskenler (str veya List[str]): Değişken sırası
+            derlenmis (bool): True ise matrisin tamamını tek seferde hesaplayan
+                derlenmiş fonksiyon ("degerlendirici") eklenir
         
-        return metin
-
-
-# Global fonksiyonlar
-def turev_hesapla(fonksiyon: str, degisken: str = 'x') -> Dict[str, Any]:
-    """Fonksiyonun türevini hesaplar"""
-    cozucu = AnalizCozucu()
-    return cozucu.turev_hesapla(fonksiyon, degisken)
-
-
-def integral_hesapla(fonksiyon: str, degisken: str = 'x', belirli: bool = False,
-                    alt_sinir: Optional[float] = None, ust_sinir: Optional[float] = None) -> Dict[str, Any]:
-    """Fonksiyonun integralini hesaplar"""
-    cozucu = AnalizCozucu()
-    return cozucu.integral_hesapla(fonksiyon, degisken, belirli, alt_sinir, ust_sinir)
+        Returns:
+            Dict: Hessian sonuçları
+        """
+        return self._turev_matrisi_hesapla("hessian", [fonksiyon_str], degiskenler, derlenmis)
+    
+    def sayisal_degerlendir(self, fonksiyon_str: str, degerler, islem: str = "fonksiyon",
+                            degisken: str = 'x') -> Dict[str, Any]:
+        """
+        Fonksiyonu, türevini veya ilkel fonksiyonunu dizi üzerinde değerlendirir.
+        
+        İfade bir kez derlenir; aynı fonksiyon ve işlem için sonraki
+        çağrılar derlenmiş fonksiyonu önbellekten kullanır.
+        
+        Args:
+            fonksiyon_str (str): Fonksiyon
+            degerler (array_like): Değerlendirme noktaları (skaler veya dizi)
+            islem (str): "fonksiyon", "turev" veya "integral"
+            degisken (str): Fonksiyonun değişkeni (varsayılan: x)
+        
+        Returns:
+            Dict: Değerlendirme sonuçları ("degerler" bir np.ndarray)
+        """
+        try:
+            if islem not in ("fonksiyon", "turev", "integral"):
+                return {
+                    "basarili": False,
+                    "hata": f"Bilinmeyen işlem: {islem}",
+                    "adimlar": []
+                }
+            
+            _, fonksiyon = self._fonksiyon_ayristir(fonksiyon_str)
+            
+            if degisken == 'x':
+                var = self.x
+            elif degisken == 't':
+                var = self.t
+            else:
+                var = sp.Symbol(degisken)
+            
+            def uret():
+                if islem == "turev":
+                    ifade = self._turev_ve_basit_hali(fonksiyon, var)[1]
+                elif islem == "integral":
+                    ifade = self._integral_ve_basit_hali(fonksiyon, var)[1]
+                else:
+                    ifade = fonksiyon
+                return ifade, derle(ifade, var)
+            
+            # Türev/integral ve derleme fonksiyon başına bir kez yapılır; sonuç
+            # sadeleştirme düzeyine ve süre sınırına bağlı olduğundan bunlar da anahtardadır
+            anahtar = ("analiz", islem, fonksiyon, var, self.sadelestirme, self.sadelestirme_suresi)
+            ifade, derlenmis_fonksiyon = derleme_onbellegi.al(anahtar, uret)
+            
+            with np.errstate(all="ignore"):
+                sonuc_degerleri = derlenmis_fonksiyon(np.asarray(degerler, dtype=float))
+            
+            adimlar = []
+            if self.adimli:
+                adimlar.append(f"Değerlendirilen ifade: {ifade}")
+                adimlar.append(f"Nokta sayısı: {np.size(degerler)}")
+            
+            return {
+                "basarili": True,
+                "adimlar": adimlar,
+                "islem": islem,
+                "ifade": str(ifade),
+                "degisken": degisken,
+                "degerler": sonuc_degerleri
+            }
+            
+        except Exception as e:
+            return {
+                "basarili": False,
+                "hata": f"Sayısal değerlendirme sırasında hata: {str(e)}",
+                "adimlar": []
+            }
+    
+    def turev_degeri_hesapla(self, fonksiyon_str: str, noktalar, degisken: str = 'x') -> Dict[str, Any]:
+        """
+        Türevin sayısal değerlerini ileri mod otomatik türevle hesaplar.
+        
+        Sembolik türev, sadeleştirme ve metin dönüşümü yapılmaz; yalnızca
+        f'(x0) değerleri gerektiğinde turev_hesapla'dan çok daha ucuzdur.
+        
+        Args:
+            fonksiyon_str (str): Fonksiyon
+            noktalar (array_like): Türevin istendiği noktalar (skaler veya dizi)
+            degisken (str): Türev değişkeni (varsayılan: x)
+        
+        Returns:
+            Dict: "degerler" f(noktalar), "turev_degerleri" f'(noktalar) (np.ndarray)
+        """
+        try:
+            _, fonksiyon = self._fonksiyon_ayristir(fonksiyon_str)
+            
+            if degisken == 'x':
+                var = self.x
+            elif degisken == 't':
+                var = self.t
+            else:
+                var = sp.Symbol(degisken)
+            
+            degerler, turev_degerleri = ileri_mod_turev(fonksiyon, var, noktalar)
+            
+            adimlar = []
+            if self.adimli:
+                adimlar.append(f"f({degisken}) = {fonksiyon}")
+                adimlar.append("Her düğüm (değer, türev) çiftini zincir kuralıyla taşır (ileri mod otomatik türev)")
+                adimlar.append(f"Nokta sayısı: {np.size(noktalar)}")
+            
+            return {
+                "basarili": True,
+                "adimlar": adimlar,
+                "sympy_fonksiyon": str(fonksiyon),
+                "degisken": degisken,
+                "yontem": "ileri_mod",
+                "degerler": degerler,
+                "turev_degerleri": turev_degerleri
+            }
+            
+        except Exception as e:
+            return {
+                "basarili": False,
+                "hata": f"Türev değeri hesaplaması sırasında hata: {str(e)}",
+                "adimlar": []
+            }
+    
+    def taylor_serisi(self, fonksiyon_str: str, nokta=0, mertebe: int = 5, degisken: str = 'x',
+                      degerler=None) -> Dict[str, Any]:
+        """
+        Fonksiyonun verilen nokta etrafındaki Taylor (nokta 0 ise Maclaurin) serisini hesaplar.
+        
+        Katsayılar (fonksiyon, nokta) başına önbelleklenir ve artımlı
+        hesaplanır: mertebe n'den n+k'ye çıkarıldığında ilk n katsayı
+        yeniden hesaplanmaz. Kalan, mertebenin ötesindeki sıfır olmayan
+        ilk terimle (|c_k|·|x-a|^k) tahmin edilir.
+        
+        Args:
+            fonksiyon_str (str): Seriye açılacak fonksiyon
+            nokta: Açılım noktası a (sayı veya "pi" gibi ifade; varsayılan: 0)
+            mertebe (int): Serinin son teriminin derecesi n
+            degisken (str): Değişken (varsayılan: x)
+            degerler (array_like): Verilirse kesilmiş seri bu noktalarda
+                Horner yöntemiyle NumPy üzerinde değerlendirilir
+        
+        Returns:
+            Dict: Seri, katsayılar, kalan tahmini ve (istenirse) değerler
+        """
+        try:
+            if int(mertebe) != mertebe or mertebe < 0:
+                return {
+                    "basarili": False,
+                    "hata": f"Mertebe negatif olmayan bir tam sayı olmalı: {mertebe}",
+                    "adimlar": []
+                }
+            mertebe = int(mertebe)
+            
+            try:
+                fonksiyon_temiz, fonksiyon = self._fonksiyon_ayristir(fonksiyon_str)
+                nokta_ifade = self._limit_noktasi_ayristir(nokta)
+            except Exception as e:
+                return {
+                    "basarili": False,
+                    "hata": f"Fonksiyon veya nokta ayrıştırılamadı: {str(e)}",
+                    "adimlar": []
+                }
+            if not nokta_ifade.is_finite:
+                return {
+                    "basarili": False,
+                    "hata": "Taylor serisi yalnızca sonlu bir nokta etrafında açılabilir",
+                    "adimlar": []
+                }
+            
+            if degisken == 'x':
+                var = self.x
+            elif degisken == 't':
+                var = self.t
+            else:
+                var = sp.Symbol(degisken)
+            
+            durum = taylor_onbellegi.al((fonksiyon, var, nokta_ifade),
+                                        lambda: _TaylorKatsayilari(fonksiyon, var, nokta_ifade))
+            katsayilar, sayisal = durum.al(mertebe + 1 + TAYLOR_KALAN_TERIMLERI)
+            
+            fark = var - nokta_ifade
+            seri = sp.Add(*[katsayilar[k] * fark**k for k in range(mertebe + 1)])
+            kalan_derecesi = next((k for k in range(mertebe + 1, len(katsayilar)) if katsayilar[k] != 0), None)
+            
+            adimlar = []
+            if self.adimli:
+                adimlar.append(f"f({degisken}) = {fonksiyon}, a = {nokta_ifade}")
+                adimlar.append(f"Katsayılar: c_k = f⁽ᵏ⁾(a)/k!, k = 0..{mertebe}")
+                for k in range(mertebe + 1):
+                    adimlar.append(f"c_{k} = {katsayilar[k]}")
+                if kalan_derecesi is not None:
+                    adimlar.append(f"Kalan ≈ {katsayilar[kalan_derecesi] * fark**kalan_derecesi}")
+            
+            sonuc = {
+                "basarili": True,
+                "adimlar": adimlar,
+                "orijinal_fonksiyon": fonksiyon_str,
+                "temizlenmis_fonksiyon": fonksiyon_temiz,
+                "sympy_fonksiyon": str(fonksiyon),
+                "nokta": str(nokta_ifade),
+                "mertebe": mertebe,
+                "degisken": degisken,
+                "seri": okunabilir(seri),
+                "katsayilar": [str(katsayi) for katsayi in katsayilar[:mertebe + 1]],
+                "kalan_terimi": (okunabilir(katsayilar[kalan_derecesi] * fark**kalan_derecesi)
+                                 if kalan_derecesi is not None else "0"),
+                "kalan_derecesi": kalan_derecesi
+            }
+            
+            if degerler is not None:
+                if sayisal is None:
+                    return {
+                        "basarili": False,
+                        "hata": f"Sayısal değerlendirme için fonksiyon yalnızca {degisken} değişkenine bağlı olmalı",
+                        "adimlar": []
+                    }
+                h = np.asarray(degerler, dtype=float) - float(nokta_ifade)
+                kalan = (np.abs(sayisal[kalan_derecesi]) * np.abs(h)**kalan_derecesi
+                         if kalan_derecesi is not None else np.zeros_like(h))
+                sonuc["degerler"] = horner_degerlendir(sayisal[:mertebe + 1], h)
+                sonuc["kalan_tahmini"] = kalan
+                sonuc["azami_kalan"] = float(np.max(kalan)) if np.size(kalan) else 0.0
+            return sonuc
+            
+        except Exception as e:
+            return {
+                "basarili": False,
+                "hata": f"Taylor serisi hesaplaması sırasında hata: {str(e)}",
+                "adimlar": []
+            }
+    
+    def kok_bul(self, denklemler, alt_sinir, ust_sinir, degisken: str = 'x',
+                parametre: Optional[str] = None, parametre_degerleri=None,
+                izgara_sayisi: int = KOK_IZGARA_SAYISI) -> Dict[str, Any]:
+        """
+        f(x) = 0 denklemlerinin verilen aralıktaki tüm gerçek köklerini sayısal olarak bulur.
+        
+        Fonksiyon bir ızgarada değerlendirilip işaret değiştiren aralıklar
+        bulunur; her aralık ikiye bölme güvenceli Newton yöntemiyle
+        iyileştirilir. Türevler ileri mod otomatik türevle hesaplanır ve
+        tüm aralıklar (tüm denklemler/parametre değerleri) birlikte
+        NumPy ile işlenir. İşaret değiştirmeyen (çift katlı) kökler
+        ancak bir ızgara noktasına denk gelirse bulunur.
+        
+        Args:
+            denklemler (str veya List[str]): Denklem(ler); "=" yoksa ifade sıfıra eşitlenir
+            alt_sinir: Aralığın alt sınırı (sayı veya "-pi" gibi ifade)
+            ust_sinir: Aralığın üst sınırı
+            degisken (str): Bilinmeyen (varsayılan: x)
+            parametre (str): Verilirse tek denklem bu parametrenin her değeri için çözülür
+            parametre_degerleri (array_like): Parametre değerleri
+            izgara_sayisi (int): İşaret değişimi aranan ızgaranın nokta sayısı
+        
+        Returns:
+            Dict: Kök matrisi (satır başına bir denklem, eksikler NaN), kök sayıları ve kök listeleri
+        """
+        try:
+            if isinstance(denklemler, str):
+                denklemler = [denklemler]
+            denklemler = list(denklemler)
+            if not denklemler:
+                return {
+                    "basarili": False,
+                    "hata": "En az bir denklem gerekli",
+                    "adimlar": []
+                }
+            if (parametre is None) != (parametre_degerleri is None):
+                return {
+                    "basarili": False,
+                    "hata": "Parametre adı ve değerleri birlikte verilmeli",
+                    "adimlar": []
+                }
+            if parametre is not None and len(denklemler) != 1:
+                return {
+                    "basarili": False,
+                    "hata": "Parametreli çözümde tek denklem verilmeli",
+                    "adimlar": []
+                }
+            
+            try:
+                ifadeler = []
+                for denklem in denklemler:
+                    sol, _, sag = denklem.partition("=")
+                    ifade = self._fonksiyon_ayristir(sol)[1]
+                    if sag.strip():
+                        ifade = ifade - self._fonksiyon_ayristir(sag)[1]
+                    ifadeler.append(ifade)
+                alt = self._limit_noktasi_ayristir(alt_sinir)
+                ust = self._limit_noktasi_ayristir(ust_sinir)
+            except Exception as e:
+                return {
+                    "basarili": False,
+                    "hata": f"Denklem veya sınırlar ayrıştırılamadı: {str(e)}",
+                    "adimlar": []
+                }
+            if not (alt.is_finite and ust.is_finite) or not alt < ust:
+                return {
+                    "basarili": False,
+                    "hata": "Sınırlar sonlu olmalı ve alt sınır üst sınırdan küçük olmalı",
+                    "adimlar": []
+                }
+            
+            if degisken == 'x':
+                var = self.x
+            elif degisken == 't':
+                var = self.t
+            else:
+                var = sp.Symbol(degisken)
+            
+            if parametre is not None:
+                ifade, p = ifadeler[0], sp.Symbol(parametre)
+                p_degerleri = np.atleast_1d(np.asarray(parametre_degerleri, dtype=float))
+                satir_sayisi = p_degerleri.size
+                
+                def hesapla(x, satirlar):
+                    return ileri_mod_turev(ifade, var, x, {p: p_degerleri[satirlar]})
+            else:
+                satir_sayisi = len(ifadeler)
+                
+                def hesapla(x, satirlar):
+                    x, satirlar = np.broadcast_arrays(x, satirlar)
+                    f, d = np.empty(x.shape), np.empty(x.shape)
+                    for i in np.unique(satirlar):
+                        secili = satirlar == i
+                        f[secili], d[secili] = ileri_mod_turev(ifadeler[i], var, x[secili])
+                    return f, d
+            
+            kokler, aralik_sayisi = toplu_kok_bul(hesapla, satir_sayisi, float(alt), float(ust), izgara_sayisi)
+            
+            kok_sayilari = np.array([k.size for k in kokler])
+            kok_matrisi = np.full((satir_sayisi, int(kok_sayilari.max(initial=0))), np.nan)
+            for i, k in enumerate(kokler):
+                kok_matrisi[i, :k.size] = k
+            
+            adimlar = []
+            if self.adimli:
+                adimlar.append(f"Aralık: [{alt}, {ust}], ızgara: {izgara_sayisi} nokta")
+                adimlar.append(f"İşaret değiştiren alt aralık sayısı: {aralik_sayisi}")
+                adimlar.append("Her alt aralık ikiye bölme güvenceli Newton yöntemiyle iyileştirildi "
+                               "(türevler ileri mod otomatik türevle)")
+                if satir_sayisi <= 10:
+                    for ifade, k in zip(ifadeler if parametre is None else [ifadeler[0]] * satir_sayisi, kokler):
+                        adimlar.append(f"{ifade} = 0: {', '.join(f'{kok:.12g}' for kok in k) or 'kök yok'}")
+            
+            sonuc = {
+                "basarili": True,
+                "adimlar": adimlar,
+                "denklemler": [str(ifade) for ifade in ifadeler],
+                "degisken": degisken,
+                "alt_sinir": str(alt),
+                "ust_sinir": str(ust),
+                "kokler": kok_matrisi,
+                "kok_sayilari": kok_sayilari,
+                "kok_listesi": [k.tolist() for k in kokler]
+            }
+            if parametre is not None:
+                sonuc["parametre"] = parametre
+                sonuc["parametre_degerleri"] = p_degerleri
+            return sonuc
+            
+        except Exception as e:
+            return {
+                "basarili": False,
+                "hata": f"Kök bulma sırasında hata: {str(e)}",
+                "adimlar": []
+            }
+    
+    def fonksiyon_tablola(self, fonksiyon_str: str, alt_sinir, ust_sinir,
+                          nokta_sayisi: int = TABLO_NOKTA_SAYISI, degisken: str = 'x',
+                          dosya_yolu: Optional[str] = None, parca_boyutu: int = TABLO_PARCA_BOYUTU,
+                          uyarlamali: bool = False) -> Dict[str, Any]:
+        """
+        Fonksiyonun x, f(x), f'(x), ∫f değer tablosunu (grafik verisini) üretir.
+        
+        Tablo parçalar halinde akış olarak üretilir; dosya_yolu verilirse
+        doğrudan CSV/NPY dosyasına yazılır, verilmezse "parcalar" anahtarında
+        parçaları üreten bir üreteç (generator) döndürülür.
+        
+        Args:
+            fonksiyon_str (str): Fonksiyon
+            alt_sinir: Aralığın alt sınırı (sayı veya "-pi" gibi ifade)
+            ust_sinir: Aralığın üst sınırı
+            nokta_sayisi (int): Eşit aralıklı temel ızgaranın nokta sayısı
+            degisken (str): Değişken (varsayılan: x)
+            dosya_yolu (str): ".csv" veya ".npy" uzantılı hedef dosya
+            parca_boyutu (int): Parça başına satır sayısı
+            uyarlamali (bool): True ise dik bölgelere ara noktalar eklenir
+        
+        Returns:
+            Dict: Tablo bilgileri; "parcalar" veya yazılan "satir_sayisi"
+        """
+        try:
+            try:
+                _, fonksiyon = self._fonksiyon_ayristir(fonksiyon_str)
+                alt = float(self._limit_noktasi_ayristir(alt_sinir))
+                ust = float(self._limit_noktasi_ayristir(ust_sinir))
+            except Exception as e:
+                return {
+                    "basarili": False,
+                    "hata": f"Fonksiyon veya sınırlar ayrıştırılamadı: {str(e)}",
+                    "adimlar": []
+                }
+            
+            if degisken == 'x':
+                var = self.x
+            elif degisken == 't':
+                var = self.t
+            else:
+                var = sp.Symbol(degisken)
+            
+            # Üreteç ilk parçaya kadar çalışmadığından girdiler burada denetlenir
+            if not (np.isfinite(alt) and np.isfinite(ust)) or not alt < ust:
+                return {
+                    "basarili": False,
+                    "hata": "Sınırlar sonlu olmalı ve alt sınır üst sınırdan küçük olmalı",
+                    "adimlar": []
+                }
+            if nokta_sayisi < 2 or parca_boyutu < 1:
+                return {
+                    "basarili": False,
+                    "hata": "Nokta sayısı en az 2, parça boyutu en az 1 olmalı",
+                    "adimlar": []
+                }
+            if not fonksiyon.free_symbols <= {var}:
+                return {
+                    "basarili": False,
+                    "hata": f"Fonksiyon {degisken} dışında değişken içeriyor",
+                    "adimlar": []
+                }
+            
+            tekiller = tekil_noktalari_bul(fonksiyon, var, alt, ust)
+            parcalar = fonksiyon_tablosu(fonksiyon, var, alt, ust, nokta_sayisi, parca_boyutu, uyarlamali,
+                                         tekil_noktalar=tekiller)
+            
+            adimlar = []
+            if self.adimli:
+                adimlar.append(f"f({degisken}) = {fonksiyon}, aralık: [{alt:g}, {ust:g}], {nokta_sayisi} nokta")
+                adimlar.append("Sütunlar: " + ", ".join(TABLO_SUTUNLARI))
+                if uyarlamali:
+                    adimlar.append("Dik bölgelere ara noktalar eklenir (uyarlamalı inceltme)")
+                if tekiller:
+                    adimlar.append(f"Tekil nokta: {degisken} = {tekiller[0]:g}; integral sütunu bu noktayı "
+                                   f"içeren alt aralıktan itibaren tanımsızdır (NaN)")
+            
+            sonuc = {
+                "basarili": True,
+                "adimlar": adimlar,
+                "sympy_fonksiyon": str(fonksiyon),
+                "degisken": degisken,
+                "alt_sinir": alt,
+                "ust_sinir": ust,
+                "nokta_sayisi": nokta_sayisi,
+                "sutunlar": list(TABLO_SUTUNLARI),
+                "tekil_noktalar": tekiller
+            }
+            if dosya_yolu is None:
+                sonuc["parcalar"] = parcalar
+            else:
+                sonuc["dosya_yolu"] = dosya_yolu
+                sonuc["satir_sayisi"] = tabloyu_yaz(parcalar, dosya_yolu)
+                if self.adimli:
+                    adimlar.append(f"{sonuc['satir_sayisi']} satır yazıldı: {dosya_yolu}")
+            return sonuc
+            
+        except Exception as e:
+            return {
+                "basarili": False,
+                "hata": f"Fonksiyon tablosu oluşturulurken hata: {str(e)}",
+                "adimlar": []
+            }
+    
+    def _turev_matrisi_hesapla(self, islem: str, fonksiyon_strler: List[str], degiskenler,
+                               derlenmis: bool) -> Dict[str, Any]:
+        """
+        Gradyan, Jacobian veya Hessian'ı hesaplar.
+        
+        Derlenmiş fonksiyon tüm bileşenleri ortak alt ifadeleri paylaşarak
+        (sp.cse) tek seferde hesaplar; tek nokta (n,) için matrisin kendisini,
+        N nokta (N, n) için (N, ...) şeklinde diziyi döndürür.
+        """
+        basliklar = {"gradyan": "Gradyan", "jakobiyen": "Jacobian", "hessian": "Hessian"}
+        try:
+            if not fonksiyon_strler:
+                return {
+                    "basarili": False,
+                    "hata": "En az bir fonksiyon gerekli",
+                    "adimlar": []
+                }
+            fonksiyonlar = [self._fonksiyon_ayristir(f)[1] for f in fonksiyon_strler]
+            if isinstance(degiskenler, str):
+                degiskenler = degiskenler.split(",")
+            if degiskenler is None:
+                # Sabit fonksiyonda serbest değişken yoktur; türevler x'e göre sıfırdır
+                degiskenler = self._serbest_degiskenler(fonksiyonlar) or [self.x]
+            else:
+                degiskenler = [sp.Symbol(str(d).strip()) for d in degiskenler]
+            if not degiskenler:
+                return {
+                    "basarili": False,
+                    "hata": "En az bir değişken gerekli",
+                    "adimlar": []
+                }
+            
+            if islem == "gradyan":
+                matris = sp.Matrix([[sp.diff(fonksiyonlar[0], d) for d in degiskenler]])
+                sekil = (len(degiskenler),)
+            elif islem == "jakobiyen":
+                matris = sp.Matrix(fonksiyonlar).jacobian(degiskenler)
+                sekil = matris.shape
+            else:
+                matris = sp.hessian(fonksiyonlar[0], degiskenler)
+                sekil = matris.shape
+            
+            adimlar = []
+            if self.adimli:
+                if len(fonksiyonlar) == 1:
+                    adimlar.append(f"Verilen fonksiyon: f({', '.join(map(str, degiskenler))}) = {fonksiyonlar[0]}")
+                else:
+                    for i, f in enumerate(fonksiyonlar, 1):
+                        adimlar.append(f"f{i}({', '.join(map(str, degiskenler))}) = {f}")
+                if islem == "gradyan":
+                    for d, bilesen in zip(degiskenler, matris):
+                        adimlar.append(f"∂f/∂{d} = {bilesen}")
+                elif islem == "jakobiyen":
+                    adimlar.append("J[i][j] = ∂fᵢ/∂xⱼ")
+                    for i in range(matris.rows):
+                        for j, d in enumerate(degiskenler):
+                            adimlar.append(f"∂f{i + 1}/∂{d} = {matris[i, j]}")
+                else:
+                    adimlar.append("H[i][j] = ∂²f/∂xᵢ∂xⱼ (simetrik)")
+                    for i, di in enumerate(degiskenler):
+                        for j in range(i, len(degiskenler)):
+                            adimlar.append(f"∂²f/∂{di}∂{degiskenler[j]} = {matris[i, j]}")
+            
+            okunabilir_matris = [[okunabilir(matris[i, j]) for j in range(matris.cols)]
+                                 for i in range(matris.rows)]
+            sonuc = {
+                "basarili": True,
+                "adimlar": adimlar,
+                "orijinal_fonksiyon": fonksiyon_strler[0] if len(fonksiyon_strler) == 1 else fonksiyon_strler,
+                "baslik": basliklar[islem],
+                islem: okunabilir_matris[0] if islem == "gradyan" else okunabilir_matris,
+                "sekil": sekil,
+                "degiskenler": [str(d) for d in degiskenler]
+            }
+            if derlenmis:
+                degerlendirici = toplu_derle(list(matris), degiskenler, sekil)
+                sonuc["degerlendirici"] = degerlendirici
+                sonuc["ortak_alt_ifade_sayisi"] = degerlendirici.ortak_alt_ifade_sayisi
+            return sonuc
+            
+        except Exception as e:
+            return {
+                "basarili": False,
+                "hata": f"{basliklar.get(islem, islem)} hesaplaması sırasında hata: {str(e)}",
+                "adimlar": []
+            }
+    
+    def _serbest_degiskenler(self, ifadeler: List[sp.Expr]) -> List[sp.Symbol]:
+        """İfadelerdeki değişkenleri ada göre sıralı döndürür"""
+        semboller = set().union(*(ifade.free_symbols for ifade in ifadeler))
+        return sorted(semboller, key=lambda sembol: sembol.name)
+    
+    def _ust_simge(self, sayi: int) -> str:
+        """Tam sayıyı üst simge karakterlerine çevirir (3 -> ³)"""
+        return str(sayi).translate(str.maketrans("0123456789", "⁰¹²³⁴⁵⁶⁷⁸⁹"))
+    
+    def _fonksiyon_ayristir(self, fonksiyon_str: str) -> Tuple[str, sp.Expr]:
+        """Fonksiyonu temizler ve SymPy ifadesine çevirir; sonuç paylaşılan önbellekte tutulur"""
+        def uret():
+            fonksiyon_temiz = self._fonksiyon_temizle(fonksiyon_str)
+            return fonksiyon_temiz, sp.sympify(fonksiyon_temiz)
+        
+        return ayristirma_onbellegi.al(("analiz", girdi_normalize_et(fonksiyon_str)), uret)
+    
+    def _turev_ve_basit_hali(self, fonksiyon: sp.Expr, var: sp.Symbol) -> Tuple[sp.Expr, sp.Expr, str]:
+        """
+        Türevi, sadeleştirilmiş halini ve uygulanan sadeleştirme düzeyini döndürür.
+        
+        Katsayıları farklı, yapısı aynı fonksiyonlar (3x² + 2x, 5x² - x gibi)
+        için türev ve sadeleştirme şablon üzerinde bir kez hesaplanır. Üsler
+        yapının parçası sayılır. Herhangi bir yerinde değişkene bağlı payda
+        bulunan ifadelerde sadeleşme sayılara bağlı olduğundan ((x²-4)/(x-2),
+        x + 2/(x+2) gibi) türev doğrudan hesaplanır. Kalıcı depo açıksa sonuç süreçler arasında saklanır.
+        """
+        def hesapla(ifade):
+            turev = sp.diff(ifade, var)
+            return (turev,) + self._sadelestir(turev)
+        
+        def paydali(ifade) -> bool:
+            # Yalnız en dıştaki payda değil, iç içe paydalar da (sin(1/x), x + 1/(x+1)) aranır
+            return any(us.exp.is_negative and us.base.has(var) for us in ifade.atoms(sp.Pow))
+        
+        def paydasiz(sonuc):
+            return not paydali(sonuc[1])
+        
+        def uret():
+            if paydali(fonksiyon):
+                return hesapla(fonksiyon)
+            return sablonla_hesapla(("turev", var, self.sadelestirme, self.sadelestirme_suresi), fonksiyon,
+                                    hesapla, usler_dahil=False, uygun=paydasiz)
+        
+        return kalici_hesapla(f"turev:{self.sadelestirme}", sp.Tuple(fonksiyon, var), uret,
+                              saklanabilir=_sure_asimsiz)
+    
+    def _belirli_integral_hesapla(self, fonksiyon: sp.Expr, var: sp.Symbol, alt_sinir, ust_sinir,
+                                  belirsiz_integral: Optional[sp.Expr] = None) -> Tuple[sp.Expr, sp.Expr]:
+        """
+        Belirli integrali ve belirsiz integrali tek sembolik integrasyonla döndürür.
+        
+        İlkel fonksiyon F sınırlarda değerlendirilir: F(b) - F(a). Sonsuz
+        sınırlarda ve değerin tanımsız çıktığı uçlarda tek yönlü limit
+        alınır. F kapalı biçimde bulunamazsa, aralık içinde süreksizliği
+        varsa (veya bu denetlenemiyorsa) ya da sonuç belirsizse tam belirli
+        integrale (sp.integrate(f, (x, a, b))) dönülür.
+        
+        Args:
+            belirsiz_integral (sp.Expr): Önceden (kurallarla) bulunmuş ilkel
+                fonksiyon; verilmezse sp.integrate ile alınır
+        
+        Returns:
+            Tuple: (belirli integral, belirsiz integral)
+        """
+        if belirsiz_integral is None:
+            belirsiz_integral = sp.integrate(fonksiyon, var)
+        
+        def tam_integral():
+            return sp.integrate(fonksiyon, (var, alt_sinir, ust_sinir)), belirsiz_integral
+        
+        if belirsiz_integral.has(sp.Integral):
+            return tam_integral()
+        
+        alt, ust = sp.sympify(alt_sinir), sp.sympify(ust_sinir)
+        try:
+            kucuk, buyuk = sp.Min(alt, ust), sp.Max(alt, ust)
+            sureksizlikler = sp.singularities(belirsiz_integral, var, sp.Interval.open(kucuk, buyuk))
+        except Exception:
+            return tam_integral()
+        if sureksizlikler is not sp.S.EmptySet:
+            return tam_integral()
+        
+        def uc_deger(nokta, yon):
+            if nokta.is_finite:
+                deger = belirsiz_integral.subs(var, nokta)
+                if deger.is_finite:
+                    return deger
+            return sp.limit(belirsiz_integral, var, nokta, yon)
+        
+        try:
+            # Alt sınır üstten büyükse uçlara diğer yönden yaklaşılır
+            artan = bool(alt <= ust)
+            integral = uc_deger(ust, "-" if artan else "+") - uc_deger(alt, "+" if artan else "-")
+        except Exception:
+            return tam_integral()
+        if integral.has(sp.nan, sp.zoo, sp.Limit) or (integral.is_infinite is None and integral.has(sp.oo)):
+            return tam_integral()
+        return integral, belirsiz_integral
+    
+    def _sayisal_integral(self, fonksiyon: sp.Expr, var: sp.Symbol, alt_sinir, ust_sinir) -> Dict[str, Any]:
+        """Fonksiyonu derleyip Gauss-Kronrod ile integraller; sonucu sözlük olarak döndürür"""
+        alt, ust = float(sp.sympify(alt_sinir)), float(sp.sympify(ust_sinir))
+        deger, hata_siniri, yakinsadi, degerlendirme = gauss_kronrod_integral(derle(fonksiyon, var), alt, ust)
+        
+        if not math.isfinite(deger):
+            return {
+                "basarili": False,
+                "hata": "Sayısal integral hesaplanamadı: fonksiyon aralıkta tanımsız veya integral ıraksak",
+                "adimlar": []
+            }
+        
+        adimlar = []
+        if self.adimli:
+            adimlar.append(f"Uyarlamalı Gauss-Kronrod (G7-K15): {degerlendirme} fonksiyon değerlendirmesi")
+            adimlar.append(f"∫[{alt_sinir}→{ust_sinir}] {fonksiyon} d{var} ≈ {deger:.12g} (hata ≤ {hata_siniri:.2e})")
+            if not yakinsadi:
+                adimlar.append("Uyarı: istenen doğruluğa alt aralık sınırı içinde ulaşılamadı")
+        
+        return {
+            "basarili": True,
+            "adimlar": adimlar,
+            "sayisal_deger": deger,
+            "hata_siniri": hata_siniri,
+            "yakinsadi": yakinsadi,
+            "yontem": "sayısal (uyarlamalı Gauss-Kronrod G7-K15)"
+        }
+    
+    def _limit_noktasi_ayristir(self, nokta) -> sp.Expr:
+        """Limit noktasını SymPy ifadesine çevirir ("∞", "sonsuz", "-oo", "pi" gibi)"""
+        if isinstance(nokta, (int, float)):
+            return sp.sympify(nokta)
+        metin = str(nokta).lower().replace(" ", "").replace("eksi", "-").replace("artı", "+")
+        metin = metin.replace("∞", "oo").replace("sonsuz", "oo").replace("π", "pi")
+        return sp.sympify(metin)
+    
+    def _limit_sonucu(self, limit: sp.Expr, yontem: str) -> Dict[str, Any]:
+        """Limit değerinden sonuç alanlarını oluşturur"""
+        try:
+            sayisal_deger = float(limit.evalf()) if limit.is_real is not False else None
+        except (TypeError, ValueError):
+            sayisal_deger = None
+        return {
+            "limit_var": True,
+            "limit": okunabilir(limit),
+            "sayisal_deger": sayisal_deger,
+            "yontem": yontem
+        }
+    
+    def _limit_kurallari(self, fonksiyon: sp.Expr, var: sp.Symbol, nokta: sp.Expr, yon: str,
+                         adimlar: List[str]) -> Optional[Dict[str, Any]]:
+        """Doğrudan yerine koyma ve rasyonel fonksiyon kurallarını dener; sonuç yoksa None"""
+        if fonksiyon.has(*_SUREKSIZ_FONKSIYONLAR):
+            return None
+        
+        if nokta.is_finite:
+            deger = fonksiyon.subs(var, nokta)
+            if deger.is_finite and deger.is_real and _noktada_surekli(fonksiyon, var, nokta):
+                if self.adimli:
+                    adimlar.append(f"Fonksiyon {var} = {nokta} noktasında sürekli; doğrudan yerine koyma: {deger}")
+                return self._limit_sonucu(deger, "doğrudan yerine koyma")
+        
+        if not fonksiyon.is_rational_function(var):
+            return None
+        
+        pay, payda = sp.fraction(sp.cancel(fonksiyon))
+        if nokta.is_finite:
+            # 0/0 belirsizliği: ortak çarpanlar sadeleştikten sonra yerine koy
+            if payda.subs(var, nokta) == 0:
+                return None
+            deger = (pay / payda).subs(var, nokta)
+            if self.adimli:
+                adimlar.append(f"Ortak çarpanlar sadeleştirildi: {pay / payda}")
+                adimlar.append(f"Yerine koyma: {deger}")
+            return self._limit_sonucu(deger, "rasyonel sadeleştirme")
+        
+        # Sonsuzda rasyonel fonksiyon: baş terimlerin derecelerini karşılaştır
+        pay_poly, payda_poly = sp.Poly(pay, var), sp.Poly(payda, var)
+        fark = pay_poly.degree() - payda_poly.degree()
+        oran = pay_poly.LC() / payda_poly.LC()
+        if fark < 0:
+            deger = sp.S.Zero
+        elif fark == 0:
+            deger = oran
+        else:
+            isaret = sp.sign(oran) * (1 if nokta is sp.oo or fark % 2 == 0 else -1)
+            deger = isaret * sp.oo
+        if self.adimli:
+            adimlar.append(f"Rasyonel fonksiyon: pay derecesi {pay_poly.degree()}, payda derecesi {payda_poly.degree()}")
+            adimlar.append(f"Baş katsayılar oranı {oran} → limit {deger}")
+        return self._limit_sonucu(deger, "derece karşılaştırması")
+    
+    def _limit_sembolik(self, fonksiyon: sp.Expr, var: sp.Symbol, nokta: sp.Expr, yon: str,
+                        adimlar: List[str]) -> Optional[Dict[str, Any]]:
+        """sp.limit'i süre sınırıyla çalıştırır; sonuçsuz kalırsa None"""
+        def tek_yonlu(y):
+            return sure_sinirli_calistir(sp.limit, fonksiyon, var, nokta, y, sure=self.sure_siniri)
+        
+        try:
+            if yon == "+-":
+                sag, sol = tek_yonlu("+"), tek_yonlu("-")
+            else:
+                sag = sol = tek_yonlu(yon)
+        except SureAsimi:
+            if self.adimli:
+                adimlar.append(f"Sembolik limit {self.sure_siniri:g} saniyede bulunamadı")
+            return None
+        except Exception:
+            return None
+        
+        if sag.has(sp.Limit) or sol.has(sp.Limit):
+            return None
+        
+        if self.adimli:
+            adimlar.append("Sembolik limit (sp.limit) hesaplandı")
+        
+        # Salınım: limit yok, değerler bir aralıkta kalır
+        if isinstance(sag, sp.AccumBounds) or isinstance(sol, sp.AccumBounds):
+            sinirlar = sag if isinstance(sag, sp.AccumBounds) else sol
+            if self.adimli:
+                adimlar.append(f"Fonksiyon salınıyor, değerler {sinirlar} aralığında: limit yok")
+            return {"limit_var": False, "limit": "yok", "sayisal_deger": None,
+                    "salinim_araligi": str(sinirlar), "yontem": "sembolik (sp.limit)"}
+        
+        if sag != sol:
+            if self.adimli:
+                adimlar.append(f"Sağdan limit {sag}, soldan limit {sol}: eşit olmadığından limit yok")
+            return {"limit_var": False, "limit": "yok", "sayisal_deger": None,
+                    "sag_limit": str(sag), "sol_limit": str(sol), "yontem": "sembolik (sp.limit)"}
+        
+        return self._limit_sonucu(sag, "sembolik (sp.limit)")
+    
+    def _limit_sayisal(self, fonksiyon: sp.Expr, var: sp.Symbol, nokta: sp.Expr, yon: str,
+                       adimlar: List[str]) -> Dict[str, Any]:
+        """Noktaya yaklaşan dizi üzerinde Richardson ekstrapolasyonuyla limit tahmini yapar"""
+        f = derle(fonksiyon, var)
+        adimlar_h = 2.0 ** -np.arange(1, LIMIT_DIZI_UZUNLUGU + 1)
+        
+        def tek_yonlu(y):
+            if nokta.is_infinite:
+                noktalar = (1.0 if nokta is sp.oo else -1.0) / adimlar_h
+            else:
+                merkez = float(nokta)
+                olcek = max(1.0, abs(merkez))
+                noktalar = merkez + (1.0 if y == "+" else -1.0) * olcek * adimlar_h
+            with np.errstate(all="ignore"):
+                degerler = np.asarray(f(noktalar), dtype=float)
+            return richardson_limit(degerler)
+        
+        if yon == "+-":
+            (sag, sag_hata), (sol, sol_hata) = tek_yonlu("+"), tek_yonlu("-")
+        else:
+            sag, sag_hata = sol, sol_hata = tek_yonlu(yon)
+        
+        yontem = "sayısal (Richardson ekstrapolasyonu)"
+        tolerans = 1e-6 * max(1.0, abs(sag)) if math.isfinite(sag) else 0.0
+        if sag == sol or abs(sag - sol) <= max(tolerans, sag_hata + sol_hata):
+            deger = sag if sag == sol else (sag + sol) / 2
+            hata = max(sag_hata, sol_hata)
+            if self.adimli:
+                adimlar.append(f"Noktaya yaklaşan dizi üzerinde Richardson ekstrapolasyonu: ≈ {deger:.12g} (hata ≈ {hata:.2e})")
+            if not math.isfinite(deger) and not math.isinf(deger):
+                return {"limit_var": False, "limit": "belirlenemedi", "sayisal_deger": None,
+                        "hata_siniri": None, "yontem": yontem}
+            return {"limit_var": True, "limit": str(deger) if math.isfinite(deger) else ("∞" if deger > 0 else "-∞"),
+                    "sayisal_deger": deger, "hata_siniri": hata, "yontem": yontem}
+        
+        if self.adimli:
+            adimlar.append(f"Sayısal tahmin: sağdan ≈ {sag:.12g}, soldan ≈ {sol:.12g}; eşit olmadığından limit yok")
+        return {"limit_var": False, "limit": "yok", "sayisal_deger": None,
+                "sag_limit": str(sag), "sol_limit": str(sol), "yontem": yontem}
+    
+    def _integral_ve_basit_hali(self, fonksiyon: sp.Expr, var: sp.Symbol) -> Tuple[sp.Expr, sp.Expr, str]:
+        """Belirsiz integrali, sadeleştirilmiş halini ve düzeyi döndürür (kalıcı depo açıksa saklanır)"""
+        # Kurallarla bulunan sonuçlar zaten sade biçimdedir; sadeleştirme ve depo atlanır
+        kural_integrali = kurallarla_integral(fonksiyon, var)
+        if kural_integrali is not None:
+            return kural_integrali, kural_integrali, SADELESTIRME_KAPALI
+        
+        def hesapla():
+            integral = sp.integrate(fonksiyon, var)
+            return (integral,) + self._sadelestir(integral)
+        
+        return kalici_hesapla(f"belirsiz_integral:{self.sadelestirme}", sp.Tuple(fonksiyon, var), hesapla,
+                              saklanabilir=_sure_asimsiz)
+    
+    def _sadelestir(self, ifade: sp.Expr) -> Tuple[sp.Expr, str]:
+        """
+        İfadeyi seçili düzeyde sadeleştirir.
+        
+        Ucuz düzey yalnızca cancel ve (trigonometri varsa) trigsimp uygular,
+        sonuç daha uzunsa ifadeyi olduğu gibi bırakır. Tam düzey sp.simplify'ı
+        çalıştırır; sadelestirme_suresi None değilse ayrı bir süreçte ve süre
+        sınırıyla.
+        
+        Returns:
+            Tuple: (sadeleştirilmiş ifade, uygulanan düzey); süre dolarsa
+                ifadenin kendisi ve SADELESTIRME_SURE_ASIMI
+        """
+        if self.sadelestirme == SADELESTIRME_KAPALI:
+            return ifade, SADELESTIRME_KAPALI
+        
+        if self.sadelestirme == SADELESTIRME_UCUZ:
+            sade = sp.cancel(ifade)
+            if sade.has(sp.sin, sp.cos, sp.tan, sp.cot, sp.sec, sp.csc):
+                sade = sp.trigsimp(sade)
+            if sp.count_ops(sade) > sp.count_ops(ifade):
+                sade = ifade
+            return sade, SADELESTIRME_UCUZ
+        
+        if self.sadelestirme_suresi is not None:
+            _simplify_isit()
+        try:
+            return sure_sinirli_calistir(sp.simplify, ifade, sure=self.sadelestirme_suresi), SADELESTIRME_TAM
+        except SureAsimi:
+            return ifade, SADELESTIRME_SURE_ASIMI
+    
+    def _fonksiyon_temizle(self, fonksiyon_str: str) -> str:
+        """Fonksiyon string'ini sözcükleyiciden geçirerek SymPy için temizler"""
+        return _sozcukleyici.ifadeye_cevir(fonksiyon_str)
+    
+    def _turev_kurallari_acikla(self, fonksiyon, var, adimlar):
+        """Türev kurallarını açıklar"""
+        if isinstance(fonksiyon, sp.Add):
+            adimlar.append("Toplam kuralı: (f + g)' = f' + g'")
+        elif isinstance(fonksiyon, sp.Mul):
+            adimlar.append("Çarpım kuralı: (fg)' = f'g + fg'")
+        elif isinstance(fonksiyon, sp.Pow):
+            adimlar.append("Kuvvet kuralı: (x^n)' = n*x^(n-1)")
+        elif isinstance(fonksiyon, (sp.sin, sp.cos, sp.tan)):
+            adimlar.append("Trigonometrik türev kuralları uygulanıyor")
+    
+    def _integral_kurallari_acikla(self, fonksiyon, var, adimlar):
+        """İntegral kurallarını açıklar"""
+        if isinstance(fonksiyon, sp.Add):
+            adimlar.append("Toplam kuralı: ∫(f + g)dx = ∫f dx + ∫g dx")
+        elif isinstance(fonksiyon, sp.Mul):
+            adimlar.append("Sabit çarpan kuralı: ∫c·f dx = c·∫f dx")
+        elif isinstance(fonksiyon, sp.Pow):
+            adimlar.append("Kuvvet kuralı: ∫x^n dx = x^(n+1)/(n+1) + C")
+        elif isinstance(fonksiyon, (sp.sin, sp.cos, sp.tan)):
+            adimlar.append("Trigonometrik integral kuralları uygulanıyor")
+
+
+
+_simplify_isitildi = False
+
+
+def _simplify_isit():
+    """
+    sp.simplify'ın tembel içe aktarmalarını ana süreçte bir kez yükler.
+    
+    Süre sınırlı sadeleştirme her seferinde yeni bir alt süreçte çalışır ve
+    alt süreçte yüklenenler ana sürece dönmez; ısıtılmadan ilk simplify
+    çağrısının ~100 ms'lik yükü her alt süreçte tekrarlanır.
+    """
+    global _simplify_isitildi
+    if not _simplify_isitildi:
+        x = sp.Symbol('x')
+        sp.simplify(sp.sin(x) ** 2 * x + sp.exp(x) / (x + 1))
+        _simplify_isitildi = True
+
+
+def _noktada_surekli(fonksiyon: sp.Expr, var: sp.Symbol, nokta: sp.Expr) -> bool:
+    """
+    Doğrudan yerine koymanın limiti verdiğini (fonksiyonun noktada sürekli
+    olduğunu) ağacı bir kez dolaşarak doğrular.
+    
+    Her alt ifadenin noktadaki değeri sonlu olmalı ve AccumBounds
+    içermemelidir (atan(1/x) x = 0'da atan(zoo) = AccumBounds(-π/2, π/2)
+    verir); sıçrama noktasındaki fonksiyonlar (acot(0)) da reddedilir.
+    Doğrulanamayan durumlar sp.limit'e bırakılır.
+    """
+    for alt in sp.preorder_traversal(fonksiyon):
+        if alt.is_Atom or not alt.has(var):
+            continue
+        deger = alt.subs(var, nokta)
+        if deger.has(sp.AccumBounds) or deger.is_finite is not True:
+            return False
+        sicrama = _SICRAMA_NOKTALARI.get(type(alt))
+        if sicrama is not None and alt.args[0].subs(var, nokta) == sicrama:
+            return False
+    return True
+
+
+def _sure_asimsiz(sonuc: Tuple) -> bool:
+    """Süre aşımıyla sadeleştirilemeyen sonuçlar kalıcı depoya yazılmaz"""
+    return sonuc[-1] != SADELESTIRME_SURE_ASIMI
+
+
+def horner_degerlendir(katsayilar: np.ndarray, h) -> np.ndarray:
+    """
+    Σ c_k·h^k polinomunu Horner yöntemiyle değerlendirir.
+    
+    Args:
+        katsayilar (np.ndarray): Artan derece sırasıyla katsayılar c_0..c_n
+        h (array_like): Değerlendirme noktaları (Taylor serisinde x - a)
+    
+    Returns:
+        np.ndarray: h ile aynı şekilde polinom değerleri
+    """
+    h = np.asarray(h)
+    sonuc = np.zeros(h.shape, dtype=np.result_type(katsayilar, h))
+    for katsayi in katsayilar[::-1]:
+        sonuc = sonuc * h + katsayi
+    return sonuc
+
+
+def richardson_limit(degerler: np.ndarray,
+                     derinlik: int = LIMIT_RICHARDSON_DERINLIGI) -> Tuple[float, float]:
+    """
+    h_k = 2^-k adımlarıyla alınmış f(a ± h_k) dizisinden limiti tahmin eder.
+    
+    f(a + h) = L + c₁h + c₂h² + ... varsayımıyla Richardson tablosu
+    kurulur; ardışık köşegen değerleri arasındaki farkın en küçük olduğu
+    yerdeki değer ve bu fark (hata tahmini) döndürülür. Küçük h'de
+    sayısal iptal nedeniyle bozulan terimler farkı büyüttüğünden seçilmez.
+    Değerler geometrik olarak büyüyorsa limit ±inf kabul edilir.
+    
+    Returns:
+        Tuple: (limit tahmini, hata tahmini)
+    """
+    sonlu = np.isfinite(degerler)
+    if not sonlu.any():
+        return float("nan"), float("inf")
+    # Tanımsız değerle karşılaşılana kadarki ardışık terimler kullanılır
+    son = len(degerler) if sonlu.all() else int(np.argmin(sonlu))
+    if son < 3:
+        degerler = degerler[sonlu]
+    else:
+        degerler = degerler[:son]
+    
+    # Iraksama: son terimler büyük ve mutlak değerce sürekli büyüyor
+    son_terimler = np.abs(degerler[-6:])
+    if len(degerler) >= 6 and son_terimler[-1] > 1e8 and np.all(np.diff(son_terimler) > 0) \
+            and np.all(np.sign(degerler[-6:]) == np.sign(degerler[-1])):
+        return float(np.sign(degerler[-1]) * np.inf), 0.0
+    
+    en_iyi, en_iyi_hata = float(degerler[-1]), float("inf")
+    onceki_satir = [float(degerler[0])]
+    for k in range(1, len(degerler)):
+        satir = [float(degerler[k])]
+        for j in range(1, min(k, derinlik) + 1):
+            satir.append(satir[j - 1] + (satir[j - 1] - onceki_satir[j - 1]) / (2 ** j - 1))
+        hata = abs(satir[-1] - onceki_satir[min(len(onceki_satir), len(satir)) - 1])
+        if hata < en_iyi_hata:
+            en_iyi, en_iyi_hata = satir[-1], hata
+        onceki_satir = satir
+    return en_iyi, en_iyi_hata
+
+
+def gauss_kronrod_integral(fonksiyon, alt: float, ust: float,
+                           mutlak_tolerans: float = SAYISAL_MUTLAK_TOLERANS,
+                           goreli_tolerans: float = SAYISAL_GORELI_TOLERANS,
+                           azami_aralik: int = SAYISAL_AZAMI_ARALIK) -> Tuple[float, float, bool, int]:
+    """
+    Uyarlamalı Gauss-Kronrod (G7-K15) ile sayısal belirli integral.
+    
+    Fonksiyon NumPy dizisi alıp dizi döndürmelidir; her turda bölünen tüm
+    alt aralıkların 15 düğümü tek çağrıda değerlendirilir. Her alt aralığın
+    hatası |K15 - G7| ile tahmin edilir. Toplam hata toleransı aşıyorsa en
+    büyük hatalı aralıklar, kalanların hatası toleransa inecek kadar,
+    ikiye bölünür. Sonsuz sınırlar değişken dönüşümüyle [0, 1) veya (-1, 1)
+    aralığına taşınır; düğümler uç noktaları içermediğinden uçtaki
+    integrallenebilir tekillikler değerlendirilmez.
+    
+    Args:
+        fonksiyon (Callable): Vektörel integrand f(x)
+        alt (float): Alt sınır (-inf olabilir)
+        ust (float): Üst sınır (inf olabilir)
+        mutlak_tolerans (float): İstenen mutlak hata
+        goreli_tolerans (float): İstenen göreli hata
+        azami_aralik (int): En fazla alt aralık sayısı
+    
+    Returns:
+        Tuple: (değer, hata tahmini, yakınsadı mı, fonksiyon değerlendirme sayısı)
+    """
+    if alt == ust:
+        return 0.0, 0.0, True, 0
+    if alt > ust:
+        deger, hata, yakinsadi, sayac = gauss_kronrod_integral(
+            fonksiyon, ust, alt, mutlak_tolerans, goreli_tolerans, azami_aralik)
+        return -deger, hata, yakinsadi, sayac
+    
+    # Sonsuz sınırlar için değişken dönüşümü: integrand(t) = f(x(t)) * x'(t)
+    if math.isinf(alt) and math.isinf(ust):
+        a, b = -1.0, 1.0
+        def integrand(t):
+            return fonksiyon(t / (1 - t * t)) * (1 + t * t) / (1 - t * t) ** 2
+    elif math.isinf(ust):
+        a, b = 0.0, 1.0
+        def integrand(t):
+            return fonksiyon(alt + t / (1 - t)) / (1 - t) ** 2
+    elif math.isinf(alt):
+        a, b = 0.0, 1.0
+        def integrand(t):
+            return fonksiyon(ust - t / (1 - t)) / (1 - t) ** 2
+    else:
+        a, b = alt, ust
+        integrand = fonksiyon
+    
+    def aralik_hesapla(sol, sag):
+        merkez = (sol + sag) / 2
+        yari = (sag - sol) / 2
+        with np.errstate(all="ignore"):
+            degerler = np.asarray(integrand(merkez[:, None] + yari[:, None] * _GK_DUGUMLER), dtype=float)
+            kronrod = yari * (degerler @ _GK_KRONROD)
+            gauss = yari * (degerler @ _GK_GAUSS)
+            return kronrod, np.abs(kronrod - gauss)
+    
+    sol, sag = np.array([a]), np.array([b])
+    tahminler, hatalar = aralik_hesapla(sol, sag)
+    degerlendirme = len(_GK_DUGUMLER)
+    
+    while True:
+        deger, toplam_hata = float(tahminler.sum()), float(hatalar.sum())
+        if not (math.isfinite(deger) and math.isfinite(toplam_hata)):
+            return deger, toplam_hata, False, degerlendirme
+        tolerans = max(mutlak_tolerans, goreli_tolerans * abs(deger))
+        if toplam_hata <= tolerans:
+            return deger, toplam_hata, True, degerlendirme
+        if len(sol) >= azami_aralik:
+            return deger, toplam_hata, False, degerlendirme
+        
+        # Hatası en büyük aralıklardan, kalan hata toleransa inecek kadarını böl
+        sira = np.argsort(hatalar)[::-1]
+        adet = int(np.searchsorted(np.cumsum(hatalar[sira]), toplam_hata - tolerans)) + 1
+        adet = min(adet, azami_aralik - len(sol), len(sol))
+        bolunen, kalan = sira[:adet], sira[adet:]
+        
+        orta = (sol[bolunen] + sag[bolunen]) / 2
+        yeni_sol = np.concatenate([sol[bolunen], orta])
+        yeni_sag = np.concatenate([orta, sag[bolunen]])
+        yeni_tahminler, yeni_hatalar = aralik_hesapla(yeni_sol, yeni_sag)
+        degerlendirme += len(yeni_sol) * len(_GK_DUGUMLER)
+        
+        sol = np.concatenate([sol[kalan], yeni_sol])
+        sag = np.concatenate([sag[kalan], yeni_sag])
+        tahminler = np.concatenate([tahminler[kalan], yeni_tahminler])
+        hatalar = np.concatenate([hatalar[kalan], yeni_hatalar])
+
+
+# İleri mod otomatik türev kuralları: fonksiyon -> (değer(u), türev(u, değer))
+# Zincir kuralındaki iç türev ileri_mod_turev içinde çarpılır.
+_ILERI_MOD_KURALLARI = {
+    sp.exp: (np.exp, lambda u, v: v),
+    sp.log: (np.log, lambda u, v: 1 / u),
+    sp.sin: (np.sin, lambda u, v: np.cos(u)),
+    sp.cos: (np.cos, lambda u, v: -np.sin(u)),
+    sp.tan: (np.tan, lambda u, v: 1 + v**2),
+    sp.sec: (lambda u: 1 / np.cos(u), lambda u, v: v * np.tan(u)),
+    sp.csc: (lambda u: 1 / np.sin(u), lambda u, v: -v / np.tan(u)),
+    sp.cot: (lambda u: 1 / np.tan(u), lambda u, v: -(1 + v**2)),
+    sp.asin: (np.arcsin, lambda u, v: 1 / np.sqrt(1 - u**2)),
+    sp.acos: (np.arccos, lambda u, v: -1 / np.sqrt(1 - u**2)),
+    sp.atan: (np.arctan, lambda u, v: 1 / (1 + u**2)),
+    sp.acot: (lambda u: np.arctan(1 / u), lambda u, v: -1 / (1 + u**2)),
+    sp.asec: (lambda u: np.arccos(1 / u), lambda u, v: 1 / (np.abs(u) * np.sqrt(u**2 - 1))),
+    sp.acsc: (lambda u: np.arcsin(1 / u), lambda u, v: -1 / (np.abs(u) * np.sqrt(u**2 - 1))),
+    sp.sinh: (np.sinh, lambda u, v: np.cosh(u)),
+    sp.cosh: (np.cosh, lambda u, v: np.sinh(u)),
+    sp.tanh: (np.tanh, lambda u, v: 1 - v**2),
+    sp.coth: (lambda u: 1 / np.tanh(u), lambda u, v: 1 - v**2),
+    sp.sech: (lambda u: 1 / np.cosh(u), lambda u, v: -v * np.tanh(u)),
+    sp.csch: (lambda u: 1 / np.sinh(u), lambda u, v: -v / np.tanh(u)),
+    sp.asinh: (np.arcsinh, lambda u, v: 1 / np.sqrt(u**2 + 1)),
+    sp.acosh: (np.arccosh, lambda u, v: 1 / np.sqrt(u**2 - 1)),
+    sp.atanh: (np.arctanh, lambda u, v: 1 / (1 - u**2)),
+    sp.acoth: (lambda u: np.arctanh(1 / u), lambda u, v: 1 / (1 - u**2)),
+    sp.Abs: (np.abs, lambda u, v: np.sign(u)),
+    sp.sign: (np.sign, lambda u, v: np.zeros_like(u)),
+    sp.floor: (np.floor, lambda u, v: np.zeros_like(u)),
+    sp.ceiling: (np.ceil, lambda u, v: np.zeros_like(u)),
+}
+
+
+def _ileri_mod_programi(ifade: sp.Expr, var: sp.Symbol,
+                        parametreler: Tuple[sp.Symbol, ...] = ()) -> List[Callable]:
+    """
+    İfade ağacını bir kez dolaşıp ileri mod türev programına çevirir.
+    
+    Program, alt ifadeleri çocuklar önce gelecek şekilde sıralanmış
+    adımlardır; her adım önceki adımların (değer, türev) çiftlerinden
+    kendi çiftini üretir. Ağaçta tekrarlanan alt ifadeler bir kez yer alır.
+    Parametrelere bağlı olup değişkeni içermeyen alt ifadeler türevi
+    sıfır olan derlenmiş yapraklardır.
+    """
+    if not ifade.free_symbols <= {var, *parametreler}:
+        fazla = ", ".join(sorted(str(s) for s in ifade.free_symbols - {var, *parametreler}))
+        raise ValueError(f"İfade {var} dışında değişken içeriyor: {fazla}")
+    
+    program = []
+    sira = {}
+    
+    def ekle(dugum) -> int:
+        if dugum in sira:
+            return sira[dugum]
+        
+        if dugum == var:
+            adim = lambda x, P, D, T: (x, np.ones_like(x))
+        elif not dugum.has(var) and not dugum.free_symbols:
+            sabit = complex(dugum.evalf())
+            sabit = sabit.real if sabit.imag == 0 else sabit
+            adim = lambda x, P, D, T: (sabit, 0.0)
+        elif not dugum.has(var):
+            deger = derle(dugum, parametreler)
+            adim = lambda x, P, D, T: (deger(*P), 0.0)
+        elif isinstance(dugum, sp.Add):
+            g = [ekle(a) for a in dugum.args]
+            adim = lambda x, P, D, T: (sum(D[i] for i in g), sum(T[i] for i in g))
+        elif isinstance(dugum, sp.Mul):
+            g = [ekle(a) for a in dugum.args]
+            
+            def adim(x, P, D, T):
+                # Çarpım kuralı: (uv)' = u'v + uv', çarpanlar soldan biriktirilir
+                v, d = D[g[0]], T[g[0]]
+                for i in g[1:]:
+                    v, d = v * D[i], d * D[i] + v * T[i]
+                return v, d
+        elif isinstance(dugum, sp.Pow) and dugum.exp.is_number:
+            b, us = ekle(dugum.base), float(dugum.exp)
+            adim = lambda x, P, D, T: (D[b]**us, us * D[b]**(us - 1) * T[b])
+        elif isinstance(dugum, sp.Pow):
+            b, e = ekle(dugum.base), ekle(dugum.exp)
+            
+            def adim(x, P, D, T):
+                # (b^e)' = b^e (e' ln b + e b'/b)
+                v = D[b]**D[e]
+                return v, v * (T[e] * np.log(D[b]) + D[e] * T[b] / D[b])
+        elif dugum.func in _ILERI_MOD_KURALLARI and len(dugum.args) == 1:
+            u = ekle(dugum.args[0])
+            deger, turev = _ILERI_MOD_KURALLARI[dugum.func]
+            
+            def adim(x, P, D, T):
+                v = deger(D[u])
+                return v, turev(D[u], v) * T[u]
+        else:
+            # Tabloda olmayan fonksiyonlar (Piecewise, erf, Min/Max...) yaprak
+            # kabul edilir; değer ve türevi derlenmiş sembolik ifadeden gelir
+            argumanlar = (var, *parametreler)
+            deger, turev = derle(dugum, argumanlar), derle(sp.diff(dugum, var), argumanlar)
+            adim = lambda x, P, D, T: (deger(x, *P), turev(x, *P))
+        
+        program.append(adim)
+        sira[dugum] = len(program) - 1
+        return sira[dugum]
+    
+    ekle(ifade)
+    return program
+
+
+def ileri_mod_turev(ifade: sp.Expr, var: sp.Symbol, noktalar,
+                    parametreler: Optional[Dict[sp.Symbol, Any]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    İfadenin ve türevinin değerlerini ikili sayılarla (ileri mod otomatik türev) hesaplar.
+    
+    Sembolik türev alınmaz; her düğüm (değer, türev) çiftini zincir
+    kuralıyla NumPy dizileri üzerinde taşır, sonuç yuvarlama hatası
+    düzeyinde kesindir. Ağaçtan üretilen program ifade başına önbelleklenir.
+    
+    Args:
+        ifade (sp.Expr): Tek değişkenli (parametreler dışında) ifade
+        var (sp.Symbol): Türev değişkeni
+        noktalar (array_like): Değerlendirme noktaları
+        parametreler (Dict[Symbol, array_like]): İfadedeki diğer sembollerin
+            değerleri; noktalarla yayınlanabilir (broadcast) şekilde olmalı
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (f, f') değerleri, noktalar ve
+        parametrelerin ortak şeklinde
+    """
+    parametreler = parametreler or {}
+    semboller = tuple(parametreler)
+    program = derleme_onbellegi.al(("ileri_mod", ifade, var, semboller),
+                                   lambda: _ileri_mod_programi(ifade, var, semboller))
+    x = np.asarray(noktalar, dtype=float)
+    P = [np.asarray(deger, dtype=float) for deger in parametreler.values()]
+    sekil = np.broadcast(x, *P).shape
+    D, T = [], []
+    with np.errstate(all="ignore"):
+        for adim in program:
+            v, d = adim(x, P, D, T)
+            D.append(v)
+            T.append(d)
+    return np.asarray(D[-1]) + np.zeros(sekil), np.asarray(T[-1]) + np.zeros(sekil)
+
+
+def toplu_kok_bul(hesapla: Callable[[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]],
+                  satir_sayisi: int, alt: float, ust: float,
+                  izgara_sayisi: int = KOK_IZGARA_SAYISI, tolerans: float = KOK_TOLERANSI,
+                  azami_iterasyon: int = KOK_AZAMI_ITERASYON) -> Tuple[List[np.ndarray], int]:
+    """
+    Çok sayıda fonksiyonun [alt, ust] aralığındaki köklerini birlikte bulur.
+    
+    Her satırın fonksiyonu ızgarada değerlendirilir; işaret değiştiren
+    alt aralıkların hepsi tek dizide güvenceli Newton ile iyileştirilir.
+    Newton adımı aralık dışına çıkarsa veya aralığı yarıdan az
+    daraltacaksa ikiye bölme yapılır, böylece yakınsama garantidir.
+    Kutuplarda (tan gibi) ve sıçramalarda oluşan sahte işaret
+    değişimleri, yakınsanan noktadaki |f| değeriyle elenir.
+    
+    Args:
+        hesapla (Callable): hesapla(x, satirlar) -> (f, f'); x ve satır
+            indeksleri yayınlanabilir dizilerdir
+        satir_sayisi (int): Fonksiyon sayısı
+        alt (float): Aralığın alt sınırı
+        ust (float): Aralığın üst sınırı
+        izgara_sayisi (int): Izgara nokta sayısı
+        tolerans (float): Göreli kök toleransı
+        azami_iterasyon (int): Aralık başına en fazla iterasyon
+    
+    Returns:
+        Tuple[List[np.ndarray], int]: Satır başına sıralı kökler ve
+        işaret değiştiren alt aralık sayısı
+    """
+    izgara = np.linspace(alt, ust, izgara_sayisi)
+    F = hesapla(izgara[None, :], np.arange(satir_sayisi)[:, None])[0]
+    F = np.where(np.isreal(F), np.real(F), np.nan)
+    
+    with np.errstate(all="ignore"):
+        gecerli = np.isfinite(F[:, :-1]) & np.isfinite(F[:, 1:])
+        satir, sutun = np.nonzero(gecerli & (np.sign(F[:, :-1]) * np.sign(F[:, 1:]) < 0))
+        
+        # f(a) < 0 < f(b) olacak şekilde yönlendir (a > b olabilir)
+        ters = F[satir, sutun] > 0
+        a = np.where(ters, izgara[sutun + 1], izgara[sutun])
+        b = np.where(ters, izgara[sutun], izgara[sutun + 1])
+        uc_buyuklugu = np.maximum(np.abs(F[satir, sutun]), np.abs(F[satir, sutun + 1]))
+        x = (a + b) / 2
+        aktif = np.ones(x.size, dtype=bool)
+        
+        for _ in range(azami_iterasyon):
+            i = np.nonzero(aktif)[0]
+            if i.size == 0:
+                break
+            f, d = hesapla(x[i], satir[i])
+            f, d = np.real(f), np.real(d)
+            a[i] = np.where(f < 0, x[i], a[i])
+            b[i] = np.where(f > 0, x[i], b[i])
+            genislik = np.abs(b[i] - a[i])
+            
+            newton = x[i] - f / d
+            icinde = np.isfinite(newton) & ((newton - a[i]) * (newton - b[i]) < 0) & \
+                (np.abs(f / d) <= genislik / 2)
+            yeni = np.where(f == 0, x[i], np.where(icinde, newton, (a[i] + b[i]) / 2))
+            
+            esik = tolerans * (1 + np.abs(yeni))
+            bitti = (f == 0) | (np.abs(yeni - x[i]) <= esik) | (genislik <= esik)
+            x[i] = yeni
+            aktif[i[bitti]] = False
+        
+        # Kutup ve sıçramaları ele: gerçek kökte |f| uçlardakinden çok küçüktür
+        if x.size:
+            f_son = np.abs(np.real(hesapla(x, satir)[0]))
+            kabul = (f_son <= 1e-3 * uc_buyuklugu) | (f_son == 0)
+            satir, x = satir[kabul], x[kabul]
+    
+    sifir_satir, sifir_sutun = np.nonzero(F == 0)
+    satir = np.concatenate([satir, sifir_satir])
+    x = np.concatenate([x, izgara[sifir_sutun]])
+    
+    kokler = []
+    for k in range(satir_sayisi):
+        satir_kokleri = np.sort(x[satir == k])
+        if satir_kokleri.size > 1:
+            # Izgara noktasına denk gelen kök komşu aralıktan da bulunabilir
+            farkli = np.diff(satir_kokleri) > 10 * tolerans * (1 + np.abs(satir_kokleri[1:]))
+            satir_kokleri = satir_kokleri[np.concatenate([[True], farkli])]
+        kokler.append(satir_kokleri)
+    return kokler, int(ters.size)
+
+
+def tekil_noktalari_bul(ifade: sp.Expr, var: sp.Symbol, alt: float, ust: float) -> List[float]:
+    """
+    [alt, ust] içindeki gerçek tekil noktaları (kutuplar, log'un sıfırı...) bulur.
+    
+    Returns:
+        List[float]: Artan sırada tekil noktalar; sp.singularities sonlu bir
+            küme veremezse boş liste (bu durumda yalnızca sonlu olmayan
+            örnekler işaretlenir)
+    """
+    try:
+        tekiller = sp.singularities(ifade, var, sp.Interval(alt, ust))
+    except Exception:
+        return []
+    if not isinstance(tekiller, sp.FiniteSet):
+        return []
+    return sorted(float(nokta) for nokta in tekiller if nokta.is_real)
+
+
+def _gercek_kisim(deger: np.ndarray) -> np.ndarray:
+    """Gerçek değerleri korur, sanal kısmı sıfır olmayanları NaN yapar"""
+    return np.where(np.isreal(deger), np.real(deger), np.nan)
+
+
+def _tabloyu_incelt(ifade: sp.Expr, var: sp.Symbol, x: np.ndarray, f: np.ndarray, d: np.ndarray,
+                    tolerans: float, azami_bolme: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Dik (hızlı değişen) alt aralıklara ara noktalar ekler.
+    
+    Kirişin fonksiyondan sapması |f'(sağ) - f'(sol)|·h/8 ile tahmin edilir;
+    sapma parçadaki değer aralığına göre toleransı aşan alt aralıklar,
+    sapma h² ile küçüldüğünden ceil(sqrt(sapma/tolerans)) parçaya bölünür.
+    """
+    h = np.diff(x)
+    with np.errstate(all="ignore"):
+        sonlu = f[np.isfinite(f)]
+        olcek = float(sonlu.max() - sonlu.min()) if sonlu.size else 0.0
+        sapma = np.abs(np.diff(d)) * h / 8
+        bolme = np.ceil(np.sqrt(sapma / (tolerans * (olcek or 1.0))))
+    bolme = np.where(np.isfinite(bolme), bolme, azami_bolme)
+    bolme = np.clip(bolme, 1, azami_bolme).astype(int)
+    if not np.any(bolme > 1):
+        return x, f, d
+    
+    # Her alt aralığın sol ucu ve k/bolme kesirli ara noktaları, sonra son uç
+    sol = np.repeat(np.arange(h.size), bolme)
+    kesir = (np.arange(sol.size) - np.repeat(np.cumsum(bolme) - bolme, bolme)) / np.repeat(bolme, bolme)
+    yeni_x = np.append(x[sol] + kesir * h[sol], x[-1])
+    yeni = kesir > 0
+    yeni_f, yeni_d = np.append(f[sol], f[-1]), np.append(d[sol], d[-1])
+    ara_f, ara_d = ileri_mod_turev(ifade, var, yeni_x[:-1][yeni])
+    yeni_f[:-1][yeni], yeni_d[:-1][yeni] = _gercek_kisim(ara_f), _gercek_kisim(ara_d)
+    return yeni_x, yeni_f, yeni_d
+
+
+def fonksiyon_tablosu(ifade: sp.Expr, var: sp.Symbol, alt: float, ust: float, nokta_sayisi: int,
+                      parca_boyutu: int = TABLO_PARCA_BOYUTU, uyarlamali: bool = False,
+                      tolerans: float = TABLO_TOLERANSI,
+                      azami_bolme: int = TABLO_AZAMI_BOLME,
+                      tekil_noktalar: Optional[Sequence[float]] = None) -> Iterator[np.ndarray]:
+    """
+    Fonksiyon tablosunu sabit boyutlu parçalar halinde üretir.
+    
+    Her parça (satır, 4) şeklinde bir dizidir; sütunlar TABLO_SUTUNLARI
+    sırasıyla x, f(x), f'(x) ve alt sınırdan x'e kadar ∫f'dir. Türev
+    ileri mod otomatik türevle, integral her alt aralıkta Gauss-Legendre
+    ile hesaplanıp önceki parçalardan devreden toplamla birikir. Bir tekil
+    nokta (1/x'in 0'daki kutbu gibi) içeren veya sonlu olmayan değer veren
+    ilk alt aralıktan itibaren integral sütunu NaN'dır: tekilliğin
+    ötesindeki birikimli integral tanımsızdır (integrallenebilir
+    tekilliklerde, örn. 1/√x, de böyle işaretlenir). Bellekte
+    aynı anda en fazla bir parçalık (incelemede azami_bolme katı) veri
+    bulunur; böylece milyonlarca nokta akış halinde üretilebilir.
+    
+    Args:
+        ifade (sp.Expr): Tek değişkenli ifade
+        var (sp.Symbol): Değişken
+        alt (float): Aralığın alt sınırı
+        ust (float): Aralığın üst sınırı
+        nokta_sayisi (int): Eşit aralıklı temel ızgaranın nokta sayısı (en az 2)
+        parca_boyutu (int): Son parça dışındaki her parçanın satır sayısı
+        uyarlamali (bool): True ise dik bölgelere ara noktalar eklenir
+        tolerans (float): İncelemede parçanın değer aralığına göre kiriş sapma sınırı
+        azami_bolme (int): Bir temel alt aralığın en fazla bölüneceği parça sayısı
+        tekil_noktalar (Sequence[float]): Aralıktaki tekil noktalar; verilmezse
+            tekil_noktalar() ile bulunur
+    
+    Yields:
+        np.ndarray: (satır, 4) şeklinde tablo parçası
+    """
+    if nokta_sayisi < 2 or parca_boyutu < 1:
+        raise ValueError("Nokta sayısı en az 2, parça boyutu en az 1 olmalı")
+    if not (np.isfinite(alt) and np.isfinite(ust)) or not alt < ust:
+        raise ValueError("Sınırlar sonlu olmalı ve alt sınır üst sınırdan küçük olmalı")
+    
+    fonksiyon = derle(ifade, var)
+    if tekil_noktalar is None:
+        tekil_noktalar = tekil_noktalari_bul(ifade, var, alt, ust)
+    tekiller = np.asarray(tekil_noktalar, dtype=float)
+    toplam = 0.0
+    tampon, tampon_boyu = [], 0
+    
+    for bas in range(0, nokta_sayisi - 1, parca_boyutu):
+        son = min(bas + parca_boyutu, nokta_sayisi - 1)
+        x = alt + (ust - alt) * np.arange(bas, son + 1) / (nokta_sayisi - 1)
+        f, d = ileri_mod_turev(ifade, var, x)
+        f, d = _gercek_kisim(f), _gercek_kisim(d)
+        if uyarlamali:
+            x, f, d = _tabloyu_incelt(ifade, var, x, f, d, tolerans, azami_bolme)
+        
+        # Alt aralık integralleri: Gauss-Legendre, ardından devreden toplamla birikim
+        yari = np.diff(x)[:, None] / 2
+        with np.errstate(all="ignore"):
+            degerler = _gercek_kisim(fonksiyon(x[:-1, None] + yari * (1 + _GL_DUGUMLER)))
+            aralik_integralleri = (degerler @ _GL_AGIRLIKLAR) * yari[:, 0]
+        
+        # Tekil nokta içeren veya sonlu olmayan değer veren alt aralık NaN olur;
+        # cumsum ve devreden toplam NaN'ı sonraki tüm satırlara taşır
+        gecerli = np.isfinite(aralik_integralleri) & np.isfinite(f[:-1]) & np.isfinite(f[1:])
+        if tekiller.size:
+            gecerli &= ~((tekiller >= x[:-1, None]) & (tekiller <= x[1:, None])).any(axis=1)
+        aralik_integralleri = np.where(gecerli, aralik_integralleri, np.nan)
+        integral = toplam + np.concatenate([[0.0], np.cumsum(aralik_integralleri)])
+        toplam = integral[-1]
+        
+        # Parçanın son noktası bir sonraki parçanın ilk noktasıdır
+        satirlar = np.column_stack([x, f, d, integral])
+        tampon.append(satirlar if son == nokta_sayisi - 1 else satirlar[:-1])
+        tampon_boyu += len(tampon[-1])
+        
+        if tampon_boyu >= parca_boyutu:
+            birlesik = np.concatenate(tampon)
+            for i in range(0, len(birlesik) - parca_boyutu + 1, parca_boyutu):
+                yield birlesik[i:i + parca_boyutu]
+            kalan = birlesik[len(birlesik) - len(birlesik) % parca_boyutu:]
+            tampon, tampon_boyu = [kalan], len(kalan)
+    
+    if tampon_boyu:
+        yield np.concatenate(tampon)
+
+
+def tabloyu_yaz(parcalar: Iterable[np.ndarray], dosya_yolu: str, bicim: Optional[str] = None) -> int:
+    """
+    Tablo parçalarını bellekte biriktirmeden CSV veya NPY dosyasına yazar.
+    
+    NPY başlığı sabit boyutta ayrılır ve satır sayısı yazma bitince
+    doldurulur; dosya np.load ile (mmap_mode dahil) okunabilir.
+    
+    Args:
+        parcalar (Iterable[np.ndarray]): fonksiyon_tablosu'nun ürettiği parçalar
+        dosya_yolu (str): Hedef dosya
+        bicim (str): "csv" veya "npy"; verilmezse dosya uzantısından alınır
+    
+    Returns:
+        int: Yazılan satır sayısı
+    """
+    bicim = (bicim or dosya_yolu.rsplit(".", 1)[-1]).lower()
+    satir_sayisi = 0
+    
+    if bicim == "csv":
+        with open(dosya_yolu, "w", encoding="utf-8") as dosya:
+            dosya.write(",".join(TABLO_SUTUNLARI) + "\n")
+            for parca in parcalar:
+                np.savetxt(dosya, parca, delimiter=",", fmt="%.17g")
+                satir_sayisi += len(parca)
+        return satir_sayisi
+    
+    if bicim == "npy":
+        def baslik(satir: int) -> bytes:
+            sozluk = f"{{'descr': '<f8', 'fortran_order': False, 'shape': ({satir}, {len(TABLO_SUTUNLARI)}), }}"
+            return (np.lib.format.magic(1, 0) + np.uint16(_NPY_BASLIK_BOYU - 10).tobytes()
+                    + sozluk.ljust(_NPY_BASLIK_BOYU - 11).encode("latin1") + b"\n")
+        
+        with open(dosya_yolu, "wb") as dosya:
+            dosya.write(baslik(0))
+            for parca in parcalar:
+                dosya.write(np.ascontiguousarray(parca, dtype="<f8").tobytes())
+                satir_sayisi += len(parca)
+            dosya.seek(0)
+            dosya.write(baslik(satir_sayisi))
+        return satir_sayisi
+    
+    raise ValueError(f"Desteklenmeyen dosya biçimi: {bicim} ('csv' veya 'npy' olmalı)")
+
+
+# Global fonksiyonlar
+def turev_hesapla(fonksiyon: str, degisken: str = 'x', adimli: bool = True,
+                  derlenmis: bool = False, sadelestirme: str = VARSAYILAN_SADELESTIRME,
+                  sadelestirme_suresi: Optional[float] = SADELESTIRME_SURE_SINIRI) -> Dict[str, Any]:
+    """Fonksiyonun türevini hesaplar"""
+    cozucu = AnalizCozucu(adimli, sadelestirme=sadelestirme, sadelestirme_suresi=sadelestirme_suresi)
+    return cozucu.turev_hesapla(fonksiyon, degisken, derlenmis)
+
+
+def integral_hesapla(fonksiyon: str, degisken: str = 'x', belirli: bool = False,
+                    alt_sinir: Optional[float] = None, ust_sinir: Optional[float] = None,
+                    adimli: bool = True, derlenmis: bool = False,
+                    sure_siniri: Optional[float] = SEMBOLIK_SURE_SINIRI,
+                    sadelestirme: str = VARSAYILAN_SADELESTIRME,
+                    sadelestirme_suresi: Optional[float] = SADELESTIRME_SURE_SINIRI) -> Dict[str, Any]:
+    """Fonksiyonun integralini hesaplar"""
+    cozucu = AnalizCozucu(adimli, sure_siniri, sadelestirme, sadelestirme_suresi)
+    return cozucu.integral_hesapla(fonksiyon, degisken, belirli, alt_sinir, ust_sinir, derlenmis)
+
+
+def limit_hesapla(fonksiyon: str, nokta, degisken: str = 'x', yon: str = "+-",
+                  adimli: bool = True, sure_siniri: Optional[float] = SEMBOLIK_SURE_SINIRI) -> Dict[str, Any]:
+    """Fonksiyonun verilen noktadaki limitini hesaplar"""
+    cozucu = AnalizCozucu(adimli, sure_siniri)
+    return cozucu.limit_hesapla(fonksiyon, nokta, degisken, yon)
+
+
+def turev_degeri_hesapla(fonksiyon: str, noktalar, degisken: str = 'x', adimli: bool = True) -> Dict[str, Any]:
+    """Türevin verilen noktalardaki değerlerini otomatik türevle hesaplar"""
+    cozucu = AnalizCozucu(adimli)
+    return cozucu.turev_degeri_hesapla(fonksiyon, noktalar, degisken)
+
+
+def kok_bul(denklemler, alt_sinir, ust_sinir, degisken: str = 'x', parametre: Optional[str] = None,
+            parametre_degerleri=None, izgara_sayisi: int = KOK_IZGARA_SAYISI,
+            adimli: bool = True) -> Dict[str, Any]:
+    """f(x) = 0 denklemlerinin aralıktaki tüm köklerini sayısal olarak bulur"""
+    cozucu = AnalizCozucu(adimli)
+    return cozucu.kok_bul(denklemler, alt_sinir, ust_sinir, degisken, parametre,
+                          parametre_degerleri, izgara_sayisi)
+
+
+def fonksiyon_tablola(fonksiyon: str, alt_sinir, ust_sinir, nokta_sayisi: int = TABLO_NOKTA_SAYISI,
+                      degisken: str = 'x', dosya_yolu: Optional[str] = None,
+                      parca_boyutu: int = TABLO_PARCA_BOYUTU, uyarlamali: bool = False,
+                      adimli: bool = True) -> Dict[str, Any]:
+    """Fonksiyonun x, f, f', ∫f tablosunu parçalar halinde üretir veya dosyaya yazar"""
+    cozucu = AnalizCozucu(adimli)
+    return cozucu.fonksiyon_tablola(fonksiyon, alt_sinir, ust_sinir, nokta_sayisi, degisken,
+                                    dosya_yolu, parca_boyutu, uyarlamali)
+
+
+def taylor_serisi(fonksiyon: str, nokta=0, mertebe: int = 5, degisken: str = 'x', degerler=None,
+                  adimli: bool = True) -> Dict[str, Any]:
+    """Fonksiyonun Taylor/Maclaurin serisini hesaplar"""
+    cozucu = AnalizCozucu(adimli)
+    return cozucu.taylor_serisi(fonksiyon, nokta, mertebe, degisken, degerler)
+
+
+def sayisal_integral_hesapla(fonksiyon: str, alt_sinir: float, ust_sinir: float, degisken: str = 'x',
+                             adimli: bool = True) -> Dict[str, Any]:
+    """Belirli integrali sayısal olarak (Gauss-Kronrod) hesaplar"""
+    cozucu = AnalizCozucu(adimli)
+    return cozucu.sayisal_integral_hesapla(fonksiyon, alt_sinir, ust_sinir, degisken)
+
+
+def kismi_turev_hesapla(fonksiyon: str, turev_degiskenleri, adimli: bool = True,
+                        derlenmis: bool = False) -> Dict[str, Any]:
+    """Kısmi (ve yüksek mertebeden) türev hesaplar"""
+    cozucu = AnalizCozucu(adimli)
+    return cozucu.kismi_turev_hesapla(fonksiyon, turev_degiskenleri, derlenmis)
+
+
+def gradyan_hesapla(fonksiyon: str, degiskenler=None, adimli: bool = True,
+                    derlenmis: bool = False) -> Dict[str, Any]:
+    """Skaler fonksiyonun gradyanını hesaplar"""
+    cozucu = AnalizCozucu(adimli)
+    return cozucu.gradyan_hesapla(fonksiyon, degiskenler, derlenmis)
+
+
+def jakobiyen_hesapla(fonksiyonlar, degiskenler=None, adimli: bool = True,
+                      derlenmis: bool = False) -> Dict[str, Any]:
+    """Vektör değerli fonksiyonun Jacobian matrisini hesaplar"""
+    cozucu = AnalizCozucu(adimli)
+    return cozucu.jakobiyen_hesapla(fonksiyonlar, degiskenler, derlenmis)
+
+
+def hessian_hesapla(fonksiyon: str, degiskenler=None, adimli: bool = True,
+                    derlenmis: bool = False) -> Dict[str, Any]:
+    """Skaler fonksiyonun Hessian matrisini hesaplar"""
+    cozucu = AnalizCozucu(adimli)
+    return cozucu.hessian_hesapla(fonksiyon, degiskenler, derlenmis)
+
+
+def sayisal_degerlendir(fonksiyon: str, degerler, islem: str = "fonksiyon", degisken: str = 'x',
+                        adimli: bool = True) -> Dict[str, Any]:
+    """Fonksiyonu, türevini veya ilkel fonksiyonunu dizi üzerinde değerlendirir"""
+    cozucu = AnalizCozucu(adimli)
+    return cozucu.sayisal_degerlendir(fonksiyon, degerler, islem, degisken)
 
 
-def trigonometrik_analiz(islem: str, fonksiyon: str) -> Dict[str, Any]:
+def trigonometrik_analiz(islem: str, fonksiyon: str, adimli: bool = True) -> Dict[str, Any]:
     """Trigonometrik fonksiyonların türev ve integrallerini hesaplar"""
-    cozucu = AnalizCozucu()
+    cozucu = AnalizCozucu(adimli)
     return cozucu.trigonometrik_turev_integral(islem, fonksiyon)
 
 
@@ -7,74 +7,326 @@ Desteklenen işlemler:
 - İkinci dereceden denklem çözme
 - Çarpanlara ayırma
 - Polinomial işlemler
+- Toplu (vektörel) ikinci dereceden denklem çözme
+- Her dereceden polinom kökleri (tekil ve toplu)
+- NumPy katsayı dizisi tabanlı polinom aritmetiği (Polinom)
+- Doğrusal denklem sistemleri (tekil ve toplu)
 - Matematik ifadesi hesaplama (faktöriyel, üslü sayılar, vs.)
 
 Yazar: Matematik Kütüphanesi
 """
 
 import sympy as sp
+import numpy as np
 import re
+from sympy.solvers.solveset import NonlinearError
 import math
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Iterable
+
+from utils.onbellek import ayristirma_onbellegi, girdi_normalize_et
+from utils.sozcukleyici import Sozcukleyici
+from utils.sablon import sablonla_hesapla
+from utils.kalici_depo import kalici_hesapla
+
+
+# Toplu çözümde kullanılan kök türü bayrakları
+KOK_IKI_GERCEK = 2     # Δ > 0: iki farklı gerçek kök
+KOK_CIFT = 1           # Δ = 0: çift kök
+KOK_DOGRUSAL = 0       # a = 0: tek kök (doğrusal denklem)
+KOK_KARMASIK = -1      # Δ < 0: iki karmaşık eşlenik kök
+KOK_YOK = -2           # a = b = 0: kök tanımsız
+
+# Bu dereceye kadar rasyonel katsayılı polinomlar kapalı formda (sp.roots) çözülür
+POLINOM_KESIN_AZAMI_DERECE = 4
+
+# Doğrusal sistem çözüm durumları
+SISTEM_TEK_COZUM = "tek_cozum"
+SISTEM_SONSUZ_COZUM = "sonsuz_cozum"
+SISTEM_COZUM_YOK = "cozum_yok"
+
+# Bu kadar bilinmeyene kadar rasyonel katsayılı sistemler kesin (kesirli) çözülür
+SISTEM_KESIN_AZAMI_BOYUT = 6
+
+# İki çarpanın da derecesi bu eşiği aşarsa çarpım FFT ile yapılır
+FFT_CARPIM_ESIGI = 64
+
+# Denklem girdilerinde atılan sorgu kelimeleri ("kuadratik denklem x² - 9x + 20 = 0")
+_GEREKSIZ_KELIMELER = ("kuadratik", "denklem", "denklemi", "denkleminin", "kökleri", "köklerini",
+                       "bul", "çöz", "hesapla")
+
+# Denklem girdileri için sözcükleyici (Türkçe katlama, üsler, örtük çarpma);
+# boşluklar önceki temizleyicideki gibi yok sayılır ("5 x" -> 5*x)
+_sozcukleyici = Sozcukleyici(atilacak_kelimeler=_GEREKSIZ_KELIMELER, bosluk_duyarli=False)
+
+
+def _katsayi_ile_carp(katsayi: sp.Expr, ifade: sp.Expr) -> sp.Expr:
+    """
+    Sayısal katsayıyı çarpanlara dağıtmadan ifadeyle çarpar: 2*(x + 1), -(x - 1)*(2*x + 1).
+
+    İfadenin kendi sayısal katsayısı öne alınır; katsayı -1 ise toplamın
+    işareti değiştirilir (-x - 1).
+    """
+    ic_katsayi, geri_kalan = sp.sympify(ifade).as_coeff_Mul()
+    katsayi = sp.sympify(katsayi) * ic_katsayi
+    if geri_kalan == 1 or katsayi == 1:
+        return katsayi * geri_kalan
+    if geri_kalan.is_Add:
+        return -geri_kalan if katsayi == -1 else sp.Mul(katsayi, geri_kalan, evaluate=False)
+    return sp.Mul(katsayi, *sp.Mul.make_args(geri_kalan), evaluate=False)
+
+
+class Polinom:
+    """
+    NumPy katsayı dizisi üzerinde yoğun (dense) polinom.
+    
+    Katsayılar en yüksek dereceden başlayarak tutulur (sp.Poly.all_coeffs
+    ve np.polyval ile aynı sıra). Baştaki sıfırlar atılır; sıfır polinom
+    [0.0] olarak saklanır ve derecesi -1 kabul edilir.
+    """
+    
+    def __init__(self, katsayilar):
+        katsayilar = np.atleast_1d(np.asarray(katsayilar))
+        if katsayilar.ndim != 1:
+            raise ValueError("Polinom katsayıları tek boyutlu olmalı")
+        katsayilar = katsayilar.astype(np.result_type(katsayilar.dtype, float))
+        
+        sifirdan_farkli = np.flatnonzero(katsayilar)
+        if sifirdan_farkli.size == 0:
+            katsayilar = katsayilar[:0]
+        else:
+            katsayilar = katsayilar[sifirdan_farkli[0]:]
+        self.katsayilar = katsayilar if katsayilar.size else np.zeros(1, dtype=katsayilar.dtype)
+    
+    @property
+    def derece(self) -> int:
+        """Polinomun derecesi (sıfır polinom için -1)"""
+        if self.katsayilar.size == 1 and self.katsayilar[0] == 0:
+            return -1
+        return self.katsayilar.size - 1
+    
+    @classmethod
+    def poly_den(cls, poly: sp.Poly) -> "Polinom":
+        """Tek değişkenli sp.Poly nesnesinden Polinom oluşturur"""
+        katsayilar = poly.all_coeffs()
+        if all(k.is_real for k in katsayilar):
+            return cls([float(k) for k in katsayilar])
+        return cls([complex(k) for k in katsayilar])
+    
+    def poly_ye_cevir(self, sembol: Optional[sp.Symbol] = None) -> sp.Poly:
+        """Polinomu sp.Poly nesnesine çevirir (tam sayı katsayılar tam sayı kalır)"""
+        sembol = sembol if sembol is not None else sp.Symbol('x')
+        katsayilar = []
+        for k in self.katsayilar:
+            if np.iscomplexobj(k) and k.imag != 0:
+                katsayilar.append(sp.Float(k.real) + sp.I * sp.Float(k.imag))
+            else:
+                k = k.real
+                katsayilar.append(sp.Integer(int(k)) if k == int(k) else sp.Float(k))
+        return sp.Poly(katsayilar, sembol)
+    
+    def degerlendir(self, x):
+        """
+        Polinomu Horner yöntemiyle vektörel olarak değerlendirir.
+        
+        Args:
+            x (array-like): Skaler veya nokta dizisi
+        
+        Returns:
+            Polinomun x noktalarındaki değerleri (x ile aynı biçimde)
+        """
+        x = np.asarray(x)
+        sonuc = np.zeros(x.shape, dtype=np.result_type(x.dtype, self.katsayilar.dtype))
+        for k in self.katsayilar:
+            sonuc = sonuc * x + k
+        return sonuc
+    
+    __call__ = degerlendir
+    
+    def turev(self, mertebe: int = 1) -> "Polinom":
+        """Polinomun türevini döndürür"""
+        katsayilar = self.katsayilar
+        for _ in range(mertebe):
+            if katsayilar.size <= 1:
+                return Polinom([0.0])
+            katsayilar = katsayilar[:-1] * np.arange(katsayilar.size - 1, 0, -1)
+        return Polinom(katsayilar)
+    
+    def integral(self, sabit: float = 0.0) -> "Polinom":
+        """Polinomun belirsiz integralini (ters türevini) döndürür"""
+        if self.derece < 0:
+            return Polinom([sabit])
+        katsayilar = self.katsayilar / np.arange(self.katsayilar.size, 0, -1)
+        return Polinom(np.append(katsayilar, sabit))
+    
+    def bol(self, bolen) -> Tuple["Polinom", "Polinom"]:
+        """
+        Uzun bölme yapar.
+        
+        Returns:
+            Tuple[Polinom, Polinom]: (bölüm, kalan)
+        """
+        bolen = self._polinoma_cevir(bolen)
+        if bolen.derece < 0:
+            raise ZeroDivisionError("Polinom sıfır polinoma bölünemez")
+        
+        kalan = self.katsayilar.astype(np.result_type(self.katsayilar, bolen.katsayilar))
+        fark = self.derece - bolen.derece
+        if fark < 0:
+            return Polinom([0.0]), Polinom(kalan)
+        
+        bas_katsayi = bolen.katsayilar[0]
+        bolum = np.zeros(fark + 1, dtype=kalan.dtype)
+        for i in range(fark + 1):
+            carpan = kalan[i] / bas_katsayi
+            bolum[i] = carpan
+            kalan[i:i + bolen.katsayilar.size] -= carpan * bolen.katsayilar
+        return Polinom(bolum), Polinom(kalan[fark + 1:])
+    
+    def _polinoma_cevir(self, diger) -> "Polinom":
+        """Sayıları sabit polinoma çevirir"""
+        return diger if isinstance(diger, Polinom) else Polinom([diger])
+    
+    def __add__(self, diger):
+        diger = self._polinoma_cevir(diger)
+        uzunluk = max(self.katsayilar.size, diger.katsayilar.size)
+        tur = np.result_type(self.katsayilar, diger.katsayilar)
+        toplam = np.zeros(uzunluk, dtype=tur)
+        toplam[uzunluk - self.katsayilar.size:] += self.katsayilar
+        toplam[uzunluk - diger.katsayilar.size:] += diger.katsayilar
+        return Polinom(toplam)
+    
+    __radd__ = __add__
+    
+    def __neg__(self):
+        return Polinom(-self.katsayilar)
+    
+    def __sub__(self, diger):
+        return self + (-self._polinoma_cevir(diger))
+    
+    def __rsub__(self, diger):
+        return self._polinoma_cevir(diger) - self
+    
+    def __mul__(self, diger):
+        diger = self._polinoma_cevir(diger)
+        a, b = self.katsayilar, diger.katsayilar
+        if min(a.size, b.size) - 1 <= FFT_CARPIM_ESIGI:
+            return Polinom(np.convolve(a, b))
+        
+        # Yüksek derecelerde evrişim FFT ile O(n log n)
+        uzunluk = a.size + b.size - 1
+        boyut = 1 << (uzunluk - 1).bit_length()
+        if np.iscomplexobj(a) or np.iscomplexobj(b):
+            carpim = np.fft.ifft(np.fft.fft(a, boyut) * np.fft.fft(b, boyut))[:uzunluk]
+        else:
+            carpim = np.fft.irfft(np.fft.rfft(a, boyut) * np.fft.rfft(b, boyut), boyut)[:uzunluk]
+            # Tam sayı katsayılı çarpanlarda yuvarlama hatasını temizle
+            if np.all(a == np.round(a)) and np.all(b == np.round(b)):
+                carpim = np.round(carpim)
+        return Polinom(carpim)
+    
+    __rmul__ = __mul__
+    
+    def __divmod__(self, diger):
+        return self.bol(diger)
+    
+    def __floordiv__(self, diger):
+        return self.bol(diger)[0]
+    
+    def __mod__(self, diger):
+        return self.bol(diger)[1]
+    
+    def __eq__(self, diger):
+        if not isinstance(diger, (Polinom, int, float, complex)):
+            return NotImplemented
+        diger = self._polinoma_cevir(diger)
+        return (self.katsayilar.size == diger.katsayilar.size
+                and bool(np.all(self.katsayilar == diger.katsayilar)))
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        return f"Polinom({self.katsayilar.tolist()})"
 
 
 class CebirCozucu:
     """Cebir problemlerini çözen ana sınıf"""
     
-    def __init__(self):
+    def __init__(self, adimli: bool = True):
         self.x = sp.Symbol('x')
         self.y = sp.Symbol('y')
         self.z = sp.Symbol('z')
+        # adimli=False ise çözüm adımı metinleri üretilmez (hızlı mod)
+        self.adimli = adimli
     
-    def ikinci_dereceden_coz(self, denklem_str: str) -> Dict[str, any]:
+    def ikinci_dereceden_coz(self, denklem_str: str, hizli: bool = True) -> Dict[str, any]:
         """
         İkinci dereceden denklemi çözer.
         
         Args:
             denklem_str (str): Denklem string formatında (örn: "x^2 - 5x + 6 = 0")
+            hizli (bool): Katsayılar rasyonel sayı ise kökleri ve çarpanları
+                sp.solve / sp.factor çağırmadan doğrudan katsayılardan hesaplar
         
         Returns:
             Dict: Çözüm adımları ve sonuçları içeren sözlük
         """
         try:
-            # Denklemi ayrıştır
-            denklem_temizlendi = self._denklem_temizle(denklem_str)
-            
-            # Sympy ile denklemi parse et
-            denklem = sp.sympify(denklem_temizlendi)
+            # Denklemi ayrıştır ve Sympy ile parse et (önbellekli)
+            denklem = self._denklem_ayristir(denklem_str)
             
             # Katsayıları al
-            a, b, c = self._katsayilari_al(denklem)
+            polinom = self._polinom_al(denklem)
+            if polinom is not None and polinom.degree() > 2:
+                # Yüksek dereceler genel kök bulucuyla çözülür; sonuç "derece"
+                # anahtarını taşır, "kokler" ve "carpanlar" her iki şemada da vardır
+                sonuc = self.polinom_coz(denklem_str)
+                if sonuc["basarili"]:
+                    sonuc["carpanlar"] = sp.factor(denklem)
+                return sonuc
+            a, b, c = self._katsayilari_al(denklem, polinom)
             
-            # Çözüm adımlarını hesapla
-            adimlar = []
-            adimlar.append(f"Verilen denklem: {denklem} = 0")
-            adimlar.append(f"Standart form: ax² + bx + c = 0")
-            adimlar.append(f"Katsayılar: a = {a}, b = {b}, c = {c}")
+            # Sayısal katsayılı polinomlar için hızlı yol (sp.solve / sp.factor yok)
+            hizli_sonuc = self._sayisal_ikinci_derece_coz(polinom) if hizli else None
             
+            # Çözüm adımlarını hesapla
             # Diskriminant hesapla
             diskriminant = b**2 - 4*a*c
-            adimlar.append(f"Diskriminant (Δ) = b² - 4ac = ({b})² - 4({a})({c}) = {b**2} - {4*a*c} = {diskriminant}")
             
             # Kökleri hesapla
-            kokler = sp.solve(denklem, self.x)
-            
-            if diskriminant > 0:
-                adimlar.append("Δ > 0 olduğu için iki farklı gerçek kök vardır.")
-                adimlar.append(f"x₁ = (-b + √Δ) / 2a = ({-b} + √{diskriminant}) / {2*a} = {kokler[0]}")
-                adimlar.append(f"x₂ = (-b - √Δ) / 2a = ({-b} - √{diskriminant}) / {2*a} = {kokler[1]}")
-            elif diskriminant == 0:
-                adimlar.append("Δ = 0 olduğu için bir çift kök vardır.")
-                adimlar.append(f"x = -b / 2a = {-b} / {2*a} = {kokler[0]}")
+            if hizli_sonuc is not None:
+                kokler, carpanlar = hizli_sonuc
+            elif hizli and polinom is not None and polinom.domain.is_RR:
+                kokler = self._sablonla_coz(denklem, polinom)
+                carpanlar = None
             else:
-                adimlar.append("Δ < 0 olduğu için gerçek kök yoktur (karmaşık kökler var).")
-                adimlar.append(f"x₁ = {kokler[0]}")
-                adimlar.append(f"x₂ = {kokler[1]}")
+                kokler = sp.solve(denklem, self.x)
+                carpanlar = None
             
             # Çarpanlara ayırma
-            carpanlar = sp.factor(denklem)
-            if carpanlar != denklem:
-                adimlar.append(f"Çarpanlarına ayrılmış hali: {carpanlar} = 0")
+            if carpanlar is None:
+                carpanlar = sp.factor(denklem)
+            
+            adimlar = []
+            if self.adimli:
+                adimlar.append(f"Verilen denklem: {denklem} = 0")
+                adimlar.append(f"Standart form: ax² + bx + c = 0")
+                adimlar.append(f"Katsayılar: a = {a}, b = {b}, c = {c}")
+                adimlar.append(f"Diskriminant (Δ) = b² - 4ac = ({b})² - 4({a})({c}) = {b**2} - {4*a*c} = {diskriminant}")
+                
+                if diskriminant > 0:
+                    adimlar.append("Δ > 0 olduğu için iki farklı gerçek kök vardır.")
+                    adimlar.append(f"x₁ = (-b + √Δ) / 2a = ({-b} + √{diskriminant}) / {2*a} = {kokler[0]}")
+                    adimlar.append(f"x₂ = (-b - √Δ) / 2a = ({-b} - √{diskriminant}) / {2*a} = {kokler[1]}")
+                elif diskriminant == 0:
+                    adimlar.append("Δ = 0 olduğu için bir çift kök vardır.")
+                    adimlar.append(f"x = -b / 2a = {-b} / {2*a} = {kokler[0]}")
+                else:
+                    adimlar.append("Δ < 0 olduğu için gerçek kök yoktur (karmaşık kökler var).")
+                    adimlar.append(f"x₁ = {kokler[0]}")
+                    adimlar.append(f"x₂ = {kokler[1]}")
+                
+                if carpanlar != denklem:
+                    adimlar.append(f"Çarpanlarına ayrılmış hali: {carpanlar} = 0")
             
             return {
                 "basarili": True,
@@ -92,40 +344,543 @@ class CebirCozucu:
                 "adimlar": []
             }
     
-    def _denklem_temizle(self, denklem_str: str) -> str:
-        """Denklem string'ini temizler ve sympy formatına dönüştürür"""
-        # Türkçe karakterleri değiştir
-        denklem = denklem_str.lower()
+    def ikinci_dereceden_toplu_coz(self, a, b, c,
+                                   adim_satirlari: Optional[Iterable[int]] = None) -> Dict[str, any]:
+        """
+        Çok sayıda ikinci dereceden denklemi NumPy ile vektörel olarak çözer.
         
-        # Eşittir işaretinden sonrasını sıfıra al
-        if "=" in denklem:
-            sol, sag = denklem.split("=", 1)
-            denklem = f"({sol}) - ({sag})"
+        Her satır için SymPy kullanılmaz; kökler kapalı formdan, sayısal
+        kararlı formülle hesaplanır:
+            q = -(b + sign(b)·√Δ) / 2,  x₁ = q / a,  x₂ = c / q
+        Bu form, b² ≫ 4ac durumunda oluşan basamak kaybını önler.
         
-        # ² karakterini **2 ile değiştir
-        denklem = denklem.replace("²", "**2")
-        # ^ karakterini ** ile değiştir  
-        denklem = denklem.replace("^", "**")
+        Args:
+            a, b, c (array-like): Katsayı dizileri (aynı boyutta veya yayınlanabilir)
+            adim_satirlari (Iterable[int]): Çözüm adımları üretilecek satır indeksleri
         
-        # Türkçe karakterleri temizle
-        denklem = denklem.replace("ü", "u").replace("ğ", "g").replace("ı", "i")
-        denklem = denklem.replace("ş", "s").replace("ç", "c").replace("ö", "o")
+        Returns:
+            Dict: Diskriminant, kökler ve kök türü dizilerini içeren sözlük
+        """
+        try:
+            a, b, c = np.broadcast_arrays(np.asarray(a, dtype=float),
+                                          np.asarray(b, dtype=float),
+                                          np.asarray(c, dtype=float))
+            a, b, c = a.ravel(), b.ravel(), c.ravel()
+            
+            diskriminant = b * b - 4.0 * a * c
+            
+            ikinci_derece = a != 0
+            dogrusal = ~ikinci_derece & (b != 0)
+            
+            kok_turu = np.full(a.shape, KOK_YOK, dtype=np.int8)
+            kok_turu[ikinci_derece & (diskriminant > 0)] = KOK_IKI_GERCEK
+            kok_turu[ikinci_derece & (diskriminant == 0)] = KOK_CIFT
+            kok_turu[ikinci_derece & (diskriminant < 0)] = KOK_KARMASIK
+            kok_turu[dogrusal] = KOK_DOGRUSAL
+            
+            kokler = np.full((a.size, 2), np.nan + 0j, dtype=complex)
+            
+            with np.errstate(divide="ignore", invalid="ignore"):
+                # Gerçek kökler (Δ ≥ 0): kararlı formül
+                gercek = ikinci_derece & (diskriminant >= 0)
+                isaret = np.where(b >= 0, 1.0, -1.0)
+                q = -0.5 * (b + isaret * np.sqrt(np.where(gercek, diskriminant, 0.0)))
+                x1 = q / a
+                x2 = np.where(q != 0, c / q, x1)
+                kokler[gercek, 0] = x1[gercek]
+                kokler[gercek, 1] = x2[gercek]
+                
+                # Karmaşık kökler (Δ < 0): eşlenik çift
+                karmasik = kok_turu == KOK_KARMASIK
+                reel = -b / (2.0 * a) + 0.0  # -0.0 yerine 0.0
+                sanal = np.sqrt(np.where(karmasik, -diskriminant, 0.0)) / (2.0 * np.abs(a))
+                kokler[karmasik, 0] = reel[karmasik] - 1j * sanal[karmasik]
+                kokler[karmasik, 1] = reel[karmasik] + 1j * sanal[karmasik]
+                
+                # Doğrusal denklemler (a = 0): bx + c = 0
+                kokler[dogrusal, 0] = -c[dogrusal] / b[dogrusal]
+            
+            # Gerçek kökleri küçükten büyüğe sırala (sp.solve ile aynı sıra)
+            sirala = kok_turu == KOK_IKI_GERCEK
+            kokler[sirala] = np.sort(kokler[sirala].real, axis=1)
+            
+            gercek_kokler = np.where(np.abs(kokler.imag) == 0, kokler.real, np.nan)
+            
+            # Adımlar sadece istenen satırlar için üretilir
+            adimlar = {}
+            if self.adimli and adim_satirlari is not None:
+                for i in adim_satirlari:
+                    adimlar[int(i)] = self._toplu_satir_adimlari(
+                        a[i], b[i], c[i], diskriminant[i], kok_turu[i], kokler[i])
+            
+            return {
+                "basarili": True,
+                "adimlar": adimlar,
+                "katsayilar": {"a": a, "b": b, "c": c},
+                "diskriminant": diskriminant,
+                "kokler": kokler,
+                "gercek_kokler": gercek_kokler,
+                "kok_turu": kok_turu,
+                "denklem_sayisi": a.size
+            }
+            
+        except Exception as e:
+            return {
+                "basarili": False,
+                "hata": f"Toplu çözüm sırasında hata oluştu: {str(e)}",
+                "adimlar": {}
+            }
+    
+    def polinom_coz(self, denklem_str: str, kesin: Optional[bool] = None,
+                    parlatma_adimi: int = 3) -> Dict[str, any]:
+        """
+        Herhangi dereceden polinom denkleminin köklerini bulur.
         
-        # Boşlukları temizle
-        denklem = re.sub(r'\s+', '', denklem)
+        Rasyonel katsayılı ve derecesi POLINOM_KESIN_AZAMI_DERECE'yi aşmayan
+        polinomlar sp.roots ile kapalı formda çözülür (sp.solve'dan hızlıdır).
+        Diğerleri eşlik (companion) matrisinin özdeğerleri ve Newton
+        iyileştirmesi ile sayısal olarak çözülür.
         
-        # Çarpma işlemlerini düzelt (2x -> 2*x)
-        denklem = re.sub(r'(\d)([a-z])', r'\1*\2', denklem)
+        Args:
+            denklem_str (str): Polinom denklemi (örn: "x^3 - 6x^2 + 11x - 6 = 0")
+            kesin (bool): True ise kapalı form zorlanır, False ise sayısal yol
+                kullanılır, None ise dereceye göre otomatik seçilir
+            parlatma_adimi (int): Sayısal köklere uygulanacak Newton adımı sayısı
         
-        return denklem
+        Returns:
+            Dict: Çözüm adımları ve sonuçları içeren sözlük
+        """
+        try:
+            denklem = self._denklem_ayristir(denklem_str)
+            polinom = self._polinom_al(denklem)
+            if polinom is None:
+                return {
+                    "basarili": False,
+                    "hata": "İfade x'e göre bir polinom değil",
+                    "adimlar": []
+                }
+            
+            derece = polinom.degree()
+            katsayilar = polinom.all_coeffs()
+            
+            adimlar = []
+            if self.adimli:
+                adimlar.append(f"Verilen denklem: {denklem} = 0")
+                adimlar.append(f"Polinomun derecesi: {derece}")
+                adimlar.append(f"Katsayılar (en yüksek dereceden): {katsayilar}")
+            
+            if derece < 1:
+                return {
+                    "basarili": False,
+                    "hata": "Sabit polinomun kökü tanımsızdır",
+                    "adimlar": adimlar
+                }
+            
+            rasyonel = polinom.domain.is_ZZ or polinom.domain.is_QQ
+            if kesin is None:
+                kesin = rasyonel and derece <= POLINOM_KESIN_AZAMI_DERECE
+            
+            kokler, katlilik = None, None
+            if kesin:
+                kok_sozlugu = sp.roots(polinom)
+                if sum(kok_sozlugu.values()) == derece:
+                    kokler = sorted(kok_sozlugu, key=sp.default_sort_key)
+                    katlilik = [kok_sozlugu[kok] for kok in kokler]
+                    sayisal_kokler = np.array([complex(sp.N(kok)) for kok, k in zip(kokler, katlilik)
+                                               for _ in range(k)])
+                    yontem = "kesin"
+                    if self.adimli:
+                        adimlar.append("Kökler kapalı formda (radikallerle) hesaplandı.")
+                elif self.adimli:
+                    adimlar.append("Kapalı form bulunamadı, sayısal yönteme geçiliyor.")
+            
+            if kokler is None:
+                toplu = self.polinom_toplu_coz([[complex(k) for k in katsayilar]], parlatma_adimi)
+                if not toplu["basarili"]:
+                    return {
+                        "basarili": False,
+                        "hata": toplu["hata"],
+                        "adimlar": adimlar
+                    }
+                sayisal_kokler = toplu["kokler"][0, :derece]
+                kokler = [complex(k) if k.imag != 0 else float(k.real) for k in sayisal_kokler]
+                katlilik = [1] * len(kokler)
+                yontem = "sayisal"
+                if self.adimli:
+                    adimlar.append("Eşlik matrisinin özdeğerleri kök yaklaşımı olarak alındı.")
+                    adimlar.append(f"Kökler {parlatma_adimi} Newton adımıyla iyileştirildi.")
+            
+            if self.adimli:
+                for i, (kok, k) in enumerate(zip(kokler, katlilik), 1):
+                    adimlar.append(f"x{i} = {kok}" + (f" ({k} katlı)" if k > 1 else ""))
+            
+            return {
+                "basarili": True,
+                "adimlar": adimlar,
+                "derece": derece,
+                "katsayilar": katsayilar,
+                "kokler": kokler,
+                "katlilik": katlilik,
+                "sayisal_kokler": sayisal_kokler,
+                "yontem": yontem
+            }
+            
+        except Exception as e:
+            return {
+                "basarili": False,
+                "hata": f"Polinom çözülürken hata oluştu: {str(e)}",
+                "adimlar": []
+            }
     
-    def _katsayilari_al(self, denklem) -> Tuple[float, float, float]:
-        """Denklemden a, b, c katsayılarını alır"""
+    def polinom_toplu_coz(self, katsayilar, parlatma_adimi: int = 3,
+                          sanal_tolerans: float = 1e-10) -> Dict[str, any]:
+        """
+        Çok sayıda polinomun köklerini NumPy ile toplu olarak bulur.
+        
+        Katsayı satırları (en yüksek dereceden başlayarak) baştan sıfırla
+        ortak dereceye tamamlanır. Aynı gerçek dereceye sahip satırların eşlik
+        matrisleri tek bir np.linalg.eigvals çağrısıyla çözülür, ardından
+        kökler vektörel Newton adımlarıyla iyileştirilir.
+        
+        Args:
+            katsayilar: Katsayı satırları (2B dizi veya farklı uzunlukta listeler)
+            parlatma_adimi (int): Newton iyileştirme adımı sayısı
+            sanal_tolerans (float): Bu göreli değerin altındaki sanal kısımlar
+                gerçek katsayılı polinomlarda sıfırlanır
+        
+        Returns:
+            Dict: Kök matrisi (eksik kökler NaN), dereceler ve gerçek kökler
+        """
+        try:
+            satirlar = [np.atleast_1d(np.asarray(satir)) for satir in katsayilar]
+            tur = np.result_type(float, *[satir.dtype for satir in satirlar])
+            ortak_uzunluk = max(satir.size for satir in satirlar)
+            
+            # Baştan sıfırla ortak dereceye tamamla
+            matris = np.zeros((len(satirlar), ortak_uzunluk), dtype=tur)
+            for i, satir in enumerate(satirlar):
+                matris[i, ortak_uzunluk - satir.size:] = satir
+            
+            sifirdan_farkli = matris != 0
+            ilk_indeks = np.where(sifirdan_farkli.any(axis=1), sifirdan_farkli.argmax(axis=1), ortak_uzunluk)
+            dereceler = np.maximum(ortak_uzunluk - 1 - ilk_indeks, 0)
+            
+            azami_derece = max(ortak_uzunluk - 1, 0)
+            kokler = np.full((len(satirlar), azami_derece), np.nan + 0j, dtype=complex)
+            
+            for derece in np.unique(dereceler):
+                if derece < 1:
+                    continue
+                grup = np.nonzero(dereceler == derece)[0]
+                c = matris[grup, ortak_uzunluk - derece - 1:]
+                
+                # Eşlik matrisi: ilk satır -c[1:]/c[0], alt köşegen birler
+                eslik = np.zeros((grup.size, derece, derece), dtype=np.result_type(tur, float))
+                eslik[:, 0, :] = -c[:, 1:] / c[:, :1]
+                eslik[:, np.arange(1, derece), np.arange(derece - 1)] = 1
+                grup_kokleri = np.linalg.eigvals(eslik).astype(complex)
+                
+                grup_kokleri = self._newton_parlat(c, grup_kokleri, parlatma_adimi)
+                kokler[grup, :derece] = grup_kokleri
+            
+            # Gerçek katsayılı polinomlarda yuvarlama kaynaklı sanal kısımları temizle
+            if not np.iscomplexobj(matris):
+                kucuk = np.abs(kokler.imag) <= sanal_tolerans * np.maximum(1.0, np.abs(kokler.real))
+                kokler[kucuk] = kokler[kucuk].real
+            
+            kokler = np.sort(kokler, axis=1)
+            gercek_kokler = np.where(kokler.imag == 0, kokler.real, np.nan)
+            
+            return {
+                "basarili": True,
+                "adimlar": [],
+                "katsayilar": matris,
+                "dereceler": dereceler,
+                "kokler": kokler,
+                "gercek_kokler": gercek_kokler,
+                "polinom_sayisi": len(satirlar)
+            }
+            
+        except Exception as e:
+            return {
+                "basarili": False,
+                "hata": f"Toplu polinom çözümü sırasında hata oluştu: {str(e)}",
+                "adimlar": []
+            }
+    
+    def _newton_parlat(self, katsayilar: np.ndarray, kokler: np.ndarray, adim_sayisi: int) -> np.ndarray:
+        """
+        Kökleri Horner yöntemiyle vektörel Newton adımlarıyla iyileştirir.
+        
+        Bir adım yalnızca |p(x)| değerini küçültüyorsa kabul edilir; böylece
+        katlı köklerde veya türevin sıfırlandığı noktalarda kök bozulmaz.
+        """
+        katsayilar = katsayilar[:, :, None]
+        
+        def horner(x):
+            deger = np.zeros_like(x)
+            turev = np.zeros_like(x)
+            for j in range(katsayilar.shape[1]):
+                turev = turev * x + deger
+                deger = deger * x + katsayilar[:, j]
+            return deger, turev
+        
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            deger, turev = horner(kokler)
+            for _ in range(adim_sayisi):
+                aday = np.where(turev != 0, kokler - deger / turev, kokler)
+                aday_deger, aday_turev = horner(aday)
+                iyi = np.isfinite(aday) & (np.abs(aday_deger) < np.abs(deger))
+                kokler = np.where(iyi, aday, kokler)
+                deger = np.where(iyi, aday_deger, deger)
+                turev = np.where(iyi, aday_turev, turev)
+        return kokler
+    
+    def _toplu_satir_adimlari(self, a: float, b: float, c: float, diskriminant: float,
+                              kok_turu: int, kokler: np.ndarray) -> List[str]:
+        """Toplu çözümdeki tek bir satır için çözüm adımlarını üretir"""
+        adimlar = []
+        adimlar.append(f"Katsayılar: a = {a}, b = {b}, c = {c}")
+        
+        if kok_turu == KOK_DOGRUSAL:
+            adimlar.append("a = 0 olduğu için denklem doğrusaldır: bx + c = 0")
+            adimlar.append(f"x = -c / b = {-c} / {b} = {kokler[0].real}")
+            return adimlar
+        if kok_turu == KOK_YOK:
+            adimlar.append("a = b = 0 olduğu için denklemin kökü tanımsızdır.")
+            return adimlar
+        
+        adimlar.append(f"Diskriminant (Δ) = b² - 4ac = ({b})² - 4({a})({c}) = {diskriminant}")
+        if kok_turu == KOK_IKI_GERCEK:
+            adimlar.append("Δ > 0 olduğu için iki farklı gerçek kök vardır.")
+            adimlar.append(f"x₁ = {kokler[0].real}")
+            adimlar.append(f"x₂ = {kokler[1].real}")
+        elif kok_turu == KOK_CIFT:
+            adimlar.append("Δ = 0 olduğu için bir çift kök vardır.")
+            adimlar.append(f"x = -b / 2a = {-b} / {2*a} = {kokler[0].real}")
+        else:
+            adimlar.append("Δ < 0 olduğu için gerçek kök yoktur (karmaşık kökler var).")
+            adimlar.append(f"x₁ = {kokler[0]}")
+            adimlar.append(f"x₂ = {kokler[1]}")
+        return adimlar
+    
+    def denklem_sistemi_coz(self, denklemler, kesin: Optional[bool] = None) -> Dict[str, any]:
+        """
+        Doğrusal denklem sistemini çözer.
+        
+        Denklemler bir kez katsayı matrisine (A·x = b) çevrilir ve önbellekte
+        tutulur. Küçük, rasyonel katsayılı sistemler kesin olarak (kesirlerle),
+        diğerleri NumPy ile sayısal olarak çözülür. Tekil ve eksik belirli
+        sistemler rank karşılaştırmasıyla tespit edilir.
+        
+        Args:
+            denklemler: Denklem listesi veya virgül / noktalı virgül / satır
+                sonu ile ayrılmış denklemler (örn: "2x + y = 5, x - y = 1")
+            kesin (bool): None ise otomatik; True kesin, False sayısal çözüm
+        
+        Returns:
+            Dict: Çözüm adımları, çözüm durumu ve bilinmeyenlerin değerleri
+        """
+        try:
+            bilinmeyenler, A, b = self._denklem_sistemi_ayristir(denklemler)
+            m, n = A.shape
+            
+            if kesin is None:
+                kesin = n <= SISTEM_KESIN_AZAMI_BOYUT and all(k.is_Rational for k in A.row_join(b))
+            
+            if kesin:
+                durum, rank, cozum = self._sistem_kesin_coz(bilinmeyenler, A, b)
+            else:
+                durum, rank, cozum = self._sistem_sayisal_coz(bilinmeyenler, A, b)
+            
+            adimlar = []
+            if self.adimli:
+                adimlar.append(f"Verilen sistem ({m} denklem, {n} bilinmeyen):")
+                for satir, sabit in zip(A.tolist(), b):
+                    terimler = sp.Add(*[k * x for k, x in zip(satir, bilinmeyenler)])
+                    adimlar.append(f"   {terimler} = {sabit}")
+                adimlar.append(f"Matris formu: A·x = b, A = {A.tolist()}, b = {list(b)}")
+                adimlar.append(f"rank(A) = {rank}, bilinmeyen sayısı = {n}")
+                
+                if durum == SISTEM_COZUM_YOK:
+                    adimlar.append("rank(A) < rank([A|b]) olduğu için sistem tutarsızdır, çözüm yoktur.")
+                elif durum == SISTEM_SONSUZ_COZUM:
+                    adimlar.append("rank(A) < bilinmeyen sayısı olduğu için sonsuz çözüm vardır.")
+                else:
+                    adimlar.append("rank(A) = bilinmeyen sayısı olduğu için tek çözüm vardır.")
+                
+                adimlar.append(f"Yöntem: {'kesin (Gauss-Jordan)' if kesin else 'sayısal (NumPy)'}")
+                for x, deger in cozum.items():
+                    adimlar.append(f"{x} = {deger}")
+            
+            return {
+                "basarili": True,
+                "adimlar": adimlar,
+                "bilinmeyenler": [str(x) for x in bilinmeyenler],
+                "katsayi_matrisi": A,
+                "sabitler": b,
+                "rank": rank,
+                "durum": durum,
+                "cozum": cozum,
+                "yontem": "kesin" if kesin else "sayisal"
+            }
+            
+        except NonlinearError:
+            return {
+                "basarili": False,
+                "hata": "Sistem doğrusal değil: bilinmeyenler yalnızca birinci dereceden olmalı",
+                "adimlar": []
+            }
+        except Exception as e:
+            return {
+                "basarili": False,
+                "hata": f"Denklem sistemi çözülürken hata oluştu: {str(e)}",
+                "adimlar": []
+            }
+    
+    def denklem_sistemi_toplu_coz(self, katsayi_matrisleri, sabitler,
+                                  tolerans: Optional[float] = None) -> Dict[str, any]:
+        """
+        Aynı boyuttaki çok sayıda doğrusal sistemi NumPy ile toplu çözer.
+        
+        Tam ranklı kare sistemler tek bir yığın np.linalg.solve çağrısıyla,
+        tekil veya dikdörtgen sistemler yığın sözde tersle (en küçük normlu
+        çözüm) çözülür. Tutarsız sistemlerin çözüm satırları NaN olur.
+        
+        Args:
+            katsayi_matrisleri (array-like): (k, m, n) boyutunda A yığını
+            sabitler (array-like): (k, m) boyutunda b yığını
+            tolerans (float): Tutarlılık kontrolü için göreli tolerans
+        
+        Returns:
+            Dict: (k, n) çözüm matrisi, rank ve durum dizileri
+        """
         try:
-            expanded = sp.expand(denklem)
+            A = np.asarray(katsayi_matrisleri)
+            A = A.astype(np.result_type(A.dtype, float))
+            b = np.asarray(sabitler, dtype=np.result_type(A.dtype, np.asarray(sabitler).dtype))
+            if A.ndim != 3 or b.shape != A.shape[:2]:
+                raise ValueError(f"Beklenen boyutlar (k, m, n) ve (k, m); gelen {A.shape} ve {b.shape}")
+            
+            k, m, n = A.shape
+            tolerans = tolerans if tolerans is not None else max(m, n) * np.finfo(float).eps * 1e3
+            rank = np.linalg.matrix_rank(A)
+            
+            cozumler = np.empty((k, n), dtype=np.result_type(A, b))
+            tam_rank = rank == n
+            if m == n and tam_rank.any():
+                cozumler[tam_rank] = np.linalg.solve(A[tam_rank], b[tam_rank, :, None])[..., 0]
+            diger = ~tam_rank if m == n else np.ones(k, dtype=bool)
+            if diger.any():
+                cozumler[diger] = (np.linalg.pinv(A[diger]) @ b[diger, :, None])[..., 0]
+            
+            # A·x ile b karşılaştırılarak tutarlılık kontrolü
+            artik = np.linalg.norm(A @ cozumler[..., None] - b[..., None], axis=(1, 2))
+            olcek = np.linalg.norm(A, axis=(1, 2)) * np.linalg.norm(cozumler, axis=1) + np.linalg.norm(b, axis=1)
+            tutarli = artik <= tolerans * np.maximum(olcek, 1.0)
+            
+            durumlar = np.where(~tutarli, SISTEM_COZUM_YOK,
+                                np.where(rank < n, SISTEM_SONSUZ_COZUM, SISTEM_TEK_COZUM))
+            cozumler[~tutarli] = np.nan
+            
+            return {
+                "basarili": True,
+                "adimlar": [],
+                "cozumler": cozumler,
+                "rank": rank,
+                "durumlar": durumlar,
+                "sistem_sayisi": k
+            }
             
+        except Exception as e:
+            return {
+                "basarili": False,
+                "hata": f"Toplu sistem çözümü sırasında hata oluştu: {str(e)}",
+                "adimlar": []
+            }
+    
+    def _denklem_sistemi_ayristir(self, denklemler) -> Tuple[Tuple[sp.Symbol, ...], sp.ImmutableMatrix, sp.ImmutableMatrix]:
+        """Denklemleri bilinmeyenlere ve A, b matrislerine çevirir; sonuç paylaşılan önbellekte tutulur"""
+        if isinstance(denklemler, str):
+            denklemler = re.split(r"[,;\n]", denklemler)
+        denklemler = tuple(girdi_normalize_et(d) for d in denklemler if d.strip())
+        if not denklemler:
+            raise ValueError("Sistemde denklem bulunamadı")
+        
+        def uret():
+            ifadeler = [self._denklem_ayristir(d) for d in denklemler]
+            bilinmeyenler = tuple(sorted(set().union(*[i.free_symbols for i in ifadeler]), key=lambda s: s.name))
+            if not bilinmeyenler:
+                raise ValueError("Sistemde bilinmeyen bulunamadı")
+            A, b = sp.linear_eq_to_matrix(ifadeler, bilinmeyenler)
+            return bilinmeyenler, sp.ImmutableMatrix(A), sp.ImmutableMatrix(b)
+        
+        return ayristirma_onbellegi.al(("cebir_sistem", denklemler), uret)
+    
+    def _sistem_kesin_coz(self, bilinmeyenler, A, b) -> Tuple[str, int, Dict]:
+        """Sistemi Gauss-Jordan ile kesin çözer: (durum, rank, çözüm)"""
+        rank = A.rank()
+        if rank < A.row_join(b).rank():
+            return SISTEM_COZUM_YOK, rank, {}
+        
+        # Sonsuz çözümde serbest bilinmeyenler parametre olarak kalır
+        cozum = next(iter(sp.linsolve((A, b), bilinmeyenler)))
+        durum = SISTEM_TEK_COZUM if rank == len(bilinmeyenler) else SISTEM_SONSUZ_COZUM
+        return durum, rank, {str(x): deger for x, deger in zip(bilinmeyenler, cozum)}
+    
+    def _sistem_sayisal_coz(self, bilinmeyenler, A, b) -> Tuple[str, int, Dict]:
+        """
+        Sistemi NumPy ile sayısal çözer: (durum, rank, çözüm)
+        
+        Sonsuz çözümde en küçük normlu özel çözüm, tutarsız sistemde boş
+        çözüm döndürülür.
+        """
+        tur = float if all(k.is_real for k in A.row_join(b)) else complex
+        A_np = np.array(A.tolist(), dtype=tur)
+        b_np = np.array(b.tolist(), dtype=tur)[:, 0]
+        
+        sonuc = self.denklem_sistemi_toplu_coz(A_np[None], b_np[None])
+        if not sonuc["basarili"]:
+            raise ValueError(sonuc["hata"])
+        
+        durum = str(sonuc["durumlar"][0])
+        cozum = {} if durum == SISTEM_COZUM_YOK else {
+            str(x): deger.item() for x, deger in zip(bilinmeyenler, sonuc["cozumler"][0])}
+        return durum, int(sonuc["rank"][0]), cozum
+    
+    def _denklem_temizle(self, denklem_str: str) -> str:
+        """Denklem string'ini sözcükleyiciden geçirir ve sympy formatına dönüştürür"""
+        sol, esittir, sag = _sozcukleyici.ifadeye_cevir(denklem_str).partition("=")
+        
+        # Eşittir işaretinden sonrasını sıfıra al
+        if not esittir:
+            return sol
+        return f"({sol})-({sag})"
+    
+    def _denklem_ayristir(self, denklem_str: str):
+        """Denklemi temizleyip SymPy ifadesine çevirir; sonuç paylaşılan önbellekte tutulur"""
+        return ayristirma_onbellegi.al(
+            ("cebir", girdi_normalize_et(denklem_str)),
+            lambda: sp.sympify(self._denklem_temizle(denklem_str)))
+    
+    def _polinom_al(self, denklem) -> Optional[sp.Poly]:
+        """Denklemi x'e göre polinoma çevirir, çevrilemezse None döndürür"""
+        try:
+            return sp.Poly(sp.expand(denklem), self.x)
+        except Exception:
+            return None
+    
+    def polinom_al(self, ifade_str: str) -> Optional[Polinom]:
+        """İfade string'ini NumPy tabanlı Polinom nesnesine çevirir"""
+        poly = self._polinom_al(self._denklem_ayristir(ifade_str))
+        return Polinom.poly_den(poly) if poly is not None else None
+    
+    def _katsayilari_al(self, denklem, poly: Optional[sp.Poly] = None) -> Tuple[float, float, float]:
+        """Denklemden a, b, c katsayılarını alır"""
+        try:
             # Polinomun katsayılarını al
-            poly = sp.Poly(expanded, self.x)
+            if poly is None:
+                poly = sp.Poly(sp.expand(denklem), self.x)
             katsayilar = poly.all_coeffs()
             
             # 2. derece denklemi için a, b, c katsayıları
@@ -141,6 +896,92 @@ class CebirCozucu:
             # Hata durumunda default değerler
             return 1.0, 0.0, 0.0
     
+    def _sayisal_ikinci_derece_coz(self, poly: Optional[sp.Poly]) -> Optional[Tuple[List, any]]:
+        """
+        Rasyonel katsayılı, derecesi ≤ 2 olan polinomun köklerini ve çarpanlarını
+        doğrudan katsayılardan hesaplar.
+        
+        Sonuçlar sp.solve ve sp.factor ile birebir aynıdır (kesin rasyonel ve
+        köklü ifadeler korunur). Katsayılar sembolik veya ondalıklı (Float)
+        ise None döndürür; bu durumda SymPy yoluna düşülür.
+        
+        Returns:
+            Optional[Tuple]: (kokler, carpanlar) veya None
+        """
+        if poly is None or not (poly.domain.is_ZZ or poly.domain.is_QQ):
+            return None
+        
+        derece = poly.degree()
+        if derece > 2:
+            return None
+        
+        katsayilar = [sp.Rational(k) for k in poly.all_coeffs()]
+        
+        # Sabit polinom: kök yok, ifade kendisi
+        if derece <= 0:
+            return [], poly.as_expr()
+        
+        if derece == 1:
+            b, c = katsayilar
+            kok = -c / b
+            return [kok], self._dogrusal_carpanlar(b, [kok])
+        
+        a, b, c = katsayilar
+        diskriminant = b**2 - 4*a*c
+        karekok = sp.sqrt(diskriminant)
+        
+        if diskriminant == 0:
+            kokler = [-b / (2*a)]
+        else:
+            kokler = sorted([(-b - karekok) / (2*a), (-b + karekok) / (2*a)],
+                            key=sp.default_sort_key)
+        
+        if karekok.is_Rational:
+            # Rasyonel kökler: a(x - r₁)(x - r₂) = k(q₁x - p₁)(q₂x - p₂)
+            carpanlar = self._dogrusal_carpanlar(a, kokler if len(kokler) == 2 else kokler * 2)
+        else:
+            # Rasyonel sayılar üzerinde indirgenemez: içerik × ilkel polinom
+            icerik = self._polinom_icerigi(katsayilar)
+            ilkel = (a / icerik) * self.x**2 + (b / icerik) * self.x + c / icerik
+            carpanlar = _katsayi_ile_carp(icerik, ilkel)
+        
+        return kokler, carpanlar
+    
+    def _sablonla_coz(self, denklem, poly: sp.Poly) -> List:
+        """
+        Ondalıklı katsayılı polinom denklemi şablon önbelleğiyle çözer.
+        
+        Katsayılar yer tutucu yapılır ve genel çözüm yapı başına bir kez
+        sp.solve ile bulunur. Sayılar yerine konunca derece düşüyorsa
+        (genel çözüm geçersizse) doğrudan sp.solve kullanılır; çakışan
+        kökler (Δ = 0) tek köke indirilir.
+        """
+        def coz(ifade):
+            return sp.Poly(sp.expand(ifade), self.x).degree(), sp.solve(ifade, self.x)
+        
+        derece, kokler = sablonla_hesapla(("coz", self.x), denklem, coz, usler_dahil=False)
+        if derece != poly.degree() or any(kok.has(sp.nan, sp.zoo) for kok in kokler):
+            return sp.solve(denklem, self.x)
+        return list(dict.fromkeys(kokler))
+    
+    def _dogrusal_carpanlar(self, bas_katsayi, kokler: List) -> any:
+        """Rasyonel köklerden sp.factor biçiminde çarpım ifadesi kurar"""
+        carpan_ifadeleri = [kok.q * self.x - kok.p for kok in kokler]
+        katsayi = bas_katsayi
+        for kok in kokler:
+            katsayi = katsayi / kok.q
+        
+        if len(kokler) == 2 and kokler[0] == kokler[1]:
+            return _katsayi_ile_carp(katsayi, carpan_ifadeleri[0]**2)
+        return _katsayi_ile_carp(katsayi, sp.Mul(*carpan_ifadeleri))
+    
+    def _polinom_icerigi(self, katsayilar: List) -> sp.Rational:
+        """Rasyonel katsayıların işaretli içeriğini (ebob / ekok) döndürür"""
+        sifirdan_farkli = [k for k in katsayilar if k != 0]
+        icerik = sp.Rational(math.gcd(*[k.p for k in sifirdan_farkli]),
+                             math.lcm(*[k.q for k in sifirdan_farkli]))
+        return -icerik if katsayilar[0] < 0 else icerik
+    
     def carpanlara_ayir(self, ifade_str: str) -> Dict[str, any]:
         """
         Verilen ifadeyi çarpanlarına ayırır.
@@ -152,19 +993,18 @@ class CebirCozucu:
             Dict: Çözüm adımları ve sonuçları
         """
         try:
-            ifade_temizlendi = self._denklem_temizle(ifade_str)
-            ifade = sp.sympify(ifade_temizlendi)
-            
-            adimlar = []
-            adimlar.append(f"Verilen ifade: {ifade}")
+            ifade = self._denklem_ayristir(ifade_str)
             
-            # Çarpanlara ayır
-            carpanlar = sp.factor(ifade)
+            # Çarpanlara ayır (kalıcı depo açıksa sonuç süreçler arasında saklanır)
+            carpanlar = kalici_hesapla("factor", ifade, lambda: sp.factor(ifade))
             
-            if carpanlar != ifade:
-                adimlar.append(f"Çarpanlarına ayrılmış hali: {carpanlar}")
-            else:
-                adimlar.append("Bu ifade daha fazla çarpanlarına ayrılamaz.")
+            adimlar = []
+            if self.adimli:
+                adimlar.append(f"Verilen ifade: {ifade}")
+                if carpanlar != ifade:
+                    adimlar.append(f"Çarpanlarına ayrılmış hali: {carpanlar}")
+                else:
+                    adimlar.append("Bu ifade daha fazla çarpanlarına ayrılamaz.")
             
             return {
                 "basarili": True,
@@ -182,15 +1022,45 @@ class CebirCozucu:
 
 
 # Kullanım kolaylığı için global fonksiyonlar
-def ikinci_dereceden_coz(denklem: str) -> Dict[str, any]:
+def ikinci_dereceden_coz(denklem: str, hizli: bool = True, adimli: bool = True) -> Dict[str, any]:
     """İkinci dereceden denklem çözer"""
-    cozucu = CebirCozucu()
-    return cozucu.ikinci_dereceden_coz(denklem)
+    cozucu = CebirCozucu(adimli)
+    return cozucu.ikinci_dereceden_coz(denklem, hizli)
+
+
+def ikinci_dereceden_toplu_coz(a, b, c, adim_satirlari: Optional[Iterable[int]] = None, adimli: bool = True) -> Dict[str, any]:
+    """NumPy katsayı dizileri ile toplu ikinci dereceden denklem çözer"""
+    cozucu = CebirCozucu(adimli)
+    return cozucu.ikinci_dereceden_toplu_coz(a, b, c, adim_satirlari)
+
+
+def polinom_coz(denklem: str, kesin: Optional[bool] = None, adimli: bool = True) -> Dict[str, any]:
+    """Her dereceden polinom denkleminin köklerini bulur"""
+    cozucu = CebirCozucu(adimli)
+    return cozucu.polinom_coz(denklem, kesin)
+
+
+def polinom_toplu_coz(katsayilar, parlatma_adimi: int = 3, adimli: bool = True) -> Dict[str, any]:
+    """Katsayı satırlarından çok sayıda polinomun köklerini toplu bulur"""
+    cozucu = CebirCozucu(adimli)
+    return cozucu.polinom_toplu_coz(katsayilar, parlatma_adimi)
+
+
+def denklem_sistemi_coz(denklemler, kesin: Optional[bool] = None, adimli: bool = True) -> Dict[str, any]:
+    """Doğrusal denklem sistemini çözer"""
+    cozucu = CebirCozucu(adimli)
+    return cozucu.denklem_sistemi_coz(denklemler, kesin)
+
+
+def denklem_sistemi_toplu_coz(katsayi_matrisleri, sabitler, adimli: bool = True) -> Dict[str, any]:
+    """Aynı boyuttaki çok sayıda doğrusal sistemi toplu çözer"""
+    cozucu = CebirCozucu(adimli)
+    return cozucu.denklem_sistemi_toplu_coz(katsayi_matrisleri, sabitler)
 
 
-def carpanlara_ayir(ifade: str) -> Dict[str, any]:
+def carpanlara_ayir(ifade: str, adimli: bool = True) -> Dict[str, any]:
     """İfadeyi çarpanlarına ayırır"""
-    cozucu = CebirCozucu()
+    cozucu = CebirCozucu(adimli)
     return cozucu.carpanlara_ayir(ifade)
 
 
@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Diferansiyel Denklem Modülü - Türkçe Matematik Kütüphanesi
+
+Bu modül adi diferansiyel denklemlerin başlangıç değer problemlerini
+sayısal olarak çözer:
+- Tek denklem ve denklem sistemleri (y' = f(t, y))
+- Uyarlamalı Dormand-Prince 5(4) yöntemi (sert olmayan problemler)
+- Rosenbrock (ROS2) yöntemi (sert problemler; Jacobian sembolik alınır)
+- Aynı sistemin birçok başlangıç değeri için birlikte çözümü
+- Zaman ızgarası üzerinde yoğun çıktı, parçalar halinde akış
+
+Sağ taraflar analiz modülünün sözcükleyicisiyle temizlenir ve
+toplu_derle ile ortak alt ifadeleri paylaşan vektörel NumPy
+fonksiyonlarına derlenir.
+"""
+
+import re
+import numpy as np
+import sympy as sp
+from typing import Dict, List, Tuple, Optional, Any, Callable, Iterator
+
+from utils.derleyici import toplu_derle
+from modules.analiz import _sozcukleyici
+
+
+# Varsayılan toleranslar ve sınırlar
+VARSAYILAN_GORELI_TOLERANS = 1e-6
+VARSAYILAN_MUTLAK_TOLERANS = 1e-9
+AZAMI_ADIM_SAYISI = 100000
+VARSAYILAN_NOKTA_SAYISI = 101
+CIKTI_PARCA_BOYUTU = 4096
+
+YONTEM_DORMAND_PRINCE = "dormand_prince"
+YONTEM_ROSENBROCK = "rosenbrock"
+
+# Dormand-Prince 5(4) katsayıları
+_DP_C = np.array([0, 1/5, 3/10, 4/5, 8/9, 1, 1])
+_DP_A = [
+    [],
+    [1/5],
+    [3/40, 9/40],
+    [44/45, -56/15, 32/9],
+    [19372/6561, -25360/2187, 64448/6561, -212/729],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+    [35/384, 0, 500/1113, 125/192, -2187/6784, 11/84],
+]
+_DP_B = np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84, 0])
+# 5. ve 4. mertebe çözümlerin farkı (hata tahmini)
+_DP_E = _DP_B - np.array([5179/57600, 0, 7571/16695, 393/640, -92097/339200, 187/2100, 1/40])
+# Yoğun çıktı: y(t + θh) = y + h·Σ_s K_s·(P_s · [θ, θ², θ³, θ⁴])
+_DP_P = np.array([
+    [1, -8048581381/2820520608, 8663915743/2820520608, -12715105075/11282082432],
+    [0, 0, 0, 0],
+    [0, 131558114200/32700410799, -68118460800/10900136933, 87487479700/32700410799],
+    [0, -1754552775/470086768, 14199869525/1410260304, -10690763975/1880347072],
+    [0, 127303824393/49829197408, -318862633887/49829197408, 701980252875/199316789632],
+    [0, -282668133/205662961, 2019193451/616988883, -1453857185/822651844],
+    [0, 40617522/29380423, -110615467/29380423, 69997945/29380423],
+])
+
+# ROS2 (Verwer ve ark.): γ = 1 + 1/√2, L-kararlı, ikinci mertebe
+_ROS2_GAMMA = 1 + 1 / np.sqrt(2)
+
+# "y' = ...", "y1' = ..." veya "dy/dt = ..." biçimindeki denklem
+_DENKLEM_DESENI = re.compile(r"^\s*(?:d([a-zA-Z]\w*)\s*/\s*d[a-zA-Z]\w*|([a-zA-Z]\w*)\s*')\s*=\s*(.+)$")
+
+
+class _Sistem:
+    """Derlenmiş y' = f(t, y) sistemi ve (istenirse) Jacobian'ı"""
+    
+    def __init__(self, sag_taraflar: List[sp.Expr], zaman: sp.Symbol, bilinmeyenler: List[sp.Symbol],
+                 jacobian: bool):
+        argumanlar = [zaman] + bilinmeyenler
+        self._f = toplu_derle(sag_taraflar, argumanlar)
+        self._j = None
+        if jacobian:
+            # Son sütun ∂f/∂t: zamana açıkça bağlı sistemlerde Rosenbrock düzeltmesi
+            matris = sp.Matrix(sag_taraflar).jacobian(bilinmeyenler + [zaman])
+            self._j = toplu_derle(list(matris), argumanlar, (len(bilinmeyenler), len(bilinmeyenler) + 1))
+        self.degerlendirme = 0
+    
+    def _noktalar(self, t: float, Y: np.ndarray) -> np.ndarray:
+        return np.concatenate([np.full(Y.shape[:-1] + (1,), t), Y], axis=-1)
+    
+    def f(self, t: float, Y: np.ndarray) -> np.ndarray:
+        """Sağ tarafı (m, n) şeklindeki durumlar için değerlendirir"""
+        self.degerlendirme += 1
+        return self._f(self._noktalar(t, Y))
+    
+    def jacobian(self, t: float, Y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """∂f/∂y matrislerini (m, n, n) ve ∂f/∂t vektörlerini (m, n) şeklinde döndürür"""
+        matris = self._j(self._noktalar(t, Y))
+        return matris[..., :-1], matris[..., -1]
+
+
+def _hata_normu(hata: np.ndarray, y_eski: np.ndarray, y_yeni: np.ndarray,
+                goreli: float, mutlak: float) -> float:
+    """Ölçekli RMS hata normu; başlangıç değeri toplulukları için en büyüğü"""
+    olcek = mutlak + goreli * np.maximum(np.abs(y_eski), np.abs(y_yeni))
+    return float(np.max(np.sqrt(np.mean((hata / olcek)**2, axis=-1))))
+
+
+def _ilk_adim(sistem: _Sistem, t0: float, y0: np.ndarray, f0: np.ndarray, yon: float, mertebe: int,
+              goreli: float, mutlak: float) -> float:
+    """Hairer'in başlangıç adım boyu tahmini"""
+    olcek = mutlak + goreli * np.abs(y0)
+    d0 = np.sqrt(np.mean((y0 / olcek)**2))
+    d1 = np.sqrt(np.mean((f0 / olcek)**2))
+    h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+    f1 = sistem.f(t0 + yon * h0, y0 + yon * h0 * f0)
+    d2 = np.sqrt(np.mean(((f1 - f0) / olcek)**2)) / h0
+    h1 = max(1e-6, h0 * 1e-3) if max(d1, d2) <= 1e-15 else (0.01 / max(d1, d2))**(1 / (mertebe + 1))
+    return min(100 * h0, h1)
+
+
+def _adim_dongusu(adim_at: Callable, sistem: _Sistem, t0: float, y0: np.ndarray, t_son: float,
+                  mertebe: int, goreli: float, mutlak: float, istatistik: Dict[str, int]) -> Iterator[Tuple]:
+    """
+    Ortak uyarlamalı adım denetimi: hata normu 1'i aşarsa adım reddedilir,
+    yeni adım boyu 0.9·hata^(-1/(mertebe+1)) katsayısıyla [0.2, 10] aralığında
+    değiştirilir. Kabul edilen her adım için (t_eski, t_yeni, ara_deger) üretir.
+    """
+    yon = 1.0 if t_son > t0 else -1.0
+    t, y = t0, y0
+    f = sistem.f(t, y)
+    h = _ilk_adim(sistem, t, y, f, yon, mertebe, goreli, mutlak)
+    
+    while yon * (t_son - t) > 0:
+        if istatistik["adim"] + istatistik["reddedilen"] >= AZAMI_ADIM_SAYISI:
+            raise RuntimeError(f"Adım sayısı sınırı ({AZAMI_ADIM_SAYISI}) aşıldı "
+                               "(problem sert olabilir; 'rosenbrock' yöntemini deneyin)")
+        if h < 10 * np.finfo(float).eps * max(1.0, abs(t)):
+            raise RuntimeError(f"t = {t:g} civarında adım boyu çok küçüldü "
+                               "(problem sert olabilir; 'rosenbrock' yöntemini deneyin)")
+        
+        son_adim = h >= abs(t_son - t)
+        h = abs(t_son - t) if son_adim else h
+        y_yeni, f_yeni, hata, ara_deger = adim_at(t, y, f, yon * h)
+        t_yeni = t_son if son_adim else t + yon * h
+        
+        with np.errstate(all="ignore"):
+            norm = _hata_normu(hata, y, y_yeni, goreli, mutlak)
+        if not np.isfinite(norm):
+            istatistik["reddedilen"] += 1
+            h *= 0.2
+            continue
+        katsayi = 10.0 if norm == 0 else min(10.0, max(0.2, 0.9 * norm**(-1 / (mertebe + 1))))
+        if norm > 1:
+            istatistik["reddedilen"] += 1
+            h *= min(1.0, katsayi)
+            continue
+        
+        istatistik["adim"] += 1
+        yield t, t_yeni, ara_deger
+        t, y, f = t_yeni, y_yeni, f_yeni
+        h *= katsayi
+
+
+def dormand_prince_adimlari(sistem: _Sistem, t0: float, y0: np.ndarray, t_son: float, goreli: float,
+                            mutlak: float, istatistik: Dict[str, int]) -> Iterator[Tuple]:
+    """Dormand-Prince 5(4) adımları; ara değerler 4. mertebe sürekli genişlemeyle"""
+    def adim_at(t, y, f, h):
+        K = [f]
+        for s in range(1, 7):
+            artis = sum(a * k for a, k in zip(_DP_A[s], K) if a != 0)
+            K.append(sistem.f(t + _DP_C[s] * h, y + h * artis))
+        K = np.stack(K)
+        y_yeni = y + h * np.tensordot(_DP_B, K, axes=1)
+        hata = h * np.tensordot(_DP_E, K, axes=1)
+        # FSAL: son aşama yeni noktadaki f'dir
+        f_yeni = K[-1]
+        Q = np.tensordot(K, _DP_P, axes=([0], [0]))
+        
+        def ara_deger(tler):
+            teta = (np.asarray(tler) - t) / h
+            kuvvetler = teta[:, None] ** np.arange(1, 5)
+            return y + h * np.tensordot(kuvvetler, Q, axes=([1], [-1])).reshape((len(teta),) + y.shape)
+        
+        return y_yeni, f_yeni, hata, ara_deger
+    
+    return _adim_dongusu(adim_at, sistem, t0, y0, t_son, 4, goreli, mutlak, istatistik)
+
+
+def rosenbrock_adimlari(sistem: _Sistem, t0: float, y0: np.ndarray, t_son: float, goreli: float,
+                        mutlak: float, istatistik: Dict[str, int]) -> Iterator[Tuple]:
+    """
+    ROS2 adımları:
+        (I - γhJ)k1 = f(t, y) + γh·∂f/∂t
+        (I - γhJ)k2 = f(t + h, y + h·k1) - 2·k1 - γh·∂f/∂t
+        y' = y + 3/2·h·k1 + 1/2·h·k2, hata ≈ 1/2·h·(k1 + k2)
+    ∂f/∂t terimleri sistemin t' = 1 ile özerkleştirilmesinden gelir; bunlar
+    olmadan zamana bağlı sistemlerde yöntem birinci mertebeye düşer.
+    Ara değerler kübik Hermite interpolasyonuyla hesaplanır.
+    """
+    birim = np.eye(y0.shape[-1])
+    
+    def adim_at(t, y, f, h):
+        J, f_t = sistem.jacobian(t, y)
+        W = birim - _ROS2_GAMMA * h * J
+        zaman_duzeltmesi = _ROS2_GAMMA * h * f_t
+        k1 = np.linalg.solve(W, (f + zaman_duzeltmesi)[..., None])[..., 0]
+        f1 = sistem.f(t + h, y + h * k1)
+        k2 = np.linalg.solve(W, (f1 - 2 * k1 - zaman_duzeltmesi)[..., None])[..., 0]
+        y_yeni = y + h * (1.5 * k1 + 0.5 * k2)
+        hata = 0.5 * h * (k1 + k2)
+        f_yeni = sistem.f(t + h, y_yeni)
+        
+        def ara_deger(tler):
+            teta = ((np.asarray(tler) - t) / h).reshape((-1,) + (1,) * y.ndim)
+            h00, h10 = 2 * teta**3 - 3 * teta**2 + 1, teta**3 - 2 * teta**2 + teta
+            h01, h11 = -2 * teta**3 + 3 * teta**2, teta**3 - teta**2
+            return h00 * y + h10 * h * f + h01 * y_yeni + h11 * h * f_yeni
+        
+        return y_yeni, f_yeni, hata, ara_deger
+    
+    return _adim_dongusu(adim_at, sistem, t0, y0, t_son, 1, goreli, mutlak, istatistik)
+
+
+def yogun_cikti(adimlar: Iterator[Tuple], t0: float, t_son: float, nokta_sayisi: int,
+                parca_boyutu: int = CIKTI_PARCA_BOYUTU) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Çözümü eşit aralıklı zaman ızgarasında parça parça üretir.
+    
+    Çözücü adımları tembel ilerletilir; her ızgara noktası onu içeren
+    adımın ara değer fonksiyonuyla hesaplanır. Bellekte aynı anda bir
+    parça ve tek bir adım tutulur.
+    
+    Yields:
+        Tuple[np.ndarray, np.ndarray]: (t parçası, y parçası (k, m, n))
+    """
+    yon = 1.0 if t_son > t0 else -1.0
+    adim = next(adimlar)
+    for bas in range(0, nokta_sayisi, parca_boyutu):
+        indeksler = np.arange(bas, min(bas + parca_boyutu, nokta_sayisi))
+        t = np.clip(t0 + (t_son - t0) * indeksler / (nokta_sayisi - 1), min(t0, t_son), max(t0, t_son))
+        t[indeksler == nokta_sayisi - 1] = t_son
+        parcalar = []
+        i = 0
+        while i < len(t):
+            # Son adım tam olarak t_son'da biter; döngü her zaman sonlanır
+            while yon * (t[i] - adim[1]) > 0:
+                adim = next(adimlar)
+            j = i + int(np.searchsorted(yon * t[i:], yon * adim[1], side="right"))
+            parcalar.append(adim[2](t[i:j]))
+            i = j
+        yield t, np.concatenate(parcalar)
+
+
+class DiferansiyelCozucu:
+    """Adi diferansiyel denklemler için başlangıç değer problemi çözücüsü"""
+    
+    def __init__(self, adimli: bool = True):
+        # adimli=False ise çözüm adımı metinleri üretilmez (hızlı mod)
+        self.adimli = adimli
+    
+    def baslangic_deger_problemi_coz(self, denklemler, baslangic_degerleri, t_araligi,
+                                     degiskenler=None, zaman: str = 't',
+                                     yontem: str = YONTEM_DORMAND_PRINCE,
+                                     nokta_sayisi: int = VARSAYILAN_NOKTA_SAYISI,
+                                     goreli_tolerans: float = VARSAYILAN_GORELI_TOLERANS,
+                                     mutlak_tolerans: float = VARSAYILAN_MUTLAK_TOLERANS,
+                                     akis: bool = False,
+                                     parca_boyutu: int = CIKTI_PARCA_BOYUTU) -> Dict[str, Any]:
+        """
+        y' = f(t, y), y(t0) = y0 başlangıç değer problemini sayısal olarak çözer.
+        
+        Args:
+            denklemler (str veya List[str]): Sağ taraflar ("-2*y + sin(t)") veya
+                "y' = ...", "dy/dt = ..." biçiminde denklemler; metin olarak
+                birden çok denklem ";" veya satır sonuyla ayrılır
+            baslangic_degerleri (array_like): y(t0); (n,) veya birlikte çözülecek
+                m başlangıç değeri için (m, n)
+            t_araligi (Tuple): (t0, t_son)
+            degiskenler (str veya List[str]): Bilinmeyenler ("x,v"); denklemlerin
+                sol tarafından veya tek denklemde "y" olarak alınabilir
+            zaman (str): Bağımsız değişken (varsayılan: t)
+            yontem (str): "dormand_prince" veya sert problemler için "rosenbrock"
+            nokta_sayisi (int): Çözümün verileceği eşit aralıklı zaman noktası sayısı
+            goreli_tolerans (float): Adım başına göreli hata toleransı
+            mutlak_tolerans (float): Adım başına mutlak hata toleransı
+            akis (bool): True ise çözüm "parcalar" anahtarında (t, y) parçaları
+                üreten bir üreteç olarak döndürülür (büyük ızgaralar için)
+            parca_boyutu (int): Akışta parça başına zaman noktası sayısı
+        
+        Returns:
+            Dict: Zaman ızgarası "t", çözüm "y" ((nokta, n) veya (nokta, m, n)) ve istatistikler
+        """
+        try:
+            if yontem not in (YONTEM_DORMAND_PRINCE, YONTEM_ROSENBROCK):
+                return {
+                    "basarili": False,
+                    "hata": f"Bilinmeyen yöntem: {yontem} ('{YONTEM_DORMAND_PRINCE}' veya '{YONTEM_ROSENBROCK}')",
+                    "adimlar": []
+                }
+            if nokta_sayisi < 2 or parca_boyutu < 1:
+                return {
+                    "basarili": False,
+                    "hata": "Nokta sayısı en az 2, parça boyutu en az 1 olmalı",
+                    "adimlar": []
+                }
+            
+            try:
+                sag_taraflar, bilinmeyenler, t = self._sistemi_ayristir(denklemler, degiskenler, zaman)
+                t0, t_son = (float(sp.sympify(str(s).replace("π", "pi"))) for s in t_araligi)
+                y0 = np.array(baslangic_degerleri, dtype=float)
+            except Exception as e:
+                return {
+                    "basarili": False,
+                    "hata": f"Denklemler veya başlangıç değerleri ayrıştırılamadı: {str(e)}",
+                    "adimlar": []
+                }
+            
+            n = len(bilinmeyenler)
+            if y0.ndim == 0 and n == 1:
+                y0 = y0.reshape(1)
+            if y0.shape[-1:] != (n,) or y0.ndim > 2:
+                return {
+                    "basarili": False,
+                    "hata": f"Başlangıç değerleri {n} bilinmeyenle uyuşmuyor: {y0.shape}",
+                    "adimlar": []
+                }
+            if not (np.isfinite(t0) and np.isfinite(t_son)) or t0 == t_son:
+                return {
+                    "basarili": False,
+                    "hata": "Zaman aralığı sonlu ve uzunluğu sıfırdan farklı olmalı",
+                    "adimlar": []
+                }
+            fazla = set().union(*(f.free_symbols for f in sag_taraflar)) - set(bilinmeyenler) - {t}
+            if fazla:
+                return {
+                    "basarili": False,
+                    "hata": f"Tanımsız semboller: {', '.join(sorted(map(str, fazla)))}",
+                    "adimlar": []
+                }
+            
+            sistem = _Sistem(sag_taraflar, t, bilinmeyenler, yontem == YONTEM_ROSENBROCK)
+            istatistik = {"adim": 0, "reddedilen": 0}
+            adim_uretici = dormand_prince_adimlari if yontem == YONTEM_DORMAND_PRINCE else rosenbrock_adimlari
+            adimlar = adim_uretici(sistem, t0, np.atleast_2d(y0), t_son,
+                                   goreli_tolerans, mutlak_tolerans, istatistik)
+            
+            def parcalar():
+                for t_parca, y_parca in yogun_cikti(adimlar, t0, t_son, nokta_sayisi, parca_boyutu):
+                    yield t_parca, (y_parca if y0.ndim == 2 else y_parca[:, 0])
+            
+            adim_metinleri = []
+            if self.adimli:
+                for x, f in zip(bilinmeyenler, sag_taraflar):
+                    adim_metinleri.append(f"{x}' = {f}")
+                adim_metinleri.append(f"Başlangıç: {t}0 = {t0:g}, "
+                                      + ", ".join(f"{x}({t0:g}) = {d}" for x, d in zip(bilinmeyenler, y0.T.tolist())))
+                adim_metinleri.append({
+                    YONTEM_DORMAND_PRINCE: "Yöntem: uyarlamalı Dormand-Prince 5(4)",
+                    YONTEM_ROSENBROCK: "Yöntem: Rosenbrock (ROS2), sembolik Jacobian ile"
+                }[yontem])
+            
+            sonuc = {
+                "basarili": True,
+                "adimlar": adim_metinleri,
+                "denklemler": [f"{x}' = {f}" for x, f in zip(bilinmeyenler, sag_taraflar)],
+                "degiskenler": [str(x) for x in bilinmeyenler],
+                "zaman": str(t),
+                "yontem": yontem,
+                "t_araligi": (t0, t_son)
+            }
+            if akis:
+                sonuc["parcalar"] = parcalar()
+                sonuc["istatistik"] = istatistik
+                return sonuc
+            
+            t_degerleri, y_degerleri = zip(*parcalar())
+            sonuc.update({
+                "t": np.concatenate(t_degerleri),
+                "y": np.concatenate(y_degerleri),
+                "adim_sayisi": istatistik["adim"],
+                "reddedilen_adim": istatistik["reddedilen"],
+                "fonksiyon_degerlendirme": sistem.degerlendirme
+            })
+            if self.adimli:
+                adim_metinleri.append(f"{istatistik['adim']} adım kabul edildi, {istatistik['reddedilen']} adım reddedildi")
+            return sonuc
+        
+        except Exception as e:
+            return {
+                "basarili": False,
+                "hata": f"Diferansiyel denklem çözümü sırasında hata: {str(e)}",
+                "adimlar": []
+            }
+    
+    def _sistemi_ayristir(self, denklemler, degiskenler, zaman: str) -> Tuple[List[sp.Expr], List[sp.Symbol], sp.Symbol]:
+        """Denklemleri sağ taraflara, bilinmeyen sembollerine ve zaman sembolüne ayırır"""
+        if isinstance(denklemler, str):
+            denklemler = [d for d in re.split(r"[;\n]", denklemler) if d.strip()]
+        if not denklemler:
+            raise ValueError("En az bir denklem gerekli")
+        
+        sol_taraflar, sag_taraflar = [], []
+        for denklem in denklemler:
+            eslesme = _DENKLEM_DESENI.match(denklem)
+            sol_taraflar.append((eslesme.group(1) or eslesme.group(2)) if eslesme else None)
+            sag_taraflar.append(sp.sympify(_sozcukleyici.ifadeye_cevir(eslesme.group(3) if eslesme else denklem)))
+        
+        if isinstance(degiskenler, str):
+            degiskenler = [d.strip() for d in degiskenler.split(",") if d.strip()]
+        if not degiskenler:
+            if all(sol_taraflar):
+                degiskenler = sol_taraflar
+            elif len(sag_taraflar) == 1:
+                degiskenler = ["y"]
+            else:
+                degiskenler = [f"y{i + 1}" for i in range(len(sag_taraflar))]
+        if len(degiskenler) != len(sag_taraflar):
+            raise ValueError(f"{len(sag_taraflar)} denklem için {len(degiskenler)} bilinmeyen verildi")
+        
+        return sag_taraflar, [sp.Symbol(d) for d in degiskenler], sp.Symbol(zaman)
+
+
+# Global fonksiyonlar
+def baslangic_deger_problemi_coz(denklemler, baslangic_degerleri, t_araligi, degiskenler=None,
+                                 zaman: str = 't', yontem: str = YONTEM_DORMAND_PRINCE,
+                                 nokta_sayisi: int = VARSAYILAN_NOKTA_SAYISI,
+                                 goreli_tolerans: float = VARSAYILAN_GORELI_TOLERANS,
+                                 mutlak_tolerans: float = VARSAYILAN_MUTLAK_TOLERANS,
+                                 akis: bool = False, parca_boyutu: int = CIKTI_PARCA_BOYUTU,
+                                 adimli: bool = True) -> Dict[str, Any]:
+    """Adi diferansiyel denklem(ler)in başlangıç değer problemini sayısal olarak çözer"""
+    cozucu = DiferansiyelCozucu(adimli)
+    return cozucu.baslangic_deger_problemi_coz(denklemler, baslangic_degerleri, t_araligi, degiskenler,
+                                               zaman, yontem, nokta_sayisi, goreli_tolerans,
+                                               mutlak_tolerans, akis, parca_boyutu)
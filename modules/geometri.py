@@ -19,8 +19,10 @@ import re
 class GeometriCozucu:
     """Ana geometri çözücü sınıfı"""
     
-    def __init__(self):
+    def __init__(self, adimli: bool = True):
         self.pi = math.pi
+        # adimli=False ise çözüm adımı metinleri üretilmez (hızlı mod)
+        self.adimli = adimli
         
     def ucgen_hesaplama(self, hesaplama_turu: str, **kwargs) -> Dict[str, Any]:
         """
@@ -73,11 +75,12 @@ class GeometriCozucu:
             
             alan = (taban * yukseklik) / 2
             
-            adimlar.append(f"Üçgen alan formülü: Alan = (taban × yükseklik) / 2")
-            adimlar.append(f"Verilen: taban = {taban}, yükseklik = {yukseklik}")
-            adimlar.append(f"Alan = ({taban} × {yukseklik}) / 2")
-            adimlar.append(f"Alan = {taban * yukseklik} / 2")
-            adimlar.append(f"Alan = {alan}")
+            if self.adimli:
+                adimlar.append(f"Üçgen alan formülü: Alan = (taban × yükseklik) / 2")
+                adimlar.append(f"Verilen: taban = {taban}, yükseklik = {yukseklik}")
+                adimlar.append(f"Alan = ({taban} × {yukseklik}) / 2")
+                adimlar.append(f"Alan = {taban * yukseklik} / 2")
+                adimlar.append(f"Alan = {alan}")
             
             return {
                 "basarili": True,
@@ -105,15 +108,16 @@ class GeometriCozucu:
             s = (a + b + c) / 2  # Yarı çevre
             alan = math.sqrt(s * (s - a) * (s - b) * (s - c))
             
-            adimlar.append(f"Heron formülü: Alan = √[s(s-a)(s-b)(s-c)]")
-            adimlar.append(f"Verilen kenarlar: a = {a}, b = {b}, c = {c}")
-            adimlar.append(f"Yarı çevre: s = (a + b + c) / 2 = ({a} + {b} + {c}) / 2 = {s}")
-            adimlar.append(f"s - a = {s} - {a} = {s - a}")
-            adimlar.append(f"s - b = {s} - {b} = {s - b}")
-            adimlar.append(f"s - c = {s} - {c} = {s - c}")
-            adimlar.append(f"Alan = √[{s} × {s - a} × {s - b} × {s - c}]")
-            adimlar.append(f"Alan = √[{s * (s - a) * (s - b) * (s - c)}]")
-            adimlar.append(f"Alan = {alan:.6f}")
+            if self.adimli:
+                adimlar.append(f"Heron formülü: Alan = √[s(s-a)(s-b)(s-c)]")
+                adimlar.append(f"Verilen kenarlar: a = {a}, b = {b}, c = {c}")
+                adimlar.append(f"Yarı çevre: s = (a + b + c) / 2 = ({a} + {b} + {c}) / 2 = {s}")
+                adimlar.append(f"s - a = {s} - {a} = {s - a}")
+                adimlar.append(f"s - b = {s} - {b} = {s - b}")
+                adimlar.append(f"s - c = {s} - {c} = {s - c}")
+                adimlar.append(f"Alan = √[{s} × {s - a} × {s - b} × {s - c}]")
+                adimlar.append(f"Alan = √[{s * (s - a) * (s - b) * (s - c)}]")
+                adimlar.append(f"Alan = {alan:.6f}")
             
             return {
                 "basarili": True,
@@ -133,13 +137,14 @@ class GeometriCozucu:
             aci_radyan = math.radians(aci)
             alan = (kenar1 * kenar2 * math.sin(aci_radyan)) / 2
             
-            adimlar.append(f"İki kenar ve aralarındaki açı ile alan formülü:")
-            adimlar.append(f"Alan = (kenar1 × kenar2 × sin(açı)) / 2")
-            adimlar.append(f"Verilen: kenar1 = {kenar1}, kenar2 = {kenar2}, açı = {aci}°")
-            adimlar.append(f"Açıyı radyana çevir: {aci}° = {aci_radyan:.6f} radyan")
-            adimlar.append(f"sin({aci}°) = {math.sin(aci_radyan):.6f}")
-            adimlar.append(f"Alan = ({kenar1} × {kenar2} × {math.sin(aci_radyan):.6f}) / 2")
-            adimlar.append(f"Alan = {alan:.6f}")
+            if self.adimli:
+                adimlar.append(f"İki kenar ve aralarındaki açı ile alan formülü:")
+                adimlar.append(f"Alan = (kenar1 × kenar2 × sin(açı)) / 2")
+                adimlar.append(f"Verilen: kenar1 = {kenar1}, kenar2 = {kenar2}, açı = {aci}°")
+                adimlar.append(f"Açıyı radyana çevir: {aci}° = {aci_radyan:.6f} radyan")
+                adimlar.append(f"sin({aci}°) = {math.sin(aci_radyan):.6f}")
+                adimlar.append(f"Alan = ({kenar1} × {kenar2} × {math.sin(aci_radyan):.6f}) / 2")
+                adimlar.append(f"Alan = {alan:.6f}")
             
             return {
                 "basarili": True,
@@ -170,9 +175,10 @@ class GeometriCozucu:
             
             cevre = a + b + c
             
-            adimlar.append(f"Üçgen çevre formülü: Çevre = a + b + c")
-            adimlar.append(f"Verilen kenarlar: a = {a}, b = {b}, c = {c}")
-            adimlar.append(f"Çevre = {a} + {b} + {c} = {cevre}")
+            if self.adimli:
+                adimlar.append(f"Üçgen çevre formülü: Çevre = a + b + c")
+                adimlar.append(f"Verilen kenarlar: a = {a}, b = {b}, c = {c}")
+                adimlar.append(f"Çevre = {a} + {b} + {c} = {cevre}")
             
             return {
                 "basarili": True,
@@ -200,10 +206,11 @@ class GeometriCozucu:
                 
                 c = math.sqrt(a**2 + b**2)
                 
-                adimlar.append(f"Dik üçgen - Pisagor teoremi: c² = a² + b²")
-                adimlar.append(f"Verilen dik kenarlar: a = {a}, b = {b}")
-                adimlar.append(f"c² = {a}² + {b}² = {a**2} + {b**2} = {a**2 + b**2}")
-                adimlar.append(f"c = √{a**2 + b**2} = {c:.6f}")
+                if self.adimli:
+                    adimlar.append(f"Dik üçgen - Pisagor teoremi: c² = a² + b²")
+                    adimlar.append(f"Verilen dik kenarlar: a = {a}, b = {b}")
+                    adimlar.append(f"c² = {a}² + {b}² = {a**2} + {b**2} = {a**2 + b**2}")
+                    adimlar.append(f"c = √{a**2 + b**2} = {c:.6f}")
                 
                 return {
                     "basarili": True,
@@ -222,14 +229,15 @@ class GeometriCozucu:
             aci_c_radyan = math.radians(aci_c)
             c = math.sqrt(a**2 + b**2 - 2 * a * b * math.cos(aci_c_radyan))
             
-            adimlar.append(f"Kosinüs kuralı: c² = a² + b² - 2ab cos(C)")
-            adimlar.append(f"Verilen: a = {a}, b = {b}, C = {aci_c}°")
-            adimlar.append(f"C açısını radyana çevir: {aci_c}° = {aci_c_radyan:.6f} radyan")
-            adimlar.append(f"cos({aci_c}°) = {math.cos(aci_c_radyan):.6f}")
-            adimlar.append(f"c² = {a}² + {b}² - 2×{a}×{b}×{math.cos(aci_c_radyan):.6f}")
-            adimlar.append(f"c² = {a**2} + {b**2} - {2 * a * b * math.cos(aci_c_radyan):.6f}")
-            adimlar.append(f"c² = {a**2 + b**2 - 2 * a * b * math.cos(aci_c_radyan):.6f}")
-            adimlar.append(f"c = √{a**2 + b**2 - 2 * a * b * math.cos(aci_c_radyan):.6f} = {c:.6f}")
+            if self.adimli:
+                adimlar.append(f"Kosinüs kuralı: c² = a² + b² - 2ab cos(C)")
+                adimlar.append(f"Verilen: a = {a}, b = {b}, C = {aci_c}°")
+                adimlar.append(f"C açısını radyana çevir: {aci_c}° = {aci_c_radyan:.6f} radyan")
+                adimlar.append(f"cos({aci_c}°) = {math.cos(aci_c_radyan):.6f}")
+                adimlar.append(f"c² = {a}² + {b}² - 2×{a}×{b}×{math.cos(aci_c_radyan):.6f}")
+                adimlar.append(f"c² = {a**2} + {b**2} - {2 * a * b * math.cos(aci_c_radyan):.6f}")
+                adimlar.append(f"c² = {a**2 + b**2 - 2 * a * b * math.cos(aci_c_radyan):.6f}")
+                adimlar.append(f"c = √{a**2 + b**2 - 2 * a * b * math.cos(aci_c_radyan):.6f} = {c:.6f}")
             
             return {
                 "basarili": True,
@@ -259,10 +267,11 @@ class GeometriCozucu:
             
             c = math.sqrt(a**2 + b**2)
             
-            adimlar.append(f"Pisagor teoremi: a² + b² = c²")
-            adimlar.append(f"Verilen dik kenarlar: a = {a}, b = {b}")
-            adimlar.append(f"c² = a² + b² = {a}² + {b}² = {a**2} + {b**2} = {a**2 + b**2}")
-            adimlar.append(f"c = √{a**2 + b**2} = {c:.6f}")
+            if self.adimli:
+                adimlar.append(f"Pisagor teoremi: a² + b² = c²")
+                adimlar.append(f"Verilen dik kenarlar: a = {a}, b = {b}")
+                adimlar.append(f"c² = a² + b² = {a}² + {b}² = {a**2} + {b**2} = {a**2 + b**2}")
+                adimlar.append(f"c = √{a**2 + b**2} = {c:.6f}")
             
             return {
                 "basarili": True,
@@ -280,11 +289,12 @@ class GeometriCozucu:
                 a = float(kwargs["a"])
                 b = math.sqrt(c**2 - a**2)
                 
-                adimlar.append(f"Pisagor teoremi: a² + b² = c²")
-                adimlar.append(f"b² = c² - a²")
-                adimlar.append(f"Verilen: c = {c}, a = {a}")
-                adimlar.append(f"b² = {c}² - {a}² = {c**2} - {a**2} = {c**2 - a**2}")
-                adimlar.append(f"b = √{c**2 - a**2} = {b:.6f}")
+                if self.adimli:
+                    adimlar.append(f"Pisagor teoremi: a² + b² = c²")
+                    adimlar.append(f"b² = c² - a²")
+                    adimlar.append(f"Verilen: c = {c}, a = {a}")
+                    adimlar.append(f"b² = {c}² - {a}² = {c**2} - {a**2} = {c**2 - a**2}")
+                    adimlar.append(f"b = √{c**2 - a**2} = {b:.6f}")
                 
                 return {
                     "basarili": True,
@@ -299,11 +309,12 @@ class GeometriCozucu:
                 b = float(kwargs["b"])
                 a = math.sqrt(c**2 - b**2)
                 
-                adimlar.append(f"Pisagor teoremi: a² + b² = c²")
-                adimlar.append(f"a² = c² - b²")
-                adimlar.append(f"Verilen: c = {c}, b = {b}")
-                adimlar.append(f"a² = {c}² - {b}² = {c**2} - {b**2} = {c**2 - b**2}")
-                adimlar.append(f"a = √{c**2 - b**2} = {a:.6f}")
+                if self.adimli:
+                    adimlar.append(f"Pisagor teoremi: a² + b² = c²")
+                    adimlar.append(f"a² = c² - b²")
+                    adimlar.append(f"Verilen: c = {c}, b = {b}")
+                    adimlar.append(f"a² = {c}² - {b}² = {c**2} - {b**2} = {c**2 - b**2}")
+                    adimlar.append(f"a = √{c**2 - b**2} = {a:.6f}")
                 
                 return {
                     "basarili": True,
@@ -334,12 +345,13 @@ class GeometriCozucu:
             aci_c_radyan = math.radians(aci_c)
             c = math.sqrt(a**2 + b**2 - 2 * a * b * math.cos(aci_c_radyan))
             
-            adimlar.append(f"Kosinüs kuralı: c² = a² + b² - 2ab cos(C)")
-            adimlar.append(f"Verilen: a = {a}, b = {b}, C = {aci_c}°")
-            adimlar.append(f"cos({aci_c}°) = {math.cos(aci_c_radyan):.6f}")
-            adimlar.append(f"c² = {a**2} + {b**2} - 2×{a}×{b}×{math.cos(aci_c_radyan):.6f}")
-            adimlar.append(f"c² = {a**2 + b**2 - 2 * a * b * math.cos(aci_c_radyan):.6f}")
-            adimlar.append(f"c = {c:.6f}")
+            if self.adimli:
+                adimlar.append(f"Kosinüs kuralı: c² = a² + b² - 2ab cos(C)")
+                adimlar.append(f"Verilen: a = {a}, b = {b}, C = {aci_c}°")
+                adimlar.append(f"cos({aci_c}°) = {math.cos(aci_c_radyan):.6f}")
+                adimlar.append(f"c² = {a**2} + {b**2} - 2×{a}×{b}×{math.cos(aci_c_radyan):.6f}")
+                adimlar.append(f"c² = {a**2 + b**2 - 2 * a * b * math.cos(aci_c_radyan):.6f}")
+                adimlar.append(f"c = {c:.6f}")
             
             return {
                 "basarili": True,
@@ -360,11 +372,12 @@ class GeometriCozucu:
             aci_c_radyan = math.acos(cos_c)
             aci_c = math.degrees(aci_c_radyan)
             
-            adimlar.append(f"Kosinüs kuralı: cos(C) = (a² + b² - c²) / (2ab)")
-            adimlar.append(f"Verilen kenarlar: a = {a}, b = {b}, c = {c}")
-            adimlar.append(f"cos(C) = ({a**2} + {b**2} - {c**2}) / (2×{a}×{b})")
-            adimlar.append(f"cos(C) = {a**2 + b**2 - c**2} / {2 * a * b} = {cos_c:.6f}")
-            adimlar.append(f"C = arccos({cos_c:.6f}) = {aci_c:.6f}°")
+            if self.adimli:
+                adimlar.append(f"Kosinüs kuralı: cos(C) = (a² + b² - c²) / (2ab)")
+                adimlar.append(f"Verilen kenarlar: a = {a}, b = {b}, c = {c}")
+                adimlar.append(f"cos(C) = ({a**2} + {b**2} - {c**2}) / (2×{a}×{b})")
+                adimlar.append(f"cos(C) = {a**2 + b**2 - c**2} / {2 * a * b} = {cos_c:.6f}")
+                adimlar.append(f"C = arccos({cos_c:.6f}) = {aci_c:.6f}°")
             
             return {
                 "basarili": True,
@@ -400,13 +413,14 @@ class GeometriCozucu:
             
             b = (a * math.sin(aci_b_radyan)) / math.sin(aci_a_radyan)
             
-            adimlar.append(f"Sinüs kuralı: a/sin(A) = b/sin(B)")
-            adimlar.append(f"Verilen: a = {a}, A = {aci_a}°, B = {aci_b}°")
-            adimlar.append(f"b = (a × sin(B)) / sin(A)")
-            adimlar.append(f"sin({aci_a}°) = {math.sin(aci_a_radyan):.6f}")
-            adimlar.append(f"sin({aci_b}°) = {math.sin(aci_b_radyan):.6f}")
-            adimlar.append(f"b = ({a} × {math.sin(aci_b_radyan):.6f}) / {math.sin(aci_a_radyan):.6f}")
-            adimlar.append(f"b = {b:.6f}")
+            if self.adimli:
+                adimlar.append(f"Sinüs kuralı: a/sin(A) = b/sin(B)")
+                adimlar.append(f"Verilen: a = {a}, A = {aci_a}°, B = {aci_b}°")
+                adimlar.append(f"b = (a × sin(B)) / sin(A)")
+                adimlar.append(f"sin({aci_a}°) = {math.sin(aci_a_radyan):.6f}")
+                adimlar.append(f"sin({aci_b}°) = {math.sin(aci_b_radyan):.6f}")
+                adimlar.append(f"b = ({a} × {math.sin(aci_b_radyan):.6f}) / {math.sin(aci_a_radyan):.6f}")
+                adimlar.append(f"b = {b:.6f}")
             
             return {
                 "basarili": True,
@@ -437,12 +451,13 @@ class GeometriCozucu:
             aci_b_radyan = math.asin(sin_b)
             aci_b = math.degrees(aci_b_radyan)
             
-            adimlar.append(f"Sinüs kuralı: a/sin(A) = b/sin(B)")
-            adimlar.append(f"Verilen: a = {a}, b = {b}, A = {aci_a}°")
-            adimlar.append(f"sin(B) = (b × sin(A)) / a")
-            adimlar.append(f"sin({aci_a}°) = {math.sin(aci_a_radyan):.6f}")
-            adimlar.append(f"sin(B) = ({b} × {math.sin(aci_a_radyan):.6f}) / {a} = {sin_b:.6f}")
-            adimlar.append(f"B = arcsin({sin_b:.6f}) = {aci_b:.6f}°")
+            if self.adimli:
+                adimlar.append(f"Sinüs kuralı: a/sin(A) = b/sin(B)")
+                adimlar.append(f"Verilen: a = {a}, b = {b}, A = {aci_a}°")
+                adimlar.append(f"sin(B) = (b × sin(A)) / a")
+                adimlar.append(f"sin({aci_a}°) = {math.sin(aci_a_radyan):.6f}")
+                adimlar.append(f"sin(B) = ({b} × {math.sin(aci_a_radyan):.6f}) / {a} = {sin_b:.6f}")
+                adimlar.append(f"B = arcsin({sin_b:.6f}) = {aci_b:.6f}°")
             
             return {
                 "basarili": True,
@@ -513,9 +528,10 @@ class GeometriCozucu:
         if hesaplama_turu == "alan":
             alan = kenar ** 2
             
-            adimlar.append(f"Kare alan formülü: Alan = kenar²")
-            adimlar.append(f"Verilen kenar: {kenar}")
-            adimlar.append(f"Alan = {kenar}² = {alan}")
+            if self.adimli:
+                adimlar.append(f"Kare alan formülü: Alan = kenar²")
+                adimlar.append(f"Verilen kenar: {kenar}")
+                adimlar.append(f"Alan = {kenar}² = {alan}")
             
             return {
                 "basarili": True,
@@ -528,9 +544,10 @@ class GeometriCozucu:
         elif hesaplama_turu == "cevre":
             cevre = 4 * kenar
             
-            adimlar.append(f"Kare çevre formülü: Çevre = 4 × kenar")
-            adimlar.append(f"Verilen kenar: {kenar}")
-            adimlar.append(f"Çevre = 4 × {kenar} = {cevre}")
+            if self.adimli:
+                adimlar.append(f"Kare çevre formülü: Çevre = 4 × kenar")
+                adimlar.append(f"Verilen kenar: {kenar}")
+                adimlar.append(f"Çevre = 4 × {kenar} = {cevre}")
             
             return {
                 "basarili": True,
@@ -564,9 +581,10 @@ class GeometriCozucu:
         if hesaplama_turu == "alan":
             alan = uzun_kenar * kisa_kenar
             
-            adimlar.append(f"Dikdörtgen alan formülü: Alan = uzun kenar × kısa kenar")
-            adimlar.append(f"Verilen: uzun kenar = {uzun_kenar}, kısa kenar = {kisa_kenar}")
-            adimlar.append(f"Alan = {uzun_kenar} × {kisa_kenar} = {alan}")
+            if self.adimli:
+                adimlar.append(f"Dikdörtgen alan formülü: Alan = uzun kenar × kısa kenar")
+                adimlar.append(f"Verilen: uzun kenar = {uzun_kenar}, kısa kenar = {kisa_kenar}")
+                adimlar.append(f"Alan = {uzun_kenar} × {kisa_kenar} = {alan}")
             
             return {
                 "basarili": True,
@@ -580,9 +598,10 @@ class GeometriCozucu:
         elif hesaplama_turu == "cevre":
             cevre = 2 * (uzun_kenar + kisa_kenar)
             
-            adimlar.append(f"Dikdörtgen çevre formülü: Çevre = 2 × (uzun kenar + kısa kenar)")
-            adimlar.append(f"Verilen: uzun kenar = {uzun_kenar}, kısa kenar = {kisa_kenar}")
-            adimlar.append(f"Çevre = 2 × ({uzun_kenar} + {kisa_kenar}) = 2 × {uzun_kenar + kisa_kenar} = {cevre}")
+            if self.adimli:
+                adimlar.append(f"Dikdörtgen çevre formülü: Çevre = 2 × (uzun kenar + kısa kenar)")
+                adimlar.append(f"Verilen: uzun kenar = {uzun_kenar}, kısa kenar = {kisa_kenar}")
+                adimlar.append(f"Çevre = 2 × ({uzun_kenar} + {kisa_kenar}) = 2 × {uzun_kenar + kisa_kenar} = {cevre}")
             
             return {
                 "basarili": True,
@@ -620,7 +639,8 @@ class GeometriCozucu:
         elif "cap" in kwargs:
             cap = float(kwargs["cap"])
             yaricap = cap / 2
-            adimlar.append(f"Çaptan yarıçap: r = çap/2 = {cap}/2 = {yaricap}")
+            if self.adimli:
+                adimlar.append(f"Çaptan yarıçap: r = çap/2 = {cap}/2 = {yaricap}")
         elif "kenar" in kwargs:  # parser bazen kenar olarak algılayabilir
             yaricap = float(kwargs["kenar"])
         else:
@@ -633,10 +653,11 @@ class GeometriCozucu:
         if hesaplama_turu == "alan":
             alan = math.pi * yaricap * yaricap
             
-            adimlar.append(f"Daire alan formülü: A = π × r²")
-            adimlar.append(f"Verilen: r = {yaricap}")
-            adimlar.append(f"A = π × {yaricap}² = π × {yaricap**2} = {math.pi} × {yaricap**2}")
-            adimlar.append(f"A = {alan:.6f}")
+            if self.adimli:
+                adimlar.append(f"Daire alan formülü: A = π × r²")
+                adimlar.append(f"Verilen: r = {yaricap}")
+                adimlar.append(f"A = π × {yaricap}² = π × {yaricap**2} = {math.pi} × {yaricap**2}")
+                adimlar.append(f"A = {alan:.6f}")
             
             return {
                 "basarili": True,
@@ -649,10 +670,11 @@ class GeometriCozucu:
         elif hesaplama_turu == "cevre":
             cevre = 2 * math.pi * yaricap
             
-            adimlar.append(f"Daire çevre formülü: Ç = 2 × π × r")
-            adimlar.append(f"Verilen: r = {yaricap}")
-            adimlar.append(f"Ç = 2 × π × {yaricap} = 2 × {math.pi} × {yaricap}")
-            adimlar.append(f"Ç = {cevre:.6f}")
+            if self.adimli:
+                adimlar.append(f"Daire çevre formülü: Ç = 2 × π × r")
+                adimlar.append(f"Verilen: r = {yaricap}")
+                adimlar.append(f"Ç = 2 × π × {yaricap} = 2 × {math.pi} × {yaricap}")
+                adimlar.append(f"Ç = {cevre:.6f}")
             
             return {
                 "basarili": True,
@@ -671,15 +693,15 @@ class GeometriCozucu:
 
 
 # Global fonksiyonlar
-def ucgen_hesapla(hesaplama_turu: str, **kwargs) -> Dict[str, Any]:
+def ucgen_hesapla(hesaplama_turu: str, adimli: bool = True, **kwargs) -> Dict[str, Any]:
     """Üçgen hesaplamaları yapar"""
-    cozucu = GeometriCozucu()
+    cozucu = GeometriCozucu(adimli)
     return cozucu.ucgen_hesaplama(hesaplama_turu, **kwargs)
 
 
-def dortgen_hesapla(sekil_turu: str, hesaplama_turu: str, **kwargs) -> Dict[str, Any]:
+def dortgen_hesapla(sekil_turu: str, hesaplama_turu: str, adimli: bool = True, **kwargs) -> Dict[str, Any]:
     """Dörtgen hesaplamaları yapar"""
-    cozucu = GeometriCozucu()
+    cozucu = GeometriCozucu(adimli)
     return cozucu.dortgen_hesaplama(sekil_turu, hesaplama_turu, **kwargs)
 
 
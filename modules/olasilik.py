@@ -20,8 +20,9 @@ import re
 class OlasililkCozucu:
     """Ana olasılık çözücü sınıfı"""
     
-    def __init__(self):
-        pass
+    def __init__(self, adimli: bool = True):
+        # adimli=False ise çözüm adımı metinleri üretilmez (hızlı mod)
+        self.adimli = adimli
     
     def faktoriyel_hesapla(self, n: int) -> Dict[str, Any]:
         """
@@ -43,21 +44,24 @@ class OlasililkCozucu:
                     "adimlar": []
                 }
             
-            adimlar.append(f"Faktöriyel hesaplanıyor: {n}!")
+            if self.adimli:
+                adimlar.append(f"Faktöriyel hesaplanıyor: {n}!")
             
             if n == 0 or n == 1:
                 sonuc = 1
-                adimlar.append(f"{n}! = 1 (tanım gereği)")
+                if self.adimli:
+                    adimlar.append(f"{n}! = 1 (tanım gereği)")
             else:
                 sonuc = math.factorial(n)
                 
                 # Adım adım göster (küçük sayılar için)
-                if n <= 10:
-                    carpim_str = " × ".join([str(i) for i in range(1, n + 1)])
-                    adimlar.append(f"{n}! = {carpim_str}")
-                    adimlar.append(f"{n}! = {sonuc}")
-                else:
-                    adimlar.append(f"{n}! = {sonuc} (büyük sayı)")
+                if self.adimli:
+                    if n <= 10:
+                        carpim_str = " × ".join([str(i) for i in range(1, n + 1)])
+                        adimlar.append(f"{n}! = {carpim_str}")
+                        adimlar.append(f"{n}! = {sonuc}")
+                    else:
+                        adimlar.append(f"{n}! = {sonuc} (büyük sayı)")
             
             return {
                 "basarili": True,
@@ -96,14 +100,16 @@ class OlasililkCozucu:
             
             # Tam permutasyon (n!)
             if r is None:
-                adimlar.append(f"Tam permutasyon: P({n}) = {n}!")
+                if self.adimli:
+                    adimlar.append(f"Tam permutasyon: P({n}) = {n}!")
                 faktoriyel_sonuc = self.faktoriyel_hesapla(n)
                 
                 if not faktoriyel_sonuc["basarili"]:
                     return faktoriyel_sonuc
                 
                 sonuc = faktoriyel_sonuc["faktoriyel"]
-                adimlar.extend(faktoriyel_sonuc["adimlar"])
+                if self.adimli:
+                    adimlar.extend(faktoriyel_sonuc["adimlar"])
                 
                 return {
                     "basarili": True,
@@ -122,23 +128,27 @@ class OlasililkCozucu:
                         "adimlar": []
                     }
                 
-                adimlar.append(f"Kısmi permutasyon: P({n},{r}) = {n}! / ({n}-{r})!")
-                adimlar.append(f"P({n},{r}) = {n}! / {n-r}!")
+                if self.adimli:
+                    adimlar.append(f"Kısmi permutasyon: P({n},{r}) = {n}! / ({n}-{r})!")
+                    adimlar.append(f"P({n},{r}) = {n}! / {n-r}!")
                 
                 # n! hesapla
                 n_fakt = math.factorial(n)
-                adimlar.append(f"{n}! = {n_fakt}")
+                if self.adimli:
+                    adimlar.append(f"{n}! = {n_fakt}")
                 
                 # (n-r)! hesapla
                 nr_fakt = math.factorial(n - r)
-                adimlar.append(f"{n-r}! = {nr_fakt}")
+                if self.adimli:
+                    adimlar.append(f"{n-r}! = {nr_fakt}")
                 
                 # Sonuç
                 sonuc = n_fakt // nr_fakt
-                adimlar.append(f"P({n},{r}) = {n_fakt} / {nr_fakt} = {sonuc}")
+                if self.adimli:
+                    adimlar.append(f"P({n},{r}) = {n_fakt} / {nr_fakt} = {sonuc}")
                 
                 # Alternatif gösterim
-                if r <= 5 and n <= 15:  # Küçük sayılar için açık gösterim
+                if self.adimli and r <= 5 and n <= 15:  # Küçük sayılar için açık gösterim
                     carpim_str = " × ".join([str(i) for i in range(n, n-r, -1)])
                     adimlar.append(f"Alternatif: P({n},{r}) = {carpim_str} = {sonuc}")
                 
@@ -186,28 +196,31 @@ class OlasililkCozucu:
                     "adimlar": []
                 }
             
-            adimlar.append(f"Kombinasyon: C({n},{r}) = {n}! / (r! × ({n}-r)!)")
-            adimlar.append(f"C({n},{r}) = {n}! / ({r}! × {n-r}!)")
+            if self.adimli:
+                adimlar.append(f"Kombinasyon: C({n},{r}) = {n}! / (r! × ({n}-r)!)")
+                adimlar.append(f"C({n},{r}) = {n}! / ({r}! × {n-r}!)")
             
             # Faktöriyelleri hesapla
             n_fakt = math.factorial(n)
             r_fakt = math.factorial(r)
             nr_fakt = math.factorial(n - r)
             
-            adimlar.append(f"{n}! = {n_fakt}")
-            adimlar.append(f"{r}! = {r_fakt}")
-            adimlar.append(f"{n-r}! = {nr_fakt}")
+            if self.adimli:
+                adimlar.append(f"{n}! = {n_fakt}")
+                adimlar.append(f"{r}! = {r_fakt}")
+                adimlar.append(f"{n-r}! = {nr_fakt}")
             
             # Sonuç
             sonuc = n_fakt // (r_fakt * nr_fakt)
-            adimlar.append(f"C({n},{r}) = {n_fakt} / ({r_fakt} × {nr_fakt})")
-            adimlar.append(f"C({n},{r}) = {n_fakt} / {r_fakt * nr_fakt} = {sonuc}")
-            
-            # Binom katsayısı açıklaması
-            adimlar.append(f"Bu aynı zamanda binom katsayısı ({n} choose {r}) olarak da bilinir")
+            if self.adimli:
+                adimlar.append(f"C({n},{r}) = {n_fakt} / ({r_fakt} × {nr_fakt})")
+                adimlar.append(f"C({n},{r}) = {n_fakt} / {r_fakt * nr_fakt} = {sonuc}")
+                
+                # Binom katsayısı açıklaması
+                adimlar.append(f"Bu aynı zamanda binom katsayısı ({n} choose {r}) olarak da bilinir")
             
             # Simetri özelliği
-            if r != n - r:
+            if self.adimli and r != n - r:
                 adimlar.append(f"Simetri özelliği: C({n},{r}) = C({n},{n-r}) = {sonuc}")
             
             return {
@@ -254,22 +267,26 @@ class OlasililkCozucu:
                     "adimlar": []
                 }
             
-            adimlar.append(f"Temel olasılık formülü: P(A) = Elverişli durum / Toplam durum")
-            adimlar.append(f"Elverişli durum sayısı: {elverişli_durum}")
-            adimlar.append(f"Toplam durum sayısı: {toplam_durum}")
+            if self.adimli:
+                adimlar.append(f"Temel olasılık formülü: P(A) = Elverişli durum / Toplam durum")
+                adimlar.append(f"Elverişli durum sayısı: {elverişli_durum}")
+                adimlar.append(f"Toplam durum sayısı: {toplam_durum}")
             
             # Olasılığı hesapla
             olasilik = elverişli_durum / toplam_durum
-            adimlar.append(f"P(A) = {elverişli_durum} / {toplam_durum} = {olasilik:.6f}")
+            if self.adimli:
+                adimlar.append(f"P(A) = {elverişli_durum} / {toplam_durum} = {olasilik:.6f}")
             
             # Yüzde ve kesir gösterimi
             yuzde = olasilik * 100
-            adimlar.append(f"Yüzde olarak: %{yuzde:.2f}")
+            if self.adimli:
+                adimlar.append(f"Yüzde olarak: %{yuzde:.2f}")
             
             # Kesir olarak basitleştir
             import fractions
             kesir = fractions.Fraction(elverişli_durum, toplam_durum)
-            adimlar.append(f"Kesir olarak: {kesir}")
+            if self.adimli:
+                adimlar.append(f"Kesir olarak: {kesir}")
             
             return {
                 "basarili": True,
@@ -317,8 +334,9 @@ class OlasililkCozucu:
                     "adimlar": []
                 }
             
-            adimlar.append(f"Binom dağılımı: P(X = k) = C(n,k) × p^k × (1-p)^(n-k)")
-            adimlar.append(f"Verilen: n = {n}, k = {k}, p = {p}")
+            if self.adimli:
+                adimlar.append(f"Binom dağılımı: P(X = k) = C(n,k) × p^k × (1-p)^(n-k)")
+                adimlar.append(f"Verilen: n = {n}, k = {k}, p = {p}")
             
             # Kombinasyonu hesapla
             kombinasyon_sonuc = self.kombinasyon_hesapla(n, k)
@@ -326,21 +344,24 @@ class OlasililkCozucu:
                 return kombinasyon_sonuc
             
             C_n_k = kombinasyon_sonuc["kombinasyon"]
-            adimlar.append(f"C({n},{k}) = {C_n_k}")
+            if self.adimli:
+                adimlar.append(f"C({n},{k}) = {C_n_k}")
             
             # Olasılığı hesapla
             p_k = p ** k
             p_nk = (1 - p) ** (n - k)
             olasilik = C_n_k * p_k * p_nk
             
-            adimlar.append(f"p^k = {p}^{k} = {p_k:.6f}")
-            adimlar.append(f"(1-p)^(n-k) = {1-p}^{n-k} = {p_nk:.6f}")
-            adimlar.append(f"P(X = {k}) = {C_n_k} × {p_k:.6f} × {p_nk:.6f}")
-            adimlar.append(f"P(X = {k}) = {olasilik:.6f}")
+            if self.adimli:
+                adimlar.append(f"p^k = {p}^{k} = {p_k:.6f}")
+                adimlar.append(f"(1-p)^(n-k) = {1-p}^{n-k} = {p_nk:.6f}")
+                adimlar.append(f"P(X = {k}) = {C_n_k} × {p_k:.6f} × {p_nk:.6f}")
+                adimlar.append(f"P(X = {k}) = {olasilik:.6f}")
             
             # Yüzde gösterim
             yuzde = olasilik * 100
-            adimlar.append(f"Yüzde olarak: %{yuzde:.2f}")
+            if self.adimli:
+                adimlar.append(f"Yüzde olarak: %{yuzde:.2f}")
             
             return {
                 "basarili": True,
@@ -362,33 +383,33 @@ class OlasililkCozucu:
 
 
 # Global fonksiyonlar
-def faktoriyel(n: int) -> Dict[str, Any]:
+def faktoriyel(n: int, adimli: bool = True) -> Dict[str, Any]:
     """Faktöriyel hesaplar"""
-    cozucu = OlasililkCozucu()
+    cozucu = OlasililkCozucu(adimli)
     return cozucu.faktoriyel_hesapla(n)
 
 
-def permutasyon(n: int, r: Optional[int] = None) -> Dict[str, Any]:
+def permutasyon(n: int, r: Optional[int] = None, adimli: bool = True) -> Dict[str, Any]:
     """Permutasyon hesaplar"""
-    cozucu = OlasililkCozucu()
+    cozucu = OlasililkCozucu(adimli)
     return cozucu.permutasyon_hesapla(n, r)
 
 
-def kombinasyon(n: int, r: int) -> Dict[str, Any]:
+def kombinasyon(n: int, r: int, adimli: bool = True) -> Dict[str, Any]:
     """Kombinasyon hesaplar"""
-    cozucu = OlasililkCozucu()
+    cozucu = OlasililkCozucu(adimli)
     return cozucu.kombinasyon_hesapla(n, r)
 
 
-def olasilik_hesapla(elverişli: int, toplam: int) -> Dict[str, Any]:
+def olasilik_hesapla(elverişli: int, toplam: int, adimli: bool = True) -> Dict[str, Any]:
     """Temel olasılık hesaplar"""
-    cozucu = OlasililkCozucu()
+    cozucu = OlasililkCozucu(adimli)
     return cozucu.temel_olasilik_hesapla(elverişli, toplam)
 
 
-def binom_dagilimi(n: int, k: int, p: float) -> Dict[str, Any]:
+def binom_dagilimi(n: int, k: int, p: float, adimli: bool = True) -> Dict[str, Any]:
     """Binom dağılımı hesaplar"""
-    cozucu = OlasililkCozucu()
+    cozucu = OlasililkCozucu(adimli)
     return cozucu.binom_dagılimi(n, k, p)
 
 
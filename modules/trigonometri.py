@@ -4,26 +4,102 @@ Trigonometri Modülü - Matematik Kütüphanesi
 
 Bu modül trigonometrik işlemler için fonksiyonlar içerir.
 Desteklenen işlemler:
-- Trigonometrik fonksiyon hesaplama (sin, cos, tan)
+- Trigonometrik fonksiyon hesaplama (sin, cos, tan, cot, sec, csc)
+- Açı dizileri üzerinde NumPy ile toplu hesaplama
 - Ters trigonometrik fonksiyonlar (arcsin, arccos, arctan)
 - Açı dönüşümleri (derece ↔ radyan)
 - Trigonometrik denklem çözme
+- 15° ve 18°'nin katlarında tam (kesin) değer tablosu
 
 Yazar: Matematik Kütüphanesi
 """
 
 import sympy as sp
+import numpy as np
 import math
 import re
 from typing import Dict, List, Tuple, Optional
 
+from utils.onbellek import ayristirma_onbellegi, girdi_normalize_et
+from utils.yazici import okunabilir
+from utils.sozcukleyici import Sozcukleyici
+
+
+# Girdilerde atılan sorgu kelimeleri
+_GEREKSIZ_KELIMELER = ("hesapla", "bul", "çöz", "değer", "sonuç")
+_TURKCE_FONKSIYONLAR = {"sinüs": "sin", "kosinüs": "cos", "tanjant": "tan"}
+
+# Fonksiyon adları (Türkçe ve ü/ı sadeleştirilmiş biçimler dahil) -> kısa ad
+_TRIG_ADLARI = {
+    "sin": "sin", "sinüs": "sin", "sinus": "sin",
+    "cos": "cos", "kosinüs": "cos", "kosinus": "cos",
+    "tan": "tan", "tanjant": "tan",
+    "cot": "cot", "cotanjant": "cot", "kotanjant": "cot",
+    "sec": "sec", "sekant": "sec",
+    "csc": "csc", "kosekant": "csc"
+}
+
+# Kısa ad -> (pay, payda); değer pay/payda, payda sıfırsa kutup
+_TRIG_ORANLARI = {
+    "sin": ("sin", None), "cos": ("cos", None),
+    "tan": ("sin", "cos"), "cot": ("cos", "sin"),
+    "sec": (None, "cos"), "csc": (None, "sin")
+}
+
+# Ters fonksiyon adları -> kısa ad
+_TERS_TRIG_ADLARI = {
+    "arcsin": "sin", "asin": "sin", "arccos": "cos", "acos": "cos",
+    "arctan": "tan", "atan": "tan", "arccot": "cot", "acot": "cot",
+    "arcsec": "sec", "asec": "sec", "arccsc": "csc", "acsc": "csc"
+}
+
+# Ters fonksiyonların esas değer aralıkları (derece; SymPy asin, acos, ... ile aynı)
+_ESAS_ARALIKLAR = {
+    "sin": lambda a: -90 <= a <= 90,
+    "cos": lambda a: 0 <= a <= 180,
+    "tan": lambda a: -90 < a < 90,
+    "cot": lambda a: -90 < a <= 90,
+    "sec": lambda a: 0 <= a <= 180,
+    "csc": lambda a: -90 <= a <= 90
+}
+
+# Tam değeri tabloda tutulan açılar: 15° ve 18°'nin [0°, 360°) içindeki katları
+OZEL_ACILAR = tuple(sorted(set(range(0, 360, 15)) | set(range(0, 360, 18))))
+
+# Ters aramada girilen değerin tablodaki float değere göreli uzaklık sınırı.
+# Göreli olduğundan 0 yalnızca tam 0 ile eşleşir: arccot(-1e-13) ≈ -90°
+# sıçrama noktasındaki 0 değerine (90°) yakalanmaz.
+OZEL_DEGER_TOLERANSI = 1e-12
+
+# (kısa ad, açı) -> (tam değer, float) ve (kısa ad, değer anahtarı) -> [(açı, float)];
+# SymPy ile kurulumu ~0.3 s sürdüğünden ilk kullanımda bir kez doldurulur
+_ozel_tablo: Optional[Tuple[Dict[Tuple[str, int], Tuple[sp.Expr, float]],
+                            Dict[Tuple[str, float], List[Tuple[int, float]]]]] = None
+
+# Temizlenmiş ifadede sayı argümanlı sin/cos/tan: sin30, sin(30), tan(.5)
+_SAYI_ARGUMANLI_TRIG = re.compile(r"(?<![^\W\d_])(sin|cos|tan)\(?(\d+(?:\.\d*)?|\.\d+)")
+
+# İfade girdileri için sözcükleyici; önceki temizleyicideki gibi boşluklar
+# yok sayılır ("sinüs 45" -> sin45)
+_ifade_sozcukleyici = Sozcukleyici(isim_donusumleri=_TURKCE_FONKSIYONLAR,
+                                   atilacak_kelimeler=_GEREKSIZ_KELIMELER,
+                                   bosluk_duyarli=False)
+
+# Karma denklemler için sözcükleyici ("x hesapla", "ise x", "x değeri" gibi kalıplar da atılır)
+_karma_sozcukleyici = Sozcukleyici(isim_donusumleri=_TURKCE_FONKSIYONLAR,
+                                   atilacak_kelimeler=("x hesapla", "ise x", "ise", "x değeri", "değeri",
+                                                       "denklemi", "denklemini") + _GEREKSIZ_KELIMELER,
+                                   ortuk_carpim=False, bosluk_duyarli=False)
+
 
 class TrigonometriCozucu:
     """Trigonometri problemlerini çözen ana sınıf"""
     
-    def __init__(self):
+    def __init__(self, adimli: bool = True):
         self.x = sp.Symbol('x')
         self.pi = sp.pi
+        # adimli=False ise çözüm adımı metinleri üretilmez (hızlı mod)
+        self.adimli = adimli
         
         # Açı birimleri
         self.derece_modu = True  # Default olarak derece
@@ -51,7 +127,13 @@ class TrigonometriCozucu:
             'arctan': sp.atan,
             'asin': sp.asin,
             'acos': sp.acos,
-            'atan': sp.atan
+            'atan': sp.atan,
+            'arccot': sp.acot,
+            'acot': sp.acot,
+            'arcsec': sp.asec,
+            'asec': sp.asec,
+            'arccsc': sp.acsc,
+            'acsc': sp.acsc
         }
     
     def fonksiyon_hesapla(self, fonksiyon: str, aci: float, birim: str = "derece") -> Dict[str, any]:
@@ -68,28 +150,40 @@ class TrigonometriCozucu:
         """
         try:
             adimlar = []
-            adimlar.append(f"Hesaplanacak: {fonksiyon}({aci}°)" if birim == "derece" else f"Hesaplanacak: {fonksiyon}({aci} radyan)")
+            if self.adimli:
+                adimlar.append(f"Hesaplanacak: {fonksiyon}({aci}°)" if birim == "derece" else f"Hesaplanacak: {fonksiyon}({aci} radyan)")
             
             # Açıyı radyana çevir
             if birim == "derece":
                 aci_radyan = math.radians(aci)
-                adimlar.append(f"Açıyı radyana çevir: {aci}° = {aci_radyan:.4f} radyan")
+                if self.adimli:
+                    adimlar.append(f"Açıyı radyana çevir: {aci}° = {aci_radyan:.4f} radyan")
             else:
                 aci_radyan = aci
             
-            # Fonksiyon hesapla
-            fonksiyon_temiz = fonksiyon.lower().replace("ü", "u").replace("ı", "i")
+            # Fonksiyon hesapla (SymPy nesnesi kurulmadan, toplu yol ile aynı hesap)
+            fonksiyon_temiz = fonksiyon.lower().replace("ı", "i")
             
-            if fonksiyon_temiz in self.trig_fonksiyonlari:
-                trig_func = self.trig_fonksiyonlari[fonksiyon_temiz]
-                sonuc = float(trig_func(aci_radyan))
+            if fonksiyon_temiz in _TRIG_ADLARI:
+                degerler, tanimsiz = trigonometrik_degerler(fonksiyon_temiz, aci, birim)
+                if tanimsiz:
+                    return {
+                        "basarili": False,
+                        "hata": f"{fonksiyon}({aci}{'°' if birim == 'derece' else ''}) tanımsızdır (kutup noktası)",
+                        "adimlar": adimlar
+                    }
+                sonuc = float(degerler)
                 
-                # Özel açılar kontrolü
-                ozel_deger = self._ozel_aci_kontrol(fonksiyon_temiz, aci)
-                if ozel_deger:
-                    adimlar.append(f"Bu özel bir açıdır: {ozel_deger}")
+                # Özel açılarda sonuç tablodaki tam değerden alınır
+                ozel = ozel_aci_degeri(fonksiyon_temiz, aci) if birim == "derece" else None
+                if ozel is not None:
+                    sonuc = ozel[1]
                 
-                adimlar.append(f"{fonksiyon}({aci}°) = {sonuc:.6f}" if birim == "derece" else f"{fonksiyon}({aci}) = {sonuc:.6f}")
+                if self.adimli:
+                    if ozel is not None:
+                        adimlar.append(f"Bu özel bir açıdır: {fonksiyon_temiz}({aci}°) = {okunabilir(ozel[0])}")
+                    
+                    adimlar.append(f"{fonksiyon}({aci}°) = {sonuc:.6f}" if birim == "derece" else f"{fonksiyon}({aci}) = {sonuc:.6f}")
                 
                 return {
                     "basarili": True,
@@ -98,7 +192,8 @@ class TrigonometriCozucu:
                     "aci": aci,
                     "birim": birim,
                     "sonuc": sonuc,
-                    "aci_radyan": aci_radyan
+                    "aci_radyan": aci_radyan,
+                    "tam_deger": okunabilir(ozel[0]) if ozel is not None else None
                 }
             else:
                 return {
@@ -114,6 +209,61 @@ class TrigonometriCozucu:
                 "adimlar": []
             }
     
+    def fonksiyon_toplu_hesapla(self, fonksiyon: str, acilar, birim: str = "derece") -> Dict[str, any]:
+        """
+        Trigonometrik fonksiyonu bir açı dizisinin tüm elemanları için hesaplar.
+        
+        Hesap NumPy ufunc'larıyla tek geçişte yapılır; tan, cot, sec ve csc
+        kutuplarında değer NaN olur ve "tanimsiz" maskesinde işaretlenir.
+        
+        Args:
+            fonksiyon (str): sin, cos, tan, cot, sec, csc (veya Türkçe adları)
+            acilar (array-like): Açı değerleri (herhangi bir şekilde)
+            birim (str): Açı birimi ("derece" veya "radyan")
+        
+        Returns:
+            Dict: Açılarla aynı şekilde "degerler" ve "tanimsiz" dizileri
+        """
+        try:
+            fonksiyon_temiz = fonksiyon.lower().replace("ı", "i")
+            if fonksiyon_temiz not in _TRIG_ADLARI:
+                return {
+                    "basarili": False,
+                    "hata": f"Bilinmeyen trigonometrik fonksiyon: {fonksiyon}",
+                    "adimlar": []
+                }
+            if birim not in ("derece", "radyan"):
+                return {
+                    "basarili": False,
+                    "hata": f"Bilinmeyen açı birimi: {birim} ('derece' veya 'radyan')",
+                    "adimlar": []
+                }
+            
+            degerler, tanimsiz = trigonometrik_degerler(fonksiyon_temiz, acilar, birim)
+            
+            adimlar = []
+            if self.adimli:
+                adimlar.append(f"{degerler.size} açı için {_TRIG_ADLARI[fonksiyon_temiz]} hesaplandı ({birim})")
+                if tanimsiz.any():
+                    adimlar.append(f"{int(tanimsiz.sum())} açı kutup noktasında (tanımsız, NaN)")
+            
+            return {
+                "basarili": True,
+                "adimlar": adimlar,
+                "fonksiyon": fonksiyon,
+                "birim": birim,
+                "degerler": degerler,
+                "tanimsiz": tanimsiz,
+                "aci_sayisi": degerler.size
+            }
+            
+        except Exception as e:
+            return {
+                "basarili": False,
+                "hata": f"Toplu hesaplama sırasında hata oluştu: {str(e)}",
+                "adimlar": []
+            }
+    
     def ters_fonksiyon_hesapla(self, fonksiyon: str, deger: float) -> Dict[str, any]:
         """
         Ters trigonometrik fonksiyon hesaplar.
@@ -127,7 +277,8 @@ class TrigonometriCozucu:
         """
         try:
             adimlar = []
-            adimlar.append(f"Hesaplanacak: {fonksiyon}({deger})")
+            if self.adimli:
+                adimlar.append(f"Hesaplanacak: {fonksiyon}({deger})")
             
             fonksiyon_temiz = fonksiyon.lower()
             
@@ -147,12 +298,30 @@ class TrigonometriCozucu:
                         "hata": f"arccos için değer [-1, 1] aralığında olmalı. Girilen: {deger}",
                         "adimlar": []
                     }
+                elif fonksiyon_temiz in ['arcsec', 'asec', 'arccsc', 'acsc'] and abs(deger) < 1:
+                    return {
+                        "basarili": False,
+                        "hata": f"{fonksiyon_temiz} için |değer| ≥ 1 olmalı. Girilen: {deger}",
+                        "adimlar": []
+                    }
                 
-                aci_radyan = float(ters_func(deger))
-                aci_derece = math.degrees(aci_radyan)
-                
-                adimlar.append(f"{fonksiyon}({deger}) = {aci_radyan:.6f} radyan")
-                adimlar.append(f"Dereceye çevir: {aci_derece:.2f}°")
+                # Özel değerlerde esas açı tablodan tam olarak alınır
+                ad = _TERS_TRIG_ADLARI[fonksiyon_temiz]
+                esas = [a for a in (a if a <= 180 else a - 360 for a in ozel_acilar(ad, deger))
+                        if _ESAS_ARALIKLAR[ad](a)]
+                if esas:
+                    aci_derece = esas[0]
+                    aci_radyan = math.radians(aci_derece)
+                    if self.adimli:
+                        adimlar.append(f"Özel değer: {fonksiyon}({self._ozel_deger_metni(ad, aci_derece % 360)}) "
+                                       f"= {aci_derece}° = {okunabilir(sp.pi * aci_derece / 180)} radyan")
+                else:
+                    aci_radyan = float(ters_func(deger))
+                    aci_derece = math.degrees(aci_radyan)
+                    
+                    if self.adimli:
+                        adimlar.append(f"{fonksiyon}({deger}) = {aci_radyan:.6f} radyan")
+                        adimlar.append(f"Dereceye çevir: {aci_derece:.2f}°")
                 
                 return {
                     "basarili": True,
@@ -188,28 +357,11 @@ class TrigonometriCozucu:
         """
         try:
             adimlar = []
-            adimlar.append(f"Verilen trigonometrik ifade: {ifade_str}")
+            if self.adimli:
+                adimlar.append(f"Verilen trigonometrik ifade: {ifade_str}")
             
-            # İfadeyi temizle
-            ifade_temiz = ifade_str.lower()
-            
-            # Gereksiz kelimeleri çıkar
-            gereksiz_kelimeler = ["hesapla", "bul", "çöz", "değer", "sonuç"]
-            for kelime in gereksiz_kelimeler:
-                ifade_temiz = ifade_temiz.replace(kelime, "")
-            
-            # Boşlukları temizle
-            ifade_temiz = ifade_temiz.replace(" ", "")
-            
-            # = işareti varsa sol tarafı al
-            if "=" in ifade_temiz:
-                ifade_temiz = ifade_temiz.split("=")[0]
-            
-            # Trigonometrik fonksiyonları tespit et ve hesapla
-            import re
-            
-            # Tüm trigonometrik fonksiyonları bul
-            trig_eslesmeler = re.findall(r'(sin|cos|tan|sinüs|kosinüs|tanjant)\s*\(?(\d+(?:\.\d+)?)\)?', ifade_temiz)
+            # İfadeyi temizle ve trigonometrik fonksiyonları tespit et (önbellekli)
+            ifade_temiz, trig_eslesmeler = self._ifade_ayristir(ifade_str)
             
             if not trig_eslesmeler:
                 return {
@@ -233,7 +385,8 @@ class TrigonometriCozucu:
                     fonksiyon_hesaplamalari[f"{fonksiyon}({aci})"] = deger
                     
                     # Adım ekle
-                    adimlar.append(f"{fonksiyon}({aci}°) = {deger:.6f}")
+                    if self.adimli:
+                        adimlar.append(f"{fonksiyon}({aci}°) = {deger:.6f}")
                     
                     # İfadede değiştir - daha güvenli replacement
                     eski_ifade = f"{fonksiyon}({aci_str})"
@@ -277,8 +430,9 @@ class TrigonometriCozucu:
                 # Basit eval kullan (sadece sayısal ifadeler için güvenli)
                 nihai_sonuc = eval(hesaplanan_ifade)
                 
-                adimlar.append(f"İfade değerlendirmesi: {hesaplanan_ifade}")
-                adimlar.append(f"Nihai sonuç: {nihai_sonuc:.6f}")
+                if self.adimli:
+                    adimlar.append(f"İfade değerlendirmesi: {hesaplanan_ifade}")
+                    adimlar.append(f"Nihai sonuç: {nihai_sonuc:.6f}")
                 
                 return {
                     "basarili": True,
@@ -315,21 +469,13 @@ class TrigonometriCozucu:
         """
         try:
             adimlar = []
-            adimlar.append(f"Verilen karma trigonometrik denklem: {denklem_str}")
-            
-            # Denklemi temizle ve ayrıştır
-            denklem_temiz = denklem_str.lower()
+            if self.adimli:
+                adimlar.append(f"Verilen karma trigonometrik denklem: {denklem_str}")
             
-            # Önce "x hesapla" gibi bileşik ifadeleri çıkar
-            denklem_temiz = denklem_temiz.replace("x hesapla", "")
-            denklem_temiz = denklem_temiz.replace("ise x", "")
-            
-            # Sonra tekil kelimeleri çıkar
-            gereksiz_kelimeler = ["ise", "hesapla", "bul", "çöz", "değer", "sonuç"]
-            for kelime in gereksiz_kelimeler:
-                denklem_temiz = denklem_temiz.replace(kelime, "")
-            
-            denklem_temiz = denklem_temiz.replace(" ", "")
+            # Denklemi temizle ve ayrıştır (önbellekli)
+            denklem_temiz = ayristirma_onbellegi.al(
+                ("trigonometri_karma", girdi_normalize_et(denklem_str)),
+                lambda: self._karma_denklem_temizle(denklem_str))
             
             if "=" not in denklem_temiz:
                 return {
@@ -341,8 +487,9 @@ class TrigonometriCozucu:
             sol_taraf, sag_taraf = denklem_temiz.split("=", 1)
             hedef_deger = float(sag_taraf)
             
-            adimlar.append(f"Sol taraf: {sol_taraf}")
-            adimlar.append(f"Hedef değer: {hedef_deger}")
+            if self.adimli:
+                adimlar.append(f"Sol taraf: {sol_taraf}")
+                adimlar.append(f"Hedef değer: {hedef_deger}")
             
             # Sabit trigonometrik fonksiyonları hesapla ve çıkar
             import re
@@ -361,7 +508,8 @@ class TrigonometriCozucu:
                 
                 if sonuc_hesaplama["basarili"]:
                     deger = sonuc_hesaplama["sonuc"]
-                    adimlar.append(f"{fonksiyon}({aci}°) = {deger:.6f}")
+                    if self.adimli:
+                        adimlar.append(f"{fonksiyon}({aci}°) = {deger:.6f}")
                     
                     # İfadeden çıkar
                     fonksiyon_ifadesi = f"{fonksiyon}({aci_str})"
@@ -387,8 +535,9 @@ class TrigonometriCozucu:
             # x için hedef değeri hesapla
             x_hedef_degeri = hedef_deger - sabit_toplam
             
-            adimlar.append(f"Sabit fonksiyonların toplamı: {sabit_toplam:.6f}")
-            adimlar.append(f"Kalan denklem: {sol_taraf_hesaplanan} = {x_hedef_degeri:.6f}")
+            if self.adimli:
+                adimlar.append(f"Sabit fonksiyonların toplamı: {sabit_toplam:.6f}")
+                adimlar.append(f"Kalan denklem: {sol_taraf_hesaplanan} = {x_hedef_degeri:.6f}")
             
             # X içeren fonksiyonu çöz
             x_fonksiyon_eslesen = re.search(r'(sin|cos|tan)\(x\)', sol_taraf_hesaplanan)
@@ -419,9 +568,10 @@ class TrigonometriCozucu:
                     aci1 = ana_aci % 360
                     aci2 = (180 - ana_aci) % 360
                     
-                    adimlar.append(f"sin(x) = {x_hedef_degeri:.6f}")
-                    adimlar.append(f"Ana açı: arcsin({x_hedef_degeri:.6f}) = {ana_aci:.2f}°")
-                    adimlar.append(f"Çözümler: x = {aci1:.2f}° veya x = {aci2:.2f}°")
+                    if self.adimli:
+                        adimlar.append(f"sin(x) = {x_hedef_degeri:.6f}")
+                        adimlar.append(f"Ana açı: arcsin({x_hedef_degeri:.6f}) = {ana_aci:.2f}°")
+                        adimlar.append(f"Çözümler: x = {aci1:.2f}° veya x = {aci2:.2f}°")
                     
                     cozumler = [aci1, aci2]
             
@@ -431,9 +581,10 @@ class TrigonometriCozucu:
                     aci1 = ana_aci % 360
                     aci2 = (360 - ana_aci) % 360
                     
-                    adimlar.append(f"cos(x) = {x_hedef_degeri:.6f}")
-                    adimlar.append(f"Ana açı: arccos({x_hedef_degeri:.6f}) = {ana_aci:.2f}°")
-                    adimlar.append(f"Çözümler: x = {aci1:.2f}° veya x = {aci2:.2f}°")
+                    if self.adimli:
+                        adimlar.append(f"cos(x) = {x_hedef_degeri:.6f}")
+                        adimlar.append(f"Ana açı: arccos({x_hedef_degeri:.6f}) = {ana_aci:.2f}°")
+                        adimlar.append(f"Çözümler: x = {aci1:.2f}° veya x = {aci2:.2f}°")
                     
                     cozumler = [aci1, aci2]
             
@@ -444,31 +595,33 @@ class TrigonometriCozucu:
                 aci1 = ana_aci % 360
                 aci2 = (ana_aci + 180) % 360
                 
-                adimlar.append(f"tan(x) = {x_hedef_degeri:.6f}")
-                adimlar.append(f"Ana açı: arctan({x_hedef_degeri:.6f}) = {ana_aci:.2f}°")
-                adimlar.append(f"Çözümler: x = {aci1:.2f}° veya x = {aci2:.2f}°")
+                if self.adimli:
+                    adimlar.append(f"tan(x) = {x_hedef_degeri:.6f}")
+                    adimlar.append(f"Ana açı: arctan({x_hedef_degeri:.6f}) = {ana_aci:.2f}°")
+                    adimlar.append(f"Çözümler: x = {aci1:.2f}° veya x = {aci2:.2f}°")
                 
                 cozumler = [aci1, aci2]
             
             # Çözümleri doğrula
-            adimlar.append("")
-            adimlar.append("Çözümleri doğrulama:")
-            for i, x_degeri in enumerate(cozumler, 1):
-                # Orijinal denklemi x değeri ile hesapla
-                dogrulama_sonucu = 0
-                
-                # Sabit fonksiyonları ekle
-                dogrulama_sonucu += sabit_toplam
-                
-                # x fonksiyonunu ekle
-                if x_fonksiyon == "sin":
-                    dogrulama_sonucu += math.sin(math.radians(x_degeri))
-                elif x_fonksiyon == "cos":
-                    dogrulama_sonucu += math.cos(math.radians(x_degeri))
-                elif x_fonksiyon == "tan":
-                    dogrulama_sonucu += math.tan(math.radians(x_degeri))
-                
-                adimlar.append(f"x = {x_degeri:.2f}° için: {dogrulama_sonucu:.6f} ≈ {hedef_deger}")
+            if self.adimli:
+                adimlar.append("")
+                adimlar.append("Çözümleri doğrulama:")
+                for i, x_degeri in enumerate(cozumler, 1):
+                    # Orijinal denklemi x değeri ile hesapla
+                    dogrulama_sonucu = 0
+                    
+                    # Sabit fonksiyonları ekle
+                    dogrulama_sonucu += sabit_toplam
+                    
+                    # x fonksiyonunu ekle
+                    if x_fonksiyon == "sin":
+                        dogrulama_sonucu += math.sin(math.radians(x_degeri))
+                    elif x_fonksiyon == "cos":
+                        dogrulama_sonucu += math.cos(math.radians(x_degeri))
+                    elif x_fonksiyon == "tan":
+                        dogrulama_sonucu += math.tan(math.radians(x_degeri))
+                    
+                    adimlar.append(f"x = {x_degeri:.2f}° için: {dogrulama_sonucu:.6f} ≈ {hedef_deger}")
             
             return {
                 "basarili": True,
@@ -501,7 +654,8 @@ class TrigonometriCozucu:
         """
         try:
             adimlar = []
-            adimlar.append(f"Verilen trigonometrik denklem: {denklem_str}")
+            if self.adimli:
+                adimlar.append(f"Verilen trigonometrik denklem: {denklem_str}")
             
             # Denklemi temizle ve ayrıştır
             denklem_temiz = denklem_str.lower().replace(" ", "")
@@ -524,54 +678,25 @@ class TrigonometriCozucu:
             if sin_eslesen and sag_taraf.replace(".", "").replace("-", "").isdigit():
                 deger = float(sag_taraf)
                 if abs(deger) <= 1:
-                    adimlar.append(f"sin(x) = {deger} denklemini çözelim")
+                    if self.adimli:
+                        adimlar.append(f"sin(x) = {deger} denklemini çözelim")
                     
-                    # Ana açı bulma
-                    if deger == 0:
-                        ana_aci = 0
-                        adimlar.append("sin(x) = 0 için ana çözümler: x = 0°, 180°")
-                        cozumler = [0, 180]
-                    elif deger == 1:
-                        ana_aci = 90
-                        adimlar.append("sin(x) = 1 için çözüm: x = 90°")
-                        cozumler = [90]
-                    elif deger == -1:
-                        ana_aci = 270
-                        adimlar.append("sin(x) = -1 için çözüm: x = 270°")
-                        cozumler = [270]
-                    elif deger == 0.5:
-                        adimlar.append("sin(x) = 0.5 için ana açı: arcsin(0.5) = 30°")
-                        adimlar.append("Genel çözümler: x = 30° + 360°k veya x = 150° + 360°k")
-                        cozumler = [30, 150]
-                    elif deger == -0.5:
-                        adimlar.append("sin(x) = -0.5 için ana açı: arcsin(-0.5) = -30°")
-                        adimlar.append("Genel çözümler: x = 210° + 360°k veya x = 330° + 360°k")
-                        cozumler = [210, 330]
-                    elif abs(deger) == sp.sqrt(2)/2:
-                        if deger > 0:
-                            adimlar.append("sin(x) = √2/2 için ana açı: 45°")
-                            adimlar.append("Genel çözümler: x = 45° + 360°k veya x = 135° + 360°k")
-                            cozumler = [45, 135]
-                        else:
-                            adimlar.append("sin(x) = -√2/2 için ana açı: -45°")
-                            adimlar.append("Genel çözümler: x = 225° + 360°k veya x = 315° + 360°k")
-                            cozumler = [225, 315]
-                    elif abs(deger) == sp.sqrt(3)/2:
-                        if deger > 0:
-                            adimlar.append("sin(x) = √3/2 için ana açı: 60°")
-                            adimlar.append("Genel çözümler: x = 60° + 360°k veya x = 120° + 360°k")
-                            cozumler = [60, 120]
-                        else:
-                            adimlar.append("sin(x) = -√3/2 için ana açı: -60°")
-                            adimlar.append("Genel çözümler: x = 240° + 360°k veya x = 300° + 360°k")
-                            cozumler = [240, 300]
+                    # Özel değerlerde çözümler tablodan alınır
+                    ozel = ozel_acilar("sin", deger)
+                    if ozel:
+                        if self.adimli:
+                            adimlar.append(f"sin(x) = {self._ozel_deger_metni('sin', ozel[0])} özel bir değerdir")
+                            adimlar.append("Genel çözümler: " + " veya ".join(f"x = {a}° + 360°k" for a in ozel))
+                        cozumler = ozel
                     else:
                         # Genel durum - arcsin kullan
                         ana_aci = math.degrees(math.asin(deger))
-                        adimlar.append(f"sin(x) = {deger} için ana açı: arcsin({deger}) = {ana_aci:.2f}°")
+                        if self.adimli:
+                            adimlar.append(f"sin(x) = {deger} için ana açı: arcsin({deger}) = {ana_aci:.2f}°")
                         aci1 = ana_aci % 360
                         aci2 = (180 - ana_aci) % 360
-                        adimlar.append(f"Genel çözümler: x = {aci1:.2f}° + 360°k veya x = {aci2:.2f}° + 360°k")
+                        if self.adimli:
+                            adimlar.append(f"Genel çözümler: x = {aci1:.2f}° + 360°k veya x = {aci2:.2f}° + 360°k")
                         cozumler = [aci1, aci2]
                         
                 else:
@@ -586,32 +711,24 @@ class TrigonometriCozucu:
             if cos_eslesen and sag_taraf.replace(".", "").replace("-", "").isdigit():
                 deger = float(sag_taraf)
                 if abs(deger) <= 1:
-                    adimlar.append(f"cos(x) = {deger} denklemini çözelim")
+                    if self.adimli:
+                        adimlar.append(f"cos(x) = {deger} denklemini çözelim")
                     
-                    if deger == 0:
-                        adimlar.append("cos(x) = 0 için çözümler: x = 90°, 270°")
-                        cozumler = [90, 270]
-                    elif deger == 1:
-                        adimlar.append("cos(x) = 1 için çözüm: x = 0°")
-                        cozumler = [0]
-                    elif deger == -1:
-                        adimlar.append("cos(x) = -1 için çözüm: x = 180°")
-                        cozumler = [180]
-                    elif deger == 0.5:
-                        adimlar.append("cos(x) = 0.5 için ana açı: arccos(0.5) = 60°")
-                        adimlar.append("Genel çözümler: x = 60° + 360°k veya x = 300° + 360°k")
-                        cozumler = [60, 300]
-                    elif deger == -0.5:
-                        adimlar.append("cos(x) = -0.5 için ana açı: arccos(-0.5) = 120°")
-                        adimlar.append("Genel çözümler: x = 120° + 360°k veya x = 240° + 360°k")
-                        cozumler = [120, 240]
+                    ozel = ozel_acilar("cos", deger)
+                    if ozel:
+                        if self.adimli:
+                            adimlar.append(f"cos(x) = {self._ozel_deger_metni('cos', ozel[0])} özel bir değerdir")
+                            adimlar.append("Genel çözümler: " + " veya ".join(f"x = {a}° + 360°k" for a in ozel))
+                        cozumler = ozel
                     else:
                         # Genel durum
                         ana_aci = math.degrees(math.acos(deger))
-                        adimlar.append(f"cos(x) = {deger} için ana açı: arccos({deger}) = {ana_aci:.2f}°")
+                        if self.adimli:
+                            adimlar.append(f"cos(x) = {deger} için ana açı: arccos({deger}) = {ana_aci:.2f}°")
                         aci1 = ana_aci % 360
                         aci2 = (360 - ana_aci) % 360
-                        adimlar.append(f"Genel çözümler: x = {aci1:.2f}° + 360°k veya x = {aci2:.2f}° + 360°k")
+                        if self.adimli:
+                            adimlar.append(f"Genel çözümler: x = {aci1:.2f}° + 360°k veya x = {aci2:.2f}° + 360°k")
                         cozumler = [aci1, aci2]
                 else:
                     return {
@@ -624,46 +741,26 @@ class TrigonometriCozucu:
             tan_eslesen = re.search(r'tan\s*\(\s*([x])\s*\)', sol_taraf)
             if tan_eslesen and sag_taraf.replace(".", "").replace("-", "").isdigit():
                 deger = float(sag_taraf)
-                adimlar.append(f"tan(x) = {deger} denklemini çözelim")
+                if self.adimli:
+                    adimlar.append(f"tan(x) = {deger} denklemini çözelim")
                 
-                if deger == 0:
-                    adimlar.append("tan(x) = 0 için çözümler: x = 0°, 180°")
-                    cozumler = [0, 180]
-                elif deger == 1:
-                    adimlar.append("tan(x) = 1 için ana açı: 45°")
-                    adimlar.append("Genel çözüm: x = 45° + 180°k")
-                    cozumler = [45, 225]
-                elif deger == -1:
-                    adimlar.append("tan(x) = -1 için ana açı: -45°")
-                    adimlar.append("Genel çözüm: x = 135° + 180°k")
-                    cozumler = [135, 315]
-                elif abs(deger) == sp.sqrt(3):
-                    if deger > 0:
-                        adimlar.append("tan(x) = √3 için ana açı: 60°")
-                        adimlar.append("Genel çözüm: x = 60° + 180°k")
-                        cozumler = [60, 240]
-                    else:
-                        adimlar.append("tan(x) = -√3 için ana açı: -60°")
-                        adimlar.append("Genel çözüm: x = 120° + 180°k")
-                        cozumler = [120, 300]
-                elif abs(deger) == sp.sqrt(3)/3:
-                    if deger > 0:
-                        adimlar.append("tan(x) = √3/3 için ana açı: 30°")
-                        adimlar.append("Genel çözüm: x = 30° + 180°k")
-                        cozumler = [30, 210]
-                    else:
-                        adimlar.append("tan(x) = -√3/3 için ana açı: -30°")
-                        adimlar.append("Genel çözüm: x = 150° + 180°k")
-                        cozumler = [150, 330]
+                ozel = ozel_acilar("tan", deger)
+                if ozel:
+                    if self.adimli:
+                        adimlar.append(f"tan(x) = {self._ozel_deger_metni('tan', ozel[0])} özel bir değerdir")
+                        adimlar.append(f"Genel çözüm: x = {ozel[0]}° + 180°k")
+                    cozumler = ozel
                 else:
                     # Genel durum
                     ana_aci = math.degrees(math.atan(deger))
                     if ana_aci < 0:
                         ana_aci += 180
-                    adimlar.append(f"tan(x) = {deger} için ana açı: arctan({deger}) = {ana_aci:.2f}°")
+                    if self.adimli:
+                        adimlar.append(f"tan(x) = {deger} için ana açı: arctan({deger}) = {ana_aci:.2f}°")
                     aci1 = ana_aci % 360
                     aci2 = (ana_aci + 180) % 360
-                    adimlar.append(f"Genel çözüm: x = {aci1:.2f}° + 180°k")
+                    if self.adimli:
+                        adimlar.append(f"Genel çözüm: x = {aci1:.2f}° + 180°k")
                     cozumler = [aci1, aci2]
             
             if not cozumler:
@@ -674,10 +771,11 @@ class TrigonometriCozucu:
                 }
             
             # [0°, 360°) aralığındaki çözümleri göster
-            adimlar.append("")
-            adimlar.append("[0°, 360°) aralığındaki çözümler:")
-            for i, cozum in enumerate(cozumler, 1):
-                adimlar.append(f"  x₍{i}₎ = {cozum}°")
+            if self.adimli:
+                adimlar.append("")
+                adimlar.append("[0°, 360°) aralığındaki çözümler:")
+                for i, cozum in enumerate(cozumler, 1):
+                    adimlar.append(f"  x₍{i}₎ = {cozum}°")
             
             return {
                 "basarili": True,
@@ -708,7 +806,8 @@ class TrigonometriCozucu:
         """
         try:
             adimlar = []
-            adimlar.append(f"Dönüştürülecek: {aci} {kaynak_birim} → {hedef_birim}")
+            if self.adimli:
+                adimlar.append(f"Dönüştürülecek: {aci} {kaynak_birim} → {hedef_birim}")
             
             if kaynak_birim == hedef_birim:
                 return {
@@ -719,12 +818,14 @@ class TrigonometriCozucu:
             
             if kaynak_birim == "derece" and hedef_birim == "radyan":
                 sonuc = math.radians(aci)
-                adimlar.append(f"Formül: radyan = derece × π/180")
-                adimlar.append(f"{aci}° × π/180 = {sonuc:.6f} radyan")
+                if self.adimli:
+                    adimlar.append(f"Formül: radyan = derece × π/180")
+                    adimlar.append(f"{aci}° × π/180 = {sonuc:.6f} radyan")
             elif kaynak_birim == "radyan" and hedef_birim == "derece":
                 sonuc = math.degrees(aci)
-                adimlar.append(f"Formül: derece = radyan × 180/π")
-                adimlar.append(f"{aci} × 180/π = {sonuc:.2f}°")
+                if self.adimli:
+                    adimlar.append(f"Formül: derece = radyan × 180/π")
+                    adimlar.append(f"{aci} × 180/π = {sonuc:.2f}°")
             else:
                 return {
                     "basarili": False,
@@ -748,66 +849,191 @@ class TrigonometriCozucu:
                 "adimlar": []
             }
     
-    def _ozel_aci_kontrol(self, fonksiyon: str, aci_derece: float) -> Optional[str]:
-        """Özel açıları kontrol eder ve değerlerini döndürür"""
-        ozel_aciler = {
-            0: {"sin": "0", "cos": "1", "tan": "0"},
-            30: {"sin": "1/2", "cos": "√3/2", "tan": "√3/3"},
-            45: {"sin": "√2/2", "cos": "√2/2", "tan": "1"},
-            60: {"sin": "√3/2", "cos": "1/2", "tan": "√3"},
-            90: {"sin": "1", "cos": "0", "tan": "∞"},
-            180: {"sin": "0", "cos": "-1", "tan": "0"},
-            270: {"sin": "-1", "cos": "0", "tan": "∞"},
-            360: {"sin": "0", "cos": "1", "tan": "0"}
-        }
-        
-        # Açıyı 0-360 aralığına indir
-        aci_normalize = aci_derece % 360
-        
-        if aci_normalize in ozel_aciler and fonksiyon in ozel_aciler[aci_normalize]:
-            return f"{fonksiyon}({aci_derece}°) = {ozel_aciler[aci_normalize][fonksiyon]}"
+    def _ifade_ayristir(self, ifade_str: str) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+        """İfadeyi temizler ve (fonksiyon, açı) eşleşmelerini çıkarır; sonuç paylaşılan önbellekte tutulur"""
+        return ayristirma_onbellegi.al(("trigonometri_ifade", girdi_normalize_et(ifade_str)),
+                                       lambda: self._ifade_temizle(ifade_str))
+    
+    def _ifade_temizle(self, ifade_str: str) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+        """İfadeyi sözcükleyiciden geçirir ve sayı argümanlı trigonometrik fonksiyonları bulur"""
+        # = işareti varsa sol tarafı al
+        ifade_temiz = _ifade_sozcukleyici.ifadeye_cevir(ifade_str).partition("=")[0]
         
+        # Sayı argümanlı tüm trigonometrik fonksiyonları bul: sin30 veya sin(30)
+        return ifade_temiz, tuple(_SAYI_ARGUMANLI_TRIG.findall(ifade_temiz))
+    
+    def _karma_denklem_temizle(self, denklem_str: str) -> str:
+        """Karma trigonometrik denklemden gereksiz kelimeleri ve boşlukları çıkarır"""
+        return _karma_sozcukleyici.ifadeye_cevir(denklem_str)
+    
+    def _ozel_deger_metni(self, ad: str, aci: int) -> str:
+        """Tablodaki özel açının tam değerini okunabilir metin olarak döndürür"""
+        return okunabilir(_ozel_deger_tablosu()[0][(ad, aci)][0])
+
+
+def _deger_anahtari(deger: float) -> float:
+    """Ters arama için değeri kovaya ayırır; eşleşme ayrıca OZEL_DEGER_TOLERANSI ile doğrulanır"""
+    return round(float(deger), 9) + 0.0  # -0.0 yerine 0.0
+
+
+def _ozel_deger_tablosu() -> Tuple[Dict[Tuple[str, int], Tuple[sp.Expr, float]],
+                                   Dict[Tuple[str, float], List[Tuple[int, float]]]]:
+    """Özel açı tablosunu ilk çağrıda kurar ve döndürür"""
+    global _ozel_tablo
+    if _ozel_tablo is None:
+        degerler = {}
+        ters = {}
+        for ad, fonksiyon in (("sin", sp.sin), ("cos", sp.cos), ("tan", sp.tan),
+                              ("cot", sp.cot), ("sec", sp.sec), ("csc", sp.csc)):
+            for aci in OZEL_ACILAR:
+                tam = fonksiyon(sp.pi * aci / 180)
+                if tam is sp.zoo:
+                    continue  # Kutup: tabloda yer almaz
+                if tam.is_Pow and tam.exp == -1:
+                    # 1/(√5/4 - 1/4) -> 1 + √5
+                    tam = sp.radsimp(tam)
+                yaklasik = float(tam)
+                degerler[(ad, aci)] = (tam, yaklasik)
+                ters.setdefault((ad, _deger_anahtari(yaklasik)), []).append((aci, yaklasik))
+        _ozel_tablo = (degerler, ters)
+    return _ozel_tablo
+
+
+def ozel_aci_degeri(fonksiyon: str, aci_derece: float) -> Optional[Tuple[sp.Expr, float]]:
+    """
+    Özel açıdaki tam değeri sabit zamanda döndürür.
+    
+    Args:
+        fonksiyon (str): sin, cos, tan, cot, sec, csc (veya Türkçe adları)
+        aci_derece (float): Açı (derece); 360°'ye göre indirgenir
+    
+    Returns:
+        Optional[Tuple[sp.Expr, float]]: (tam değer, float değer); açı özel
+            değilse, fonksiyon bilinmiyorsa veya açı kutupsa None
+    """
+    ad = _TRIG_ADLARI.get(fonksiyon)
+    aci = aci_derece % 360
+    if ad is None or aci != int(aci):
         return None
+    return _ozel_deger_tablosu()[0].get((ad, int(aci)))
+
+
+def ozel_acilar(fonksiyon: str, deger: float) -> List[int]:
+    """
+    f(x) = deger eşitliğini sağlayan [0°, 360°) aralığındaki özel açıları bulur.
+    
+    Args:
+        fonksiyon (str): sin, cos, tan, cot, sec, csc (veya Türkçe adları)
+        deger (float): Fonksiyon değeri (örn: 0.5, (√5 - 1)/4 ≈ 0.309017)
+    
+    Returns:
+        List[int]: Küçükten büyüğe açılar (derece); değer özel değilse boş liste
+    """
+    ad = _TRIG_ADLARI.get(fonksiyon)
+    if ad is None:
+        return []
+    deger = float(deger)
+    ters = _ozel_deger_tablosu()[1]
+    # Tolerans aralığı bir kova sınırına taşabilir; iki ucun kovasına da bakılır
+    kovalar = {_deger_anahtari(deger * (1 - OZEL_DEGER_TOLERANSI)),
+               _deger_anahtari(deger * (1 + OZEL_DEGER_TOLERANSI))}
+    return sorted(aci for kova in kovalar for aci, yaklasik in ters.get((ad, kova), [])
+                  if math.isclose(deger, yaklasik, rel_tol=OZEL_DEGER_TOLERANSI, abs_tol=0.0))
+
+def trigonometrik_degerler(fonksiyon: str, acilar, birim: str = "derece") -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Trigonometrik fonksiyonu açı dizisi üzerinde NumPy ile hesaplar.
+    
+    Derecelerde açı önce [-180°, 180°] aralığına indirgenir ve 90°'nin tam katlarında
+    sin/cos tam 0 veya ±1 alınır; böylece tan(90°) gibi kutuplar kesin
+    tespit edilir. Radyanda payda, açının yuvarlama hatası düzeyinde
+    (4·eps·max(1, |x|)) kaldığında kutup sayılır.
+    
+    Args:
+        fonksiyon (str): Fonksiyon adı (_TRIG_ADLARI anahtarlarından biri)
+        acilar (array-like): Açı değerleri
+        birim (str): "derece" veya "radyan"
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (değerler, kutup maskesi); kutuplarda değer NaN
+    """
+    acilar = np.asarray(acilar, dtype=float)
+    if birim == "derece":
+        indirgenmis = acilar - 360.0 * np.round(acilar / 360.0)
+        radyan = np.radians(indirgenmis)
+        ceyrek = np.mod(indirgenmis, 90.0) == 0
+        kutup_esigi = 0.0
+    else:
+        radyan = acilar
+        ceyrek = None
+        kutup_esigi = 4 * np.finfo(float).eps * np.maximum(1.0, np.abs(acilar))
+    
+    bilesenler = {}
+    
+    def bilesen(ad):
+        if ad not in bilesenler:
+            deger = np.sin(radyan) if ad == "sin" else np.cos(radyan)
+            if ceyrek is not None:
+                deger = np.where(ceyrek, np.round(deger) + 0.0, deger)  # -0.0 yerine 0.0
+            bilesenler[ad] = deger
+        return bilesenler[ad]
+    
+    pay, payda = _TRIG_ORANLARI[_TRIG_ADLARI[fonksiyon]]
+    ust = bilesen(pay) if pay else np.ones_like(radyan)
+    if payda is None:
+        return ust, np.zeros(radyan.shape, dtype=bool)
+    
+    alt = bilesen(payda)
+    tanimsiz = np.abs(alt) <= kutup_esigi
+    with np.errstate(divide="ignore", invalid="ignore"):
+        degerler = np.where(tanimsiz, np.nan, ust / np.where(tanimsiz, 1.0, alt) + 0.0)
+    return degerler, tanimsiz
 
 
 # Kullanım kolaylığı için global fonksiyonlar
-def trigonometrik_hesapla(fonksiyon: str, aci: float, birim: str = "derece") -> Dict[str, any]:
+def trigonometrik_hesapla(fonksiyon: str, aci: float, birim: str = "derece", adimli: bool = True) -> Dict[str, any]:
     """Trigonometrik fonksiyon hesaplar"""
-    cozucu = TrigonometriCozucu()
+    cozucu = TrigonometriCozucu(adimli)
     return cozucu.fonksiyon_hesapla(fonksiyon, aci, birim)
 
 
-def ters_trigonometrik_hesapla(fonksiyon: str, deger: float) -> Dict[str, any]:
+def trigonometrik_toplu_hesapla(fonksiyon: str, acilar, birim: str = "derece", adimli: bool = True) -> Dict[str, any]:
+    """Trigonometrik fonksiyonu açı dizisi üzerinde toplu hesaplar"""
+    cozucu = TrigonometriCozucu(adimli)
+    return cozucu.fonksiyon_toplu_hesapla(fonksiyon, acilar, birim)
+
+
+def ters_trigonometrik_hesapla(fonksiyon: str, deger: float, adimli: bool = True) -> Dict[str, any]:
     """Ters trigonometrik fonksiyon hesaplar"""
-    cozucu = TrigonometriCozucu()
+    cozucu = TrigonometriCozucu(adimli)
     return cozucu.ters_fonksiyon_hesapla(fonksiyon, deger)
 
 
-def aci_donustur(aci: float, kaynak_birim: str, hedef_birim: str) -> Dict[str, any]:
+def aci_donustur(aci: float, kaynak_birim: str, hedef_birim: str, adimli: bool = True) -> Dict[str, any]:
     """Açı birim dönüşümü yapar"""
-    cozucu = TrigonometriCozucu()
+    cozucu = TrigonometriCozucu(adimli)
     return cozucu.aci_donusumu(aci, kaynak_birim, hedef_birim)
 
 
-def trigonometrik_denklem_coz(denklem: str) -> Dict[str, any]:
+def trigonometrik_denklem_coz(denklem: str, adimli: bool = True) -> Dict[str, any]:
     """Trigonometrik denklem çözer"""
-    cozucu = TrigonometriCozucu()
+    cozucu = TrigonometriCozucu(adimli)
     return cozucu.trigonometrik_denklem_coz(denklem)
 
 
-def trigonometrik_ifade_hesapla(ifade: str) -> Dict[str, any]:
+def trigonometrik_ifade_hesapla(ifade: str, adimli: bool = True) -> Dict[str, any]:
     """Karmaşık trigonometrik ifadeleri hesaplar"""
-    cozucu = TrigonometriCozucu()
+    cozucu = TrigonometriCozucu(adimli)
     return cozucu.trigonometrik_ifade_hesapla(ifade)
 
 
-def karma_trigonometrik_denklem_coz(denklem: str) -> Dict[str, any]:
+def karma_trigonometrik_denklem_coz(denklem: str, adimli: bool = True) -> Dict[str, any]:
     """Karma trigonometrik denklem çözer"""
-    cozucu = TrigonometriCozucu()
+    cozucu = TrigonometriCozucu(adimli)
     return cozucu.karma_trigonometrik_denklem_coz(denklem)
 
 
-def trigonometrik_turev_integral(islem: str, fonksiyon: str) -> Dict[str, any]:
+def trigonometrik_turev_integral(islem: str, fonksiyon: str, adimli: bool = True) -> Dict[str, any]:
     """Trigonometrik fonksiyonların türev ve integrallerini hesaplar"""
     try:
         adimlar = []
@@ -841,20 +1067,22 @@ def trigonometrik_turev_integral(islem: str, fonksiyon: str) -> Dict[str, any]:
         fonksiyon_temiz = fonksiyon.lower().strip()
         
         if islem.lower() in ["türev", "turev"]:
-            adimlar.append(f"Trigonometrik türev hesaplanıyor: {fonksiyon}")
+            if adimli:
+                adimlar.append(f"Trigonometrik türev hesaplanıyor: {fonksiyon}")
             
             if fonksiyon_temiz in trig_turevler:
                 sonuc = trig_turevler[fonksiyon_temiz]
-                adimlar.append(f"Trigonometrik türev kuralı:")
-                adimlar.append(f"d/dx[{fonksiyon}] = {sonuc}")
-                
-                # Açıklama ekle
-                if "sin" in fonksiyon_temiz:
-                    adimlar.append("Sinüs fonksiyonunun türevi kosinüs fonksiyonudur")
-                elif "cos" in fonksiyon_temiz:
-                    adimlar.append("Kosinüs fonksiyonunun türevi negatif sinüs fonksiyonudur")
-                elif "tan" in fonksiyon_temiz:
-                    adimlar.append("Tanjant fonksiyonunun türevi sekant karesine eşittir")
+                if adimli:
+                    adimlar.append(f"Trigonometrik türev kuralı:")
+                    adimlar.append(f"d/dx[{fonksiyon}] = {sonuc}")
+                    
+                    # Açıklama ekle
+                    if "sin" in fonksiyon_temiz:
+                        adimlar.append("Sinüs fonksiyonunun türevi kosinüs fonksiyonudur")
+                    elif "cos" in fonksiyon_temiz:
+                        adimlar.append("Kosinüs fonksiyonunun türevi negatif sinüs fonksiyonudur")
+                    elif "tan" in fonksiyon_temiz:
+                        adimlar.append("Tanjant fonksiyonunun türevi sekant karesine eşittir")
                 
                 return {
                     "basarili": True,
@@ -871,20 +1099,22 @@ def trigonometrik_turev_integral(islem: str, fonksiyon: str) -> Dict[str, any]:
                 }
         
         elif islem.lower() == "integral":
-            adimlar.append(f"Trigonometrik integral hesaplanıyor: ∫{fonksiyon} dx")
+            if adimli:
+                adimlar.append(f"Trigonometrik integral hesaplanıyor: ∫{fonksiyon} dx")
             
             if fonksiyon_temiz in trig_integraller:
                 sonuc = trig_integraller[fonksiyon_temiz]
-                adimlar.append(f"Trigonometrik integral kuralı:")
-                adimlar.append(f"∫{fonksiyon} dx = {sonuc} + C")
-                
-                # Açıklama ekle
-                if "sin" in fonksiyon_temiz:
-                    adimlar.append("Sinüs fonksiyonunun integrali negatif kosinüstür")
-                elif "cos" in fonksiyon_temiz:
-                    adimlar.append("Kosinüs fonksiyonunun integrali sinüstür")
-                elif "tan" in fonksiyon_temiz:
-                    adimlar.append("Tanjant fonksiyonunun integrali -ln|cos(x)|'tır")
+                if adimli:
+                    adimlar.append(f"Trigonometrik integral kuralı:")
+                    adimlar.append(f"∫{fonksiyon} dx = {sonuc} + C")
+                    
+                    # Açıklama ekle
+                    if "sin" in fonksiyon_temiz:
+                        adimlar.append("Sinüs fonksiyonunun integrali negatif kosinüstür")
+                    elif "cos" in fonksiyon_temiz:
+                        adimlar.append("Kosinüs fonksiyonunun integrali sinüstür")
+                    elif "tan" in fonksiyon_temiz:
+                        adimlar.append("Tanjant fonksiyonunun integrali -ln|cos(x)|'tır")
                 
                 return {
                     "basarili": True,
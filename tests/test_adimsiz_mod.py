@@ -0,0 +1,29 @@
+"""
+Adımsız (adimli=False) mod testleri: her çözücü aynı sonucu adım metni üretmeden verir
+"""
+
+import pytest
+
+from modules import analiz, cebir, geometri, olasilik, trigonometri
+
+
+CAGRILAR = [
+    ("cebir", lambda adimli: cebir.ikinci_dereceden_coz("2x^2 + 3x - 2 = 0", adimli=adimli)),
+    ("polinom", lambda adimli: cebir.polinom_coz("x^3 - 6x^2 + 11x - 6 = 0", adimli=adimli)),
+    ("turev", lambda adimli: analiz.turev_hesapla("x^3 * sin(x)", adimli=adimli)),
+    ("integral", lambda adimli: analiz.integral_hesapla("x^2 + 3x", adimli=adimli)),
+    ("trigonometri", lambda adimli: trigonometri.trigonometrik_hesapla("sin", 30, adimli=adimli)),
+    ("olasilik", lambda adimli: olasilik.kombinasyon(5, 2, adimli=adimli)),
+    ("geometri", lambda adimli: geometri.ucgen_hesapla("alan", adimli=adimli, taban=3, yukseklik=4)),
+]
+
+
+@pytest.mark.parametrize("ad, cagri", CAGRILAR, ids=[ad for ad, _ in CAGRILAR])
+def test_adimsiz_mod_ayni_sonucu_adimsiz_verir(ad, cagri):
+    adimli, adimsiz = cagri(True), cagri(False)
+    assert adimli["basarili"] and adimsiz["basarili"]
+    assert adimli["adimlar"]
+    assert not adimsiz["adimlar"]
+    for anahtar, deger in adimli.items():
+        if anahtar != "adimlar":
+            assert str(adimsiz[anahtar]) == str(deger), anahtar
@@ -0,0 +1,387 @@
+"""
+Analiz modülü testleri
+"""
+
+import math
+import time
+
+import numpy as np
+import pytest
+import sympy as sp
+
+from modules import analiz
+from modules.analiz import (AnalizCozucu, fonksiyon_tablosu, gauss_kronrod_integral, horner_degerlendir,
+                            ileri_mod_turev, richardson_limit, tabloyu_yaz, taylor_onbellegi)
+
+x = sp.Symbol('x')
+
+
+# --- Tek sembolik integrasyonla belirli integral (user-012) ---
+
+@pytest.mark.parametrize("fonksiyon, alt, ust", [
+    ("x^2", 0, 3),
+    ("x*exp(x)", -1, 2),
+    ("1/x^2", 1, "oo"),
+    ("exp(-x)", 0, "oo"),
+    ("1/(1+x^2)", "-oo", "oo"),
+    ("1/sqrt(x)", 0, 1),
+    ("abs(x)", -1, 2),
+    ("sin(x)/x", 0, 1),
+    ("log(x)", 2, 1),
+    ("1/x^2", -1, 1),
+])
+def test_belirli_integral_sympy_ile_ayni(fonksiyon, alt, ust):
+    sonuc = analiz.integral_hesapla(fonksiyon, belirli=True, alt_sinir=alt, ust_sinir=ust, adimli=False)
+    assert sonuc["basarili"] and sonuc["yontem"] == "sembolik"
+    ifade = sp.sympify(sonuc["sympy_fonksiyon"])
+    beklenen = sp.integrate(ifade, (x, sp.sympify(alt), sp.sympify(ust)))
+    integral = sp.sympify(sonuc["integral"])
+    assert integral == beklenen or sp.simplify(integral - beklenen) == 0
+    # Gösterilen ilkel fonksiyonun türevi integrand olmalı
+    assert sp.simplify(sp.diff(sp.sympify(sonuc["belirsiz_integral"]), x) - ifade) == 0
+
+
+def test_ilkel_fonksiyonu_sureksiz_araliklar_tam_integrale_doner():
+    # atan(tan(x)/2) benzeri ilkel fonksiyonlar aralık içinde sıçrar
+    sonuc = analiz.integral_hesapla("1/(2 + cos(x))", belirli=True, alt_sinir=0, ust_sinir="2*pi", adimli=False)
+    assert sonuc["sayisal_deger"] == pytest.approx(2 * math.pi / math.sqrt(3))
+
+
+# --- Sayısal integral yedeği (user-013) ---
+
+@pytest.mark.parametrize("fonksiyon, alt, ust, beklenen", [
+    (np.exp, 0.0, 1.0, math.e - 1),
+    (lambda t: 1 / np.sqrt(t), 0.0, 1.0, 2.0),
+    (lambda t: np.exp(-t * t), -np.inf, np.inf, math.sqrt(math.pi)),
+    (lambda t: 1 / (1 + t * t), 0.0, np.inf, math.pi / 2),
+    (np.cos, 1.0, 0.0, -math.sin(1.0)),
+])
+def test_gauss_kronrod_bilinen_integraller(fonksiyon, alt, ust, beklenen):
+    deger, hata, yakinsadi, sayac = gauss_kronrod_integral(fonksiyon, alt, ust)
+    assert yakinsadi and sayac > 0
+    assert deger == pytest.approx(beklenen, rel=1e-8)
+    assert hata < 1e-6
+
+
+def test_kapali_bicim_yoksa_sayisal_integral():
+    sonuc = analiz.integral_hesapla("x^x", belirli=True, alt_sinir=0, ust_sinir=1, adimli=False)
+    assert sonuc["basarili"] and "Gauss-Kronrod" in sonuc["yontem"]
+    assert sonuc["sayisal_deger"] == pytest.approx(0.7834305107121345, rel=1e-9)
+    assert sonuc["hata_siniri"] < 1e-8
+
+
+def test_sure_dolunca_sayisal_integrale_gecer():
+    baslangic = time.perf_counter()
+    sonuc = analiz.integral_hesapla("exp(-x^2)*cos(3x)*log(1+x^2)", belirli=True, alt_sinir=0, ust_sinir=2,
+                                    sure_siniri=1e-3)
+    assert time.perf_counter() - baslangic < 10
+    assert sonuc["basarili"] and "Gauss-Kronrod" in sonuc["yontem"]
+    assert any("saniyede bulunamadı" in adim for adim in sonuc["adimlar"])
+    beklenen = gauss_kronrod_integral(lambda t: np.exp(-t * t) * np.cos(3 * t) * np.log1p(t * t), 0.0, 2.0)[0]
+    assert sonuc["sayisal_deger"] == pytest.approx(beklenen)
+
+
+def test_varsayilan_sure_siniri_sonlu_none_ile_kalkar():
+    assert analiz.SEMBOLIK_SURE_SINIRI is not None and analiz.SEMBOLIK_SURE_SINIRI > 0
+    assert analiz.AnalizCozucu().sure_siniri == analiz.SEMBOLIK_SURE_SINIRI
+    for sure in (analiz.SEMBOLIK_SURE_SINIRI, None):
+        sonuc = analiz.integral_hesapla("x^2", belirli=True, alt_sinir=0, ust_sinir=3, adimli=False,
+                                        sure_siniri=sure)
+        assert sonuc["basarili"] and sonuc["sayisal_deger"] == pytest.approx(9)
+
+
+def test_sayisal_integral_hesapla_sonsuz_sinir():
+    sonuc = analiz.sayisal_integral_hesapla("exp(-x)*sqrt(x)", 0, "oo", adimli=False)
+    assert sonuc["basarili"]
+    assert sonuc["sayisal_deger"] == pytest.approx(math.sqrt(math.pi) / 2)
+
+
+# --- Sadeleştirme düzeyleri (user-014) ---
+
+@pytest.mark.parametrize("ayarlar, duzey", [
+    ({}, "tam"),
+    ({"sadelestirme": "ucuz"}, "ucuz"),
+    ({"sadelestirme": "kapali"}, "kapali"),
+    ({"sadelestirme_suresi": None}, "tam"),
+])
+def test_sadelestirme_duzeyi_sonucu_degistirmez(ayarlar, duzey):
+    cozucu = AnalizCozucu(adimli=False, **ayarlar)
+    turev = cozucu.turev_hesapla("sin(x)^2*cos(x) + (x^2-1)/(x-1)")
+    integral = cozucu.integral_hesapla("sin(x)^2*cos(x)*x")
+    assert turev["sadelestirme"] == integral["sadelestirme"] == duzey
+    ifade = sp.sin(x)**2*sp.cos(x) + (x**2 - 1)/(x - 1)
+    assert sp.simplify(sp.sympify(turev["turev_basit"]) - sp.diff(ifade, x)) == 0
+    assert sp.simplify(sp.diff(sp.sympify(integral["integral_basit"]), x) - sp.sin(x)**2*sp.cos(x)*x) == 0
+
+
+def test_tam_duzey_kapalidan_kisa():
+    tam = AnalizCozucu(adimli=False).turev_hesapla("x*(x^2-4)/(x-2)")
+    kapali = AnalizCozucu(adimli=False, sadelestirme="kapali").turev_hesapla("x*(x^2-4)/(x-2)")
+    assert tam["turev_basit"] == "2*x + 2"
+    assert kapali["turev_basit"] == kapali["turev"]
+
+
+def test_ucuz_duzey_simplify_cagirmaz(monkeypatch):
+    def yasak(*argumanlar, **secenekler):
+        raise AssertionError("sp.simplify çağrıldı")
+
+    monkeypatch.setattr(sp, "simplify", yasak)
+    sonuc = AnalizCozucu(adimli=False, sadelestirme="ucuz").turev_hesapla("x^3*(x^2-9)/(x-3)")
+    assert sonuc["basarili"], sonuc.get("hata")
+    assert sp.sympify(sonuc["turev_basit"]).equals(4*x**3 + 9*x**2)
+
+
+def test_sadelestirme_suresi_dolunca_ham_sonuc_doner():
+    sonuc = AnalizCozucu(adimli=False, sadelestirme_suresi=1e-4).turev_hesapla("tan(x)^3*exp(x)/(x^2+7)")
+    assert sonuc["sadelestirme"] == "sure_asimi"
+    assert sonuc["turev_basit"] == sonuc["turev"]
+
+
+def test_sadelestirme_suresi_varsayilan_olarak_sonlu():
+    assert analiz.SADELESTIRME_SURE_SINIRI is not None and analiz.SADELESTIRME_SURE_SINIRI > 0
+    assert AnalizCozucu().sadelestirme_suresi == analiz.SADELESTIRME_SURE_SINIRI
+
+
+def test_bilinmeyen_sadelestirme_duzeyi():
+    with pytest.raises(ValueError, match="sadeleştirme düzeyi"):
+        AnalizCozucu(sadelestirme="hepsi")
+
+
+# --- Gradyan, Jacobian ve Hessian (user-015) ---
+
+def test_gradyan_ve_hessian_sembolik():
+    y = sp.Symbol('y')
+    ifade = x**2*y + sp.sin(x*y)
+    gradyan = analiz.gradyan_hesapla("x^2*y + sin(x*y)", adimli=False)
+    hessian = analiz.hessian_hesapla("x^2*y + sin(x*y)", adimli=False)
+    assert gradyan["degiskenler"] == hessian["degiskenler"] == ["x", "y"]
+    for bilesen, degisken in zip(gradyan["gradyan"], (x, y)):
+        assert sp.simplify(sp.sympify(bilesen) - sp.diff(ifade, degisken)) == 0
+    assert sp.Matrix(sp.sympify(hessian["hessian"])) == sp.hessian(ifade, (x, y))
+    assert hessian["sekil"] == (2, 2)
+
+
+def test_jakobiyen_toplu_degerlendirici():
+    y, z = sp.symbols('y z')
+    fonksiyonlar = ["x*y*z + exp(x*y)", "sin(x*y)*z", "z^2 + exp(x*y)"]
+    sonuc = analiz.jakobiyen_hesapla(fonksiyonlar, adimli=False, derlenmis=True)
+    assert sonuc["sekil"] == (3, 3) and sonuc["degiskenler"] == ["x", "y", "z"]
+    # exp(x*y) ve x*y bileşenler arasında paylaşılır
+    assert sonuc["ortak_alt_ifade_sayisi"] >= 1
+
+    jakobiyen = sp.Matrix([sp.sympify(f.replace("^", "**")) for f in fonksiyonlar]).jacobian((x, y, z))
+    noktalar = np.random.default_rng(15).uniform(-1, 1, size=(20, 3))
+    sonuclar = sonuc["degerlendirici"](noktalar)
+    assert sonuclar.shape == (20, 3, 3)
+    for nokta, deger in zip(noktalar, sonuclar):
+        beklenen = np.array(jakobiyen.subs(dict(zip((x, y, z), nokta))), dtype=float)
+        assert deger == pytest.approx(beklenen)
+    assert sonuc["degerlendirici"](noktalar[0]) == pytest.approx(sonuclar[0])
+
+
+def test_kismi_turev_yuksek_mertebe():
+    sonuc = analiz.kismi_turev_hesapla("x^3*y^2", ["x", "x", "y"], adimli=False)
+    assert sonuc["mertebe"] == 3 and sonuc["kismi_turev"] == "12*x*y"
+
+
+def test_sabitin_gradyani_sifir():
+    sonuc = analiz.gradyan_hesapla("3", adimli=False)
+    assert sonuc["basarili"] and sonuc["gradyan"] == ["0"]
+    assert not analiz.gradyan_hesapla("3", degiskenler=[], adimli=False)["basarili"]
+
+
+# --- Limit (user-016) ---
+
+@pytest.mark.parametrize("fonksiyon, nokta, limit, yontem", [
+    ("x^2 + 1", 2, "5", "doğrudan yerine koyma"),
+    ("(x^3-1)/(x-1)", 1, "3", "rasyonel sadeleştirme"),
+    ("(3x^2+1)/(2x^2-5)", "oo", "3/2", "derece karşılaştırması"),
+    ("sin(x)/x", 0, "1", "sembolik (sp.limit)"),
+    ("(1+1/x)^x", "oo", "E", "sembolik (sp.limit)"),
+])
+def test_limit_ucuz_kurallar_ve_sympy(fonksiyon, nokta, limit, yontem):
+    sonuc = analiz.limit_hesapla(fonksiyon, nokta, adimli=False)
+    assert sonuc["basarili"] and sonuc["limit_var"]
+    assert sonuc["limit"] == limit and sonuc["yontem"] == yontem
+
+
+def test_tek_yonlu_limitler_farkliysa_limit_yok():
+    iki_yonlu = analiz.limit_hesapla("1/x", 0, adimli=False)
+    assert not iki_yonlu["limit_var"]
+    assert (iki_yonlu["sag_limit"], iki_yonlu["sol_limit"]) == ("oo", "-oo")
+    assert analiz.limit_hesapla("1/x", 0, yon="+", adimli=False)["limit"] == "∞"
+
+
+@pytest.mark.parametrize("fonksiyon", ["atan(1/x)", "acot(x)"])
+def test_sicramada_dogrudan_yerine_koyma_kullanilmaz(fonksiyon):
+    iki_yonlu = analiz.limit_hesapla(fonksiyon, 0, adimli=False)
+    assert not iki_yonlu["limit_var"]
+    assert (iki_yonlu["sag_limit"], iki_yonlu["sol_limit"]) == ("pi/2", "-pi/2")
+    assert analiz.limit_hesapla(fonksiyon, 0, yon="+", adimli=False)["limit"] == "π/2"
+    sol = analiz.limit_hesapla(fonksiyon, 0, yon="-", adimli=False)
+    assert sol["limit"] == "-π/2" and sol["yontem"] != "doğrudan yerine koyma"
+    assert analiz.limit_hesapla(fonksiyon, 1, adimli=False)["yontem"] == "doğrudan yerine koyma"
+
+
+def test_sure_dolunca_sayisal_limit():
+    sonuc = analiz.limit_hesapla("gamma(x)*x - exp(-x)*Si(x)*zeta(x+2)", 0, adimli=False, sure_siniri=1e-4)
+    assert sonuc["limit_var"] and "Richardson" in sonuc["yontem"]
+    assert sonuc["sayisal_deger"] == pytest.approx(1.0, abs=1e-8)
+    iraksak = analiz.limit_hesapla("exp(1/x)*Si(x)/x", 0, yon="+", adimli=False, sure_siniri=1e-4)
+    assert iraksak["sayisal_deger"] == np.inf
+
+
+def test_richardson_limit():
+    h = 2.0 ** -np.arange(1, analiz.LIMIT_DIZI_UZUNLUGU + 1)
+    tahmin, hata = richardson_limit((np.exp(h) - 1) / h)
+    assert tahmin == pytest.approx(1.0, abs=1e-10) and hata < 1e-8
+    assert richardson_limit(1 / h)[0] == np.inf
+    assert np.isnan(richardson_limit(np.full(5, np.nan))[0])
+
+
+# --- Taylor serisi (user-017) ---
+
+@pytest.mark.parametrize("fonksiyon, nokta", [
+    ("exp(x)", 0), ("log(x)", 1), ("sin(x)/x", 0), ("cos(x)", "pi/3"), ("atan(x)", 0.5),
+])
+def test_taylor_katsayilari_sympy_serisiyle_ayni(fonksiyon, nokta):
+    sonuc = analiz.taylor_serisi(fonksiyon, nokta, 6, adimli=False)
+    assert sonuc["basarili"], sonuc.get("hata")
+    a = sp.sympify(nokta)
+    beklenen = sp.series(sp.sympify(sonuc["sympy_fonksiyon"]), x, a, 7).removeO()
+    seri = sum(sp.sympify(katsayi) * (x - a)**k for k, katsayi in enumerate(sonuc["katsayilar"]))
+    fark = sp.Poly(sp.expand(seri - beklenen), x).coeffs()
+    assert max(abs(complex(katsayi)) for katsayi in fark) < 1e-12
+
+
+def test_taylor_mertebe_artinca_yalnizca_yeni_turevler_alinir(monkeypatch):
+    taylor_onbellegi.temizle()
+    analiz.taylor_serisi("exp(sin(x))", 0, 3, adimli=False)
+    turevler = []
+    asil_diff = sp.diff
+    monkeypatch.setattr(sp, "diff", lambda *a, **k: turevler.append(1) or asil_diff(*a, **k))
+    sonuc = analiz.taylor_serisi("exp(sin(x))", 0, 6, adimli=False)
+    assert len(turevler) == 3
+    assert sonuc["katsayilar"][:4] == ["1", "1", "1/2", "0"]
+
+
+def test_taylor_degerleri_ve_kalan_tahmini():
+    noktalar = np.array([-0.5, 0.1, 0.5])
+    sonuc = analiz.taylor_serisi("exp(x)", 0, 5, degerler=noktalar, adimli=False)
+    assert sonuc["kalan_derecesi"] == 6
+    hata = np.abs(sonuc["degerler"] - np.exp(noktalar))
+    assert np.all(hata <= 2 * sonuc["kalan_tahmini"])
+    assert sonuc["azami_kalan"] == pytest.approx(0.5**6 / 720)
+
+
+def test_taylor_acilamayan_nokta_ve_horner():
+    assert not analiz.taylor_serisi("log(x)", 0, 3, adimli=False)["basarili"]
+    assert not analiz.taylor_serisi("exp(x)", 0, -1, adimli=False)["basarili"]
+    assert horner_degerlendir(np.array([1.0, -2.0, 3.0]), np.array([0.0, 2.0])) == pytest.approx([1.0, 9.0])
+
+
+# --- İleri mod otomatik türev (user-018) ---
+
+@pytest.mark.parametrize("fonksiyon", [
+    "x^3*exp(-x) + sqrt(x)",
+    "sec(x)^2 + csc(x)*cot(x)",
+    "tan(x)*log(x) - cos(x^2)",
+    "asin(x/3) + acos(x/4) + atan(x)",
+    "sinh(x)*cosh(x) - tanh(x)",
+    "x^x + 2^x",
+    "abs(x - 1)",
+    "gamma(x) + erf(x)",
+])
+def test_ileri_mod_sembolik_turevle_ayni(fonksiyon):
+    noktalar = np.array([0.3, 0.7, 1.3, 2.2])
+    sonuc = analiz.turev_degeri_hesapla(fonksiyon, noktalar, adimli=False)
+    assert sonuc["basarili"], sonuc.get("hata")
+    # Abs'ın türevi yalnızca reel değişkende sign() olarak sadeleşir
+    gercek = sp.Symbol('x', real=True)
+    ifade = sp.sympify(sonuc["sympy_fonksiyon"]).subs(x, gercek)
+    turev = sp.diff(ifade, gercek)
+    assert sonuc["degerler"] == pytest.approx([float(ifade.subs(gercek, n)) for n in noktalar], rel=1e-12)
+    assert sonuc["turev_degerleri"] == pytest.approx([float(turev.subs(gercek, n).evalf()) for n in noktalar], rel=1e-10)
+
+
+def test_ileri_mod_parametreler_yayinlanir():
+    a = sp.Symbol('a')
+    noktalar = np.linspace(0.1, 1, 4)
+    parametre = np.array([[1.0], [2.0], [3.0]])
+    f, d = ileri_mod_turev(sp.sin(a*x)*x, x, noktalar, {a: parametre})
+    assert f.shape == d.shape == (3, 4)
+    assert d == pytest.approx(np.sin(parametre*noktalar) + parametre*noktalar*np.cos(parametre*noktalar))
+
+
+# --- Sayısal kök bulma (user-019) ---
+
+def test_kok_bul_birden_cok_denklem():
+    sonuc = analiz.kok_bul(["sin(x)", "x^2 - 2", "exp(x) = 3", "cos(x) = x"], -4, 4, adimli=False)
+    assert sonuc["basarili"]
+    assert list(sonuc["kok_sayilari"]) == [3, 2, 1, 1]
+    beklenen = [[-math.pi, 0.0, math.pi], [-math.sqrt(2), math.sqrt(2)], [math.log(3)], [0.7390851332151607]]
+    for kokler, dogru in zip(sonuc["kok_listesi"], beklenen):
+        assert kokler == pytest.approx(dogru, abs=1e-9)
+    assert np.isnan(sonuc["kokler"][1:, 2]).all()
+
+
+def test_kok_bul_parametre_degerleri():
+    degerler = np.linspace(0.5, 8, 16)
+    sonuc = analiz.kok_bul("x^2 - a", 0, 3, parametre="a", parametre_degerleri=degerler, adimli=False)
+    # Tolerans KOK_TOLERANSI * (1 + |x|) biçiminde görelidir
+    assert sonuc["kokler"][:, 0] == pytest.approx(np.sqrt(degerler), abs=analiz.KOK_TOLERANSI * 4)
+
+
+def test_kok_bul_trigonometrik_sinirlar():
+    sonuc = analiz.kok_bul("tan(x) - 1", "-pi/2 + 0.01", "3*pi/2 - 0.01", adimli=False)
+    assert sonuc["kok_listesi"][0] == pytest.approx([math.pi / 4, 5 * math.pi / 4], abs=1e-9)
+
+
+# --- Fonksiyon tablosu (user-020) ---
+
+def test_tablo_parcalar_ve_sutunlar():
+    sonuc = analiz.fonksiyon_tablola("x^2", 0, 3, nokta_sayisi=7, parca_boyutu=3, adimli=False)
+    parcalar = list(sonuc["parcalar"])
+    assert [parca.shape for parca in parcalar] == [(3, 4), (3, 4), (1, 4)]
+    tablo = np.vstack(parcalar)
+    xs = np.linspace(0, 3, 7)
+    assert tablo[:, 0] == pytest.approx(xs)
+    assert tablo[:, 1] == pytest.approx(xs**2)
+    assert tablo[:, 2] == pytest.approx(2 * xs)
+    assert tablo[:, 3] == pytest.approx(xs**3 / 3)
+    assert sonuc["tekil_noktalar"] == []
+
+
+def test_tablo_tekil_noktadan_sonra_integral_nan():
+    sonuc = analiz.fonksiyon_tablola("1/x", -1, 1, nokta_sayisi=5, adimli=False)
+    assert sonuc["tekil_noktalar"] == [0.0]
+    tablo = np.vstack(list(sonuc["parcalar"]))
+    assert tablo[1, 3] == pytest.approx(-math.log(2), abs=1e-6)
+    assert np.isnan(tablo[2:, 3]).all()
+    assert tablo[3:, 1] == pytest.approx([2.0, 1.0])
+
+
+def test_uyarlamali_tablo_dik_bolgeyi_inceltir():
+    tablo = np.vstack(list(fonksiyon_tablosu(sp.tanh(50*x), x, -1, 1, 11, uyarlamali=True)))
+    assert np.all(np.diff(tablo[:, 0]) > 0)
+    assert all(np.isclose(tablo[:, 0], nokta).any() for nokta in np.linspace(-1, 1, 11))
+    # Ek noktalar dik bölgeye (x = 0 civarı) yoğunlaşır
+    assert np.sum(np.abs(tablo[:, 0]) < 0.2) > 20
+    assert tablo[:, 1] == pytest.approx(np.tanh(50 * tablo[:, 0]))
+
+
+@pytest.mark.parametrize("uzanti", ["csv", "npy"])
+def test_tablo_dosyaya_akis_halinde_yazilir(tmp_path, uzanti):
+    yol = str(tmp_path / f"tablo.{uzanti}")
+    sonuc = analiz.fonksiyon_tablola("sin(x)", 0, "pi", nokta_sayisi=1001, parca_boyutu=128,
+                                     dosya_yolu=yol, adimli=False)
+    assert sonuc["basarili"] and sonuc["satir_sayisi"] == 1001
+    if uzanti == "csv":
+        okunan = np.loadtxt(yol, delimiter=",", skiprows=1)
+    else:
+        okunan = np.load(yol, mmap_mode="r")
+    beklenen = np.vstack(list(fonksiyon_tablosu(sp.sin(x), x, 0, math.pi, 1001, parca_boyutu=128)))
+    assert okunan.shape == (1001, 4)
+    assert np.asarray(okunan) == pytest.approx(beklenen)
+    assert okunan[-1, 3] == pytest.approx(2.0)
+    assert tabloyu_yaz(iter([]), str(tmp_path / "bos.npy")) == 0
@@ -0,0 +1,142 @@
+"""
+Cebir modülü testleri
+"""
+
+import numpy as np
+import pytest
+import sympy as sp
+
+from modules import cebir
+from modules.cebir import (KOK_CIFT, KOK_DOGRUSAL, KOK_IKI_GERCEK, KOK_KARMASIK, KOK_YOK,
+                           SISTEM_COZUM_YOK, SISTEM_SONSUZ_COZUM, SISTEM_TEK_COZUM)
+from utils.parser import sorgu_analiz_et
+
+
+# --- Toplu ikinci dereceden çözüm (user-001) ---
+
+def test_toplu_cozum_kok_turleri():
+    sonuc = cebir.ikinci_dereceden_toplu_coz([1, 1, 0, 0, 1], [-3, 2, 2, 0, 0], [2, 1, -4, 0, 1], adimli=False)
+    assert sonuc["basarili"]
+    assert list(sonuc["kok_turu"]) == [KOK_IKI_GERCEK, KOK_CIFT, KOK_DOGRUSAL, KOK_YOK, KOK_KARMASIK]
+    assert np.allclose(np.sort(sonuc["gercek_kokler"][0]), [1, 2])
+    assert np.allclose(sonuc["gercek_kokler"][1], [-1, -1])
+    assert sonuc["gercek_kokler"][2][0] == 2
+    assert np.allclose(np.sort_complex(sonuc["kokler"][4]), [-1j, 1j])
+
+
+def test_toplu_cozum_kokler_denklemi_saglar():
+    uretec = np.random.default_rng(0)
+    a, b, c = uretec.uniform(-10, 10, (3, 1000))
+    sonuc = cebir.ikinci_dereceden_toplu_coz(a, b, c, adimli=False)
+    kokler = sonuc["kokler"]
+    artik = a[:, None] * kokler**2 + b[:, None] * kokler + c[:, None]
+    olcek = np.abs(a[:, None] * kokler**2) + np.abs(b[:, None] * kokler) + np.abs(c[:, None])
+    assert np.all(np.abs(artik) <= 1e-12 * olcek + 1e-12)
+
+
+# --- İkinci derece hızlı yol (user-002) ---
+
+def test_hizli_yol_sympy_ile_ayni_sonucu_verir():
+    for denklem in ["x^2 - 5x + 6 = 0", "2x^2 + 3x - 2 = 0", "x^2 - 2 = 0", "x^2 + 1 = 0",
+                    "4x^2 - 4x + 1 = 0", "3x^2 + 3x + 3 = 0", "x/2 + x^2/3 = 1"]:
+        hizli = cebir.ikinci_dereceden_coz(denklem, hizli=True, adimli=False)
+        yavas = cebir.ikinci_dereceden_coz(denklem, hizli=False, adimli=False)
+        assert hizli["basarili"] and yavas["basarili"], denklem
+        assert sorted(map(complex, hizli["kokler"]), key=lambda z: (z.real, z.imag)) == \
+            sorted(map(complex, yavas["kokler"]), key=lambda z: (z.real, z.imag)), denklem
+        assert (hizli["carpanlar"] - yavas["carpanlar"]).expand() == 0, denklem
+
+
+def test_hizli_yol_carpanlari_dagitmaz():
+    sonuc = cebir.ikinci_dereceden_coz("3x^2 + 3x + 3 = 0", adimli=False)
+    assert str(sonuc["carpanlar"]) == "3*(x**2 + x + 1)"
+
+
+# --- Her dereceden polinom kökleri (user-004) ---
+
+def test_polinom_coz_kesin_kokler():
+    sonuc = cebir.polinom_coz("x^3 - 6x^2 + 11x - 6 = 0", adimli=False)
+    assert sonuc["basarili"] and sonuc["yontem"] == "kesin"
+    assert sonuc["kokler"] == [1, 2, 3]
+    assert sonuc["katlilik"] == [1, 1, 1]
+
+
+def test_polinom_coz_yuksek_derece_sayisal():
+    sonuc = cebir.polinom_coz("x^7 - 1 = 0", adimli=False)
+    assert sonuc["basarili"] and sonuc["yontem"] == "sayisal"
+    kokler = np.asarray(sonuc["sayisal_kokler"])
+    assert len(kokler) == 7
+    assert np.allclose(kokler**7, 1)
+
+
+def test_polinom_toplu_coz_kokleri_polinomu_sifirlar():
+    katsayilar = np.array([[1, -6, 11, -6], [1, 0, 0, -1], [2, -3, 0, 1]], dtype=float)
+    sonuc = cebir.polinom_toplu_coz(katsayilar, adimli=False)
+    assert sonuc["basarili"]
+    for satir, kokler in zip(katsayilar, sonuc["kokler"]):
+        assert np.allclose(np.polyval(satir, kokler), 0, atol=1e-9)
+
+
+def test_ikinci_dereceden_coz_yuksek_dereceyi_polinom_cozucuye_devreder():
+    sonuc = cebir.ikinci_dereceden_coz("x^3 - 6x^2 + 11x - 6 = 0", adimli=False)
+    assert sonuc["basarili"] and sonuc["derece"] == 3
+    assert sonuc["kokler"] == [1, 2, 3]
+    x = sp.Symbol("x")
+    assert sonuc["carpanlar"] == (x - 1) * (x - 2) * (x - 3)
+
+
+# --- Doğrusal denklem sistemleri (user-009) ---
+
+def test_denklem_sistemi_kesin_tek_cozum():
+    sonuc = cebir.denklem_sistemi_coz(["2x + y - z = 1", "x - y = 2", "x + z = 4"], adimli=False)
+    assert sonuc["basarili"] and sonuc["yontem"] == "kesin"
+    assert sonuc["durum"] == SISTEM_TEK_COZUM and sonuc["rank"] == 3
+    assert sonuc["cozum"] == {"x": sp.Rational(7, 4), "y": sp.Rational(-1, 4), "z": sp.Rational(9, 4)}
+
+
+@pytest.mark.parametrize("kesin", [True, False])
+def test_denklem_sistemi_tekil_sistemleri_ayirt_eder(kesin):
+    sonsuz = cebir.denklem_sistemi_coz(["x + y = 3", "2x + 2y = 6"], kesin=kesin, adimli=False)
+    assert sonsuz["durum"] == SISTEM_SONSUZ_COZUM and sonsuz["rank"] == 1
+    celiskili = cebir.denklem_sistemi_coz(["x + y = 3", "x + y = 4"], kesin=kesin, adimli=False)
+    assert celiskili["durum"] == SISTEM_COZUM_YOK and celiskili["cozum"] == {}
+
+
+def test_denklem_sistemi_sayisal_yol():
+    sonuc = cebir.denklem_sistemi_coz(["0.5x + y = 2", "x - y = 1"], adimli=False)
+    assert sonuc["yontem"] == "sayisal" and sonuc["durum"] == SISTEM_TEK_COZUM
+    assert float(sonuc["cozum"]["x"]) == pytest.approx(2)
+    assert float(sonuc["cozum"]["y"]) == pytest.approx(1)
+
+
+def test_denklem_sistemi_dogrusal_olmayani_reddeder():
+    sonuc = cebir.denklem_sistemi_coz(["x^2 + y = 3", "x - y = 1"], adimli=False)
+    assert not sonuc["basarili"] and "doğrusal değil" in sonuc["hata"]
+
+
+def test_denklem_sistemi_toplu_coz_numpy_ile_ayni():
+    uretec = np.random.default_rng(9)
+    A = uretec.normal(size=(50, 4, 4))
+    b = uretec.normal(size=(50, 4))
+    sonuc = cebir.denklem_sistemi_toplu_coz(A, b, adimli=False)
+    assert sonuc["basarili"] and sonuc["sistem_sayisi"] == 50
+    assert np.allclose(sonuc["cozumler"], np.linalg.solve(A, b[..., None])[..., 0])
+    assert set(sonuc["durumlar"]) == {SISTEM_TEK_COZUM}
+
+
+def test_denklem_sistemi_toplu_coz_tekil_satirlar():
+    A = np.array([[[2., 1], [1, 3]], [[1, 1], [2, 2]], [[1, 1], [2, 2]]])
+    b = np.array([[3., 5], [1, 3], [1, 2]])
+    sonuc = cebir.denklem_sistemi_toplu_coz(A, b, adimli=False)
+    assert list(sonuc["durumlar"]) == [SISTEM_TEK_COZUM, SISTEM_COZUM_YOK, SISTEM_SONSUZ_COZUM]
+    assert np.allclose(sonuc["cozumler"][0], [0.8, 1.4])
+    assert np.isnan(sonuc["cozumler"][1]).all()
+    # Sonsuz çözümde en küçük normlu çözüm döner
+    assert np.allclose(A[2] @ sonuc["cozumler"][2], b[2])
+    assert np.allclose(sonuc["cozumler"][2], [0.5, 0.5])
+
+
+def test_parser_denklem_sistemini_yonlendirir():
+    oneri = sorgu_analiz_et("x + y = 3, x - y = 1 denklem sistemini çöz")["oneri"]
+    assert oneri["fonksiyon"] == "denklem_sistemi_coz"
+    assert oneri["parametreler"]["denklemler"] == ["x + y = 3", "x - y = 1"]
@@ -0,0 +1,107 @@
+"""
+Sayısal derleyici testleri
+"""
+
+import numpy as np
+import pytest
+import sympy as sp
+
+from modules import analiz
+from modules.analiz import AnalizCozucu
+from utils.derleyici import degerlendir, derle, derleme_onbellegi, toplu_derle
+
+x, y = sp.symbols('x y')
+NOKTALAR = np.array([0.3, 0.7, 1.1, 2.5, 4.0])
+
+
+def sembolik_degerler(ifade, noktalar=NOKTALAR):
+    return np.array([float(ifade.subs(x, nokta).evalf()) for nokta in noktalar])
+
+
+# --- Derlenmiş değerlendiriciler (user-011) ---
+
+@pytest.mark.parametrize("ifade", [
+    x**3*sp.sin(x) + sp.exp(-x),
+    sp.log(x)*sp.sqrt(x + 1),
+    sp.atan(x)/(1 + x**2),
+    sp.erf(x),
+    sp.gamma(x),
+    sp.Si(x),
+    sp.Ci(x),
+    sp.Ei(x),
+    sp.fresnels(x),
+    sp.fresnelc(x),
+    sp.besselj(1, x),
+    sp.elliptic_k(x/5),
+    sp.Si(x)*sp.erf(x) + sp.gamma(x),
+])
+def test_derlenmis_ifade_sembolik_degerle_ayni(ifade):
+    assert derle(ifade, x)(NOKTALAR) == pytest.approx(sembolik_degerler(ifade), rel=1e-9)
+
+
+def test_reel_olmayan_degerler_nan():
+    sonuc = derle(sp.Si(x) + sp.sqrt(x), x)(np.array([-1.0, 4.0]))
+    assert np.isnan(sonuc[0])
+    assert sonuc[1] == pytest.approx(float(sp.Si(4) + 2))
+
+
+def test_tanimsiz_fonksiyon_derlemede_reddedilir():
+    with pytest.raises(ValueError, match="derlenemedi"):
+        derle(sp.Function('f')(x) + x, x)
+
+
+def test_sabit_ifade_girdi_seklinde_doner():
+    sonuc = degerlendir(sp.Integer(3), x, np.zeros((2, 3)))
+    assert sonuc.shape == (2, 3) and (sonuc == 3).all()
+
+
+def test_derleme_onbellekten_kullanilir():
+    ifade = sp.cos(x)**2 + 7*x
+    assert derle(ifade, x) is derle(ifade, [x])
+
+
+def test_toplu_derle_bilesenleri_dogru_hesaplar():
+    ifadeler = [sp.sin(x*y), x*sp.cos(x*y), sp.exp(x*y)]
+    hesapla = toplu_derle(ifadeler, (x, y))
+    noktalar = np.array([[0.5, 1.0], [1.5, -2.0]])
+    beklenen = [[float(ifade.subs({x: a, y: b})) for ifade in ifadeler] for a, b in noktalar]
+    assert hesapla(noktalar) == pytest.approx(np.array(beklenen))
+    assert hesapla.ortak_alt_ifade_sayisi >= 1
+    with pytest.raises(ValueError):
+        hesapla(np.zeros((2, 3)))
+
+
+def test_toplu_derle_ozel_fonksiyonda_bilesen_bilesen_derler():
+    ifadeler = [sp.Si(x)*y, sp.fresnels(y) + x]
+    hesapla = toplu_derle(ifadeler, (x, y), sekil=(2, 1))
+    sonuc = hesapla(np.array([1.0, 2.0]))
+    assert sonuc.shape == (2, 1)
+    assert sonuc[:, 0] == pytest.approx([float(sp.Si(1)*2), float(sp.fresnels(2) + 1)])
+
+
+def test_analiz_derlenmis_turev_ve_integral():
+    turev = analiz.turev_hesapla("x^2*sin(x)", adimli=False, derlenmis=True)
+    integral = analiz.integral_hesapla("exp(-x^2)", adimli=False, derlenmis=True)
+    assert turev["turev_fonksiyonu"](NOKTALAR) == pytest.approx(sembolik_degerler(2*x*sp.sin(x) + x**2*sp.cos(x)))
+    assert integral["integral_fonksiyonu"](NOKTALAR) == pytest.approx(sembolik_degerler(sp.sqrt(sp.pi)*sp.erf(x)/2))
+
+
+@pytest.mark.parametrize("islem, beklenen", [
+    ("fonksiyon", sp.Si(x)),
+    ("turev", sp.sin(x)/x),
+    ("integral", x*sp.Si(x) + sp.cos(x)),
+])
+def test_sayisal_degerlendir_ozel_fonksiyon(islem, beklenen):
+    sonuc = analiz.sayisal_degerlendir("Si(x)", NOKTALAR, islem=islem, adimli=False)
+    assert sonuc["basarili"], sonuc.get("hata")
+    assert sonuc["degerler"] == pytest.approx(sembolik_degerler(beklenen))
+
+
+def test_sayisal_degerlendir_anahtari_sadelestirme_duzeyini_icerir():
+    derleme_onbellegi.temizle()
+    kapali = AnalizCozucu(adimli=False, sadelestirme="kapali").sayisal_degerlendir(
+        "(x^2-1)/(x-1)*x", [2.0], islem="turev")
+    tam = AnalizCozucu(adimli=False).sayisal_degerlendir("(x^2-1)/(x-1)*x", [2.0], islem="turev")
+    assert kapali["ifade"] != tam["ifade"]
+    assert tam["ifade"] == "2*x + 1"
+    assert kapali["degerler"] == pytest.approx(tam["degerler"])
@@ -0,0 +1,101 @@
+"""
+Diferansiyel denklem modülü testleri
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from modules import diferansiyel
+from utils.parser import sorgu_analiz_et
+
+
+# --- Başlangıç değer problemleri (user-022) ---
+
+def test_ustel_buyume():
+    sonuc = diferansiyel.baslangic_deger_problemi_coz("y' = y", [1.0], (0, 1), nokta_sayisi=5, adimli=False)
+    assert sonuc["basarili"] and sonuc["degiskenler"] == ["y"]
+    assert sonuc["t"] == pytest.approx([0, 0.25, 0.5, 0.75, 1])
+    assert sonuc["y"][:, 0] == pytest.approx(np.exp(sonuc["t"]), rel=1e-6)
+    assert sonuc["reddedilen_adim"] >= 0 and sonuc["fonksiyon_degerlendirme"] > 0
+
+
+def test_harmonik_salinici_birden_cok_baslangic_degeri():
+    sonuc = diferansiyel.baslangic_deger_problemi_coz(["x' = v", "v' = -x"], [[1.0, 0.0], [0.0, 1.0]],
+                                                    (0, "2*pi"), nokta_sayisi=9, adimli=False)
+    assert sonuc["degiskenler"] == ["x", "v"]
+    t = sonuc["t"]
+    assert sonuc["y"].shape == (9, 2, 2)
+    assert sonuc["y"][:, 0, 0] == pytest.approx(np.cos(t), abs=1e-5)
+    assert sonuc["y"][:, 1, 0] == pytest.approx(np.sin(t), abs=1e-5)
+
+
+@pytest.mark.parametrize("t_son", [1, 10])
+def test_rosenbrock_zamana_bagli_sert_problem(t_son):
+    sonuc = diferansiyel.baslangic_deger_problemi_coz("y' = -1000*(y - cos(t))", [0.0], (0, t_son),
+                                                    yontem="rosenbrock", nokta_sayisi=3, adimli=False)
+    assert sonuc["basarili"], sonuc.get("hata")
+    kesin = (1e6 * math.cos(t_son) + 1e3 * math.sin(t_son)) / (1e6 + 1)
+    assert sonuc["y"][-1, 0] == pytest.approx(kesin, abs=1e-5)
+    assert sonuc["adim_sayisi"] < 10000
+
+
+def test_van_der_pol_sert():
+    sonuc = diferansiyel.baslangic_deger_problemi_coz(["y1' = y2", "y2' = 1000*(1-y1**2)*y2 - y1"], [2.0, 0.0],
+                                                    (0, 3000), yontem="rosenbrock", nokta_sayisi=3,
+                                                    goreli_tolerans=1e-4, mutlak_tolerans=1e-7, adimli=False)
+    assert sonuc["basarili"], sonuc.get("hata")
+    assert sonuc["y"][-1, 0] == pytest.approx(-1.512, abs=5e-3)
+
+
+def test_akis_parcalari_tam_cozumle_ayni():
+    tam = diferansiyel.baslangic_deger_problemi_coz("y' = -y", [1.0], (0, 5), nokta_sayisi=1001, adimli=False)
+    akis = diferansiyel.baslangic_deger_problemi_coz("y' = -y", [1.0], (0, 5), nokta_sayisi=1001,
+                                                   akis=True, parca_boyutu=300, adimli=False)
+    parcalar = list(akis["parcalar"])
+    assert [len(t) for t, _ in parcalar] == [300, 300, 300, 101]
+    assert np.concatenate([y for _, y in parcalar]) == pytest.approx(tam["y"])
+
+
+def test_gecersiz_yontem_ve_nokta_sayisi():
+    assert not diferansiyel.baslangic_deger_problemi_coz("y' = y", [1.0], (0, 1), yontem="euler",
+                                                       adimli=False)["basarili"]
+    assert not diferansiyel.baslangic_deger_problemi_coz("y' = y", [1.0], (0, 1), nokta_sayisi=1,
+                                                       adimli=False)["basarili"]
+
+
+@pytest.mark.parametrize("sorgu, denklemler, degerler, aralik", [
+    ("y' = -2y + sin(t), y(0) = 1, t 0 dan 5 e kadar diferansiyel denklemi çöz",
+     ["y' = -2y + sin(t)"], [1.0], ("0", "5")),
+    ("y' = y, y(0)=1, 0'dan 1'e diferansiyel denklemi çöz", ["y' = y"], [1.0], ("0", "1")),
+    ("x' = v; v' = -x, x(0)=1, v(0)=0, 0 dan 6 ya diferansiyel denklemi çöz",
+     ["x' = v", "v' = -x"], [1.0, 0.0], ("0", "6")),
+    ("y' = y, 0 dan 1 e kadar, y(0) = 1.5 iken diferansiyel denklemi çöz", ["y' = y"], [1.5], ("0", "1")),
+])
+def test_parser_baslangic_deger_problemi(sorgu, denklemler, degerler, aralik):
+    oneri = sorgu_analiz_et(sorgu)["oneri"]
+    assert oneri["fonksiyon"] == "baslangic_deger_problemi_coz"
+    parametreler = oneri["parametreler"]
+    assert "hata" not in parametreler
+    assert parametreler["denklemler"] == denklemler
+    assert parametreler["baslangic_degerleri"] == degerler
+    assert parametreler["t_araligi"] == aralik
+
+
+@pytest.mark.parametrize("sorgu, hata", [
+    ("y' = y, y(0)=1 diferansiyel denklemi çöz", "Çözüm aralığı verilmedi"),
+    ("y' = y, 0 dan 1 e diferansiyel denklemi çöz", "y için başlangıç koşulu verilmedi"),
+    ("y' = y, y(2)=1, 0 dan 1 e diferansiyel denklemi çöz", "aralığın başında"),
+    ("y' = y, y(0)=1x, 0 dan 1 e diferansiyel denklemi çöz", "anlaşılamadı"),
+    ("y' = y, y(0)=1, z(0)=2, 0 dan 1 e diferansiyel denklemi çöz", "Bilinmeyen değişken"),
+])
+def test_parser_eksik_veya_hatali_girdi(sorgu, hata):
+    parametreler = sorgu_analiz_et(sorgu)["oneri"]["parametreler"]
+    assert hata in parametreler["hata"]
+
+
+def test_parser_kosuldan_sonraki_kelimeler():
+    parametreler = sorgu_analiz_et("y' = y, y(0)=1 diferansiyel denklemi çöz")["oneri"]["parametreler"]
+    assert parametreler["baslangic_degerleri"] == [1.0]
+    assert "anlaşılamadı" not in parametreler["hata"]
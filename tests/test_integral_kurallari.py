@@ -0,0 +1,83 @@
+"""
+Kurallı integral testleri
+"""
+
+import pytest
+import sympy as sp
+
+from modules import analiz
+from utils.integral_kurallari import kural_istatistikleri, kural_sayaclarini_sifirla, kurallarla_integral
+
+x = sp.Symbol('x')
+a, b = sp.symbols('a b', positive=True)
+
+
+def tureve_esit(ilkel, integrand) -> bool:
+    fark = sp.diff(ilkel, x) - integrand
+    if sp.simplify(fark) == 0:
+        return True
+    # Karmaşık dallarda simplify yetmezse birkaç noktada sayısal denetim
+    return all(abs(complex(fark.subs({x: nokta, a: 1.3, b: 0.7}).evalf())) < 1e-10
+               for nokta in (0.31, 0.77, 1.9))
+
+
+# --- Kurallı integral hızlı yolu (user-021) ---
+
+@pytest.mark.parametrize("integrand", [
+    sp.Integer(5),
+    3*x**4 - 2*x + 7,
+    (2*x + 1)**5,
+    1/(3*x - 2),
+    1/(x + 1)**3,
+    sp.sqrt(4*x + 1),
+    5*sp.sin(3*x + 1) - sp.cos(x/2),
+    sp.exp(-2*x) + 2**x + 3**(2*x - 1),
+    sp.tan(2*x) + sp.cot(x) + sp.sec(x) + sp.csc(3*x),
+    sp.sinh(x) + sp.cosh(2*x) + sp.tanh(x),
+    sp.log(2*x + 3),
+    (x**3 + 1)/(x + 2),
+    (2*x + 3)/(x**2 + 2*x + 5),
+    1/(x**2 - 5*x + 6),
+    (x + 1)/(x**2 + 4*x + 4),
+    a*sp.sin(b*x) + sp.exp(a*x),
+])
+def test_kural_sonucunun_turevi_integrand(integrand):
+    ilkel = kurallarla_integral(integrand, x)
+    assert ilkel is not None
+    assert not ilkel.has(sp.Integral)
+    assert tureve_esit(ilkel, integrand)
+
+
+def test_sembolik_katsayi_sifir_olabiliyorsa_parcali_sonuc():
+    c = sp.Symbol('c')
+    ilkel = kurallarla_integral(sp.cos(c*x), x)
+    assert isinstance(ilkel, sp.Piecewise)
+    assert ilkel.subs(c, 0) == x
+    assert sp.simplify(sp.diff(ilkel.args[0][0], x) - sp.cos(c*x)) == 0
+
+
+@pytest.mark.parametrize("integrand", [
+    x*sp.sin(x), sp.exp(x**2), 1/(x**3 + 1), sp.sin(x)**2, sp.sqrt(x**2 + 1),
+])
+def test_kural_yoksa_none(integrand):
+    assert kurallarla_integral(integrand, x) is None
+
+
+def test_kural_sayaclari():
+    kural_sayaclarini_sifirla()
+    kurallarla_integral(x**2 + sp.sin(2*x), x)
+    kurallarla_integral(x*sp.exp(x), x)
+    istatistik = kural_istatistikleri()
+    assert (istatistik["isabet"], istatistik["iskalama"]) == (1, 1)
+    assert istatistik["isabet_orani"] == pytest.approx(0.5)
+    assert istatistik["kurallar"] == {"dogrusallik": 1, "kuvvet": 1, "sin": 1}
+
+
+def test_integral_hesapla_kural_uyarsa_integrate_cagirmaz(monkeypatch):
+    def yasak(*argumanlar, **secenekler):
+        raise AssertionError("sp.integrate çağrıldı")
+
+    monkeypatch.setattr(sp, "integrate", yasak)
+    sonuc = analiz.integral_hesapla("4x^3 + 2/(x+5) + cos(7x)", adimli=False)
+    assert sonuc["basarili"], sonuc.get("hata")
+    assert tureve_esit(sp.sympify(sonuc["integral_basit"]), 4*x**3 + 2/(x + 5) + sp.cos(7*x))
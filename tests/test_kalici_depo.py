@@ -0,0 +1,77 @@
+"""
+Kalıcı sonuç deposu testleri
+"""
+
+import pytest
+import sympy as sp
+
+from modules import analiz, cebir
+from utils.kalici_depo import KaliciDepo, kalici_depo, kalici_depoyu_ac, kalici_depoyu_kapat
+
+x = sp.Symbol('x')
+
+
+@pytest.fixture
+def depo_yolu(tmp_path):
+    return str(tmp_path / "alt" / "sonuclar.sqlite3")
+
+
+def test_sonuc_surec_yeniden_baslayinca_korunur(depo_yolu):
+    depo = KaliciDepo(depo_yolu)
+    assert depo.al("factor", x**2 - 1, lambda: sp.factor(x**2 - 1)) == (x - 1)*(x + 1)
+    depo.kapat()
+
+    depo = KaliciDepo(depo_yolu)
+    sonuc = depo.al("factor", x**2 - 1, lambda: pytest.fail("kayıt yeniden hesaplandı"))
+    assert sonuc == (x - 1)*(x + 1)
+    assert depo.istatistikler()["isabet"] == 1
+    depo.kapat()
+
+
+def test_islem_adi_anahtarin_parcasi(depo_yolu):
+    depo = KaliciDepo(depo_yolu)
+    assert depo.anahtar_olustur("factor", x**2) != depo.anahtar_olustur("expand", x**2)
+    assert depo.anahtar_olustur("factor", x**2) != depo.anahtar_olustur("factor", x**3)
+    assert depo.anahtar_olustur("factor", x**2) == depo.anahtar_olustur("factor", sp.Pow(x, 2))
+    depo.kapat()
+
+
+def test_en_eski_kullanilan_tahliye_edilir(depo_yolu):
+    depo = KaliciDepo(depo_yolu, azami_kayit=2)
+    depo.al("kare", x, lambda: x**2)
+    depo.al("kare", x + 1, lambda: (x + 1)**2)
+    depo.al("kare", x, lambda: pytest.fail("x tahliye edilmemeliydi"))
+    depo.al("kare", x + 2, lambda: (x + 2)**2)
+
+    istatistik = depo.istatistikler()
+    assert istatistik["kayit"] == 2 and istatistik["tahliye"] == 1
+    cagrilar = []
+    depo.al("kare", x + 1, lambda: cagrilar.append(1) or (x + 1)**2)
+    assert cagrilar == [1]
+    depo.kapat()
+
+
+def test_bayt_siniri_ve_saklanamayan_sonuclar(depo_yolu):
+    depo = KaliciDepo(depo_yolu, azami_bayt=64)
+    depo.al("buyuk", x, lambda: "a" * 1000)
+    depo.al("yarim", x, lambda: None, saklanabilir=lambda sonuc: sonuc is not None)
+    assert depo.istatistikler()["kayit"] == 0
+    depo.kapat()
+
+    with pytest.raises(ValueError):
+        KaliciDepo(depo_yolu, azami_kayit=0)
+
+
+def test_cozuculer_acik_depoyu_kullanir(depo_yolu):
+    try:
+        depo = kalici_depoyu_ac(depo_yolu)
+        assert kalici_depo() is depo
+        ilk = analiz.integral_hesapla("x*exp(x)", adimli=False)
+        tekrar = analiz.integral_hesapla("x*exp(x)", adimli=False)
+        assert ilk["integral_basit"] == tekrar["integral_basit"]
+        assert cebir.carpanlara_ayir("x^4 - 1", adimli=False)["basarili"]
+        istatistik = depo.istatistikler()
+        assert istatistik["isabet"] >= 1 and istatistik["kayit"] >= 2
+    finally:
+        kalici_depoyu_kapat()
+    assert kalici_depo() is None
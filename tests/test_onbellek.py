@@ -0,0 +1,52 @@
+"""
+Ayrıştırma önbelleği testleri
+"""
+
+import pytest
+
+from modules.analiz import AnalizCozucu
+from utils.onbellek import AyristirmaOnbellegi, ayristirma_onbellegi
+
+
+def test_lru_tahliyesi_en_eski_kaydi_siler():
+    onbellek = AyristirmaOnbellegi(2)
+    onbellek.al("a", lambda: 1)
+    onbellek.al("b", lambda: 2)
+    onbellek.al("a", lambda: pytest.fail("isabet yeniden üretmemeli"))
+    onbellek.al("c", lambda: 3)
+
+    assert onbellek.al("a", lambda: -1) == 1
+    assert onbellek.al("b", lambda: -2) == -2
+    istatistik = onbellek.istatistikler()
+    assert istatistik["boyut"] == 2
+    assert istatistik["tahliye"] == 2
+
+
+def test_uretim_hatasi_saklanmaz():
+    onbellek = AyristirmaOnbellegi(4)
+
+    def hatali():
+        raise ValueError("ayrıştırılamadı")
+
+    with pytest.raises(ValueError):
+        onbellek.al("x", hatali)
+    assert len(onbellek) == 0
+    assert onbellek.al("x", lambda: 5) == 5
+
+
+def test_sifir_boyut_onbellegi_kapatir():
+    onbellek = AyristirmaOnbellegi(0)
+    assert onbellek.al("x", lambda: 1) == 1
+    assert onbellek.al("x", lambda: 2) == 2
+    with pytest.raises(ValueError):
+        AyristirmaOnbellegi(-1)
+
+
+def test_cozuculer_ayni_girdiyi_bir_kez_ayristirir():
+    ayristirma_onbellegi.temizle()
+    cozucu = AnalizCozucu(adimli=False)
+    ilk = cozucu.turev_hesapla("x^3 + 2x")
+    iskalama = ayristirma_onbellegi.istatistikler()["iskalama"]
+    ikinci = cozucu.turev_hesapla("  x^3 + 2x ")
+    assert ilk["turev"] == ikinci["turev"] == "3*x**2 + 2"
+    assert ayristirma_onbellegi.istatistikler()["iskalama"] == iskalama
@@ -0,0 +1,42 @@
+"""
+Polinom (yoğun NumPy katsayı dizisi) testleri
+"""
+
+import numpy as np
+import sympy as sp
+
+from modules.cebir import FFT_CARPIM_ESIGI, Polinom
+
+
+def test_aritmetik_ve_degerlendirme():
+    p = Polinom([1, -3, 2])
+    assert p.derece == 2
+    assert np.allclose(p(np.array([0, 1, 2])), [2, 0, 0])
+    assert p * p == Polinom([1, -6, 13, -12, 4])
+    assert p + Polinom([1]) == Polinom([1, -3, 3])
+    assert (p - p).derece == -1
+
+
+def test_turev_integral_ve_bolme():
+    p = Polinom([1, -3, 2])
+    assert p.turev() == Polinom([2, -3])
+    assert p.integral().turev() == p
+    bolum, kalan = p.bol(Polinom([1, -1]))
+    assert bolum == Polinom([1, -2])
+    assert kalan.derece == -1
+
+
+def test_fft_carpimi_dogrudan_evrisimle_ayni():
+    uretec = np.random.default_rng(0)
+    a = uretec.integers(-5, 5, 4 * FFT_CARPIM_ESIGI).astype(float)
+    b = uretec.integers(-5, 5, 3 * FFT_CARPIM_ESIGI).astype(float)
+    carpim = Polinom(a) * Polinom(b)
+    assert np.allclose(carpim.katsayilar, np.convolve(a, b))
+
+
+def test_sympy_poly_donusumu():
+    x = sp.Symbol('x')
+    poly = sp.Poly(2 * x**3 - x + 5, x)
+    p = Polinom.poly_den(poly)
+    assert np.allclose(p.katsayilar, [2, 0, -1, 5])
+    assert p.poly_ye_cevir(x).as_expr() == 2 * x**3 - x + 5
@@ -0,0 +1,84 @@
+"""
+Şablon çözüm önbelleği testleri
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import sympy as sp
+
+from modules.analiz import AnalizCozucu
+from modules.cebir import CebirCozucu
+from utils import sablon
+from utils.sablon import sablon_onbellegi, sablona_cevir, sablonla_hesapla, yerine_koy
+
+x = sp.Symbol('x')
+
+
+def test_ayni_yapi_ayni_sablonu_uretir():
+    sablon1, sayilar1 = sablona_cevir(3*x**4 + 2*x, usler_dahil=False)
+    sablon2, sayilar2 = sablona_cevir(5*x**4 - 7*x, usler_dahil=False)
+    assert sablon1 == sablon2
+    assert sayilar1 != sayilar2
+    assert yerine_koy(sablon2, sayilar2) == 5*x**4 - 7*x
+    # Üsler dahil edilince x**4 ile x**3 aynı şablona düşer
+    assert sablona_cevir(3*x**4, usler_dahil=True)[0] == sablona_cevir(2*x**3, usler_dahil=True)[0]
+
+
+def test_sablon_yapi_basina_bir_kez_hesaplanir():
+    sablon_onbellegi.temizle()
+    cagrilar = []
+
+    def turev(ifade):
+        cagrilar.append(ifade)
+        return sp.diff(ifade, x)
+
+    for a, b in [(3, 2), (5, -7), (2, 3), (11, 13)]:
+        assert sablonla_hesapla(("test_turev", x), a*x**4 + b*x, turev, usler_dahil=False) == 4*a*x**3 + b
+    assert len(cagrilar) == 1
+
+
+def test_uygun_olmayan_sablon_sonucu_dogrudan_hesaplanir():
+    sablon_onbellegi.temizle()
+    sonuc = sablonla_hesapla(("test_uygun", x), 2*x + 1, lambda ifade: ifade, uygun=lambda sonuc: False)
+    assert sonuc == 2*x + 1
+
+
+def test_yer_tutucular_es_zamanli_buyurken_tutarli_kalir():
+    # Daha önce hiç istenmemiş sıralar, listeyi iş parçacıkları arasında büyütür
+    baslangic = len(sablon._yer_tutucular)
+    siralar = range(baslangic, baslangic + 200)
+    with ThreadPoolExecutor(max_workers=8) as havuz:
+        sonuclar = list(havuz.map(lambda _: [sablon._yer_tutucu(sira) for sira in siralar], range(8)))
+    assert all(sonuc == sonuclar[0] for sonuc in sonuclar)
+    assert len(sablon._yer_tutucular) == baslangic + 200
+    assert [str(yer) for yer in sablon._yer_tutucular] == [f"_s{sira}" for sira in range(baslangic + 200)]
+    assert sonuclar[0] == sablon._yer_tutucular[baslangic:]
+
+
+@pytest.mark.parametrize("fonksiyon, beklenen", [
+    ("3x^4 + 2x", 12*x**3 + 2),
+    ("5x^4 - 7x", 20*x**3 - 7),
+    ("2.5*x^3", 7.5*x**2),
+    ("x*sin(2x) + 4", sp.sin(2*x) + 2*x*sp.cos(2*x)),
+    # Payda sadeleşmesi sayılara bağlı: şablon kullanılmamalı
+    ("x + (x^2-1)/(x-1)", sp.Integer(2)),
+    ("x + (x^2-4)/(x-2)", sp.Integer(2)),
+    ("sin(1/x)", -sp.cos(1/x)/x**2),
+    ("x + 1/(x+1)", 1 - 1/(x + 1)**2),
+])
+def test_turev_sablonu_dogru_sonuc_verir(fonksiyon, beklenen):
+    sonuc = AnalizCozucu(adimli=False).turev_hesapla(fonksiyon)
+    assert sonuc["basarili"]
+    assert sp.simplify(sp.sympify(sonuc["turev_basit"]) - beklenen) == 0
+
+
+@pytest.mark.parametrize("denklem, beklenen", [
+    ("1.5x^2 - 3.5x + 1 = 0", [1/3, 2.0]),
+    ("2.5x^2 - 5.5x + 1.5 = 0", [0.3189750324, 1.8810249676]),
+    ("0.5x^2 - 2x + 2 = 0", [2.0]),
+])
+def test_ondalikli_katsayilar_sablonla_cozulur(denklem, beklenen):
+    sonuc = CebirCozucu(adimli=False).ikinci_dereceden_coz(denklem)
+    assert sonuc["basarili"]
+    assert sorted(float(kok) for kok in sonuc["kokler"]) == pytest.approx(beklenen)
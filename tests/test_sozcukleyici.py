@@ -0,0 +1,114 @@
+"""
+Sözcükleyici testleri
+"""
+
+import pytest
+import sympy as sp
+
+from main import MatematikKutuphanesi
+from modules import analiz, cebir, trigonometri
+from modules.analiz import _sozcukleyici as analiz_sozcukleyici
+from modules.cebir import CebirCozucu
+from modules.trigonometri import TrigonometriCozucu
+from utils.sozcukleyici import BOSLUK, ESITTIR, ISIM, SAYI, Sozcukleyici, birlestir, esitlikten_ayir, katla
+
+
+@pytest.mark.parametrize("girdi, beklenen", [
+    ("2x", "2*x"),
+    ("2(x+1)", "2*(x+1)"),
+    ("(x+1)(x-1)", "(x+1)*(x-1)"),
+    ("x²y", "x**2*y"),
+    ("x^3 + 4x", "x**3+4*x"),
+    ("y2", "y2"),
+    ("1000*(1-y1**2)*y2 - y1", "1000*(1-y1**2)*y2-y1"),
+    ("sinüs(x) * 2x", "sin(x)*2*x"),
+    ("kosinüs(x) + ln(x) + x³", "cos(x)+log(x)+x**3"),
+    ("Si(x) + arctan(x)", "Si(x)+atan(x)"),
+])
+def test_ifadeye_cevir(girdi, beklenen):
+    assert analiz_sozcukleyici.ifadeye_cevir(girdi) == beklenen
+
+
+@pytest.mark.parametrize("girdi", ["2 3", "sin(x) i", "x y", "2 x", "x^2  0"])
+def test_boslukla_ayrilmis_terimler_birlestirilmez(girdi):
+    metin = analiz_sozcukleyici.ifadeye_cevir(girdi)
+    assert " " in metin
+    with pytest.raises(sp.SympifyError):
+        sp.sympify(metin)
+
+
+@pytest.mark.parametrize("girdi", ["x^2  0 dan 2 ye", "x^3 fonksiyonunun", "xa + 1", "sinx"])
+def test_taninmayan_isimler_reddedilir(girdi):
+    with pytest.raises(ValueError, match="Tanınmayan ifade"):
+        analiz_sozcukleyici.ifadeye_cevir(girdi)
+
+
+def test_sozcuk_turleri_ve_esitlik():
+    sozcukler = Sozcukleyici().sozcuklere_ayir("3x = 6")
+    assert [sozcuk.tur for sozcuk in sozcukler] == [SAYI, "ISLEC", ISIM, ESITTIR, SAYI]
+    sol, sag = esitlikten_ayir(sozcukler)
+    assert birlestir(sol) == "3*x" and birlestir(sag) == "6"
+    assert esitlikten_ayir(sozcukler[:3])[1] is None
+
+
+def test_atilacak_kelimeler_ve_gruplar():
+    sozcukleyici = Sozcukleyici(atilacak_kelimeler=("x hesapla", "ise x", "ise", "hesapla"), ortuk_carpim=False)
+    assert sozcukleyici.ifadeye_cevir("sin(x) + cos(45) = 1.20 ise x hesapla") == "sin(x)+cos(45)=1.20"
+    # Kelime içindeki eşleşmeler atılmaz
+    assert Sozcukleyici(atilacak_kelimeler=("ise",)).sozcuklere_ayir("2 ise")[-1].tur == SAYI
+
+
+def test_turkce_katlama():
+    assert katla("KOSİNÜS ğşçö") == "kosinus gsco"
+
+
+def test_cebir_temizleyici_esitligi_farka_cevirir():
+    assert CebirCozucu()._denklem_temizle("2x² + 3x = 2") == "(2*x**2+3*x)-(2)"
+
+
+def test_trigonometri_fonksiyon_adindan_sonraki_boslugu_atar():
+    temiz, eslesmeler = TrigonometriCozucu()._ifade_temizle("sinüs 45 * 2 + tan(60) hesapla")
+    assert temiz == "sin45*2+tan(60)"
+    assert eslesmeler == (("sin", "45"), ("tan", "60"))
+
+
+def test_bosluk_sozcugu_yalnizca_terimler_arasinda():
+    sozcukler = Sozcukleyici().sozcuklere_ayir("x  +  2 3")
+    assert [sozcuk.tur for sozcuk in sozcukler].count(BOSLUK) == 1
+
+
+def test_degisken_harflerinden_olusan_isimler_carpima_acilir():
+    assert analiz_sozcukleyici.ifadeye_cevir("xy + 2xyz") == "x*y+2*x*y*z"
+    sonuc = analiz.turev_hesapla("xy", adimli=False)
+    assert sonuc["basarili"] and sonuc["turev"] == "y"
+
+
+def test_boslugu_yok_sayan_sozcukleyici():
+    sozcukleyici = Sozcukleyici(bosluk_duyarli=False)
+    assert sozcukleyici.ifadeye_cevir("x^2 - 5 x + 6") == "x**2-5*x+6"
+    assert BOSLUK not in [sozcuk.tur for sozcuk in sozcukleyici.sozcuklere_ayir("x  +  2 3")]
+
+
+@pytest.mark.parametrize("denklem, kokler", [
+    ("x^2 - 5 x + 6 = 0", [2, 3]),
+    ("2 x^2 + 3 x - 2 = 0", [-2, sp.Rational(1, 2)]),
+    ("kuadratik denklem x² - 9x + 20 = 0", [4, 5]),
+])
+def test_cebir_eski_bosluk_davranisini_korur(denklem, kokler):
+    sonuc = cebir.ikinci_dereceden_coz(denklem, adimli=False)
+    assert sonuc["basarili"], sonuc.get("hata")
+    assert sonuc["kokler"] == kokler
+
+
+@pytest.mark.parametrize("sorgu", [
+    "kuadratik denklem x² - 9x + 20 = 0",
+    "sin(x) + cos(45) = 1.207 x değeri",
+    "cos(x) + sin(30) = 1.5 denklemini çöz",
+])
+def test_readme_sorgulari_gereksiz_kelimeleri_atar(sorgu):
+    assert "HATA" not in MatematikKutuphanesi().sorgu_isle(sorgu)
+
+
+def test_karma_denklem_sorgu_kelimelerini_atar():
+    sonuc = trigonometri.karma_trigonometrik_denklem_coz("cos(x) + sin(30) = 1.5 denklemini çöz", adimli=False)
+    assert sonuc["basarili"], sonuc.get("hata")
@@ -0,0 +1,143 @@
+"""
+Trigonometri modülü testleri
+"""
+
+import numpy as np
+import pytest
+import sympy as sp
+
+from modules import trigonometri
+from modules.trigonometri import OZEL_ACILAR, ozel_aci_degeri, ozel_acilar, trigonometrik_degerler
+
+NUMPY_KARSILIKLARI = {
+    "sin": np.sin, "cos": np.cos, "tan": np.tan,
+    "cot": lambda x: 1 / np.tan(x), "sec": lambda x: 1 / np.cos(x), "csc": lambda x: 1 / np.sin(x),
+}
+
+
+# --- Vektörel trigonometrik hesap (user-024) ---
+
+@pytest.mark.parametrize("fonksiyon", sorted(NUMPY_KARSILIKLARI))
+def test_toplu_degerler_numpy_ile_ayni(fonksiyon):
+    uretec = np.random.default_rng(24)
+    radyan = uretec.uniform(-10, 10, 1000)
+    derece = np.degrees(radyan)
+    beklenen = NUMPY_KARSILIKLARI[fonksiyon](radyan)
+    for acilar, birim in ((radyan, "radyan"), (derece, "derece")):
+        degerler, tanimsiz = trigonometrik_degerler(fonksiyon, acilar, birim)
+        assert degerler.shape == acilar.shape and not tanimsiz.any()
+        assert degerler == pytest.approx(beklenen, rel=1e-9, abs=1e-12)
+
+
+@pytest.mark.parametrize("fonksiyon, acilar, kutuplar", [
+    ("tan", [0, 45, 90, 135, 270, -90, 450], [False, False, True, False, True, True, True]),
+    ("cot", [0, 45, 180, 360, 90], [True, False, True, True, False]),
+    ("sec", [0, 60, 90, 120], [False, False, True, False]),
+    ("csc", [0, 30, 180, -180], [True, False, True, True]),
+])
+def test_derecede_kutuplar_kesin(fonksiyon, acilar, kutuplar):
+    degerler, tanimsiz = trigonometrik_degerler(fonksiyon, acilar)
+    assert list(tanimsiz) == kutuplar
+    assert np.isnan(degerler[tanimsiz]).all() and np.isfinite(degerler[~tanimsiz]).all()
+
+
+def test_derecede_ceyrek_acilar_tam():
+    degerler, _ = trigonometrik_degerler("sin", [0, 90, 180, 270, 360, 720, -90])
+    assert list(degerler) == [0.0, 1.0, 0.0, -1.0, 0.0, 0.0, -1.0]
+    # Sıfırlar -0.0 olarak dönmez
+    assert not np.signbit(degerler[degerler == 0]).any()
+
+
+def test_radyanda_kutup_yuvarlama_hatasiyla_bulunur():
+    degerler, tanimsiz = trigonometrik_degerler("tan", [np.pi / 2, -np.pi / 2, np.pi / 2 + 1e-6], "radyan")
+    assert list(tanimsiz) == [True, True, False]
+
+
+def test_toplu_hesapla_ve_turkce_adlar():
+    sonuc = trigonometri.trigonometrik_toplu_hesapla("kosinüs", np.array([[0, 60], [90, 180]]), adimli=False)
+    assert sonuc["basarili"] and sonuc["aci_sayisi"] == 4
+    assert sonuc["degerler"] == pytest.approx(np.array([[1.0, 0.5], [0.0, -1.0]]))
+    assert not trigonometri.trigonometrik_toplu_hesapla("sinh", [0], adimli=False)["basarili"]
+
+
+def test_skaler_yol_sympy_kullanmaz(monkeypatch):
+    # Özel açı tablosu ilk çağrıda SymPy ile bir kez kurulur
+    trigonometri.ozel_aci_degeri("sin", 30)
+
+    def yasak(*argumanlar):
+        raise AssertionError("SymPy trigonometrik fonksiyonu çağrıldı")
+
+    for ad in ("sin", "cos", "tan", "cot", "sec", "csc"):
+        monkeypatch.setattr(sp, ad, yasak)
+    sonuc = trigonometri.trigonometrik_hesapla("sec", 37, adimli=False)
+    assert sonuc["sonuc"] == pytest.approx(1 / np.cos(np.radians(37)))
+    assert not trigonometri.trigonometrik_hesapla("tan", 90, adimli=False)["basarili"]
+
+
+# --- Özel açı tablosu (user-025) ---
+
+@pytest.mark.parametrize("fonksiyon, aci, tam", [
+    ("sin", 30, sp.Rational(1, 2)),
+    ("sin", 18, (sp.sqrt(5) - 1) / 4),
+    ("cos", 36, (sp.sqrt(5) + 1) / 4),
+    ("tan", 15, 2 - sp.sqrt(3)),
+    ("cot", 15, 2 + sp.sqrt(3)),
+    ("sec", 72, 1 + sp.sqrt(5)),
+    ("csc", 45, sp.sqrt(2)),
+    ("sin", 390, sp.Rational(1, 2)),
+    ("kosinüs", -60, sp.Rational(1, 2)),
+])
+def test_ozel_aci_tam_degerleri(fonksiyon, aci, tam):
+    deger, yaklasik = ozel_aci_degeri(fonksiyon, aci)
+    assert sp.simplify(deger - tam) == 0
+    assert yaklasik == pytest.approx(float(tam))
+
+
+def test_tablo_tum_ozel_acilarda_sympy_ile_ayni():
+    assert len(OZEL_ACILAR) == 40
+    for ad, fonksiyon in (("sin", sp.sin), ("cos", sp.cos), ("tan", sp.tan),
+                          ("cot", sp.cot), ("sec", sp.sec), ("csc", sp.csc)):
+        for aci in OZEL_ACILAR:
+            kayit = ozel_aci_degeri(ad, aci)
+            beklenen = fonksiyon(sp.pi * aci / 180)
+            if beklenen is sp.zoo:
+                assert kayit is None
+            else:
+                assert kayit[1] == pytest.approx(float(beklenen), abs=1e-15)
+
+
+def test_ozel_olmayan_acilar():
+    assert ozel_aci_degeri("sin", 20) is None
+    assert ozel_aci_degeri("sin", 30.5) is None
+    assert ozel_aci_degeri("tan", 90) is None
+    assert ozel_aci_degeri("sinh", 30) is None
+
+
+@pytest.mark.parametrize("fonksiyon, deger, acilar", [
+    ("sin", 0.5, [30, 150]),
+    ("cos", (5 ** 0.5 - 1) / 4, [72, 288]),
+    ("tan", 1, [45, 225]),
+    ("tan", 2 - 3 ** 0.5, [15, 195]),
+    ("sin", 0.3, []),
+])
+def test_ters_arama(fonksiyon, deger, acilar):
+    assert ozel_acilar(fonksiyon, deger) == acilar
+
+
+def test_cozuculer_tabloyu_kullanir():
+    assert trigonometri.trigonometrik_hesapla("sin", 18, adimli=False)["tam_deger"] == "-1/4 + √(5)/4"
+    assert trigonometri.ters_trigonometrik_hesapla("arctan", 2 - 3 ** 0.5, adimli=False)["aci_derece"] == 15
+    assert trigonometri.trigonometrik_denklem_coz("sin(x) = 0.5", adimli=False)["cozumler"] == [30, 150]
+    assert trigonometri.trigonometrik_denklem_coz("tan(x) = 1", adimli=False)["cozumler"] == [45, 225]
+
+
+def test_ters_arama_sicrama_noktasina_yakalanmaz():
+    # Göreli tolerans: 0'a çok yakın değerler tablodaki 0 ile eşleşmez
+    assert ozel_acilar("cot", -1e-13) == []
+    arccot = trigonometri.ters_trigonometrik_hesapla("arccot", -1e-13, adimli=False)
+    assert arccot["aci_derece"] == pytest.approx(-90.0)
+    assert trigonometri.ters_trigonometrik_hesapla("arccot", 0, adimli=False)["aci_derece"] == 90
+    arctan = trigonometri.ters_trigonometrik_hesapla("arctan", -1e-13, adimli=False)["aci_derece"]
+    assert arctan < 0 and arctan == pytest.approx(np.degrees(-1e-13), rel=1e-9)
+    assert ozel_acilar("sin", 0.5 * (1 + 1e-14)) == [30, 150]
+    assert ozel_acilar("sin", 0.5 + 1e-9) == []
@@ -0,0 +1,51 @@
+"""
+Okunabilir yazıcı testleri
+"""
+
+import pytest
+import sympy as sp
+
+from modules import analiz, cebir
+from utils.formatter import cozum_formatla
+from utils.yazici import okunabilir
+
+x, n = sp.symbols('x n')
+
+
+# --- Yazıcı tabanlı okunabilir çıktı (user-023) ---
+
+@pytest.mark.parametrize("ifade, beklenen", [
+    (sp.sqrt(x), "√(x)"),
+    (sp.sqrt(sp.sqrt(x + 1) + x), "√(x + √(x + 1))"),
+    (1/sp.sqrt(x), "1/√(x)"),
+    (sp.sin(x)/sp.sqrt(x), "sin(x)/√(x)"),
+    (x**sp.Rational(3, 2), "x**(3/2)"),
+    (sp.pi*sp.Symbol('alpha'), "π*α"),
+    (sp.oo, "∞"),
+    (-sp.oo, "-∞"),
+    (sp.Symbol('Theta') + sp.gamma(x), "Θ + Γ(x)"),
+    (sp.Symbol('gamma'), "γ"),
+    (sp.fresnels(x) + sp.fresnelc(x), "C(x) + S(x)"),
+    (sp.elliptic_k(x), "K(x)"),
+    (sp.elliptic_e(x), "E(x)"),
+    (sp.elliptic_f(x, 2), "F(x|2)"),
+    (sp.elliptic_pi(n, x, 2), "Π(n; x|2)"),
+])
+def test_okunabilir_gosterimler(ifade, beklenen):
+    assert okunabilir(ifade) == beklenen
+
+
+def test_sympy_olmayan_degerler_str():
+    assert okunabilir(3) == "3"
+    assert okunabilir([1, 2]) == "[1, 2]"
+    assert okunabilir(None) == "None"
+
+
+def test_analiz_sonuclari_yaziciyi_kullanir():
+    assert analiz.turev_hesapla("sqrt(sqrt(x)+1)", adimli=False)["turev_basit"] == "1/(4*√(x)*√(√(x) + 1))"
+    assert analiz.integral_hesapla("sin(x^2)", adimli=False)["integral_basit"] == "√(2)*√(π)*S(√(2)*x/√(π))/2"
+
+
+def test_bicimlendirici_yaziciyi_kullanir():
+    cikti = cozum_formatla(cebir.ikinci_dereceden_coz("x^2 - 2 = 0", adimli=False), "İkinci Derece")
+    assert "x₍1₎ = -√(2)" in cikti and "x₍2₎ = √(2)" in cikti
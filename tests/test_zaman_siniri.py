@@ -0,0 +1,27 @@
+"""
+Süre sınırlı çalıştırma testleri
+"""
+
+import os
+import time
+
+import pytest
+
+from utils.zaman_siniri import SureAsimi, sure_sinirli_calistir
+
+
+def test_sure_verilmezse_ayni_surecte_calisir():
+    assert sure_sinirli_calistir(os.getpid) == os.getpid()
+
+
+def test_sure_verilirse_sonuc_ve_hata_aktarilir():
+    assert sure_sinirli_calistir(pow, 2, 10, sure=5.0) == 1024
+    with pytest.raises(ZeroDivisionError):
+        sure_sinirli_calistir(divmod, 1, 0, sure=5.0)
+
+
+def test_sure_dolunca_sure_asimi():
+    baslangic = time.perf_counter()
+    with pytest.raises(SureAsimi):
+        sure_sinirli_calistir(time.sleep, 5, sure=0.2)
+    assert time.perf_counter() - baslangic < 3
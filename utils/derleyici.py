@@ -0,0 +1,196 @@
+"""
+Sayısal Derleyici - Matematik Kütüphanesi
+=========================================
+
+SymPy ifadelerini sp.lambdify ile NumPy üzerinde vektörel çalışan
+Python fonksiyonlarına derler. Derleme (kod üretimi ve exec) ifade
+başına bir kez yapılır; aynı ifade ve değişkenler için sonraki
+isteklerde önbellekteki fonksiyon döndürülür.
+
+Derlenen fonksiyonlar dizileri doğrudan kabul eder; 10^6 noktalık bir
+ızgara tek çağrıda ve NumPy hızında değerlendirilir. SciPy kuruluysa
+özel fonksiyonlar (erf, gamma, besselj...) scipy.special ile çevrilir.
+NumPy/SciPy karşılığı olmayan fonksiyonlar (Si, fresnels...) mpmath ile
+skaler derlenip np.vectorize ile sarılır; bu yol daha yavaştır ama
+aynı dizi arayüzünü sunar. Derlenemeyen ifadeler derle() çağrısında
+ValueError ile bildirilir, ilk değerlendirmeye kadar beklenmez.
+
+Birden çok ifade (gradyan, Jacobian, Hessian bileşenleri) toplu_derle
+ile tek fonksiyona derlenir; ortak alt ifadeler sp.cse ile bir kez
+hesaplanır.
+
+Yazar: Matematik Kütüphanesi
+"""
+
+from typing import Callable, Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import sympy as sp
+
+from utils.onbellek import AyristirmaOnbellegi
+
+try:
+    import scipy.special  # noqa: F401
+    SCIPY_VAR = True
+except ImportError:
+    SCIPY_VAR = False
+
+
+# Derlenmiş fonksiyonların önbelleği; anahtar (ifade, değişkenler)
+derleme_onbellegi = AyristirmaOnbellegi()
+
+# Vektörel derlemede kullanılan modüller; scipy özel fonksiyonları kapsar
+VEKTOREL_MODULLER = ["numpy", "scipy"] if SCIPY_VAR else ["numpy"]
+
+# Vektörel yolda desteklenmeyen fonksiyonun belirtisi olan hatalar
+# (tanımsız ad, math fonksiyonuna dizi verilmesi, eksik öznitelik)
+_DESTEKLENMEYEN_HATALAR = (NameError, TypeError, AttributeError)
+
+
+def _dene(ham: Callable, degisken_sayisi: int) -> None:
+    """Derlenen fonksiyonu küçük bir deneme dizisinde çalıştırır; desteklenmeyen fonksiyon hatası yükseltir"""
+    deneme = np.full(2, 0.5)
+    with np.errstate(all="ignore"):
+        ham(*([deneme] * degisken_sayisi))
+
+
+def _gercek_deger(deger) -> float:
+    """mpmath sonucunu float'a çevirir; reel olmayan sonuçlar NaN olur (NumPy gibi)"""
+    deger = complex(deger)
+    return deger.real if deger.imag == 0 else np.nan
+
+
+def _skaler_derle(degiskenler: Tuple[sp.Symbol, ...], ifade: sp.Expr) -> Callable[..., np.ndarray]:
+    """İfadeyi mpmath/math ile skaler derler ve np.vectorize ile dizi kabul eder hale getirir"""
+    ham = sp.lambdify(degiskenler, ifade, modules=["mpmath", "math"])
+
+    def skaler(*argumanlar) -> float:
+        try:
+            return _gercek_deger(ham(*argumanlar))
+        except (ZeroDivisionError, ValueError, OverflowError):
+            return np.nan
+
+    return np.vectorize(skaler, otypes=[float])
+
+
+def _vektorel_derle(degiskenler: Tuple[sp.Symbol, ...], ifade: sp.Expr) -> Callable[..., np.ndarray]:
+    """
+    İfadeyi NumPy (varsa SciPy) ile derler; desteklenmeyen fonksiyon varsa
+    mpmath ile skaler derlemeye düşer.
+
+    Raises:
+        ValueError: İfade iki yolla da derlenemiyorsa (örn: tanımsız f(x))
+    """
+    try:
+        ham = sp.lambdify(degiskenler, ifade, modules=VEKTOREL_MODULLER)
+        _dene(ham, len(degiskenler))
+        return ham
+    except Exception:
+        pass
+
+    try:
+        ham = _skaler_derle(degiskenler, ifade)
+        _dene(ham, len(degiskenler))
+        return ham
+    except Exception as e:
+        raise ValueError(f"İfade sayısal olarak derlenemedi: {ifade} ({e})") from e
+
+
+def derle(ifade: sp.Expr, degiskenler: Union[sp.Symbol, Iterable[sp.Symbol]]) -> Callable[..., np.ndarray]:
+    """
+    İfadeyi NumPy ile vektörel değerlendiren fonksiyona derler (önbellekli).
+
+    Değişkenlerin hepsini içermeyen ifadelerde (sabitler gibi) sonuç
+    girdilerin ortak şekline genişletilir; böylece çıktı her zaman
+    girdiyle aynı şekilde olur.
+
+    Args:
+        ifade (sp.Expr): Derlenecek ifade
+        degiskenler (Symbol veya Iterable[Symbol]): Fonksiyon argümanları, sırasıyla
+
+    Returns:
+        Callable: f(*diziler) -> np.ndarray
+
+    Raises:
+        ValueError: İfade sayısal olarak derlenemiyorsa
+    """
+    if isinstance(degiskenler, sp.Symbol):
+        degiskenler = (degiskenler,)
+    degiskenler = tuple(degiskenler)
+    ifade = sp.sympify(ifade)
+
+    def uret():
+        ham = _vektorel_derle(degiskenler, ifade)
+        if set(degiskenler) <= ifade.free_symbols:
+            return ham
+
+        def genisletilmis(*argumanlar):
+            sekil = np.broadcast(*argumanlar).shape if argumanlar else ()
+            return np.asarray(ham(*argumanlar)) + np.zeros(sekil)
+
+        return genisletilmis
+
+    return derleme_onbellegi.al((ifade, degiskenler), uret)
+
+
+def degerlendir(ifade: sp.Expr, degiskenler: Union[sp.Symbol, Iterable[sp.Symbol]],
+                *degerler) -> np.ndarray:
+    """İfadeyi derleyip verilen dizi(ler) üzerinde değerlendirir"""
+    return derle(ifade, degiskenler)(*[np.asarray(deger) for deger in degerler])
+
+
+def toplu_derle(ifadeler: Sequence[sp.Expr], degiskenler: Iterable[sp.Symbol],
+                sekil: Optional[Tuple[int, ...]] = None) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Birden çok ifadeyi ortak alt ifadeleri paylaşan tek fonksiyona derler (önbellekli).
+
+    Tüm bileşenler üzerinde sp.cse çalıştırılır; tekrarlanan alt ifadeler
+    nokta başına bir kez hesaplanır. Derlenen fonksiyon noktaları son
+    ekseni değişkenler olan bir dizi olarak alır: tek nokta için (n,),
+    N nokta için (N, n). Sonuç (..., *sekil) şeklindedir. Fonksiyonun
+    ortak_alt_ifade_sayisi özniteliği cse'nin çıkardığı ara ifade sayısıdır.
+
+    Args:
+        ifadeler (Sequence[sp.Expr]): Satır sırasıyla düzleştirilmiş bileşenler
+        degiskenler (Iterable[Symbol]): Noktaların son eksenindeki değişken sırası
+        sekil (Tuple[int, ...]): Sonucun nokta başına şekli; verilmezse (len(ifadeler),)
+
+    Returns:
+        Callable: f(noktalar) -> np.ndarray
+
+    Raises:
+        ValueError: Şekil uyuşmuyorsa veya ifadeler sayısal olarak derlenemiyorsa
+    """
+    ifadeler = tuple(sp.sympify(ifade) for ifade in ifadeler)
+    degiskenler = tuple(degiskenler)
+    sekil = tuple(sekil) if sekil is not None else (len(ifadeler),)
+    if int(np.prod(sekil)) != len(ifadeler):
+        raise ValueError("Şekil ile ifade sayısı uyuşmuyor")
+
+    def uret():
+        yerine_konanlar, indirgenmis = sp.cse(list(ifadeler))
+        try:
+            ham = sp.lambdify(degiskenler, indirgenmis, modules=VEKTOREL_MODULLER,
+                              cse=lambda _: (yerine_konanlar, indirgenmis))
+            _dene(ham, len(degiskenler))
+        except Exception:
+            # Desteklenmeyen fonksiyon: bileşenler ayrı ayrı derlenir (cse'siz)
+            bilesenler = [derle(ifade, degiskenler) for ifade in ifadeler]
+            yerine_konanlar = []
+
+            def ham(*diziler):
+                return [bilesen(*diziler) for bilesen in bilesenler]
+
+        def hesapla(noktalar) -> np.ndarray:
+            noktalar = np.asarray(noktalar, dtype=float)
+            if noktalar.shape[-1:] != (len(degiskenler),):
+                raise ValueError(f"Noktaların son ekseni {len(degiskenler)} değişken içermeli")
+            sonuc = np.empty(noktalar.shape[:-1] + (len(ifadeler),))
+            for k, deger in enumerate(ham(*np.moveaxis(noktalar, -1, 0))):
+                sonuc[..., k] = deger
+            return sonuc.reshape(noktalar.shape[:-1] + sekil)
+
+        hesapla.ortak_alt_ifade_sayisi = len(yerine_konanlar)
+        return hesapla
+
+    return derleme_onbellegi.al(("toplu", ifadeler, degiskenler, sekil), uret)
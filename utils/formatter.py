@@ -11,6 +11,8 @@ Yazar: Matematik Kütüphanesi
 from typing import Dict, List, Any
 import sympy as sp
 
+from utils.yazici import okunabilir
+
 
 class CozumFormatlayicisi:
     """Matematik çözümlerini formatlar"""
@@ -63,10 +65,10 @@ class CozumFormatlayicisi:
             if len(kokler) == 0:
                 cikti.append("   Gerçek kök bulunamadı.")
             elif len(kokler) == 1:
-                cikti.append(f"   x = {kokler[0]}")
+                cikti.append(f"   x = {okunabilir(kokler[0])}")
             else:
                 for i, kok in enumerate(kokler, 1):
-                    cikti.append(f"   x₍{i}₎ = {kok}")
+                    cikti.append(f"   x₍{i}₎ = {okunabilir(kok)}")
         
         if "carpanlar" in sonuc:
             cikti.append(f"   Çarpanlara ayrılmış hali: {sonuc['carpanlar']}")
@@ -75,6 +77,17 @@ class CozumFormatlayicisi:
             delta = sonuc["diskriminant"]
             cikti.append(f"   Diskriminant (Δ): {delta}")
         
+        # Denklem sistemi sonuçları
+        if "durum" in sonuc and "cozum" in sonuc:
+            durum_metinleri = {
+                "tek_cozum": "Tek çözüm",
+                "sonsuz_cozum": "Sonsuz çözüm (serbest bilinmeyenlere bağlı)",
+                "cozum_yok": "Çözüm yok (sistem tutarsız)"
+            }
+            cikti.append(f"   Durum: {durum_metinleri.get(sonuc['durum'], sonuc['durum'])}")
+            for bilinmeyen, deger in sonuc["cozum"].items():
+                cikti.append(f"   {bilinmeyen} = {deger}")
+        
         # Trigonometri sonuçları
         if "sonuc" in sonuc and "fonksiyon" in sonuc:
             fonksiyon = sonuc["fonksiyon"]
@@ -135,6 +148,8 @@ class CozumFormatlayicisi:
                 cikti.append(f"   Belirli integral [{sonuc['alt_sinir']}, {sonuc['ust_sinir']}]: {sonuc['integral']}")
                 if sonuc.get("sayisal_deger"):
                     cikti.append(f"   Sayısal değer: {sonuc['sayisal_deger']:.6f}")
+                if sonuc.get("yontem", "sembolik") != "sembolik":
+                    cikti.append(f"   Yöntem: {sonuc['yontem']} (hata ≤ {sonuc['hata_siniri']:.2e})")
             else:
                 # Karmaşık integraller için özel açıklama
                 if sonuc.get("karmasik_integral", False):
@@ -154,6 +169,41 @@ class CozumFormatlayicisi:
                     if "integral_basit" in sonuc and sonuc["integral"] != sonuc["integral_basit"]:
                         cikti.append(f"   Basitleştirilmiş: {sonuc['integral_basit']} + C")
         
+        if "limit" in sonuc and "nokta" in sonuc:
+            yon = "" if "oo" in sonuc["nokta"] else {"+": "⁺", "-": "⁻"}.get(sonuc.get("yon"), "")
+            baslik = f"lim({sonuc.get('degisken', 'x')}→{sonuc['nokta']}{yon})"
+            if sonuc.get("limit_var"):
+                cikti.append(f"   {baslik} = {sonuc['limit']}")
+            elif "sag_limit" in sonuc:
+                cikti.append(f"   Sağdan limit: {sonuc['sag_limit']}, soldan limit: {sonuc['sol_limit']}")
+                cikti.append(f"   {baslik}: limit yok")
+            elif "salinim_araligi" in sonuc:
+                cikti.append(f"   {baslik}: limit yok (değerler {sonuc['salinim_araligi']} aralığında salınıyor)")
+            else:
+                cikti.append(f"   {baslik}: {sonuc['limit']}")
+            if sonuc.get("yontem"):
+                hata = f" (hata ≈ {sonuc['hata_siniri']:.2e})" if sonuc.get("hata_siniri") is not None else ""
+                cikti.append(f"   Yöntem: {sonuc['yontem']}{hata}")
+        
+        if "seri" in sonuc and "mertebe" in sonuc:
+            cikti.append(f"   Taylor serisi ({sonuc.get('degisken', 'x')} = {sonuc['nokta']} etrafında, "
+                         f"mertebe {sonuc['mertebe']}):")
+            cikti.append(f"   {sonuc['seri']}")
+            if sonuc.get("kalan_derecesi") is not None:
+                cikti.append(f"   Kalan ≈ {sonuc['kalan_terimi']}")
+            if "azami_kalan" in sonuc:
+                cikti.append(f"   En büyük kalan tahmini: {sonuc['azami_kalan']:.2e}")
+        
+        if "tablo" in sonuc and "sutunlar" in sonuc:
+            basliklar = {"x": sonuc.get("degisken", "x"), "f": "f", "turev": "f'", "integral": "∫f"}
+            satirlar = [[f"{deger:.6g}" for deger in satir] for satir in sonuc["tablo"]]
+            cikti.append("")
+            for satir in self.tablo_formatla([basliklar.get(s, s) for s in sonuc["sutunlar"]], satirlar).split("\n"):
+                cikti.append(f"   {satir}")
+        
+        if sonuc.get("sadelestirme") == "sure_asimi":
+            cikti.append("   ⏱️ Sadeleştirme süresi doldu, sonuç sadeleştirilmeden verildi")
+        
         # Olasılık sonuçları
         if "faktoriyel" in sonuc:
             cikti.append(f"   {sonuc['n']}! = {sonuc['faktoriyel']}")
@@ -240,9 +290,9 @@ class CozumFormatlayicisi:
             if len(kokler) == 0:
                 ozet_parcalari.append("Gerçek kök yok")
             elif len(kokler) == 1:
-                ozet_parcalari.append(f"x = {kokler[0]}")
+                ozet_parcalari.append(f"x = {okunabilir(kokler[0])}")
             else:
-                kok_str = ", ".join([f"x₍{i}₎ = {kok}" for i, kok in enumerate(kokler, 1)])
+                kok_str = ", ".join([f"x₍{i}₎ = {okunabilir(kok)}" for i, kok in enumerate(kokler, 1)])
                 ozet_parcalari.append(kok_str)
         
         if "carpanlar" in sonuc and "orijinal" in sonuc:
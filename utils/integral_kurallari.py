@@ -0,0 +1,248 @@
+"""
+Kurallı İntegral - Matematik Kütüphanesi
+========================================
+
+Sık gelen basit integrandları sp.integrate'e gitmeden, SymPy ağacının
+yapısına göre seçilen kurallarla mikrosaniyeler içinde integre eder:
+
+    - Doğrusallık: ∫(c·f + g) = c·∫f + ∫g
+    - Kuvvet kuralı: ∫(ax+b)^n, n = -1 için ln
+    - Doğrusal argümanlı fonksiyonlar: ∫f(ax+b) = F(ax+b)/a
+      (sin, cos, tan, cot, sec, csc, exp, log, sinh, cosh, tanh, c^(ax+b))
+    - Paydası en fazla ikinci dereceden rasyonel fonksiyonlar
+      (polinom bölmesi ve basit kesirlere ayırma: ln ve arctan)
+
+Kural, düğümün türüne göre doğrudan seçilir (Add, Mul, Pow veya
+fonksiyon tablosunda tek sözlük araması); ağaç bir kez dolaşılır. Hiçbir kural uymazsa None döner ve çağıran sp.integrate'e
+geçer; isabet/ıskalama sayaçları ve kural başına kullanım sayıları
+kural_istatistikleri ile okunur.
+
+Yazar: Matematik Kütüphanesi
+"""
+
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+import sympy as sp
+
+
+# f(u) -> ∫f(u) du; doğrusal argümanda sonuç a'ya bölünür
+_TEMEL_INTEGRALLER: Dict[type, Callable[[sp.Expr], sp.Expr]] = {
+    sp.sin: lambda u: -sp.cos(u),
+    sp.cos: lambda u: sp.sin(u),
+    sp.tan: lambda u: -sp.log(sp.cos(u)),
+    sp.cot: lambda u: sp.log(sp.sin(u)),
+    sp.sec: lambda u: sp.log(sp.sec(u) + sp.tan(u)),
+    sp.csc: lambda u: -sp.log(sp.csc(u) + sp.cot(u)),
+    sp.exp: lambda u: sp.exp(u),
+    sp.log: lambda u: u * sp.log(u) - u,
+    sp.sinh: lambda u: sp.cosh(u),
+    sp.cosh: lambda u: sp.sinh(u),
+    sp.tanh: lambda u: sp.log(sp.cosh(u)),
+}
+
+
+class _KuralSayaclari:
+    """İş parçacığı güvenli isabet/ıskalama ve kural kullanım sayaçları"""
+
+    def __init__(self):
+        self._kilit = threading.Lock()
+        self.isabet = 0
+        self.iskalama = 0
+        self.kurallar: Dict[str, int] = {}
+
+    def kaydet(self, basarili: bool, kurallar: Dict[str, int]):
+        with self._kilit:
+            if basarili:
+                self.isabet += 1
+                for kural, adet in kurallar.items():
+                    self.kurallar[kural] = self.kurallar.get(kural, 0) + adet
+            else:
+                self.iskalama += 1
+
+    def sifirla(self):
+        with self._kilit:
+            self.isabet = 0
+            self.iskalama = 0
+            self.kurallar = {}
+
+    def istatistikler(self) -> Dict[str, object]:
+        with self._kilit:
+            toplam = self.isabet + self.iskalama
+            return {
+                "isabet": self.isabet,
+                "iskalama": self.iskalama,
+                "isabet_orani": self.isabet / toplam if toplam else 0.0,
+                "kurallar": dict(self.kurallar)
+            }
+
+
+_sayaclar = _KuralSayaclari()
+
+
+def _dogrusal(ifade: sp.Expr, var: sp.Symbol) -> Optional[Tuple[sp.Expr, sp.Expr]]:
+    """İfade a·var + b biçimindeyse (a, b), değilse None döndürür"""
+    if ifade == var:
+        return sp.S.One, sp.S.Zero
+    if ifade.is_Add:
+        bagimli = [terim for terim in ifade.args if terim.has(var)]
+        bagimsiz = ifade.func(*[terim for terim in ifade.args if not terim.has(var)])
+    else:
+        bagimli, bagimsiz = [ifade], sp.S.Zero
+    a = sp.S.Zero
+    for terim in bagimli:
+        katsayi, kalan = terim.as_independent(var, as_Add=False)
+        if kalan != var:
+            return None
+        a += katsayi
+    return (a, bagimsiz) if a.is_zero is not True else None
+
+
+def _sifir_degilse(katsayi: sp.Expr, genel: sp.Expr, ozel: sp.Expr) -> sp.Expr:
+    """
+    Katsayı sıfır olamıyorsa genel sonucu, olabiliyorsa (a sembolü gibi)
+    SymPy'nin verdiği biçimde parçalı sonucu döndürür.
+    """
+    if katsayi.is_zero is False:
+        return genel
+    return sp.Piecewise((genel, sp.Ne(katsayi, 0)), (ozel, True))
+
+
+def _kuvvet(ifade: sp.Pow, var: sp.Symbol, kurallar: Dict[str, int]) -> Optional[sp.Expr]:
+    """(ax+b)^n, c^(ax+b) ve 1/(ikinci derece) biçimli kuvvetler"""
+    taban, us = ifade.args
+    if not us.has(var):
+        dogrusal = _dogrusal(taban, var)
+        if dogrusal is not None:
+            a, b = dogrusal
+            ozel = b**us * var
+            if us == -1:
+                kurallar["ln"] = kurallar.get("ln", 0) + 1
+                return _sifir_degilse(a, sp.log(taban) / a, ozel)
+            kurallar["kuvvet"] = kurallar.get("kuvvet", 0) + 1
+            genel = _sifir_degilse(us + 1, taban**(us + 1) / (us + 1), sp.log(taban))
+            return _sifir_degilse(a, genel / a, ozel)
+        if us.is_Integer and us < 0:
+            return _rasyonel(ifade, var, kurallar)
+        return None
+    if not taban.has(var):
+        dogrusal = _dogrusal(us, var)
+        if dogrusal is not None:
+            kurallar["ustel"] = kurallar.get("ustel", 0) + 1
+            a, b = dogrusal
+            return _sifir_degilse(a * sp.log(taban), ifade / (a * sp.log(taban)), taban**b * var)
+    return None
+
+
+def _rasyonel(ifade: sp.Expr, var: sp.Symbol, kurallar: Dict[str, int]) -> Optional[sp.Expr]:
+    """Polinomlar ve paydası birinci/ikinci dereceden, katsayıları sayısal rasyonel fonksiyonlar"""
+    pay, payda = ifade.as_numer_denom()
+    if not (pay.is_polynomial(var) and payda.is_polynomial(var)):
+        return None
+    try:
+        P, Q = sp.Poly(pay, var), sp.Poly(payda, var)
+    except sp.PolynomialError:
+        return None
+    if Q.degree() == 0:
+        kurallar["kuvvet"] = kurallar.get("kuvvet", 0) + 1
+        return P.integrate().as_expr() / Q.as_expr()
+    if Q.degree() > 2 or not all(c.is_number for c in P.all_coeffs() + Q.all_coeffs()):
+        return None
+    
+    bolum, kalan = P.div(Q)
+    sonuc = bolum.integrate().as_expr()
+    if Q.degree() == 1:
+        sonuc += kalan.as_expr() * sp.log(Q.as_expr()) / Q.LC()
+    else:
+        # (px + q)/(ax² + bx + c) = p/(2a)·Q'/Q + (q - pb/(2a))/Q
+        a, b, c = Q.all_coeffs()
+        p, q = kalan.all_coeffs() if kalan.degree() == 1 else (sp.S.Zero, kalan.as_expr())
+        sonuc += p / (2 * a) * sp.log(Q.as_expr())
+        sabit = q - p * b / (2 * a)
+        if sabit != 0:
+            diskriminant = b**2 - 4 * a * c
+            dogrusal = 2 * a * var + b
+            if diskriminant.is_negative:
+                kok = sp.sqrt(-diskriminant)
+                sonuc += sabit * 2 / kok * sp.atan(dogrusal / kok)
+            elif diskriminant.is_positive:
+                # a(x - r1)(x - r2) için a(r1 - r2) = √D
+                kok = sp.sqrt(diskriminant)
+                r1, r2 = (-b + kok) / (2 * a), (-b - kok) / (2 * a)
+                sonuc += sabit / kok * (sp.log(var - r1) - sp.log(var - r2))
+            elif diskriminant.is_zero:
+                sonuc += -sabit / (a * (var + b / (2 * a)))
+            else:
+                return None
+    kurallar["basit_kesir"] = kurallar.get("basit_kesir", 0) + 1
+    return sonuc
+
+
+def _integral(ifade: sp.Expr, var: sp.Symbol, kurallar: Dict[str, int]) -> Optional[sp.Expr]:
+    """Düğüm türüne göre kuralı seçer; uyan kural yoksa None döndürür"""
+    if not ifade.has(var):
+        kurallar["sabit"] = kurallar.get("sabit", 0) + 1
+        return ifade * var
+    if ifade == var:
+        kurallar["kuvvet"] = kurallar.get("kuvvet", 0) + 1
+        return var**2 / 2
+
+    if ifade.is_Add:
+        kurallar["dogrusallik"] = kurallar.get("dogrusallik", 0) + 1
+        terimler = []
+        for terim in ifade.args:
+            terim_integrali = _integral(terim, var, kurallar)
+            if terim_integrali is None:
+                return None
+            terimler.append(terim_integrali)
+        return sp.Add(*terimler)
+
+    if ifade.is_Mul:
+        katsayi, bagimli = ifade.as_independent(var, as_Add=False)
+        if katsayi != 1:
+            kurallar["dogrusallik"] = kurallar.get("dogrusallik", 0) + 1
+            bagimli_integral = _integral(bagimli, var, kurallar)
+            return katsayi * bagimli_integral if bagimli_integral is not None else None
+        return _rasyonel(ifade, var, kurallar)
+
+    if ifade.is_Pow:
+        return _kuvvet(ifade, var, kurallar)
+
+    temel = _TEMEL_INTEGRALLER.get(ifade.func)
+    if temel is not None and len(ifade.args) == 1:
+        dogrusal = _dogrusal(ifade.args[0], var)
+        if dogrusal is not None:
+            kurallar[ifade.func.__name__] = kurallar.get(ifade.func.__name__, 0) + 1
+            a, b = dogrusal
+            return _sifir_degilse(a, temel(ifade.args[0]) / a, ifade.func(b) * var)
+    return None
+
+
+def kurallarla_integral(ifade: sp.Expr, var: sp.Symbol) -> Optional[sp.Expr]:
+    """
+    İfadenin belirsiz integralini yapısal kurallarla hesaplar.
+
+    Args:
+        ifade (sp.Expr): İntegrand
+        var (sp.Symbol): İntegral değişkeni
+
+    Returns:
+        Optional[sp.Expr]: İlkel fonksiyon (sabit hariç); kural yoksa None
+    """
+    kurallar: Dict[str, int] = {}
+    try:
+        sonuc = _integral(ifade, var, kurallar)
+    except Exception:
+        sonuc = None
+    _sayaclar.kaydet(sonuc is not None, kurallar)
+    return sonuc
+
+
+def kural_istatistikleri() -> Dict[str, object]:
+    """İsabet, ıskalama, isabet oranı ve kural başına kullanım sayılarını döndürür"""
+    return _sayaclar.istatistikler()
+
+
+def kural_sayaclarini_sifirla():
+    """Kurallı integral sayaçlarını sıfırlar"""
+    _sayaclar.sifirla()
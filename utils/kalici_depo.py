@@ -0,0 +1,224 @@
+"""
+Kalıcı Sonuç Deposu - Matematik Kütüphanesi
+===========================================
+
+sp.factor, sp.integrate ve sp.simplify gibi zor girdilerde saniyeler
+sürebilen işlemlerin sonuçlarını SQLite dosyasında saklar; böylece
+süreç yeniden başlatıldığında aynı iş tekrar yapılmaz.
+
+Depo isteğe bağlıdır ve varsayılan olarak kapalıdır. İki yolla açılır:
+    - MATEMATIK_KALICI_DEPO ortam değişkenine dosya yolu verilerek
+      (ilk kullanımda açılır)
+    - kalici_depoyu_ac() çağrılarak
+
+Anahtar; işlem adı, SymPy sürümü, depo biçim sürümü ve ifadenin
+sp.srepr ile elde edilen kanonik biçiminden üretilir. Kayıt sayısı ve
+toplam boyut sınırlıdır; sınır aşılınca en uzun süredir kullanılmayan
+kayıtlar silinir (LRU).
+
+Değerler pickle ile saklanır; depo dosyası yalnızca güvenilen bir
+konumda tutulmalıdır.
+
+Yazar: Matematik Kütüphanesi
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import sympy as sp
+
+
+# Kayıt biçimi değişirse artırılır; eski kayıtlar kendiliğinden geçersiz olur
+DEPO_SURUMU = 1
+
+VARSAYILAN_AZAMI_KAYIT = 10000
+VARSAYILAN_AZAMI_BAYT = 64 * 1024 * 1024
+
+ORTAM_DEGISKENI = "MATEMATIK_KALICI_DEPO"
+VARSAYILAN_YOL = os.path.join(os.path.expanduser("~"), ".cache", "matematik_kutuphanesi", "sonuclar.sqlite3")
+
+
+class KaliciDepo:
+    """SQLite tabanlı, boyutu sınırlı, LRU tahliyeli sonuç deposu"""
+
+    def __init__(self, yol: str = VARSAYILAN_YOL, azami_kayit: int = VARSAYILAN_AZAMI_KAYIT,
+                 azami_bayt: int = VARSAYILAN_AZAMI_BAYT):
+        if azami_kayit < 1 or azami_bayt < 1:
+            raise ValueError("Depo sınırları pozitif olmalı")
+        self.yol = yol
+        self.azami_kayit = azami_kayit
+        self.azami_bayt = azami_bayt
+        self.isabet = 0
+        self.iskalama = 0
+        self.tahliye = 0
+        self._kilit = threading.Lock()
+
+        if yol != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(yol)), exist_ok=True)
+        self._baglanti = sqlite3.connect(yol, check_same_thread=False)
+        self._baglanti.execute("""
+            CREATE TABLE IF NOT EXISTS sonuclar (
+                anahtar TEXT PRIMARY KEY,
+                islem TEXT NOT NULL,
+                deger BLOB NOT NULL,
+                boyut INTEGER NOT NULL,
+                son_erisim REAL NOT NULL
+            )
+        """)
+        self._baglanti.execute("CREATE INDEX IF NOT EXISTS son_erisim_indeksi ON sonuclar (son_erisim)")
+        self._baglanti.commit()
+
+    def anahtar_olustur(self, islem: str, ifade: sp.Basic) -> str:
+        """İşlem, sürümler ve ifadenin kanonik biçiminden anahtar üretir"""
+        kanonik = f"{DEPO_SURUMU}|{sp.__version__}|{islem}|{sp.srepr(ifade)}"
+        return hashlib.sha256(kanonik.encode("utf-8")).hexdigest()
+
+    def al(self, islem: str, ifade: sp.Basic, uret: Callable[[], Any],
+           saklanabilir: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        Kayıtlı sonucu döndürür; yoksa üretip depoya yazar.
+
+        Üretim kilit dışında yapılır. Sonuç pickle ile saklanamıyorsa
+        yalnızca döndürülür.
+
+        Args:
+            islem (str): İşlem adı (örn: "factor", "integral:x")
+            ifade (sp.Basic): İşlemin uygulandığı ifade
+            uret (Callable): Kayıt yoksa sonucu hesaplayan fonksiyon
+            saklanabilir (Callable): False döndürürse sonuç depoya yazılmaz
+                (örn: süre aşımıyla yarım kalan sonuçlar)
+
+        Returns:
+            Any: Kayıtlı veya yeni hesaplanan sonuç
+        """
+        anahtar = self.anahtar_olustur(islem, ifade)
+
+        with self._kilit:
+            satir = self._baglanti.execute(
+                "SELECT deger FROM sonuclar WHERE anahtar = ?", (anahtar,)).fetchone()
+            if satir is not None:
+                try:
+                    deger = pickle.loads(satir[0])
+                except Exception:
+                    # Okunamayan kayıt silinir ve yeniden hesaplanır
+                    self._baglanti.execute("DELETE FROM sonuclar WHERE anahtar = ?", (anahtar,))
+                    self._baglanti.commit()
+                else:
+                    self._baglanti.execute(
+                        "UPDATE sonuclar SET son_erisim = ? WHERE anahtar = ?", (time.time(), anahtar))
+                    self._baglanti.commit()
+                    self.isabet += 1
+                    return deger
+            self.iskalama += 1
+
+        deger = uret()
+        if saklanabilir is not None and not saklanabilir(deger):
+            return deger
+
+        try:
+            veri = pickle.dumps(deger, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return deger
+
+        if len(veri) <= self.azami_bayt:
+            with self._kilit:
+                self._baglanti.execute(
+                    "INSERT OR REPLACE INTO sonuclar VALUES (?, ?, ?, ?, ?)",
+                    (anahtar, islem, veri, len(veri), time.time()))
+                self._fazlayi_tahliye_et()
+                self._baglanti.commit()
+        return deger
+
+    def temizle(self):
+        """Tüm kayıtları ve sayaçları sıfırlar"""
+        with self._kilit:
+            self._baglanti.execute("DELETE FROM sonuclar")
+            self._baglanti.commit()
+            self.isabet = 0
+            self.iskalama = 0
+            self.tahliye = 0
+
+    def istatistikler(self) -> Dict[str, Any]:
+        """İsabet, ıskalama, tahliye sayaçlarını ve depo boyutunu döndürür"""
+        with self._kilit:
+            kayit, bayt = self._baglanti.execute(
+                "SELECT COUNT(*), COALESCE(SUM(boyut), 0) FROM sonuclar").fetchone()
+            return {
+                "isabet": self.isabet,
+                "iskalama": self.iskalama,
+                "tahliye": self.tahliye,
+                "kayit": kayit,
+                "bayt": bayt,
+                "azami_kayit": self.azami_kayit,
+                "azami_bayt": self.azami_bayt,
+                "yol": self.yol
+            }
+
+    def kapat(self):
+        """Veritabanı bağlantısını kapatır"""
+        with self._kilit:
+            self._baglanti.close()
+
+    def _fazlayi_tahliye_et(self):
+        """Sınırlar aşıldıkça en eski erişilen kaydı siler (kilit altında çağrılır)"""
+        kayit, bayt = self._baglanti.execute(
+            "SELECT COUNT(*), COALESCE(SUM(boyut), 0) FROM sonuclar").fetchone()
+        for anahtar, boyut in self._baglanti.execute(
+                "SELECT anahtar, boyut FROM sonuclar ORDER BY son_erisim").fetchall():
+            if kayit <= self.azami_kayit and bayt <= self.azami_bayt:
+                break
+            self._baglanti.execute("DELETE FROM sonuclar WHERE anahtar = ?", (anahtar,))
+            kayit -= 1
+            bayt -= boyut
+            self.tahliye += 1
+
+
+# Açık depo; None ise kalıcı saklama kapalıdır
+_depo: Optional[KaliciDepo] = None
+_depo_kilidi = threading.Lock()
+_ortam_denendi = False
+
+
+def kalici_depoyu_ac(yol: Optional[str] = None, azami_kayit: int = VARSAYILAN_AZAMI_KAYIT,
+                     azami_bayt: int = VARSAYILAN_AZAMI_BAYT) -> KaliciDepo:
+    """Kalıcı depoyu açar (varsa öncekini kapatır) ve döndürür"""
+    global _depo
+    with _depo_kilidi:
+        if _depo is not None:
+            _depo.kapat()
+        _depo = KaliciDepo(yol or os.environ.get(ORTAM_DEGISKENI) or VARSAYILAN_YOL,
+                           azami_kayit, azami_bayt)
+        return _depo
+
+
+def kalici_depoyu_kapat():
+    """Kalıcı depoyu kapatır; sonraki işlemler depoya yazılmaz"""
+    global _depo
+    with _depo_kilidi:
+        if _depo is not None:
+            _depo.kapat()
+            _depo = None
+
+
+def kalici_depo() -> Optional[KaliciDepo]:
+    """Açık depoyu döndürür; ortam değişkeni tanımlıysa ilk çağrıda açar"""
+    global _ortam_denendi
+    if _depo is None and not _ortam_denendi:
+        _ortam_denendi = True
+        if os.environ.get(ORTAM_DEGISKENI):
+            kalici_depoyu_ac()
+    return _depo
+
+
+def kalici_hesapla(islem: str, ifade: sp.Basic, uret: Callable[[], Any],
+                   saklanabilir: Optional[Callable[[Any], bool]] = None) -> Any:
+    """Depo açıksa sonucu depodan alır veya hesaplayıp yazar; kapalıysa doğrudan hesaplar"""
+    depo = kalici_depo()
+    if depo is None:
+        return uret()
+    return depo.al(islem, ifade, uret, saklanabilir)
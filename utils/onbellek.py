@@ -0,0 +1,130 @@
+"""
+Ayrıştırma Önbelleği - Matematik Kütüphanesi
+============================================
+
+Bu modül, çözücülerin temizleyip SymPy ifadesine çevirdiği girdileri
+paylaşılan, boyutu sınırlı bir LRU önbellekte saklar. Aynı girdi
+tekrar geldiğinde düzenli ifade temizliği ve sp.sympify yeniden
+çalıştırılmaz.
+
+SymPy ifadeleri değiştirilemez (immutable) olduğu için önbellekteki
+değerler çözücüler arasında güvenle paylaşılabilir.
+
+Yazar: Matematik Kütüphanesi
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+
+VARSAYILAN_AZAMI_BOYUT = 1024
+
+
+class AyristirmaOnbellegi:
+    """İş parçacığı güvenli, boyutu sınırlı LRU ayrıştırma önbelleği"""
+
+    def __init__(self, azami_boyut: int = VARSAYILAN_AZAMI_BOYUT):
+        if azami_boyut < 0:
+            raise ValueError("Önbellek boyutu negatif olamaz")
+        self._azami_boyut = azami_boyut
+        self._kayitlar = OrderedDict()
+        self._kilit = threading.Lock()
+        self.isabet = 0
+        self.iskalama = 0
+        self.tahliye = 0
+
+    @property
+    def azami_boyut(self) -> int:
+        return self._azami_boyut
+
+    @azami_boyut.setter
+    def azami_boyut(self, deger: int):
+        if deger < 0:
+            raise ValueError("Önbellek boyutu negatif olamaz")
+        with self._kilit:
+            self._azami_boyut = deger
+            self._fazlayi_tahliye_et()
+
+    def al(self, anahtar: Hashable, uret: Callable[[], Any]) -> Any:
+        """
+        Anahtara karşılık gelen değeri döndürür; yoksa üretip saklar.
+
+        Üretim kilit dışında yapılır, böylece uzun süren bir sympify diğer
+        iş parçacıklarını bekletmez. Üretim hata verirse hiçbir şey
+        saklanmaz ve hata çağırana iletilir.
+
+        Args:
+            anahtar (Hashable): Normalize edilmiş girdi anahtarı
+            uret (Callable): Önbellekte yoksa değeri üreten fonksiyon
+
+        Returns:
+            Any: Önbellekteki veya yeni üretilen değer
+        """
+        with self._kilit:
+            if anahtar in self._kayitlar:
+                self._kayitlar.move_to_end(anahtar)
+                self.isabet += 1
+                return self._kayitlar[anahtar]
+            self.iskalama += 1
+
+        deger = uret()
+
+        with self._kilit:
+            if self._azami_boyut > 0:
+                self._kayitlar[anahtar] = deger
+                self._kayitlar.move_to_end(anahtar)
+                self._fazlayi_tahliye_et()
+        return deger
+
+    def temizle(self):
+        """Tüm kayıtları ve sayaçları sıfırlar"""
+        with self._kilit:
+            self._kayitlar.clear()
+            self.isabet = 0
+            self.iskalama = 0
+            self.tahliye = 0
+
+    def istatistikler(self) -> Dict[str, int]:
+        """İsabet, ıskalama ve tahliye sayaçlarını döndürür"""
+        with self._kilit:
+            return {
+                "isabet": self.isabet,
+                "iskalama": self.iskalama,
+                "tahliye": self.tahliye,
+                "boyut": len(self._kayitlar),
+                "azami_boyut": self._azami_boyut
+            }
+
+    def __len__(self) -> int:
+        return len(self._kayitlar)
+
+    def _fazlayi_tahliye_et(self):
+        """En uzun süredir kullanılmayan kayıtları siler (kilit altında çağrılır)"""
+        while len(self._kayitlar) > self._azami_boyut:
+            self._kayitlar.popitem(last=False)
+            self.tahliye += 1
+
+
+# Tüm çözücülerin paylaştığı önbellek
+ayristirma_onbellegi = AyristirmaOnbellegi()
+
+
+def girdi_normalize_et(metin: str) -> str:
+    """Önbellek anahtarı için girdinin baş/son boşluklarını atar"""
+    return metin.strip()
+
+
+def onbellek_istatistikleri() -> Dict[str, int]:
+    """Paylaşılan ayrıştırma önbelleğinin sayaçlarını döndürür"""
+    return ayristirma_onbellegi.istatistikler()
+
+
+def onbellek_boyutu_ayarla(azami_boyut: int):
+    """Paylaşılan ayrıştırma önbelleğinin azami boyutunu değiştirir"""
+    ayristirma_onbellegi.azami_boyut = azami_boyut
+
+
+def onbellegi_temizle():
+    """Paylaşılan ayrıştırma önbelleğini boşaltır"""
+    ayristirma_onbellegi.temizle()
@@ -31,7 +31,8 @@ class DoğalDilParser:
         self.alt_konu_anahtarlari = {
             "cebir": {
                 "ikinci_dereceden": ["ikinci dereceden", "kuadratik", "x²", "x^2", "kök bul"],
-                "carpanlara_ayirma": ["çarpan", "faktör", "çarpanlara ayır", "faktörel"]
+                "carpanlara_ayirma": ["çarpan", "faktör", "çarpanlara ayır", "faktörel"],
+                "denklem_sistemi": ["denklem sistemi", "sistem", "bilinmeyenli"]
             },
             "geometri": {
                 "ucgen_hesaplama": ["üçgen", "pisagor", "pitagor", "hipotenüs", "dik üçgen", "üçüncü kenar", "kosinüs kuralı", "sinus kuralı"],
@@ -77,6 +78,7 @@ class DoğalDilParser:
             "trigonometrik_ifade_hesapla": ["hesapla", "+", "-", "toplam", "fark", "ifade"],
             "turev_hesapla": ["türev", "türevini", "d/dx", "diferansiyel"],
             "integral_hesapla": ["integral", "integrali", "∫", "belirsiz", "belirli"],
+            "limit_hesapla": ["limit", "limiti", "yaklaşır", "sonsuza", "∞"],
             "faktoriyel_hesapla": ["faktöriyel", "n!", "!"],
             "permutasyon_hesapla": ["permutasyon", "düzenleme", "P(", "sıralama"],
             "kombinasyon_hesapla": ["kombinasyon", "seçim", "C(", "choose"],
@@ -161,6 +163,65 @@ class DoğalDilParser:
         
         return None
     
+    def _denklem_sistemi_tespit_et(self, metin: str) -> Optional[List[str]]:
+        """Metinden virgül, noktalı virgül, satır sonu veya 've' ile ayrılmış denklemleri çıkarır"""
+        if metin.count("=") < 2 or any(trig in metin for trig in ["sin", "cos", "tan"]):
+            return None
+        
+        denklemler = []
+        for parca in re.split(r"[,;\n]|\bve\b", metin):
+            if parca.count("=") != 1:
+                continue
+            # Değişkenler tek harflidir; "çöz:", "sistemini" gibi kelimeleri at
+            parca = re.sub(r"[^\W\d_]{2,}", " ", parca).strip(" :.")
+            sol, sag = parca.split("=")
+            if sol.strip() and sag.strip():
+                denklemler.append(parca)
+        
+        return denklemler if len(denklemler) >= 2 else None
+    
+    def _limit_bilgisi_cikar(self, metin: str) -> Optional[Dict[str, str]]:
+        """
+        Limit sorgusundan fonksiyonu, değişkeni, noktayı ve yönü çıkarır.
+        
+        "lim x->0 sin(x)/x", "x sonsuza giderken 1/x limiti",
+        "x sağdan 0'a yaklaşırken 1/x" gibi kalıpları tanır.
+        
+        Returns:
+            Dict: fonksiyon, degisken, nokta, yon; nokta bulunamazsa None
+        """
+        metin = metin.lower().strip()
+        
+        yon = "+-"
+        if "sağdan" in metin:
+            yon = "+"
+        elif "soldan" in metin:
+            yon = "-"
+        metin = re.sub(r"\b(?:sağdan|soldan)\b", " ", metin)
+        
+        nokta_deseni = r"(-\s*|eksi\s+)?(∞|oo|sonsuz|\d+(?:[.,]\d+)?|pi|π)"
+        eslesme = re.search(r"\b([a-z])\s*(?:->|→|=>)\s*" + nokta_deseni + r"\s*([⁺⁻])?", metin)
+        if not eslesme:
+            eslesme = re.search(r"\b([a-z])\s+" + nokta_deseni + r"\s*['’]?\s*[a-zçğıöşü]*\s+"
+                                r"(?:yaklaşırken|yaklaşır|giderken|gider)()", metin)
+        if not eslesme:
+            return None
+        
+        degisken, eksi, nokta, ust_yon = eslesme.groups()
+        nokta = ("-" if eksi else "") + nokta.replace(",", ".")
+        if ust_yon:
+            yon = "+" if ust_yon == "⁺" else "-"
+        
+        # Nokta ifadesini, limit kelimelerini ve Türkçe ekleri at
+        fonksiyon = metin[:eslesme.start()] + " " + metin[eslesme.end():]
+        fonksiyon = re.sub(r"\blim(?:it)?(?:i|ini|inin)?\b|\bhesapla\b|\bbul\b|\bnedir\b|\biçin\b", " ", fonksiyon)
+        fonksiyon = re.sub(r"['’][a-zçğıöşü]+", "", fonksiyon)
+        fonksiyon = fonksiyon.strip(" :?.,")
+        if not fonksiyon:
+            return None
+        
+        return {"fonksiyon": fonksiyon, "degisken": degisken, "nokta": nokta, "yon": yon}
+    
     def _trigonometri_tespit_et(self, metin: str) -> Optional[str]:
         """Metinden trigonometrik ifadeleri çıkarır"""
         # ÖNCE karmaşık trigonometrik ifade arama (birden fazla fonksiyon)
@@ -231,6 +292,120 @@ class DoğalDilParser:
         
         return None
     
+    def _aralik_bilgisi_cikar(self, metin: str) -> Dict[str, str]:
+        """
+        Grafik sorgusundan fonksiyonu ve çizim aralığını çıkarır.
+        
+        "sin(x) grafiğini [0, 2pi] aralığında çiz", "x**2'yi -3 ile 3
+        arasında çiz" gibi kalıpları tanır; aralık yoksa [-10, 10] alınır.
+        
+        Returns:
+            Dict: fonksiyon, alt_sinir, ust_sinir
+        """
+        metin = metin.lower().strip()
+        
+        alt_sinir, ust_sinir = "-10", "10"
+        aralik = self._aralik_bul(metin)
+        if aralik:
+            alt_sinir, ust_sinir, metin = aralik
+        
+        # Grafik kelimelerini ve Türkçe ekleri at
+        fonksiyon = re.sub(r"\b(?:grafi[kğ]\w*|çiz\w*|görselleştir\w*|aralığında|arasında|fonksiyonu\w*)",
+                           " ", metin)
+        fonksiyon = re.sub(r"['’][a-zçğıöşü]+", "", fonksiyon)
+        fonksiyon = fonksiyon.replace("²", "**2").replace("³", "**3").strip(" :?.,")
+        
+        return {"fonksiyon": fonksiyon or "x", "alt_sinir": alt_sinir, "ust_sinir": ust_sinir}
+    
+    def _aralik_bul(self, metin: str) -> Optional[Tuple[str, str, str]]:
+        """
+        "[a, b]", "a ile b arasında", "a'dan b'ye kadar" ve ekli yalın "a dan b ye"
+        kalıplarındaki aralığı bulur.
+        
+        Returns:
+            Optional[Tuple]: (alt_sinir, ust_sinir, aralığı çıkarılmış metin); aralık yoksa None
+        """
+        sinir_deseni = r"(-?\s*(?:\d+(?:[.,]\d+)?\s*\*?\s*(?:pi|π)?|pi|π))"
+        eslesme = re.search(r"\[\s*" + sinir_deseni + r"\s*[,;]\s*" + sinir_deseni + r"\s*\]", metin)
+        if not eslesme:
+            eslesme = re.search(sinir_deseni + r"\s*(?:ile|ila|['’]?[dt][ae]n)\s+" + sinir_deseni
+                                + r"\s*['’]?[a-zçğıöşü]*\s+(?:arasında|aralığında|kadar)", metin)
+        if not eslesme:
+            # Yalın kalıp: "0 dan 1 e", "0'dan 2'ye"; üst sınırda yönelme eki zorunludur
+            eslesme = re.search(sinir_deseni + r"\s*['’]?[dt][ae]n\s+" + sinir_deseni
+                                + r"\s*['’]?y?[ae](?![\wçğıöşü])", metin)
+        if not eslesme:
+            return None
+        
+        alt_sinir, ust_sinir = (re.sub(r"(\d)(pi)", r"\1*\2", s.replace(" ", "").replace(",", ".").replace("π", "pi"))
+                                for s in eslesme.groups())
+        return alt_sinir, ust_sinir, metin[:eslesme.start()] + " " + metin[eslesme.end():]
+    
+    def _diferansiyel_denklem_cikar(self, metin: str) -> Dict[str, any]:
+        """
+        Diferansiyel denklem sorgusundan denklemleri, başlangıç koşullarını
+        ve çözüm aralığını çıkarır.
+        
+        "y' = -2y + sin(t), y(0) = 1, [0, 5] aralığında çöz",
+        "dy/dt = y, y(0)=1, t 0 dan 1 e" veya "x' = v; v' = -x; x(0) = 1;
+        v(0) = 0, 0'dan 10'a kadar" gibi kalıpları tanır. Aralık ve her
+        bilinmeyenin başlangıç koşulu verilmelidir; eksik, anlaşılamayan
+        veya bilinmeyen değişkene ait koşullar varsayılan değerle
+        doldurulmaz, "hata" anahtarıyla bildirilir.
+        
+        Returns:
+            Dict: denklemler, baslangic_degerleri, t_araligi, degiskenler;
+                girdi eksik veya hatalıysa ayrıca hata
+        """
+        metin = metin.lower().strip()
+        aralik = self._aralik_bul(metin)
+        if aralik:
+            metin = aralik[2]
+        
+        denklemler, kosullar, zamanlar, hatalar = [], {}, set(), []
+        for parca in re.split(r"[,;\n]|\s+ve\s+", metin):
+            parca = parca.strip(" :?.")
+            # Koşuldan sonra sayı içermeyen kelimeler gelebilir ("y(0) = 1 iken çöz")
+            kosul = re.match(r"^([a-z]\w*)\(\s*(-?[\d.]+)\s*\)\s*=\s*(-?[\d.]+)(?:\s+[^\d=()\[\]]*)?$", parca)
+            if kosul:
+                kosullar[kosul.group(1)] = float(kosul.group(3))
+                zamanlar.add(float(kosul.group(2)))
+                continue
+            if re.match(r"^[a-z]\w*\s*\([^)]*\)\s*=", parca):
+                hatalar.append(f"Başlangıç koşulu anlaşılamadı: '{parca}' (örn: y(0) = 1)")
+                continue
+            denklem = re.search(r"(?:d[a-z]\w*\s*/\s*d[a-z]\w*|[a-z]\w*\s*')\s*=\s*.+", parca)
+            if denklem:
+                denklemler.append(denklem.group().replace("²", "**2").replace("³", "**3"))
+        
+        degiskenler = [re.match(r"d?([a-z]\w*?)\s*(?:/|')", d).group(1) for d in denklemler]
+        
+        if not aralik:
+            if re.search(r"\[|\b(?:aralığında|arasında|kadar)\b|\d\s*['’]?[dt][ae]n\b", metin):
+                hatalar.append("Çözüm aralığı anlaşılamadı (örn: [0, 5] aralığında, t 0 dan 5 e)")
+            else:
+                hatalar.append("Çözüm aralığı verilmedi (örn: [0, 5] aralığında, t 0 dan 5 e)")
+        for degisken in degiskenler:
+            if degisken not in kosullar:
+                hatalar.append(f"{degisken} için başlangıç koşulu verilmedi (örn: {degisken}(0) = 1)")
+        for degisken in kosullar:
+            if degisken not in degiskenler:
+                hatalar.append(f"Bilinmeyen değişken için başlangıç koşulu: {degisken}")
+        if len(zamanlar) > 1:
+            hatalar.append("Başlangıç koşulları aynı zamanda verilmeli")
+        elif aralik and zamanlar and re.fullmatch(r"-?[\d.]+", aralik[0]) and float(aralik[0]) not in zamanlar:
+            hatalar.append(f"Başlangıç koşulları aralığın başında (t = {aralik[0]}) verilmeli")
+        
+        sonuc = {
+            "denklemler": denklemler,
+            "baslangic_degerleri": [kosullar.get(d) for d in degiskenler],
+            "t_araligi": (aralik[0], aralik[1]) if aralik else None,
+            "degiskenler": degiskenler
+        }
+        if hatalar:
+            sonuc["hata"] = "; ".join(hatalar)
+        return sonuc
+    
     def _fonksiyon_cikar(self, metin: str) -> str:
         """Metinden matematik fonksiyonunu çıkarır"""
         # Türev/integral kelimelerini temizle
@@ -386,10 +561,16 @@ class DoğalDilParser:
     def _islem_tespit_et(self, metin: str) -> str:
         """Metinden yapılacak işlemi tespit eder"""
         # Öncelikli kontroller
+        if re.search(r"\b[a-z]\w*\s*'\s*=|\bd[a-z]\w*\s*/\s*dt\b", metin.lower()):
+            return "diferansiyel_coz"
         if "integral" in metin.lower():
             return "integral_hesapla"
         if "türev" in metin.lower():
             return "turev_hesapla"
+        if re.search(r"\blim|yaklaşır", metin.lower()):
+            return "limit_hesapla"
+        if re.search(r"\bçiz|grafi[kğ]|görselleştir", metin.lower()):
+            return "grafikle"
         if "!" in metin:
             return "faktoriyel_hesapla"
         if "P(" in metin:
@@ -439,7 +620,25 @@ class DoğalDilParser:
         """Analiz sonucuna göre işlem önerisi oluşturur"""
         
         # ÖNCELİKLE analiz konusu kontrol et
-        if konu == "analiz" or islem in ["turev_hesapla", "integral_hesapla"]:
+        # Grafik isteği: fonksiyon tablosu (grafik verisi) üretilir
+        if islem == "grafikle":
+            return {
+                "modül": "analiz",
+                "fonksiyon": "fonksiyon_tablola",
+                "parametreler": self._aralik_bilgisi_cikar(orijinal_girdi),
+                "açıklama": "Fonksiyonun değer tablosu (grafik verisi) oluşturulacak"
+            }
+        
+        # Diferansiyel denklem: sayısal başlangıç değer problemi çözümü
+        if islem == "diferansiyel_coz":
+            return {
+                "modül": "analiz",
+                "fonksiyon": "baslangic_deger_problemi_coz",
+                "parametreler": self._diferansiyel_denklem_cikar(orijinal_girdi),
+                "açıklama": "Diferansiyel denklem sayısal olarak çözülecek"
+            }
+        
+        if konu == "analiz" or islem in ["turev_hesapla", "integral_hesapla", "limit_hesapla"]:
             if islem == "integral_hesapla" or "integral" in str(ifade).lower():
                 # İntegral işlemi
                 return {
@@ -448,6 +647,14 @@ class DoğalDilParser:
                     "parametreler": {},
                     "açıklama": "Fonksiyonun integrali hesaplanacak"
                 }
+            elif islem == "limit_hesapla" or alt_konu == "limit":
+                # Limit işlemi; fonksiyon, nokta ve yön girdiden çıkarılır
+                return {
+                    "modül": "analiz",
+                    "fonksiyon": "limit_hesapla",
+                    "parametreler": self._limit_bilgisi_cikar(orijinal_girdi) or {},
+                    "açıklama": "Fonksiyonun limiti hesaplanacak"
+                }
             elif islem == "turev_hesapla" or "türev" in str(ifade).lower():
                 # Türev işlemi
                 return {
@@ -527,6 +734,16 @@ class DoğalDilParser:
                 "açıklama": "Trigonometrik denklem çözülecek"
             }
         
+        if konu == "cebir":
+            denklemler = self._denklem_sistemi_tespit_et(orijinal_girdi.lower())
+            if denklemler:
+                return {
+                    "modül": "cebir",
+                    "fonksiyon": "denklem_sistemi_coz",
+                    "parametreler": {"denklemler": denklemler},
+                    "açıklama": f"{len(denklemler)} denklemli doğrusal sistem çözülecek"
+                }
+        
         if konu == "cebir" and ifade:
             if islem == "çarpanlara_ayır" or "çarpan" in islem or "faktör" in islem:
                 return {
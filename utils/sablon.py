@@ -0,0 +1,137 @@
+"""
+Şablon Çözüm Önbelleği - Matematik Kütüphanesi
+==============================================
+
+Gelen ifadelerin çoğu aynı yapıda olup yalnızca sayıları farklıdır
+("2x^2+3x-2", "5x^2-x+7" gibi). Bu modül ifadedeki sayıları yer
+tutucu sembollerle değiştirip yapısal bir şablon çıkarır. Şablon
+üzerinde sembolik işlem (çözme, türev alma) yalnızca bir kez yapılır;
+aynı yapıdaki sonraki girdilerde önbellekteki şablon sonucuna sayılar
+yerleştirilir.
+
+Önbellek anahtarı şablon ifadesinin kendisidir; SymPy ifadeleri
+yapısal olarak karşılaştırılıp özetlendiği (hash) için aynı yapı aynı
+anahtarı üretir. Tahliye, ayrıştırma önbelleğindeki LRU politikasıyla
+yapılır.
+
+Yazar: Matematik Kütüphanesi
+"""
+
+import threading
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+import sympy as sp
+
+from utils.onbellek import AyristirmaOnbellegi
+
+
+# Tüm çözücülerin paylaştığı şablon önbelleği
+sablon_onbellegi = AyristirmaOnbellegi()
+
+# Yer tutucular bir kez oluşturulur; aynı sıradaki sayı her şablonda aynı
+# Dummy ile temsil edildiğinden aynı yapılar aynı şablonu üretir. Liste
+# yalnızca kilit altında büyür; aksi halde iki iş parçacığı aynı sıraya
+# farklı Dummy'ler ekleyip sonraki sayıları yanlış yer tutucuya kaydırabilir.
+_yer_tutucular: List[sp.Dummy] = []
+_yer_tutucu_kilidi = threading.Lock()
+
+
+def _yer_tutucu(sira: int) -> sp.Dummy:
+    """Verilen sıradaki yer tutucu sembolü döndürür"""
+    if sira < len(_yer_tutucular):
+        return _yer_tutucular[sira]
+    with _yer_tutucu_kilidi:
+        while len(_yer_tutucular) <= sira:
+            _yer_tutucular.append(sp.Dummy(f"s{len(_yer_tutucular)}"))
+        return _yer_tutucular[sira]
+
+
+# Sıralama anahtarında tüm sayıların yerine geçen ortak sembol
+_ortak_yer_tutucu = sp.Dummy("s")
+
+
+def _yapi_anahtari(ifade: sp.Basic):
+    """Sayılardan bağımsız sıralama anahtarı (yalnız yapıya bakar)"""
+    return sp.default_sort_key(ifade.replace(lambda alt: alt.is_Number, lambda alt: _ortak_yer_tutucu))
+
+
+def sablona_cevir(ifade: sp.Basic, usler_dahil: bool = True) -> Tuple[sp.Basic, Tuple[sp.Number, ...]]:
+    """
+    İfadedeki sayıları sırayla yer tutucularla değiştirir.
+
+    Çarpım içinde işaret olarak duran -1 (x - y gibi) yapının parçası
+    sayılır ve değiştirilmez. Toplam ve çarpım terimleri SymPy'nin
+    (sayılara bağlı) sırasıyla değil yapılarına göre sıralanarak
+    numaralandırılır; böylece 3x⁴ + 2x ile 5x⁴ - 7x aynı şablonu üretir.
+
+    Args:
+        ifade (sp.Basic): Şablona çevrilecek SymPy ifadesi
+        usler_dahil (bool): False ise üslerdeki sayılar (x**2 gibi)
+            yapının parçası olarak bırakılır
+
+    Returns:
+        Tuple: (şablon ifadesi, yerine konacak sayılar)
+    """
+    sayilar: List[sp.Number] = []
+
+    def donustur(alt_ifade):
+        if alt_ifade.is_Number:
+            sayilar.append(alt_ifade)
+            return _yer_tutucu(len(sayilar) - 1)
+        if not alt_ifade.args:
+            return alt_ifade
+        if alt_ifade.is_Pow and not usler_dahil:
+            return alt_ifade.func(donustur(alt_ifade.base), alt_ifade.exp)
+        if alt_ifade.is_Mul and alt_ifade.args[0] is sp.S.NegativeOne:
+            return -donustur(alt_ifade.func(*alt_ifade.args[1:]))
+        argumanlar = alt_ifade.args
+        if alt_ifade.is_Add or alt_ifade.is_Mul:
+            argumanlar = sorted(argumanlar, key=_yapi_anahtari)
+        return alt_ifade.func(*[donustur(arguman) for arguman in argumanlar])
+
+    return donustur(ifade), tuple(sayilar)
+
+
+def yerine_koy(sablon_sonucu: Any, sayilar: Tuple[sp.Number, ...]) -> Any:
+    """Şablon sonucundaki yer tutuculara sayıları yerleştirir (liste/demetler dahil)"""
+    if isinstance(sablon_sonucu, (list, tuple)):
+        return type(sablon_sonucu)(yerine_koy(eleman, sayilar) for eleman in sablon_sonucu)
+    if isinstance(sablon_sonucu, sp.Basic):
+        return sablon_sonucu.xreplace(dict(zip(_yer_tutucular, sayilar)))
+    return sablon_sonucu
+
+
+def sablonla_hesapla(islem: Hashable, ifade: sp.Basic, hesapla: Callable[[sp.Basic], Any],
+                     usler_dahil: bool = True,
+                     uygun: Optional[Callable[[Any], bool]] = None) -> Any:
+    """
+    İşlemi ifadenin şablonu üzerinde bir kez yapar, sonucu önbellekten kullanır.
+
+    Şablona çevirme başarısız olursa veya şablon sonucu uygun bulunmazsa
+    işlem doğrudan ifade üzerinde yapılır.
+
+    Args:
+        islem (Hashable): İşlemi ve parametrelerini ayırt eden anahtar
+            (örn: ("turev", x))
+        ifade (sp.Basic): İşlem yapılacak ifade
+        hesapla (Callable): Şablon (veya ifade) üzerinde işlemi yapan fonksiyon
+        usler_dahil (bool): Üslerdeki sayılar da şablona çevrilsin mi
+        uygun (Callable): Şablon sonucunun sayılar yerine konarak
+            kullanılabilir olup olmadığını söyler; yapı başına bir kez çağrılır
+
+    Returns:
+        Any: Sayıları yerine konmuş işlem sonucu
+    """
+    try:
+        sablon, sayilar = sablona_cevir(ifade, usler_dahil)
+    except Exception:
+        return hesapla(ifade)
+
+    def sablonu_hesapla():
+        sonuc = hesapla(sablon)
+        return (uygun is None or uygun(sonuc)), sonuc
+
+    kullanilabilir, sablon_sonucu = sablon_onbellegi.al((islem, usler_dahil, sablon), sablonu_hesapla)
+    if not kullanilabilir:
+        return hesapla(ifade)
+    return yerine_koy(sablon_sonucu, sayilar)
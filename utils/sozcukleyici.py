@@ -0,0 +1,310 @@
+"""
+Sözcükleyici (Lexer) - Matematik Kütüphanesi
+============================================
+
+Bu modül, çözücülere gelen metin girdilerini SymPy'nin anlayacağı
+metne ve sözcüklere (token) çevirir. Türkçe karakter katlama, üst simge
+üsler (², ³), örtük çarpma (2x -> 2*x), isim dönüşümleri ve gereksiz
+anahtar kelimelerin atılması, her sözcükleyici için bir kez derlenen
+düzenli ifadelerle metnin tamamı üzerinde yapılır; sözcük başına Python
+döngüsü çalışmaz.
+
+Boşluk duyarlı sözcükleyicide (varsayılan) örtük çarpma yalnızca
+aralarında boşluk olmayan sözcüklere uygulanır (2x, 2(x), (x)(y)).
+Boşlukla ayrılmış iki terim ("2 3", "sin(x) i") birleştirilmez; araya
+BOSLUK sözcüğü girer ve SymPy ifadeyi reddeder. bosluk_duyarli=False
+ile boşluklar yok sayılır ("5 x" -> 5*x); girdilerdeki boşlukları
+önceden silen çözücüler (cebir, trigonometri) bu ayarı kullanır.
+
+Çok harfli isimler şu sırayla ele alınır: atılacak kelimeler atılır,
+bilinen fonksiyon, sabit ve Yunan harfleri kabul edilir, yalnızca
+değişken harflerinden oluşanlar çarpıma açılır (xy -> x*y); geri
+kalanlar ValueError ile reddedilir. Tek harfler değişken sayılır.
+
+Her çözücü kendi ayarlarıyla bir Sozcukleyici örneği oluşturur.
+ifadeye_cevir() temizlenmiş metni, sozcuklere_ayir() aynı metnin sözcük
+dizisini döndürür; birlestir() ile dizi metne geri çevrilebilir.
+
+Yazar: Matematik Kütüphanesi
+"""
+
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+
+# Sözcük türleri
+SAYI = "SAYI"
+ISIM = "ISIM"
+ISLEC = "ISLEC"
+AC_PARANTEZ = "AC_PARANTEZ"
+KAPA_PARANTEZ = "KAPA_PARANTEZ"
+ESITTIR = "ESITTIR"
+VIRGUL = "VIRGUL"
+DIGER = "DIGER"
+BOSLUK = "BOSLUK"
+
+
+class Sozcuk(NamedTuple):
+    """Tek bir sözcük: türü ve metni"""
+    tur: str
+    deger: str
+
+
+# İsim harfi: harf olup rakam, alt çizgi veya üst simge olmayan karakter
+_HARF = r"[^\W\d_²³]"
+
+# Temizlenmiş metni sayı, isim, **, boşluk ve diğer tek karakterlere ayıran desen
+_PARCA_DESENI = re.compile(r"\d+(?:\.\d*)?|\.\d+|" + _HARF + r"+|\*\*|\s+|\S")
+
+# İki ve daha fazla harfli isimler (tek harfler her zaman değişkendir);
+# katlanmış girdiler çoğunlukla ASCII olduğundan daha hızlı ASCII deseni önce denenir
+_COK_HARFLI_ISIM = re.compile(_HARF + r"{2,}")
+_ASCII_COK_HARFLI_ISIM = re.compile(r"[A-Za-z]{2,}")
+
+# Terim sonu (sayı, isim, üst simge, kapa parantez) ve terim başı (sayı, isim, açık parantez)
+_TERIM_SONU = r"(?:(?<=[^\W_])|(?<=\))|(?<=\d\.))"
+_TERIM_BASI = r"(?=[^\W_²³]|\(|\.\d)"
+
+# Bitişik sözcükler arasındaki örtük çarpma yerleri: 2x, 2(x), )(, )x, )2, x²y.
+# Rakamdan sonra gelen rakam veya nokta aynı sayının parçasıdır. Baştaki tek
+# karakter sınıflı geriye bakış, eşleşemeyecek konumları ucuzca eler.
+_BITISIK_CARPIM = re.compile(
+    r"(?<=[\d)²³.])(?:"
+    r"(?<=[)²³])(?=[^\W_²³]|\(|\.\d)"
+    r"|(?:(?<=\d)|(?<=\d\.))(?=" + _HARF + r"|\()"
+    r")"
+)
+
+# Boşlukla ayrılmış iki terim: boşluk duyarlıysa BOSLUK olarak kalır,
+# diğer boşluklar silinir
+_TERIM_ARASI_BOSLUK = re.compile(r"(?<=[\w).])" + _TERIM_SONU + r"\s+" + _TERIM_BASI)
+
+# Boşluk duyarsız modda bitişik ve boşluklu örtük çarpmalar tek geçişte bulunur;
+# eşleşen boşluk * ile değiştirilir, kalan boşluklar sonra silinir
+_CARPIM_YERI = re.compile(
+    r"(?<=[\d)²³.])(?:"
+    r"(?<=[)²³])\s*" + _TERIM_BASI +
+    r"|(?:(?<=\d)|(?<=\d\.))(?:(?=" + _HARF + r"|\()|\s+" + _TERIM_BASI + r")"
+    r")"
+)
+
+# Boşluk silinirken korunacak terim arası boşluğun geçici işareti
+_BOSLUK_ISARETI = "\x00"
+
+# Türkçe karakter katlama çiftleri (küçük harfe çevrildikten sonra uygulanır);
+# kısa metinlerde str.replace zinciri sözlüklü str.translate'ten hızlıdır
+_KATLAMA_CIFTLERI = (
+    ("ü", "u"), ("ğ", "g"), ("ı", "i"), ("ş", "s"), ("ç", "c"), ("ö", "o"),
+    ("\u0307", "")  # "İ".lower() sonrası kalan birleşik nokta
+)
+
+# Üs yazımları: ^ ve üst simgeler ** ile yazılır
+_US_CIFTLERI = (("^", "**"), ("²", "**2"), ("³", "**3"))
+
+# Boşlukla ayrılmış iki terimin arasına giren sözcük
+_BOSLUK_SOZCUGU = Sozcuk(BOSLUK, " ")
+
+# Sabit parçaların önceden oluşturulmuş sözcükleri
+_SABIT_SOZCUKLER = {
+    "**": Sozcuk(ISLEC, "**"),
+    "+": Sozcuk(ISLEC, "+"), "-": Sozcuk(ISLEC, "-"), "*": Sozcuk(ISLEC, "*"),
+    "/": Sozcuk(ISLEC, "/"), "%": Sozcuk(ISLEC, "%"),
+    "(": Sozcuk(AC_PARANTEZ, "("), ")": Sozcuk(KAPA_PARANTEZ, ")"),
+    "=": Sozcuk(ESITTIR, "="), ",": Sozcuk(VIRGUL, ","),
+    " ": _BOSLUK_SOZCUGU,
+}
+
+# Çok harfli isimlerden kabul edilenler (katlanmış halleriyle): SymPy
+# fonksiyonları, sabitleri ve Yunan harfleri
+BILINEN_ISIMLER = frozenset({
+    "sin", "cos", "tan", "cot", "sec", "csc",
+    "asin", "acos", "atan", "acot", "asec", "acsc", "atan2",
+    "sinh", "cosh", "tanh", "coth", "sech", "csch",
+    "asinh", "acosh", "atanh", "acoth", "asech", "acsch",
+    "exp", "log", "sqrt", "cbrt", "root", "abs", "sign", "floor", "ceiling",
+    "factorial", "binomial", "erf", "erfc", "erfi", "besselj", "bessely",
+    "besseli", "besselk", "fresnels", "fresnelc", "airyai", "airybi",
+    "li", "polylog", "lambertw", "heaviside", "diracdelta", "sinc",
+    "re", "im", "arg", "conjugate", "pi", "oo",
+    "alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta",
+    "iota", "kappa", "mu", "nu", "xi", "omicron", "rho", "sigma", "tau",
+    "upsilon", "phi", "chi", "psi", "omega",
+})
+
+# Çok harfli isimlerde çarpım olarak açılabilen varsayılan değişken harfleri
+DEGISKEN_HARFLERI = "xyzt"
+
+
+# Sık görülen sayı ve isim sözcükleri tabloda bu sayıya kadar saklanır
+AZAMI_TABLO_BOYUTU = 4096
+
+
+def katla(metin: str) -> str:
+    """Metni küçük harfe çevirir ve Türkçe karakterleri ASCII karşılıklarına katlar"""
+    metin = metin.lower()
+    if not metin.isascii():
+        for harf, karsilik in _KATLAMA_CIFTLERI:
+            metin = metin.replace(harf, karsilik)
+    return metin
+
+
+class Sozcukleyici:
+    """Önceden derlenmiş düzenli ifadelerle metnin tamamı üzerinde çalışan sözcükleyici"""
+
+    def __init__(self, isim_donusumleri: Optional[Dict[str, str]] = None,
+                 atilacak_kelimeler: Iterable[str] = (), ortuk_carpim: bool = True,
+                 bosluk_duyarli: bool = True, degisken_harfleri: str = DEGISKEN_HARFLERI):
+        """
+        Args:
+            isim_donusumleri (Dict[str, str]): İsim -> yerine geçecek metin
+                (örn: {"sinüs": "sin", "üs": "**"})
+            atilacak_kelimeler (Iterable[str]): Atılacak kelimeler ve
+                boşlukla ayrılmış kelime grupları (örn: "x hesapla")
+            ortuk_carpim (bool): 2x, 2(x+1), (x)(y) gibi yerlere * eklenir
+            bosluk_duyarli (bool): False ise boşluklar yok sayılır ve örtük
+                çarpma boşlukla ayrılmış terimlere de uygulanır
+            degisken_harfleri (str): Yalnızca bu harflerden oluşan tanınmayan
+                isimler örtük çarpıma açılır (ortuk_carpim açıksa)
+        """
+        # Dönüştürülen isimler karşılıklarıyla, atılan kelimeler boşlukla değişir;
+        # hepsi tek bir desende, uzun olan önce denenecek şekilde birleştirilir
+        self._karsiliklar: Dict[str, str] = {katla(isim): karsilik
+                                             for isim, karsilik in (isim_donusumleri or {}).items()}
+        kelime_gruplari = [katla(kelime).split() for kelime in atilacak_kelimeler] + [[isim] for isim in self._karsiliklar]
+        kaliplar = [r"\s+".join(map(re.escape, grup)) for grup in kelime_gruplari]
+        self._ozel_desen = re.compile(
+            "(?<!" + _HARF + ")(?:" + "|".join(sorted(kaliplar, key=len, reverse=True)) + ")(?!" + _HARF + ")"
+        ) if kaliplar else None
+
+        karsiliklar = self._karsiliklar
+        self._karsilik = lambda eslesme: karsiliklar.get(eslesme.group(), " ")
+
+        # Desen yalnızca metindeki çok harfli isimlerden biri bir grupta geçiyorsa
+        # çalıştırılır; tek harflerden oluşan grup varsa her zaman çalıştırılır
+        tetikleyiciler = [{kelime for kelime in grup if len(kelime) > 1} for grup in kelime_gruplari]
+        self._tetikleyiciler = (frozenset().union(*tetikleyiciler)
+                                if all(tetikleyiciler) else None)
+
+        # Dönüşümle gelen isimler (Si, atan) de bilinen isim sayılır
+        self._bilinen_isimler = BILINEN_ISIMLER.union(self._karsiliklar.values())
+
+        self.ortuk_carpim = ortuk_carpim
+        self.bosluk_duyarli = bosluk_duyarli
+        self._degisken_harfleri = frozenset(degisken_harfleri) if ortuk_carpim else frozenset()
+
+        # Parça -> sözcük tablosu (sozcuklere_ayir için)
+        self._tablo: Dict[str, Sozcuk] = dict(_SABIT_SOZCUKLER)
+        self._sabit_boyut = len(self._tablo)
+
+    def ifadeye_cevir(self, metin: str) -> str:
+        """
+        Metni SymPy'nin anlayacağı ifade metnine çevirir.
+
+        Args:
+            metin (str): Ham kullanıcı girdisi
+
+        Returns:
+            str: Temizlenmiş metin; boşluklar yalnızca iki terim arasında
+                kaldıysa (boşluk duyarlı sözcükleyicide) tek boşluk olarak yer alır
+
+        Raises:
+            ValueError: Tanınmayan çok harfli isim varsa
+        """
+        metin = katla(metin)
+        isimler = _isimleri_bul(metin)
+        if self._ozel_desen is not None and (self._tetikleyiciler is None
+                                             or not self._tetikleyiciler.isdisjoint(isimler)):
+            metin = self._ozel_desen.sub(self._karsilik, metin)
+            isimler = _isimleri_bul(metin)
+
+        if isimler and not self._bilinen_isimler.issuperset(isimler):
+            metin = self._bilinmeyen_isimleri_ac(metin, isimler)
+
+        if self.ortuk_carpim:
+            metin = (_BITISIK_CARPIM if self.bosluk_duyarli else _CARPIM_YERI).sub("*", metin)
+
+        # " " dışındaki boşluk karakterleri (\t, \n, \xa0) yazdırılamaz sayılır
+        if " " in metin or not metin.isprintable():
+            if self.bosluk_duyarli and _TERIM_ARASI_BOSLUK.search(metin):
+                metin = _TERIM_ARASI_BOSLUK.sub(_BOSLUK_ISARETI, metin)
+                return _us_yaz("".join(metin.split()).replace(_BOSLUK_ISARETI, " "))
+            metin = "".join(metin.split())
+
+        return _us_yaz(metin)
+
+    def sozcuklere_ayir(self, metin: str) -> Tuple[Sozcuk, ...]:
+        """
+        Metni temizleyip sözcük dizisine çevirir.
+
+        Args:
+            metin (str): Ham kullanıcı girdisi
+
+        Returns:
+            Tuple[Sozcuk, ...]: Sözcük dizisi; boşluklar yalnızca iki terim
+                arasında kaldıysa BOSLUK sözcüğü olarak yer alır
+
+        Raises:
+            ValueError: Tanınmayan çok harfli isim varsa
+        """
+        tablo = self._tablo
+        return tuple([tablo.get(parca) or self._sozcuk_olustur(parca)
+                      for parca in _PARCA_DESENI.findall(self.ifadeye_cevir(metin))])
+
+    def _bilinmeyen_isimleri_ac(self, metin: str, isimler: List[str]) -> str:
+        """Değişken harflerinden oluşan isimleri çarpıma açar (xy -> x*y), diğerlerini reddeder"""
+        acilacaklar = []
+        for isim in isimler:
+            if isim in self._bilinen_isimler:
+                continue
+            if not self._degisken_harfleri.issuperset(isim):
+                raise ValueError(f"Tanınmayan ifade: '{isim}'")
+            acilacaklar.append(re.escape(isim))
+        desen = "(?<!" + _HARF + ")(?:" + "|".join(acilacaklar) + ")(?!" + _HARF + ")"
+        return re.sub(desen, lambda m: "*".join(m.group()), metin)
+
+    def _sozcuk_olustur(self, parca: str) -> Sozcuk:
+        """Tabloda olmayan parçanın türünü belirler ve sözcüğünü tabloya ekler"""
+        son = parca[-1]
+        if son.isdigit():
+            sozcuk = Sozcuk(SAYI, parca)
+        elif son.isalpha():
+            sozcuk = Sozcuk(ISIM, parca)
+        else:
+            sozcuk = Sozcuk(DIGER, parca)
+
+        # Tablo dolduysa sonradan eklenenler silinir, sabit girdiler korunur
+        if len(self._tablo) >= self._sabit_boyut + AZAMI_TABLO_BOYUTU:
+            self._tablo = dict(list(self._tablo.items())[:self._sabit_boyut])
+        self._tablo[parca] = sozcuk
+        return sozcuk
+
+
+def _isimleri_bul(metin: str) -> List[str]:
+    """Metindeki çok harfli isimleri sırasıyla döndürür"""
+    return (_ASCII_COK_HARFLI_ISIM if metin.isascii() else _COK_HARFLI_ISIM).findall(metin)
+
+
+def _us_yaz(metin: str) -> str:
+    """^, ² ve ³ üslerini ** ile yazar"""
+    for us, karsilik in _US_CIFTLERI:
+        if us in metin:
+            metin = metin.replace(us, karsilik)
+    return metin
+
+
+def birlestir(sozcukler: Iterable[Sozcuk]) -> str:
+    """Sözcük dizisini ifade metnine çevirir; BOSLUK sözcükleri boşluk olarak kalır"""
+    return "".join([sozcuk.deger for sozcuk in sozcukler])
+
+
+def esitlikten_ayir(sozcukler: Tuple[Sozcuk, ...]) -> Tuple[Tuple[Sozcuk, ...], Optional[Tuple[Sozcuk, ...]]]:
+    """
+    Sözcük dizisini ilk eşittir işaretinden böler.
+
+    Returns:
+        Tuple: (sol taraf, sağ taraf); eşittir yoksa sağ taraf None
+    """
+    for i, sozcuk in enumerate(sozcukler):
+        if sozcuk.tur == ESITTIR:
+            return sozcukler[:i], sozcukler[i + 1:]
+    return sozcukler, None
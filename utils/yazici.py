@@ -0,0 +1,104 @@
+"""
+Okunabilir Yazıcı - Matematik Kütüphanesi
+=========================================
+
+SymPy ifadelerini kullanıcıya gösterilecek okunabilir metne çevirir.
+StrPrinter'ın alt sınıfı olduğundan semboller yazdırma sırasında,
+ağaç bir kez dolaşılırken üretilir; str() çıktısı üzerinde düzenli
+ifade değiştirmeleri yapılmaz ve iç içe parantezler sorun olmaz:
+
+    - Karekök: sqrt(u) -> √(u), 1/sqrt(u) -> 1/√(u)
+    - Sabitler: pi -> π, oo -> ∞
+    - Yunan harfi adlı semboller: alpha -> α, Theta -> Θ
+    - Özel fonksiyonlar: fresnels -> S, fresnelc -> C, gamma -> Γ,
+      elliptic_f(φ, m) -> F(φ|m), elliptic_e(φ, m) -> E(φ|m),
+      elliptic_k(m) -> K(m), elliptic_pi(n, φ, m) -> Π(n; φ|m)
+
+Yazar: Matematik Kütüphanesi
+"""
+
+from typing import Any
+
+import sympy as sp
+from sympy.printing.str import StrPrinter
+
+
+# Sembol adı -> Yunan harfi
+YUNAN_HARFLERI = {
+    "alpha": "α", "beta": "β", "gamma": "γ", "Gamma": "Γ", "delta": "δ", "Delta": "Δ",
+    "epsilon": "ε", "theta": "θ", "Theta": "Θ", "lambda": "λ", "Lambda": "Λ", "mu": "μ",
+    "nu": "ν", "rho": "ρ", "sigma": "σ", "Sigma": "Σ", "tau": "τ", "phi": "φ", "Phi": "Φ",
+    "psi": "ψ", "Psi": "Ψ", "omega": "ω", "Omega": "Ω"
+}
+
+
+class OkunabilirYazici(StrPrinter):
+    """√, π, ∞, Yunan harfleri ve özel fonksiyon gösterimlerini doğrudan üreten yazıcı"""
+
+    def _print_Pow(self, expr, rational=False):
+        if expr.exp is sp.S.Half:
+            return f"√({self._print(expr.base)})"
+        if expr.is_commutative and expr.exp == -sp.S.Half and not rational:
+            return f"1/√({self._print(expr.base)})"
+        return super()._print_Pow(expr, rational)
+
+    def _print_Pi(self, expr):
+        return "π"
+
+    def _print_Infinity(self, expr):
+        return "∞"
+
+    def _print_NegativeInfinity(self, expr):
+        return "-∞"
+
+    def _print_Symbol(self, expr):
+        return YUNAN_HARFLERI.get(expr.name, super()._print_Symbol(expr))
+
+    def _adli_fonksiyon(self, ad: str, expr) -> str:
+        return f"{ad}({self.stringify(expr.args, ', ')})"
+
+    def _print_fresnels(self, expr):
+        return self._adli_fonksiyon("S", expr)
+
+    def _print_fresnelc(self, expr):
+        return self._adli_fonksiyon("C", expr)
+
+    def _print_gamma(self, expr):
+        return self._adli_fonksiyon("Γ", expr)
+
+    def _print_elliptic_k(self, expr):
+        return self._adli_fonksiyon("K", expr)
+
+    def _eliptik(self, ad: str, expr) -> str:
+        # Son argüman parametre m; "|" ile ayrılır
+        argumanlar = [self._print(arguman) for arguman in expr.args]
+        if len(argumanlar) == 1:
+            return f"{ad}({argumanlar[0]})"
+        return f"{ad}({'; '.join(argumanlar[:-1])}|{argumanlar[-1]})"
+
+    def _print_elliptic_f(self, expr):
+        return self._eliptik("F", expr)
+
+    def _print_elliptic_e(self, expr):
+        return self._eliptik("E", expr)
+
+    def _print_elliptic_pi(self, expr):
+        return self._eliptik("Π", expr)
+
+
+_yazici = OkunabilirYazici()
+
+
+def okunabilir(ifade: Any) -> str:
+    """
+    İfadeyi okunabilir matematik sembolleriyle metne çevirir.
+
+    Args:
+        ifade (Any): SymPy ifadesi; SymPy nesnesi olmayan değerler str() ile yazılır
+
+    Returns:
+        str: Okunabilir metin
+    """
+    if isinstance(ifade, sp.Basic):
+        return _yazici.doprint(ifade)
+    return str(ifade)
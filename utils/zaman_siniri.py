@@ -0,0 +1,105 @@
+"""
+Süre Sınırlı Çalıştırma - Matematik Kütüphanesi
+===============================================
+
+sp.integrate ve sp.simplify gibi bazı girdilerde dakikalarca süren
+sembolik işlemleri verilen süre içinde bitmezse keser.
+
+Süre verilmezse işlem doğrudan, aynı süreçte çağrılır. Süre verilirse
+işlem ayrı bir süreçte çalıştırılır; süre dolunca süreç sonlandırılır,
+böylece yarıda kalan hesap arka planda işlemci tüketmeye devam etmez.
+Süreç açmak ve sonucu aktarmak çağrı başına milisaniyeler mertebesinde
+ek maliyet getirdiğinden süre sınırı yalnızca gerektiğinde açılmalıdır.
+Sonuç ve hatalar çağırana pickle ile aktarılır. "fork" desteklenmeyen
+platformlarda (Windows) işlem bir arka plan iş parçacığında çalıştırılır;
+süre dolunca çağıran beklemeyi bırakır ama iş parçacığı kendi bitene
+kadar sürer.
+
+Yazar: Matematik Kütüphanesi
+"""
+
+import multiprocessing
+import threading
+from typing import Any, Callable, Optional
+
+
+class SureAsimi(Exception):
+    """İşlem verilen süre içinde tamamlanamadı"""
+
+
+def _surecte_calistir(baglanti, fonksiyon, argumanlar):
+    """Alt süreçte fonksiyonu çalıştırıp (başarılı mı, sonuç/hata) gönderir"""
+    try:
+        baglanti.send((True, fonksiyon(*argumanlar)))
+    except BaseException as e:
+        try:
+            baglanti.send((False, e))
+        except Exception:
+            baglanti.send((False, RuntimeError(str(e))))
+    finally:
+        baglanti.close()
+
+
+def sure_sinirli_calistir(fonksiyon: Callable[..., Any], *argumanlar, sure: Optional[float] = None) -> Any:
+    """
+    Fonksiyonu en fazla verilen süre kadar çalıştırır.
+
+    Args:
+        fonksiyon (Callable): Çalıştırılacak fonksiyon
+        *argumanlar: Fonksiyona verilecek argümanlar
+        sure (float): Saniye cinsinden süre sınırı; None ise sınır yoktur
+            ve fonksiyon doğrudan çağrılır
+
+    Returns:
+        Any: Fonksiyonun sonucu
+
+    Raises:
+        SureAsimi: Süre dolduğunda
+    """
+    if sure is None:
+        return fonksiyon(*argumanlar)
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return _is_parcaciginda_calistir(fonksiyon, argumanlar, sure)
+
+    baglam = multiprocessing.get_context("fork")
+    okuyucu, yazici = baglam.Pipe(duplex=False)
+    surec = baglam.Process(target=_surecte_calistir, args=(yazici, fonksiyon, argumanlar), daemon=True)
+    surec.start()
+    yazici.close()
+    try:
+        if not okuyucu.poll(sure):
+            raise SureAsimi(f"İşlem {sure:g} saniyede tamamlanamadı")
+        try:
+            basarili, sonuc = okuyucu.recv()
+        except EOFError:
+            raise RuntimeError("Hesaplama süreci beklenmedik şekilde sonlandı")
+    finally:
+        okuyucu.close()
+        if surec.is_alive():
+            surec.terminate()
+        surec.join()
+
+    if not basarili:
+        raise sonuc
+    return sonuc
+
+
+def _is_parcaciginda_calistir(fonksiyon, argumanlar, sure: float) -> Any:
+    """Süreç açılamayan platformlar için iş parçacığı ile süre sınırı"""
+    sonuc = {}
+
+    def calistir():
+        try:
+            sonuc["deger"] = fonksiyon(*argumanlar)
+        except BaseException as e:
+            sonuc["hata"] = e
+
+    is_parcacigi = threading.Thread(target=calistir, daemon=True)
+    is_parcacigi.start()
+    is_parcacigi.join(sure)
+    if is_parcacigi.is_alive():
+        raise SureAsimi(f"İşlem {sure:g} saniyede tamamlanamadı")
+    if "hata" in sonuc:
+        raise sonuc["hata"]
+    return sonuc["deger"]